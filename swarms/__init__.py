@@ -6,12 +6,22 @@ from swarms.telemetry.bootup import bootup  # noqa: E402, F403
 
 bootup()
 
-from swarms.agents import *  # noqa: E402, F403
+from swarms.utils.lazy_loader import (  # noqa: E402
+    lazy_package_namespace,
+)
 
-from swarms.artifacts import *  # noqa: E402, F403
-from swarms.prompts import *  # noqa: E402, F403
-from swarms.schemas import *  # noqa: E402, F403
-from swarms.structs import *  # noqa: E402, F403
-from swarms.telemetry import *  # noqa: E402, F403
-from swarms.tools import *  # noqa: E402, F403
-from swarms.utils import *  # noqa: E402, F403
+# Equivalent to ``from swarms.<subpackage> import *`` for each subpackage,
+# resolved on first attribute access instead of at import time.
+__getattr__, __dir__, __all__ = lazy_package_namespace(
+    __name__,
+    [
+        "swarms.agents",
+        "swarms.artifacts",
+        "swarms.prompts",
+        "swarms.schemas",
+        "swarms.structs",
+        "swarms.telemetry",
+        "swarms.tools",
+        "swarms.utils",
+    ],
+)
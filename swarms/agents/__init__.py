@@ -1,28 +1,29 @@
-from swarms.agents.agent_judge import AgentJudge
-from swarms.agents.consistency_agent import SelfConsistencyAgent
-from swarms.agents.create_agents_from_yaml import (
-    create_agents_from_yaml,
-)
-from swarms.agents.flexion_agent import ReflexionAgent
-from swarms.agents.gkp_agent import GKPAgent
-from swarms.agents.i_agent import IterativeReflectiveExpansion
-from swarms.agents.reasoning_agents import (
-    ReasoningAgentRouter,
-    agent_types,
-)
-from swarms.agents.reasoning_duo import ReasoningDuo
-from swarms.structs.stopping_conditions import (
-    check_cancelled,
-    check_complete,
-    check_done,
-    check_end,
-    check_error,
-    check_exit,
-    check_failure,
-    check_finished,
-    check_stopped,
-    check_success,
-)
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "AgentJudge": "swarms.agents.agent_judge",
+    "SelfConsistencyAgent": "swarms.agents.consistency_agent",
+    "create_agents_from_yaml": "swarms.agents.create_agents_from_yaml",
+    "ReflexionAgent": "swarms.agents.flexion_agent",
+    "GKPAgent": "swarms.agents.gkp_agent",
+    "IterativeReflectiveExpansion": "swarms.agents.i_agent",
+    "ReasoningAgentRouter": "swarms.agents.reasoning_agents",
+    "agent_types": "swarms.agents.reasoning_agents",
+    "ReasoningDuo": "swarms.agents.reasoning_duo",
+    "check_cancelled": "swarms.structs.stopping_conditions",
+    "check_complete": "swarms.structs.stopping_conditions",
+    "check_done": "swarms.structs.stopping_conditions",
+    "check_end": "swarms.structs.stopping_conditions",
+    "check_error": "swarms.structs.stopping_conditions",
+    "check_exit": "swarms.structs.stopping_conditions",
+    "check_failure": "swarms.structs.stopping_conditions",
+    "check_finished": "swarms.structs.stopping_conditions",
+    "check_stopped": "swarms.structs.stopping_conditions",
+    "check_success": "swarms.structs.stopping_conditions",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "check_done",
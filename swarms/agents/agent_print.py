@@ -8,26 +8,23 @@ def agent_print(
     streaming_on: bool = False,
 ):
     """
-    Prints the response from an agent based on the streaming mode.
+    Prints the response from an agent in a panel.
 
     Args:
         agent_name (str): The name of the agent.
         response (str): The response from the agent.
         loop_count (int): The maximum number of loops.
-        streaming_on (bool): Indicates if streaming is on or off.
+        streaming_on (bool): Kept for backwards compatibility; complete
+            responses are never replayed token by token.
 
     Returns:
         str: The response from the agent.
     """
-    if streaming_on:
-        formatter.print_panel_token_by_token(
-            f"{agent_name}: {response}",
-            title=f"Agent Name: {agent_name} [Max Loops: {loop_count}]",
-        )
-    else:
-        formatter.print_panel(
-            f"{agent_name}: {response}",
-            f"Agent Name {agent_name} [Max Loops: {loop_count} ]",
-        )
+    # The response is already complete, so it is printed in one go;
+    # live output comes from Formatter.stream_panel while generating.
+    formatter.print_panel(
+        f"{agent_name}: {response}",
+        f"Agent Name {agent_name} [Max Loops: {loop_count} ]",
+    )
 
     return response
@@ -1,12 +1,17 @@
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+from functools import partial
+from typing import Any, Callable, List, Optional, Union
 
 from loguru import logger
 
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
 from swarms.structs.malt import majority_voting_prompt
+from swarms.structs.quorum_voting import (
+    QuorumResult,
+    normalize_answer,
+    quorum_vote,
+)
 from swarms.utils.output_types import OutputType
 from swarms.utils.any_to_str import any_to_str
 from swarms.utils.history_output_formatter import (
@@ -52,6 +57,9 @@ class SelfConsistencyAgent(Agent):
         majority_voting_prompt: str = None,
         eval: bool = False,
         output_type: OutputType = "dict",
+        quorum: Union[int, float, None] = None,
+        normalizer: Callable[[Any], str] = normalize_answer,
+        max_workers: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -59,6 +67,13 @@ class SelfConsistencyAgent(Agent):
 
         Args:
             num_samples (int): Number of independent responses to sample.
+            quorum (Union[int, float, None]): Matching samples needed to
+                accept an answer without aggregation. A float is a fraction
+                of ``num_samples``; None means a strict majority.
+            normalizer (Callable[[Any], str]): Maps a sample to the answer
+                it votes for.
+            max_workers (Optional[int]): Samples generated at once.
+                Defaults to the quorum.
             **kwargs: Other keyword arguments passed to the base Agent.
         """
         super().__init__(
@@ -73,12 +88,17 @@ class SelfConsistencyAgent(Agent):
         self.eval = eval
         self.output_type = output_type
         self.system_prompt = system_prompt
+        self.quorum = quorum
+        self.normalizer = normalizer
+        self.max_workers = max_workers
+        self.last_vote: Optional[QuorumResult] = None
 
     def run(
         self, task: str, answer: str = None, *args, **kwargs
     ) -> str:
         """
-        Generates multiple responses for the given prompt and aggregates them concurrently.
+        Generates responses concurrently until a quorum of them agree, and
+        aggregates them with an LLM only when they do not.
 
         Args:
             task (str): The input prompt.
@@ -86,21 +106,28 @@ class SelfConsistencyAgent(Agent):
         Returns:
             str: The aggregated final answer.
         """
-        responses = []
         logger.info(
-            f"Generating {self.num_samples} responses concurrently..."
+            f"Generating up to {self.num_samples} responses concurrently..."
         )
 
         self.conversation.add(role="User", content=task)
 
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(super().run, task, *args, **kwargs): i
+        sample = partial(super().run, task, *args, **kwargs)
+        vote = quorum_vote(
+            [
+                (f"{self.agent_name}-{i}", sample)
                 for i in range(self.num_samples)
-            }
-            for future in as_completed(futures):
-                response = future.result()
-                responses.append(response)
+            ],
+            quorum=self.quorum,
+            normalizer=self.normalizer,
+            max_workers=self.max_workers,
+        )
+        self.last_vote = vote
+        responses = [
+            response
+            for _, response in vote.responses
+            if not isinstance(response, Exception)
+        ]
 
         self.conversation.add(role=self.agent_name, content=responses)
 
@@ -119,7 +146,11 @@ class SelfConsistencyAgent(Agent):
         # Aggregation agent
         # final_answer = self.aggregation_agent(responses)
 
-        final_answer = aggregation_agent(responses)
+        # Only aggregate with an LLM when the samples disagree
+        if vote.decided:
+            final_answer = vote.winner
+        else:
+            final_answer = aggregation_agent(responses)
 
         self.conversation.add(
             role="Majority Voting Agent", content=final_answer
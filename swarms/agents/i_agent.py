@@ -18,7 +18,17 @@ Workflow:
 
 """
 
-from typing import List, Tuple
+import heapq
+import itertools
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict, List, Optional, Tuple
+
 from loguru import logger
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
@@ -54,19 +64,34 @@ class IterativeReflectiveExpansion:
         system_prompt: str = GENERAL_REASONING_AGENT_SYS_PROMPT,
         model_name: str = "gpt-4o-mini",
         output_type: OutputType = "dict",
+        score_threshold: float = 0.7,
+        max_paths: Optional[int] = 5,
+        early_stop_score: Optional[float] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize the Iterative Reflective Expansion engine.
 
         :param agent: The Swarms agent instance used to perform reasoning tasks.
         :param max_iterations: Maximum number of iterations for the reasoning process.
+        :param score_threshold: Paths scoring below this are reflected on and revised.
+        :param max_paths: Maximum number of paths explored per iteration (branching factor), or None for no cap.
+        :param early_stop_score: Stop exploring as soon as a path scores at least this, or None to disable.
+        :param max_workers: Maximum number of concurrent agent calls while exploring paths.
         """
         self.agent_name = agent_name
         self.description = description
         self.agent = agent
         self.max_iterations = max_iterations
         self.output_type = output_type
+        self.score_threshold = score_threshold
+        self.max_paths = max_paths
+        self.early_stop_score = early_stop_score
+        self.max_workers = max_workers or min(
+            32, (os.cpu_count() or 1) + 4
+        )
         self.system_prompt = system_prompt
+        self.model_name = model_name
         self.conversation = Conversation()
 
         self.agent = Agent(
@@ -77,6 +102,20 @@ class IterativeReflectiveExpansion:
             dynamic_temperature_enabled=True,
         )
 
+    def _create_worker_agent(self) -> Agent:
+        """
+        Create a fresh reasoning agent for one concurrent exploration call.
+
+        Agents keep per-run state, so concurrent calls never share one.
+        """
+        return Agent(
+            agent_name=self.agent_name,
+            system_prompt=self.system_prompt,
+            model_name=self.model_name,
+            max_loops=1,
+            dynamic_temperature_enabled=True,
+        )
+
     def generate_initial_hypotheses(self, task: str) -> List[str]:
         """
         Generate an initial set of reasoning hypotheses based on the problem input.
@@ -103,11 +142,14 @@ class IterativeReflectiveExpansion:
         logger.debug(f"Initial hypotheses: {hypotheses}")
         return hypotheses
 
-    def simulate_path(self, path: str) -> Tuple[str, float, str]:
+    def simulate_path(
+        self, path: str, agent: Optional[Agent] = None
+    ) -> Tuple[str, float, str]:
         """
         Simulate a given reasoning path and evaluate its effectiveness.
 
         :param path: A candidate reasoning path.
+        :param agent: The agent to run, defaults to the engine's agent.
         :return: A tuple containing the simulated outcome, a numerical score (0.0 to 1.0), and error information.
         """
         logger.info(f"Simulating path: {path}")
@@ -118,10 +160,9 @@ class IterativeReflectiveExpansion:
             f"3. Errors: Any potential errors or shortcomings identified during the reasoning.\n\n"
             f"Reasoning Path: {path}"
         )
-        response = self.agent.run(prompt)
-        self.conversation.add(
-            role=self.agent.agent_name, content=response
-        )
+        agent = self.agent if agent is None else agent
+        response = agent.run(prompt)
+        self.conversation.add(role=agent.agent_name, content=response)
         outcome = ""
         score = 0.0
         error_info = ""
@@ -141,11 +182,14 @@ class IterativeReflectiveExpansion:
         )
         return outcome, score, error_info
 
-    def meta_reflect(self, error_info: str) -> str:
+    def meta_reflect(
+        self, error_info: str, agent: Optional[Agent] = None
+    ) -> str:
         """
         Perform meta-cognitive reflection on the provided error information.
 
         :param error_info: Information regarding errors in the reasoning path.
+        :param agent: The agent to run, defaults to the engine's agent.
         :return: Feedback and suggestions for revising the reasoning path.
         """
         logger.info(
@@ -156,19 +200,21 @@ class IterativeReflectiveExpansion:
             f"{error_info}\n"
             "Provide clear and actionable feedback."
         )
-        feedback = self.agent.run(prompt)
-        self.conversation.add(
-            role=self.agent.agent_name, content=feedback
-        )
+        agent = self.agent if agent is None else agent
+        feedback = agent.run(prompt)
+        self.conversation.add(role=agent.agent_name, content=feedback)
         logger.debug(f"Meta-reflection feedback: {feedback}")
         return feedback
 
-    def revise_path(self, path: str, feedback: str) -> List[str]:
+    def revise_path(
+        self, path: str, feedback: str, agent: Optional[Agent] = None
+    ) -> List[str]:
         """
         Revise the reasoning path based on the provided feedback.
 
         :param path: The original reasoning path.
         :param feedback: Feedback from meta-cognitive reflection.
+        :param agent: The agent to run, defaults to the engine's agent.
         :return: A list of revised reasoning paths.
         """
         logger.info("Revising reasoning path based on feedback.")
@@ -178,10 +224,9 @@ class IterativeReflectiveExpansion:
             "Generate revised reasoning paths that address the issues raised. "
             "Present each revised path on a new line."
         )
-        response = self.agent.run(prompt)
-        self.conversation.add(
-            role=self.agent.agent_name, content=response
-        )
+        agent = self.agent if agent is None else agent
+        response = agent.run(prompt)
+        self.conversation.add(role=agent.agent_name, content=response)
         revised_paths = [
             line.strip()
             for line in response.split("\n")
@@ -190,6 +235,114 @@ class IterativeReflectiveExpansion:
         logger.debug(f"Revised paths: {revised_paths}")
         return revised_paths
 
+    def explore_path(self, path: str) -> Tuple[str, float, str]:
+        """
+        Simulate a path on a fresh worker agent.
+
+        :param path: A candidate reasoning path.
+        :return: The result of ``simulate_path``.
+        """
+        return self.simulate_path(path, self._create_worker_agent())
+
+    def reflect_and_revise(
+        self, path: str, error_info: str
+    ) -> List[str]:
+        """
+        Meta-reflect on a path's errors and revise it in one pipeline step.
+
+        Both calls run on the same fresh worker agent.
+
+        :param path: The reasoning path that scored below the threshold.
+        :param error_info: Error information from the path's simulation.
+        :return: A list of revised reasoning paths.
+        """
+        agent = self._create_worker_agent()
+        feedback = self.meta_reflect(error_info, agent)
+        return self.revise_path(path, feedback, agent)
+
+    def explore_paths(
+        self, paths: List[str], executor: ThreadPoolExecutor
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Simulate all candidate paths concurrently and expand them.
+
+        Simulations are submitted at once. As each one completes, paths below
+        the score threshold are immediately handed to reflection and revision
+        while other simulations are still in flight. Expanded paths are kept in
+        a bounded priority queue ordered by score. Every call runs on its own
+        worker agent, and an early stop waits for calls that were already
+        running so none outlive the exploration.
+
+        :param paths: The candidate reasoning paths for this iteration.
+        :param executor: The executor used to run agent calls.
+        :return: The highest-scoring expanded paths, and the path that cleared
+            ``early_stop_score`` if exploration was cut off early.
+        """
+        frontier: List[Tuple[float, int, str]] = []
+        order = itertools.count()
+
+        def push(score: float, path: str) -> None:
+            entry = (score, -next(order), path)
+            if (
+                self.max_paths is None
+                or len(frontier) < self.max_paths
+            ):
+                heapq.heappush(frontier, entry)
+            else:
+                heapq.heappushpop(frontier, entry)
+
+        pending: Dict[Future, Tuple[str, str, float]] = {
+            executor.submit(self.explore_path, path): (
+                "simulate",
+                path,
+                0.0,
+            )
+            for path in paths
+        }
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, path, parent_score = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Error while exploring path '{path}': {e}"
+                    )
+                    continue
+
+                if stage == "revise":
+                    # Revisions inherit their parent's score until simulated
+                    for revised_path in result:
+                        push(parent_score, revised_path)
+                    continue
+
+                _, score, error_info = result
+                if (
+                    self.early_stop_score is not None
+                    and score >= self.early_stop_score
+                ):
+                    logger.info(
+                        f"Path cleared early stop score {self.early_stop_score}: {path}"
+                    )
+                    for outstanding in pending:
+                        outstanding.cancel()
+                    # Running calls cannot be cancelled; let them finish
+                    wait(pending)
+                    return [path], path
+
+                if score < self.score_threshold:
+                    revision = executor.submit(
+                        self.reflect_and_revise, path, error_info
+                    )
+                    pending[revision] = ("revise", path, score)
+                else:
+                    push(score, path)
+
+        ranked = sorted(frontier, reverse=True)
+        return [path for _, _, path in ranked], None
+
     def select_promising_paths(self, paths: List[str]) -> List[str]:
         """
         Select the most promising reasoning paths from a list of candidates.
@@ -215,6 +368,17 @@ class IterativeReflectiveExpansion:
         logger.debug(f"Selected paths: {selected_paths}")
         return selected_paths
 
+    def cap_paths(self, paths: List[str]) -> List[str]:
+        """
+        Limit a list of paths to the configured branching factor.
+
+        :param paths: Candidate reasoning paths, most promising first.
+        :return: At most ``max_paths`` paths.
+        """
+        if self.max_paths is None:
+            return paths
+        return paths[: self.max_paths]
+
     def synthesize_solution(
         self, paths: List[str], memory_pool: List[str]
     ) -> str:
@@ -252,32 +416,34 @@ class IterativeReflectiveExpansion:
         logger.info(
             f"Starting iterative reflective expansion for problem: {task}"
         )
-        candidate_paths = self.generate_initial_hypotheses(task)
+        candidate_paths = self.cap_paths(
+            self.generate_initial_hypotheses(task)
+        )
         memory_pool: List[str] = []
 
-        for iteration in range(self.max_iterations):
-            logger.info(
-                f"Iteration {iteration + 1}/{self.max_iterations}"
-            )
-            expanded_paths: List[str] = []
-
-            for path in candidate_paths:
-                outcome, score, error_info = self.simulate_path(path)
-                # Use a threshold score of 0.7 (this can be adjusted)
-                if score < 0.7:
-                    feedback = self.meta_reflect(error_info)
-                    revised_paths = self.revise_path(path, feedback)
-                    expanded_paths.extend(revised_paths)
-                else:
-                    expanded_paths.append(path)
-
-            memory_pool.extend(candidate_paths)
-            candidate_paths = self.select_promising_paths(
-                expanded_paths
-            )
-            logger.info(
-                f"Candidate paths for next iteration: {candidate_paths}"
-            )
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for iteration in range(self.max_iterations):
+                logger.info(
+                    f"Iteration {iteration + 1}/{self.max_iterations}"
+                )
+                expanded_paths, winner = self.explore_paths(
+                    candidate_paths, executor
+                )
+
+                memory_pool.extend(candidate_paths)
+                if winner is not None:
+                    candidate_paths = expanded_paths
+                    break
+
+                candidate_paths = self.cap_paths(
+                    self.select_promising_paths(expanded_paths)
+                )
+                logger.info(
+                    f"Candidate paths for next iteration: {candidate_paths}"
+                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
         self.synthesize_solution(candidate_paths, memory_pool)
         logger.info("Final solution generated.")
@@ -1,41 +1,55 @@
+import asyncio
+import inspect
 import json
 import os
-import subprocess
-import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict, List, Optional
-
-from loguru import logger
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
 
 from swarms.structs.agent import Agent
+from swarms.utils.optional_dependencies import require
 
 
 def check_openai_package():
-    """Check if the OpenAI package is installed, and install it if not."""
-    try:
-        import openai
-
-        return openai
-    except ImportError:
-        logger.info(
-            "OpenAI package not found. Attempting to install..."
-        )
+    """
+    Import the OpenAI package.
+
+    Raises:
+        MissingDependencyError: If openai is not installed.
+    """
+    return require("openai", feature="OpenAIAssistant")
 
-        # Attempt to install the OpenAI package
-        try:
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", "openai"]
-            )
-            logger.info("OpenAI package installed successfully.")
-            import openai  # Re-import the package after installation
 
-            return openai
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install OpenAI package: {e}")
-            raise RuntimeError(
-                "OpenAI package installation failed."
-            ) from e
+TERMINAL_FAILURES = ("failed", "expired", "cancelled", "incomplete")
+
+
+def poll_delays(
+    initial: float = 0.25,
+    maximum: float = 3.0,
+    backoff: float = 1.5,
+) -> Iterator[float]:
+    """
+    Yield an adaptive polling schedule.
+
+    Short runs are picked up after a fraction of a second; long runs back
+    off geometrically until polls are ``maximum`` seconds apart.
+
+    Args:
+        initial (float): First delay in seconds.
+        maximum (float): Upper bound for a single delay.
+        backoff (float): Growth factor between delays.
+    """
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * backoff, maximum)
 
 
 class OpenAIAssistant(Agent):
@@ -63,6 +77,12 @@ class OpenAIAssistant(Agent):
         file_ids: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         functions: Optional[List[Dict[str, Any]]] = None,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 3.0,
+        poll_backoff: float = 1.5,
+        run_timeout: Optional[float] = 600.0,
+        client: Any = None,
+        async_client: Any = None,
         *args,
         **kwargs,
     ):
@@ -76,6 +96,12 @@ class OpenAIAssistant(Agent):
             file_ids: List of file IDs to attach
             metadata: Additional metadata
             functions: List of custom functions to make available
+            poll_interval: First delay between run status checks, in seconds
+            max_poll_interval: Longest delay between status checks, in seconds
+            poll_backoff: Growth factor applied to the delay after each check
+            run_timeout: Seconds to wait for a run before cancelling it (None waits forever)
+            client: Preconfigured ``openai.OpenAI`` client
+            async_client: Preconfigured ``openai.AsyncOpenAI`` client for ``arun``
         """
         self.name = name
         self.description = description
@@ -85,6 +111,10 @@ class OpenAIAssistant(Agent):
         self.file_ids = file_ids
         self.metadata = metadata
         self.functions = functions
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
+        self.run_timeout = run_timeout
 
         super().__init__(*args, **kwargs)
 
@@ -97,10 +127,13 @@ class OpenAIAssistant(Agent):
                 )
 
         # Create the OpenAI Assistant
-        openai = check_openai_package()
-        self.client = openai.OpenAI(
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        if client is None:
+            openai = check_openai_package()
+            client = openai.OpenAI(
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.client = client
+        self._async_client = async_client
         self.assistant = self.client.beta.assistants.create(
             name=name,
             instructions=instructions,
@@ -143,16 +176,58 @@ class OpenAIAssistant(Agent):
             assistant_id=self.assistant.id, tools=self.tools
         )
 
-    def _handle_tool_calls(self, run, thread_id: str) -> None:
+    @property
+    def async_client(self):
+        """The ``openai.AsyncOpenAI`` client used by ``arun``, created on first use."""
+        if self._async_client is None:
+            openai = check_openai_package()
+            self._async_client = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        return self._async_client
+
+    def _poll_delays(self) -> Iterator[float]:
+        return poll_delays(
+            self.poll_interval,
+            self.max_poll_interval,
+            self.poll_backoff,
+        )
+
+    def _deadline(self) -> Optional[float]:
+        if self.run_timeout is None:
+            return None
+        return time.monotonic() + self.run_timeout
+
+    def _function_calls(self, run) -> List[Any]:
+        """Return the function tool calls a run is waiting on."""
+        return [
+            tool_call
+            for tool_call in run.required_action.submit_tool_outputs.tool_calls
+            if tool_call.type == "function"
+            and tool_call.function.name in self.available_functions
+        ]
+
+    def _call_function(self, tool_call) -> Dict[str, str]:
+        """Execute one function tool call and format its output."""
+        function = self.available_functions[tool_call.function.name]
+        result = function(**json.loads(tool_call.function.arguments))
+        return {"tool_call_id": tool_call.id, "output": str(result)}
+
+    def _handle_tool_calls(
+        self, run, thread_id: str, deadline: Optional[float] = None
+    ) -> None:
         """Handle any required tool calls during a run.
 
         This method processes any tool calls required by the assistant during execution.
-        It extracts function calls, executes them with provided arguments, and submits
-        the results back to the assistant.
+        It extracts function calls, executes them with provided arguments (in parallel
+        when the assistant requests several at once), and submits the results back to
+        the assistant.
 
         Args:
             run: The current run object from the OpenAI API
             thread_id: ID of the current conversation thread
+            deadline: The run's ``time.monotonic()`` deadline, shared
+                with the wait loop that called this
 
         Returns:
             Updated run object after processing tool calls
@@ -161,30 +236,20 @@ class OpenAIAssistant(Agent):
             Exception: If there are errors executing the tool calls
         """
         while run.status == "requires_action":
-            tool_calls = (
-                run.required_action.submit_tool_outputs.tool_calls
-            )
-            tool_outputs = []
-
-            for tool_call in tool_calls:
-                if tool_call.type == "function":
-                    # Get function details
-                    function_name = tool_call.function.name
-                    function_args = json.loads(
-                        tool_call.function.arguments
+            tool_calls = self._function_calls(run)
+
+            if len(tool_calls) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=len(tool_calls)
+                ) as executor:
+                    tool_outputs = list(
+                        executor.map(self._call_function, tool_calls)
                     )
-
-                    # Call function if available
-                    if function_name in self.available_functions:
-                        function_response = self.available_functions[
-                            function_name
-                        ](**function_args)
-                        tool_outputs.append(
-                            {
-                                "tool_call_id": tool_call.id,
-                                "output": str(function_response),
-                            }
-                        )
+            else:
+                tool_outputs = [
+                    self._call_function(tool_call)
+                    for tool_call in tool_calls
+                ]
 
             # Submit outputs back to the run
             run = self.client.beta.threads.runs.submit_tool_outputs(
@@ -194,26 +259,36 @@ class OpenAIAssistant(Agent):
             )
 
             # Wait for processing
-            run = self._wait_for_run(run)
+            run = self._wait_for_run(run, deadline)
 
         return run
 
-    def _wait_for_run(self, run) -> Any:
+    def _wait_for_run(
+        self, run, deadline: Optional[float] = None
+    ) -> Any:
         """Wait for a run to complete and handle any required actions.
 
-        This method polls the OpenAI API to check the status of a run until it completes
-        or fails. It handles intermediate states like required actions and implements
-        exponential backoff.
+        This method polls the OpenAI API until the run completes or fails. Polls start
+        at ``poll_interval`` and back off to ``max_poll_interval``, so short runs return
+        quickly without hammering the API during long ones.
 
         Args:
             run: The run object to monitor
+            deadline: ``time.monotonic()`` deadline for the whole run.
+                Computed from ``run_timeout`` when omitted, and passed
+                through tool-call rounds so they cannot reset it.
 
         Returns:
             The completed run object
 
         Raises:
             Exception: If the run fails or expires
+            TimeoutError: If the run does not finish within ``run_timeout``
         """
+        if deadline is None:
+            deadline = self._deadline()
+        delays = self._poll_delays()
+
         while True:
             run = self.client.beta.threads.runs.retrieve(
                 thread_id=run.thread_id, run_id=run.id
@@ -222,15 +297,116 @@ class OpenAIAssistant(Agent):
             if run.status == "completed":
                 break
             elif run.status == "requires_action":
-                run = self._handle_tool_calls(run, run.thread_id)
+                run = self._handle_tool_calls(
+                    run, run.thread_id, deadline
+                )
                 if run.status == "completed":
                     break
-            elif run.status in ["failed", "expired"]:
+                delays = self._poll_delays()
+            elif run.status in TERMINAL_FAILURES:
                 raise Exception(
                     f"Run failed with status: {run.status}"
                 )
 
-            time.sleep(3)  # Wait 3 seconds before checking again
+            delay = next(delays)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.client.beta.threads.runs.cancel(
+                        thread_id=run.thread_id, run_id=run.id
+                    )
+                    raise TimeoutError(
+                        f"Run {run.id} did not finish within {self.run_timeout}s"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+        return run
+
+    async def _ahandle_tool_calls(
+        self, run, thread_id: str, deadline: Optional[float] = None
+    ) -> Any:
+        """Async ``_handle_tool_calls``; tool calls run concurrently.
+
+        Coroutine functions are awaited directly, plain functions run in worker
+        threads so they do not block the event loop.
+        """
+        while run.status == "requires_action":
+            tool_calls = self._function_calls(run)
+
+            async def call(tool_call):
+                function = self.available_functions[
+                    tool_call.function.name
+                ]
+                arguments = json.loads(tool_call.function.arguments)
+                if inspect.iscoroutinefunction(function):
+                    result = await function(**arguments)
+                else:
+                    result = await asyncio.to_thread(
+                        function, **arguments
+                    )
+                return {
+                    "tool_call_id": tool_call.id,
+                    "output": str(result),
+                }
+
+            tool_outputs = await asyncio.gather(
+                *(call(tool_call) for tool_call in tool_calls)
+            )
+
+            run = await self.async_client.beta.threads.runs.submit_tool_outputs(
+                thread_id=thread_id,
+                run_id=run.id,
+                tool_outputs=list(tool_outputs),
+            )
+            run = await self._await_run(run, deadline)
+
+        return run
+
+    async def _await_run(
+        self, run, deadline: Optional[float] = None
+    ) -> Any:
+        """Async ``_wait_for_run``: polls with ``asyncio.sleep`` so many runs share one loop.
+
+        Raises:
+            Exception: If the run fails or expires
+            TimeoutError: If the run does not finish within ``run_timeout``
+        """
+        if deadline is None:
+            deadline = self._deadline()
+        delays = self._poll_delays()
+
+        while True:
+            run = await self.async_client.beta.threads.runs.retrieve(
+                thread_id=run.thread_id, run_id=run.id
+            )
+
+            if run.status == "completed":
+                break
+            elif run.status == "requires_action":
+                run = await self._ahandle_tool_calls(
+                    run, run.thread_id, deadline
+                )
+                if run.status == "completed":
+                    break
+                delays = self._poll_delays()
+            elif run.status in TERMINAL_FAILURES:
+                raise Exception(
+                    f"Run failed with status: {run.status}"
+                )
+
+            delay = next(delays)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    await self.async_client.beta.threads.runs.cancel(
+                        thread_id=run.thread_id, run_id=run.id
+                    )
+                    raise TimeoutError(
+                        f"Run {run.id} did not finish within {self.run_timeout}s"
+                    )
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
 
         return run
 
@@ -314,6 +490,55 @@ class OpenAIAssistant(Agent):
             return self._get_response()
         return ""
 
+    async def arun(self, task: str, *args, **kwargs) -> str:
+        """Run a task asynchronously on its own thread.
+
+        Unlike ``run``, each call creates and uses a local thread, so many
+        ``arun`` calls can be awaited concurrently on one event loop.
+
+        Args:
+            task: The task or prompt to send to the assistant
+
+        Returns:
+            The assistant's response as a string
+        """
+        client = self.async_client
+        thread = await client.beta.threads.create()
+        await client.beta.threads.messages.create(
+            thread_id=thread.id, role="user", content=task
+        )
+
+        run = await client.beta.threads.runs.create(
+            thread_id=thread.id,
+            assistant_id=self.assistant.id,
+            instructions=self.instructions,
+        )
+        run = await self._await_run(run)
+
+        if run.status != "completed":
+            return ""
+
+        messages = await client.beta.threads.messages.list(
+            thread_id=thread.id, order="desc", limit=1
+        )
+        if not messages.data:
+            return ""
+
+        message = messages.data[0]
+        if message.role == "assistant":
+            return message.content[0].text.value
+        return ""
+
+    async def arun_concurrently(
+        self, tasks: List[str], *args, **kwargs
+    ) -> List[str]:
+        """Await several tasks at once on the current event loop."""
+        return list(
+            await asyncio.gather(
+                *(self.arun(task, *args, **kwargs) for task in tasks)
+            )
+        )
+
     def call(self, task: str, *args, **kwargs) -> str:
         """Alias for run() to maintain compatibility with different agent interfaces."""
         return self.run(task, *args, **kwargs)
@@ -1,4 +1,11 @@
-from swarms.artifacts.main_artifact import Artifact
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "Artifact": "swarms.artifacts.main_artifact",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "Artifact",
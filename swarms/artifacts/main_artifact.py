@@ -1,39 +1,19 @@
 import json
 import os
-import subprocess
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Union
 
 from pydantic import BaseModel, Field
 from pydantic.v1 import validator
 
+from swarms.artifacts.version_store import FileVersion, VersionStore
 from swarms.utils.file_processing import create_file_in_folder
 from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.optional_dependencies import require
 
 logger = initialize_logger(log_folder="main_artifact")
 
 
-class FileVersion(BaseModel):
-    """
-    Represents a version of the file with its content and timestamp.
-    """
-
-    version_number: int = Field(
-        ..., description="The version number of the file"
-    )
-    content: str = Field(
-        ..., description="The content of the file version"
-    )
-    timestamp: str = Field(
-        time.strftime("%Y-%m-%d %H:%M:%S"),
-        description="The timestamp of the file version",
-    )
-
-    def __str__(self) -> str:
-        return f"Version {self.version_number} (Timestamp: {self.timestamp}):\n{self.content}"
-
-
 class Artifact(BaseModel):
     """
     Represents a file artifact.
@@ -43,7 +23,8 @@ class Artifact(BaseModel):
         file_path (str): The path to the file.
         file_type (str): The type of the file.
         contents (str): The contents of the file.
-        versions (List[FileVersion]): The list of file versions.
+        versions (VersionStore): The file versions, stored as periodic full
+            snapshots plus diffs. Behaves like a list of FileVersion.
         edit_count (int): The number of times the file has been edited.
     """
 
@@ -60,7 +41,7 @@ class Artifact(BaseModel):
     contents: str = Field(
         ..., description="The contents of the file in string format"
     )
-    versions: List[FileVersion] = Field(default_factory=list)
+    versions: VersionStore = Field(default_factory=VersionStore)
     edit_count: int = Field(
         ...,
         description="The number of times the file has been edited",
@@ -167,10 +148,7 @@ class Artifact(BaseModel):
         """
         Retrieves a specific version of the artifact by its version number.
         """
-        for version in self.versions:
-            if version.version_number == version_number:
-                return version
-        return None
+        return self.versions.get(version_number)
 
     def get_contents(self) -> str:
         """
@@ -209,12 +187,61 @@ class Artifact(BaseModel):
         """
         with open(file_path, "r") as json_file:
             data = json.load(json_file)
-        # Convert timestamp strings back to datetime objects
-        for version in data["versions"]:
-            version["timestamp"] = datetime.fromisoformat(
-                version["timestamp"]
+        return cls.from_dict(data)
+
+    def log_versions(self, file_path: str) -> None:
+        """
+        Streams the version history to a JSONL file.
+
+        Writes the existing versions, then appends one line per future edit
+        instead of rewriting the whole history.
+
+        Args:
+            file_path (str): The path to the JSONL file.
+        """
+        self.versions.write_jsonl(file_path)
+        self.versions.log_path = file_path
+
+    @classmethod
+    def load_versions(
+        cls, log_path: str, file_path: str, **kwargs
+    ) -> "Artifact":
+        """
+        Rebuilds an artifact from a JSONL version log.
+
+        Args:
+            log_path (str): The JSONL file written by ``log_versions``.
+            file_path (str): The path of the artifact's file. ``save``
+                writes here, never to ``log_path``.
+            **kwargs: Other artifact fields. ``file_type`` defaults to the
+                extension of ``file_path``.
+
+        Returns:
+            Artifact: The artifact at its latest version.
+
+        Raises:
+            ValueError: If ``file_path`` is the log itself, or it has no
+                extension and no ``file_type`` is given.
+        """
+        if os.path.abspath(file_path) == os.path.abspath(log_path):
+            raise ValueError(
+                "file_path must differ from the version log path"
             )
-        return cls(**data)
+        if not kwargs.get("file_type"):
+            _, ext = os.path.splitext(file_path)
+            if not ext:
+                raise ValueError(
+                    f"Pass file_type; it cannot be inferred from {file_path}"
+                )
+            kwargs["file_type"] = ext
+
+        versions = VersionStore.read_jsonl(log_path)
+        latest = versions[-1] if len(versions) else None
+        kwargs.setdefault(
+            "contents", latest.content if latest else ""
+        )
+        kwargs.setdefault("edit_count", max(len(versions) - 1, 0))
+        return cls(file_path=file_path, versions=versions, **kwargs)
 
     def get_metrics(self) -> str:
         """
@@ -244,12 +271,7 @@ class Artifact(BaseModel):
         Creates an artifact instance from a dictionary representation.
         """
         try:
-            # Convert timestamp strings back to datetime objects if necessary
-            for version in data.get("versions", []):
-                if isinstance(version["timestamp"], str):
-                    version["timestamp"] = datetime.fromisoformat(
-                        version["timestamp"]
-                    )
+            # Versions may be a compact VersionStore dict or a legacy list
             return cls(**data)
         except Exception as e:
             logger.error(f"Error creating artifact from dict: {e}")
@@ -305,14 +327,9 @@ class Artifact(BaseModel):
         """
         Helper method to save content as PDF using reportlab
         """
-        try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-        except ImportError as e:
-            logger.error(f"Error importing reportlab: {e}")
-            subprocess.run(["pip", "install", "reportlab"])
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
+        require("reportlab", feature="Artifact PDF export")
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
 
         c = canvas.Canvas(output_path, pagesize=letter)
         # Split content into lines
@@ -0,0 +1,333 @@
+"""
+Delta-compressed version history for artifacts.
+
+Every ``snapshot_interval``-th version is stored in full; the versions in
+between are stored as line diffs against the previous version. Lookups by
+version number are O(1) dictionary hits, and old versions are materialized
+lazily by replaying at most ``snapshot_interval - 1`` diffs from the nearest
+snapshot (with a small LRU cache of materialized contents).
+
+Records are plain JSON objects, so a history can be written as JSONL and
+appended to one line per version while an agent keeps editing:
+
+    {"v": 1, "t": "2025-01-01 12:00:00", "full": "..."}
+    {"v": 2, "t": "2025-01-01 12:01:00", "ops": [[0, 12], "new line\\n"]}
+
+In ``ops``, ``[start, end]`` copies lines ``start:end`` of the previous
+version and a string inserts literal text.
+"""
+
+import difflib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+from pydantic_core import core_schema
+
+
+class FileVersion(BaseModel):
+    """
+    Represents a version of the file with its content and timestamp.
+    """
+
+    version_number: int = Field(
+        ..., description="The version number of the file"
+    )
+    content: str = Field(
+        ..., description="The content of the file version"
+    )
+    timestamp: str = Field(
+        time.strftime("%Y-%m-%d %H:%M:%S"),
+        description="The timestamp of the file version",
+    )
+
+    def __str__(self) -> str:
+        return f"Version {self.version_number} (Timestamp: {self.timestamp}):\n{self.content}"
+
+
+def compute_delta(old: str, new: str) -> List[Union[List[int], str]]:
+    """
+    Encode ``new`` as line operations against ``old``.
+
+    Args:
+        old (str): The previous content.
+        new (str): The new content.
+
+    Returns:
+        List[Union[List[int], str]]: ``[start, end]`` copies lines of ``old``;
+        a string inserts text.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(
+        None, old_lines, new_lines, autojunk=False
+    )
+
+    ops: List[Union[List[int], str]] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_delta(
+    old: str, ops: Sequence[Union[List[int], str]]
+) -> str:
+    """Rebuild content from ``old`` and operations from ``compute_delta``."""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            start, end = op
+            parts.extend(old_lines[start:end])
+    return "".join(parts)
+
+
+class VersionStore:
+    """
+    List-like, delta-compressed sequence of ``FileVersion`` objects.
+
+    Supports ``len``, iteration, indexing and slicing like the plain list it
+    replaces, plus O(1) ``get(version_number)``.
+
+    Args:
+        snapshot_interval (int): Store a full copy every N versions.
+        cache_size (int): Number of materialized versions kept in memory.
+        log_path (Optional[str]): JSONL file each new version is appended to.
+    """
+
+    def __init__(
+        self,
+        snapshot_interval: int = 10,
+        cache_size: int = 8,
+        log_path: Optional[str] = None,
+    ):
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+
+        self.snapshot_interval = snapshot_interval
+        self.cache_size = cache_size
+        self.log_path = log_path
+
+        self._records: List[Dict[str, Any]] = []
+        self._positions: Dict[int, int] = {}
+        self._since_snapshot = 0
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled or deep-copied; recreate on restore
+        state = self.__dict__.copy()
+        state.pop("_lock", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[FileVersion]:
+        for position in range(len(self._records)):
+            yield self._version_at(position)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self._version_at(position)
+                for position in range(len(self._records))[index]
+            ]
+        if index < 0:
+            index += len(self._records)
+        if not 0 <= index < len(self._records):
+            raise IndexError("version index out of range")
+        return self._version_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, VersionStore):
+            return self._records == other._records
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"VersionStore(versions={len(self)}, snapshot_interval={self.snapshot_interval})"
+
+    # Writing
+
+    def append(self, version: FileVersion) -> None:
+        """Add a version, storing it as a diff unless a snapshot is due."""
+        with self._lock:
+            record: Dict[str, Any] = {
+                "v": version.version_number,
+                "t": str(version.timestamp),
+            }
+
+            if (
+                not self._records
+                or self._since_snapshot + 1 >= self.snapshot_interval
+            ):
+                record["full"] = version.content
+            else:
+                ops = compute_delta(
+                    self._content_at(len(self._records) - 1),
+                    version.content,
+                )
+                # Rewrites can make a diff larger than the text itself
+                if len(json.dumps(ops)) < len(version.content):
+                    record["ops"] = ops
+                else:
+                    record["full"] = version.content
+
+            self._add_record(record)
+            self._remember(len(self._records) - 1, version.content)
+
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+
+    def extend(self, versions: Sequence[FileVersion]) -> None:
+        """Add several versions in order."""
+        for version in versions:
+            self.append(version)
+
+    def _add_record(self, record: Dict[str, Any]) -> None:
+        self._positions[record["v"]] = len(self._records)
+        self._records.append(record)
+        self._since_snapshot = (
+            0 if "full" in record else self._since_snapshot + 1
+        )
+
+    # Reading
+
+    def get(self, version_number: int) -> Optional[FileVersion]:
+        """Return the version with ``version_number`` in O(1), or None."""
+        position = self._positions.get(version_number)
+        if position is None:
+            return None
+        return self._version_at(position)
+
+    def _version_at(self, position: int) -> FileVersion:
+        record = self._records[position]
+        return FileVersion(
+            version_number=record["v"],
+            content=self._content_at(position),
+            timestamp=record["t"],
+        )
+
+    def _content_at(self, position: int) -> str:
+        with self._lock:
+            if position in self._cache:
+                self._cache.move_to_end(position)
+                return self._cache[position]
+
+            # Walk back to the nearest snapshot or cached version
+            start = position
+            while (
+                "full" not in self._records[start]
+                and start not in self._cache
+            ):
+                start -= 1
+
+            content = self._cache.get(start)
+            if content is None:
+                content = self._records[start]["full"]
+            for step in range(start + 1, position + 1):
+                record = self._records[step]
+                content = (
+                    record["full"]
+                    if "full" in record
+                    else apply_delta(content, record["ops"])
+                )
+
+            self._remember(position, content)
+            return content
+
+    def _remember(self, position: int, content: str) -> None:
+        self._cache[position] = content
+        self._cache.move_to_end(position)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # Serialization
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Compact JSON-serializable form: one snapshot or diff per version."""
+        return [dict(record) for record in self._records]
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[Dict[str, Any]],
+        snapshot_interval: int = 10,
+        **kwargs,
+    ) -> "VersionStore":
+        """Rebuild a store from records produced by ``to_records`` or JSONL."""
+        store = cls(snapshot_interval=snapshot_interval, **kwargs)
+        for record in records:
+            store._add_record(dict(record))
+        return store
+
+    def write_jsonl(self, path: str) -> None:
+        """Write every record to ``path``, one JSON object per line."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self._records:
+                f.write(json.dumps(record) + "\n")
+
+    @classmethod
+    def read_jsonl(cls, path: str, **kwargs) -> "VersionStore":
+        """Load a store from a JSONL file written by ``write_jsonl`` or ``log_path``."""
+        with open(path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        return cls.from_records(records, **kwargs)
+
+    @classmethod
+    def validate(cls, value: Any) -> "VersionStore":
+        """Coerce a store, its records or a legacy list of full versions."""
+        if isinstance(value, VersionStore):
+            return value
+
+        items = list(value or [])
+        if items and isinstance(items[0], dict) and "v" in items[0]:
+            return cls.from_records(items)
+
+        store = cls()
+        for item in items:
+            if isinstance(item, dict):
+                item = dict(item)
+                if "timestamp" in item:
+                    item["timestamp"] = str(item["timestamp"])
+                item = FileVersion(**item)
+            store.append(item)
+        return store
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda store: store.to_records()
+            ),
+        )
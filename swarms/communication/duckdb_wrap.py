@@ -14,6 +14,7 @@ from swarms.communication.base_communication import (
     Message,
     MessageType,
 )
+from swarms.utils.optional_dependencies import require
 
 try:
     from loguru import logger
@@ -75,36 +76,9 @@ class DuckDBConversation(BaseCommunication):
         *args,
         **kwargs,
     ):
-        # Lazy load duckdb with auto-installation
-        try:
-            import duckdb
-
-            self.duckdb = duckdb
-            self.duckdb_available = True
-        except ImportError:
-            # Auto-install duckdb if not available
-            print("📦 DuckDB not found. Installing automatically...")
-            try:
-                import subprocess
-                import sys
-
-                # Install duckdb
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", "duckdb"]
-                )
-                print("✅ DuckDB installed successfully!")
-
-                # Try importing again
-                import duckdb
-
-                self.duckdb = duckdb
-                self.duckdb_available = True
-                print("✅ DuckDB loaded successfully!")
-
-            except Exception as e:
-                raise ImportError(
-                    f"Failed to auto-install DuckDB. Please install manually with 'pip install duckdb': {e}"
-                )
+        # Lazy load duckdb; fails fast if it is not installed
+        self.duckdb = require("duckdb", feature="DuckDBConversation")
+        self.duckdb_available = True
 
         super().__init__(
             system_prompt=system_prompt,
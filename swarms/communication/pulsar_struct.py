@@ -10,6 +10,10 @@ from swarms.communication.base_communication import (
     Message,
     MessageType,
 )
+from swarms.utils.optional_dependencies import (
+    MissingDependencyError,
+    require,
+)
 
 
 class PulsarConnectionError(Exception):
@@ -30,7 +34,7 @@ class PulsarConversation(BaseCommunication):
     Uses Apache Pulsar for message storage and retrieval.
 
     Attributes:
-        client (pulsar.Client): The Pulsar client instance
+        client (self.pulsar.Client): The Pulsar client instance
         producer (pulsar.Producer): The Pulsar producer for sending messages
         consumer (pulsar.Consumer): The Pulsar consumer for receiving messages
         topic (str): The Pulsar topic name
@@ -63,48 +67,16 @@ class PulsarConversation(BaseCommunication):
         **kwargs,
     ):
         """Initialize the Pulsar conversation interface."""
-        # Lazy load Pulsar with auto-installation
+        # Lazy load Pulsar; fails fast if pulsar-client is missing
         try:
-            import pulsar
-
-            self.pulsar = pulsar
-            self.pulsar_available = True
-        except ImportError:
-            # Auto-install pulsar-client if not available
-            print(
-                "📦 Pulsar client not found. Installing automatically..."
+            self.pulsar = require(
+                "pulsar", feature="PulsarConversation"
             )
-            try:
-                import subprocess
-                import sys
-
-                # Install pulsar-client
-                subprocess.check_call(
-                    [
-                        sys.executable,
-                        "-m",
-                        "pip",
-                        "install",
-                        "pulsar-client",
-                    ]
-                )
-                print("✅ Pulsar client installed successfully!")
-
-                # Try importing again
-                import pulsar
-
-                self.pulsar = pulsar
-                self.pulsar_available = True
-                print("✅ Pulsar loaded successfully!")
-
-            except Exception as e:
-                self.pulsar_available = False
-                logger.error(
-                    f"Failed to auto-install Pulsar client. Please install manually with 'pip install pulsar-client': {e}"
-                )
-                raise ImportError(
-                    f"Failed to auto-install Pulsar client. Please install manually with 'pip install pulsar-client': {e}"
-                )
+            self.pulsar_available = True
+        except MissingDependencyError as e:
+            self.pulsar_available = False
+            logger.error(str(e))
+            raise
 
         logger.info(
             f"Initializing PulsarConversation with host: {pulsar_host}"
@@ -119,7 +91,7 @@ class PulsarConversation(BaseCommunication):
             logger.debug(
                 f"Connecting to Pulsar broker at {pulsar_host}"
             )
-            self.client = pulsar.Client(pulsar_host)
+            self.client = self.pulsar.Client(pulsar_host)
 
             logger.debug(f"Creating producer for topic: {self.topic}")
             self.producer = self.client.create_producer(self.topic)
@@ -132,7 +104,7 @@ class PulsarConversation(BaseCommunication):
             )
             logger.info("Successfully connected to Pulsar broker")
 
-        except pulsar.ConnectError as e:
+        except self.pulsar.ConnectError as e:
             error_msg = f"Failed to connect to Pulsar broker at {pulsar_host}: {str(e)}"
             logger.error(error_msg)
             raise PulsarConnectionError(error_msg)
@@ -221,7 +193,7 @@ class PulsarConversation(BaseCommunication):
             )
             return message["id"]
 
-        except pulsar.ConnectError as e:
+        except self.pulsar.ConnectError as e:
             error_msg = f"Failed to send message to Pulsar: Connection error: {str(e)}"
             logger.error(error_msg)
             raise PulsarConnectionError(error_msg)
@@ -258,7 +230,7 @@ class PulsarConversation(BaseCommunication):
                     msg = self.consumer.receive(timeout_millis=1000)
                     messages.append(json.loads(msg.data()))
                     self.consumer.acknowledge(msg)
-                except pulsar.Timeout:
+                except self.pulsar.Timeout:
                     break  # No more messages available
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to decode message: {e}")
@@ -273,7 +245,7 @@ class PulsarConversation(BaseCommunication):
 
             return messages
 
-        except pulsar.ConnectError as e:
+        except self.pulsar.ConnectError as e:
             error_msg = f"Failed to receive messages from Pulsar: Connection error: {str(e)}"
             logger.error(error_msg)
             raise PulsarConnectionError(error_msg)
@@ -410,7 +382,7 @@ class PulsarConversation(BaseCommunication):
                 f"Successfully cleared conversation. New ID: {self.conversation_id}"
             )
 
-        except pulsar.ConnectError as e:
+        except self.pulsar.ConnectError as e:
             error_msg = f"Failed to clear conversation: Connection error: {str(e)}"
             logger.error(error_msg)
             raise PulsarConnectionError(error_msg)
@@ -706,7 +678,7 @@ class PulsarConversation(BaseCommunication):
                     msg = self.consumer.receive(timeout_millis=1000)
                     self.consumer.acknowledge(msg)
                     health["consumer_active"] = True
-                except pulsar.Timeout:
+                except self.pulsar.Timeout:
                     pass
 
             logger.info(f"Health check results: {health}")
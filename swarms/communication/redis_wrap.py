@@ -17,12 +17,15 @@ from swarms.structs.base_structure import BaseStructure
 from swarms.utils.any_to_str import any_to_str
 from swarms.utils.formatter import formatter
 from swarms.utils.litellm_tokenizer import count_tokens
+from swarms.utils.optional_dependencies import (
+    MissingDependencyError,
+    is_available,
+)
 
-# Module-level variable to track Redis availability
-REDIS_AVAILABLE = False
+# Redis is optional: probe for it without installing anything at import
+REDIS_AVAILABLE = is_available("redis")
 
-# Try to import Redis and set availability flag
-try:
+if REDIS_AVAILABLE:
     import redis
     from redis.exceptions import (
         AuthenticationError,
@@ -32,39 +35,6 @@ try:
         TimeoutError,
     )
 
-    REDIS_AVAILABLE = True
-except ImportError:
-    # Auto-install Redis at import time
-    print("📦 Redis not found. Installing automatically...")
-    try:
-        import subprocess
-        import sys
-
-        # Install redis
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "redis"]
-        )
-        print("✅ Redis installed successfully!")
-
-        # Try importing again
-        import redis
-        from redis.exceptions import (
-            AuthenticationError,
-            BusyLoadingError,
-            ConnectionError,
-            RedisError,
-            TimeoutError,
-        )
-
-        REDIS_AVAILABLE = True
-        print("✅ Redis loaded successfully!")
-
-    except Exception as e:
-        REDIS_AVAILABLE = False
-        print(
-            f"❌ Failed to auto-install Redis. Please install manually with 'pip install redis': {e}"
-        )
-
 
 class RedisConnectionError(Exception):
     """Custom exception for Redis connection errors."""
@@ -337,11 +307,9 @@ class RedisConversation(BaseStructure):
         """
         global REDIS_AVAILABLE
 
-        # Check if Redis is available (should be True after module import auto-installation)
         if not REDIS_AVAILABLE:
-            raise ImportError(
-                "Redis is not available. Module-level auto-installation failed. "
-                "Please install manually with 'pip install redis'"
+            raise MissingDependencyError(
+                "redis", feature="RedisConversation"
             )
 
         self.redis_available = True
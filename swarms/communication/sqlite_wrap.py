@@ -13,6 +13,11 @@ from swarms.communication.base_communication import (
     Message,
     MessageType,
 )
+from swarms.utils.message_index import (
+    Since,
+    fts5_query,
+    normalize_since,
+)
 from typing import Callable
 
 try:
@@ -154,8 +159,76 @@ class SQLiteConversation(BaseCommunication):
                 )
             """
             )
+            # Secondary indexes for role and time filters
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_role "
+                f"ON {self.table_name} (conversation_id, role)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_time "
+                f"ON {self.table_name} (conversation_id, timestamp)"
+            )
+            self.fts_enabled = self._init_fts(cursor)
             conn.commit()
 
+    def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index over message content, kept in sync by triggers.
+
+        Returns:
+            bool: False if this SQLite build lacks FTS5, in which case
+            searches fall back to ``LIKE``.
+        """
+        fts = f"{self.table_name}_fts"
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (fts,),
+        ).fetchone()
+        try:
+            cursor.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    content,
+                    content='{self.table_name}',
+                    content_rowid='id'
+                )
+            """
+            )
+        except sqlite3.OperationalError as e:
+            if self.enable_logging:
+                self.logger.warning(
+                    f"FTS5 unavailable, search will scan messages: {e}"
+                )
+            return False
+
+        cursor.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_insert
+            AFTER INSERT ON {self.table_name} BEGIN
+                INSERT INTO {fts} (rowid, content)
+                VALUES (new.id, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS {fts}_delete
+            AFTER DELETE ON {self.table_name} BEGIN
+                INSERT INTO {fts} ({fts}, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS {fts}_update
+            AFTER UPDATE OF content ON {self.table_name} BEGIN
+                INSERT INTO {fts} ({fts}, rowid, content)
+                VALUES ('delete', old.id, old.content);
+                INSERT INTO {fts} (rowid, content)
+                VALUES (new.id, new.content);
+            END;
+            """
+        )
+        if not exists:
+            # Index messages stored before the FTS table existed
+            cursor.execute(
+                f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')"
+            )
+        return True
+
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections with retry logic."""
@@ -408,25 +481,76 @@ class SQLiteConversation(BaseCommunication):
             conn.commit()
             return cursor.rowcount > 0
 
-    def search_messages(self, query: str) -> List[Dict]:
+    def search_messages(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+        ranked: bool = False,
+    ) -> List[Dict]:
         """
-        Search for messages containing specific text in the current conversation.
+        Search messages in the current conversation.
+
+        By default this returns messages whose content contains ``query``
+        (SQL ``LIKE``), oldest first. With ``ranked=True`` every word in
+        ``query`` must appear in a message (``word*`` matches a prefix);
+        matches come from the FTS5 index ranked by BM25, best first, and
+        the ``score`` column holds the relevance (higher is better).
+        Without query words, ranked searches return messages newest first.
 
         Args:
-            query (str): Text to search for
+            query (str): Text, or words, to search for
+            role (Optional[str]): Only messages from this role
+            since (Since): Only messages timestamped at or after this
+                datetime, ISO-8601 string or Unix time
+            limit (Optional[int]): Maximum number of messages to return
+            ranked (bool): Full-text search ranked by relevance
 
         Returns:
             List[Dict]: List of matching messages
         """
+        conditions = ["t.conversation_id = ?"]
+        params: List[Any] = [self.current_conversation_id]
+        if role is not None:
+            conditions.append("t.role = ?")
+            params.append(role)
+        if since is not None:
+            conditions.append("t.timestamp >= ?")
+            params.append(normalize_since(since))
+
+        match = fts5_query(query) if ranked else None
+        fts = f"{self.table_name}_fts"
+        if match and self.fts_enabled:
+            sql = f"""
+                SELECT t.*, -bm25({fts}) AS score
+                FROM {fts} JOIN {self.table_name} t ON t.id = {fts}.rowid
+                WHERE {fts} MATCH ? AND {" AND ".join(conditions)}
+                ORDER BY score DESC, t.id ASC
+            """
+            params.insert(0, match)
+        else:
+            if match:
+                # FTS5 unavailable: match each word as a substring
+                for word in query.split():
+                    conditions.append("t.content LIKE ?")
+                    params.append(f"%{word.rstrip('*')}%")
+            elif query:
+                conditions.append("t.content LIKE ?")
+                params.append(f"%{query}%")
+            score = ", 0.0 AS score" if ranked else ""
+            sql = f"""
+                SELECT t.*{score} FROM {self.table_name} t
+                WHERE {" AND ".join(conditions)}
+                ORDER BY t.id {"DESC" if ranked else "ASC"}
+            """
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                SELECT * FROM {self.table_name}
-                WHERE conversation_id = ? AND content LIKE ?
-            """,
-                (self.current_conversation_id, f"%{query}%"),
-            )
+            cursor.execute(sql, params)
             return [dict(row) for row in cursor.fetchall()]
 
     def get_statistics(self) -> Dict:
@@ -880,9 +1004,22 @@ class SQLiteConversation(BaseCommunication):
                 "token_count": row["token_count"],
             }
 
-    def search(self, keyword: str) -> List[Dict]:
+    def search(
+        self,
+        keyword: str,
+        role: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+        ranked: bool = False,
+    ) -> List[Dict]:
         """Search for messages containing a keyword."""
-        return self.search_messages(keyword)
+        return self.search_messages(
+            keyword,
+            role=role,
+            since=since,
+            limit=limit,
+            ranked=ranked,
+        )
 
     def display_conversation(self, detailed: bool = False):
         """Display the conversation history."""
@@ -12,6 +12,10 @@ from swarms.communication.base_communication import (
     Message,
     MessageType,
 )
+from swarms.utils.optional_dependencies import (
+    MissingDependencyError,
+    require,
+)
 
 # Try to import loguru logger, fallback to standard logging
 try:
@@ -93,51 +97,20 @@ class SupabaseConversation(BaseCommunication):
         *args,
         **kwargs,
     ):
-        # Lazy load Supabase with auto-installation
+        # Lazy load Supabase; fails fast if it is not installed
         try:
-            from supabase import Client, create_client
-
-            self.supabase_client = Client
-            self.create_client = create_client
-            self.supabase_available = True
-        except ImportError:
-            # Auto-install supabase if not available
-            print(
-                "📦 Supabase not found. Installing automatically..."
+            supabase = require(
+                "supabase", feature="SupabaseConversation"
             )
-            try:
-                import subprocess
-                import sys
-
-                # Install supabase
-                subprocess.check_call(
-                    [
-                        sys.executable,
-                        "-m",
-                        "pip",
-                        "install",
-                        "supabase",
-                    ]
-                )
-                print("✅ Supabase installed successfully!")
-
-                # Try importing again
-                from supabase import Client, create_client
-
-                self.supabase_client = Client
-                self.create_client = create_client
-                self.supabase_available = True
-                print("✅ Supabase loaded successfully!")
+        except MissingDependencyError as e:
+            self.supabase_available = False
+            if logger:
+                logger.error(str(e))
+            raise
 
-            except Exception as e:
-                self.supabase_available = False
-                if logger:
-                    logger.error(
-                        f"Failed to auto-install Supabase. Please install manually with 'pip install supabase': {e}"
-                    )
-                raise ImportError(
-                    f"Failed to auto-install Supabase. Please install manually with 'pip install supabase': {e}"
-                )
+        self.supabase_client = supabase.Client
+        self.create_client = supabase.create_client
+        self.supabase_available = True
 
         # Store initialization parameters - BaseCommunication.__init__ is just pass
         self.system_prompt = system_prompt
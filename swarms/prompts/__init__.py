@@ -1,13 +1,18 @@
-from swarms.prompts.code_interpreter import CODE_INTERPRETER
-from swarms.prompts.documentation import DOCUMENTATION_WRITER_SOP
-from swarms.prompts.finance_agent_prompt import FINANCE_AGENT_PROMPT
-from swarms.prompts.growth_agent_prompt import GROWTH_AGENT_PROMPT
-from swarms.prompts.legal_agent_prompt import LEGAL_AGENT_PROMPT
-from swarms.prompts.operations_agent_prompt import (
-    OPERATIONS_AGENT_PROMPT,
-)
-from swarms.prompts.product_agent_prompt import PRODUCT_AGENT_PROMPT
-from swarms.prompts.prompt import Prompt
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "CODE_INTERPRETER": "swarms.prompts.code_interpreter",
+    "DOCUMENTATION_WRITER_SOP": "swarms.prompts.documentation",
+    "FINANCE_AGENT_PROMPT": "swarms.prompts.finance_agent_prompt",
+    "GROWTH_AGENT_PROMPT": "swarms.prompts.growth_agent_prompt",
+    "LEGAL_AGENT_PROMPT": "swarms.prompts.legal_agent_prompt",
+    "OPERATIONS_AGENT_PROMPT": "swarms.prompts.operations_agent_prompt",
+    "PRODUCT_AGENT_PROMPT": "swarms.prompts.product_agent_prompt",
+    "Prompt": "swarms.prompts.prompt",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "CODE_INTERPRETER",
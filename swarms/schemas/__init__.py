@@ -1,8 +1,14 @@
-from swarms.schemas.agent_step_schemas import Step, ManySteps
-from swarms.schemas.mcp_schemas import (
-    MCPConnection,
-    MultipleMCPConnections,
-)
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "Step": "swarms.schemas.agent_step_schemas",
+    "ManySteps": "swarms.schemas.agent_step_schemas",
+    "MCPConnection": "swarms.schemas.mcp_schemas",
+    "MultipleMCPConnections": "swarms.schemas.mcp_schemas",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "Step",
@@ -1,89 +1,81 @@
-from swarms.structs.agent import Agent
-from swarms.structs.agent_builder import AgentsBuilder
-from swarms.structs.auto_swarm_builder import AutoSwarmBuilder
-from swarms.structs.base_structure import BaseStructure
-from swarms.structs.base_swarm import BaseSwarm
-from swarms.structs.base_workflow import BaseWorkflow
-from swarms.structs.batch_agent_execution import batch_agent_execution
-from swarms.structs.concurrent_workflow import ConcurrentWorkflow
-from swarms.structs.conversation import Conversation
-from swarms.structs.council_judge import CouncilAsAJudge
-from swarms.structs.de_hallucination_swarm import DeHallucinationSwarm
-from swarms.structs.deep_research_swarm import DeepResearchSwarm
-from swarms.structs.graph_workflow import (
-    Edge,
-    GraphWorkflow,
-    Node,
-    NodeType,
-)
-from swarms.structs.groupchat import (
-    GroupChat,
-    expertise_based,
-)
-from swarms.structs.hybrid_hiearchical_peer_swarm import (
-    HybridHierarchicalClusterSwarm,
-)
-from swarms.structs.ma_blocks import (
-    aggregate,
-    find_agent_by_name,
-    run_agent,
-)
-from swarms.structs.majority_voting import (
-    MajorityVoting,
-    majority_voting,
-    most_frequent,
-    parse_code_completion,
-)
-from swarms.structs.malt import MALT
-from swarms.structs.meme_agent_persona_generator import (
-    MemeAgentGenerator,
-)
-from swarms.structs.mixture_of_agents import MixtureOfAgents
-from swarms.structs.model_router import ModelRouter
-from swarms.structs.multi_agent_exec import (
-    get_agents_info,
-    get_swarms_info,
-    run_agent_with_timeout,
-    run_agents_concurrently,
-    run_agents_concurrently_async,
-    run_agents_concurrently_multiprocess,
-    run_agents_sequentially,
-    run_agents_with_different_tasks,
-    run_agents_with_resource_monitoring,
-    run_agents_with_tasks_concurrently,
-    run_single_agent,
-)
-from swarms.structs.multi_agent_router import MultiAgentRouter
-from swarms.structs.rearrange import AgentRearrange, rearrange
-from swarms.structs.round_robin import RoundRobinSwarm
-from swarms.structs.sequential_workflow import SequentialWorkflow
-from swarms.structs.spreadsheet_swarm import SpreadSheetSwarm
-from swarms.structs.swarm_arange import SwarmRearrange
-from swarms.structs.swarm_router import (
-    SwarmRouter,
-    SwarmType,
-)
-from swarms.structs.swarming_architectures import (
-    broadcast,
-    circular_swarm,
-    exponential_swarm,
-    fibonacci_swarm,
-    geometric_swarm,
-    grid_swarm,
-    harmonic_swarm,
-    linear_swarm,
-    log_swarm,
-    mesh_swarm,
-    one_to_one,
-    one_to_three,
-    power_swarm,
-    prime_swarm,
-    pyramid_swarm,
-    sigmoid_swarm,
-    staircase_swarm,
-    star_swarm,
-)
-from swarms.structs.interactive_groupchat import InteractiveGroupChat
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "Agent": "swarms.structs.agent",
+    "AgentsBuilder": "swarms.structs.agent_builder",
+    "AutoSwarmBuilder": "swarms.structs.auto_swarm_builder",
+    "BaseStructure": "swarms.structs.base_structure",
+    "BaseSwarm": "swarms.structs.base_swarm",
+    "BaseWorkflow": "swarms.structs.base_workflow",
+    "batch_agent_execution": "swarms.structs.batch_agent_execution",
+    "ConcurrentWorkflow": "swarms.structs.concurrent_workflow",
+    "Conversation": "swarms.structs.conversation",
+    "CouncilAsAJudge": "swarms.structs.council_judge",
+    "DeHallucinationSwarm": "swarms.structs.de_hallucination_swarm",
+    "DeepResearchSwarm": "swarms.structs.deep_research_swarm",
+    "Edge": "swarms.structs.graph_workflow",
+    "GraphWorkflow": "swarms.structs.graph_workflow",
+    "Node": "swarms.structs.graph_workflow",
+    "NodeType": "swarms.structs.graph_workflow",
+    "GroupChat": "swarms.structs.groupchat",
+    "expertise_based": "swarms.structs.groupchat",
+    "HybridHierarchicalClusterSwarm": "swarms.structs.hybrid_hiearchical_peer_swarm",
+    "aggregate": "swarms.structs.ma_blocks",
+    "find_agent_by_name": "swarms.structs.ma_blocks",
+    "run_agent": "swarms.structs.ma_blocks",
+    "MajorityVoting": "swarms.structs.majority_voting",
+    "majority_voting": "swarms.structs.majority_voting",
+    "most_frequent": "swarms.structs.majority_voting",
+    "parse_code_completion": "swarms.structs.majority_voting",
+    "MALT": "swarms.structs.malt",
+    "MemeAgentGenerator": "swarms.structs.meme_agent_persona_generator",
+    "MixtureOfAgents": "swarms.structs.mixture_of_agents",
+    "ModelRouter": "swarms.structs.model_router",
+    "get_agents_info": "swarms.structs.multi_agent_exec",
+    "get_swarms_info": "swarms.structs.multi_agent_exec",
+    "run_agent_with_timeout": "swarms.structs.multi_agent_exec",
+    "run_agents_concurrently": "swarms.structs.multi_agent_exec",
+    "run_agents_concurrently_async": "swarms.structs.multi_agent_exec",
+    "run_agents_concurrently_multiprocess": "swarms.structs.multi_agent_exec",
+    "run_agents_sequentially": "swarms.structs.multi_agent_exec",
+    "run_agents_with_different_tasks": "swarms.structs.multi_agent_exec",
+    "run_agents_with_resource_monitoring": "swarms.structs.multi_agent_exec",
+    "run_agents_with_tasks_concurrently": "swarms.structs.multi_agent_exec",
+    "run_single_agent": "swarms.structs.multi_agent_exec",
+    "MultiAgentRouter": "swarms.structs.multi_agent_router",
+    "QuorumResult": "swarms.structs.quorum_voting",
+    "quorum_vote": "swarms.structs.quorum_voting",
+    "AgentRearrange": "swarms.structs.rearrange",
+    "rearrange": "swarms.structs.rearrange",
+    "RoundRobinSwarm": "swarms.structs.round_robin",
+    "SequentialWorkflow": "swarms.structs.sequential_workflow",
+    "SpreadSheetSwarm": "swarms.structs.spreadsheet_swarm",
+    "SwarmRearrange": "swarms.structs.swarm_arange",
+    "SwarmRouter": "swarms.structs.swarm_router",
+    "SwarmType": "swarms.structs.swarm_router",
+    "broadcast": "swarms.structs.swarming_architectures",
+    "circular_swarm": "swarms.structs.swarming_architectures",
+    "exponential_swarm": "swarms.structs.swarming_architectures",
+    "fibonacci_swarm": "swarms.structs.swarming_architectures",
+    "geometric_swarm": "swarms.structs.swarming_architectures",
+    "grid_swarm": "swarms.structs.swarming_architectures",
+    "harmonic_swarm": "swarms.structs.swarming_architectures",
+    "linear_swarm": "swarms.structs.swarming_architectures",
+    "log_swarm": "swarms.structs.swarming_architectures",
+    "mesh_swarm": "swarms.structs.swarming_architectures",
+    "one_to_one": "swarms.structs.swarming_architectures",
+    "one_to_three": "swarms.structs.swarming_architectures",
+    "power_swarm": "swarms.structs.swarming_architectures",
+    "prime_swarm": "swarms.structs.swarming_architectures",
+    "pyramid_swarm": "swarms.structs.swarming_architectures",
+    "sigmoid_swarm": "swarms.structs.swarming_architectures",
+    "staircase_swarm": "swarms.structs.swarming_architectures",
+    "star_swarm": "swarms.structs.swarming_architectures",
+    "InteractiveGroupChat": "swarms.structs.interactive_groupchat",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "Agent",
@@ -97,6 +89,8 @@ __all__ = [
     "majority_voting",
     "most_frequent",
     "parse_code_completion",
+    "QuorumResult",
+    "quorum_vote",
     "AgentRearrange",
     "rearrange",
     "RoundRobinSwarm",
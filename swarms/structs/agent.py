@@ -6,7 +6,7 @@ import random
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import (
     Any,
@@ -44,6 +44,7 @@ from swarms.schemas.llm_agent_schema import ModelConfigOrigin
 from swarms.structs.agent_rag_handler import (
     RAGConfig,
     AgentRAGHandler,
+    create_memory_backend,
 )
 from swarms.structs.agent_roles import agent_roles
 from swarms.structs.conversation import Conversation
@@ -53,10 +54,10 @@ from swarms.structs.safe_loading import (
 )
 from swarms.telemetry.main import log_agent_data
 from swarms.tools.base_tool import BaseTool
-from swarms.tools.py_func_to_openai_func_str import (
-    convert_multiple_functions_to_openai_function_schema,
+from swarms.utils.document_ingestion import (
+    DocumentIngestor,
+    format_documents,
 )
-from swarms.utils.data_to_text import data_to_text
 from swarms.utils.file_processing import create_file_in_folder
 from swarms.utils.formatter import formatter
 from swarms.utils.generate_keys import generate_api_key
@@ -244,6 +245,9 @@ class Agent:
         artifacts_output_path (str): The artifacts output path
         artifacts_file_extension (str): The artifacts file extension (.pdf, .md, .txt, )
         scheduled_run_date (datetime): The date and time to schedule the task
+        max_memory_messages (int): Messages of short-term memory kept in RAM; older ones spill to disk
+        max_memory_bytes (int): Serialized bytes of short-term memory kept in RAM
+        spill_dir (str): Where spilled short-term memory is written
 
     Methods:
         run: Run the agent
@@ -420,6 +424,9 @@ class Agent:
         tool_call_summary: bool = True,
         output_raw_json_from_tool_call: bool = False,
         summarize_multiple_images: bool = False,
+        max_memory_messages: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
         *args,
         **kwargs,
     ):
@@ -559,6 +566,9 @@ class Agent:
             output_raw_json_from_tool_call
         )
         self.summarize_multiple_images = summarize_multiple_images
+        self.max_memory_messages = max_memory_messages
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = spill_dir
 
         # self.short_memory = self.short_memory_init()
 
@@ -600,6 +610,14 @@ class Agent:
         if self.random_models_on is True:
             self.model_name = set_random_models_for_agents()
 
+        if (
+            self.long_term_memory is None
+            and self.rag_config is not None
+        ):
+            self.long_term_memory = create_memory_backend(
+                self.rag_config
+            )
+
         if self.long_term_memory is not None:
             self.rag_handler = self.rag_setup_handling()
 
@@ -616,6 +634,48 @@ class Agent:
             verbose=self.verbose,
         )
 
+    def get_rag_handler(self) -> AgentRAGHandler:
+        """Return the RAG handler, creating it if memory was attached later."""
+        handler = getattr(self, "rag_handler", None)
+        if (
+            handler is None
+            or handler.long_term_memory is not self.long_term_memory
+        ):
+            self.rag_handler = self.rag_setup_handling()
+        return self.rag_handler
+
+    def add_rag_context(
+        self,
+        prefetch: Future,
+        conversation: str,
+        loop_count: Optional[int] = None,
+    ) -> None:
+        """
+        Add prefetched RAG results to short-term memory.
+
+        Results already present in the conversation or injected earlier are
+        skipped, and the context is bounded by ``context_window_tokens``.
+
+        Args:
+            prefetch (Future): Future returned by ``AgentRAGHandler.prefetch``.
+            conversation (str): The conversation the query was built from.
+            loop_count (Optional[int]): The current loop, for the header.
+        """
+        try:
+            results = prefetch.result()
+        except Exception as error:
+            logger.error(f"Error retrieving RAG context: {error}")
+            return
+
+        context = self.rag_handler.build_context(
+            results,
+            existing_context=conversation,
+            context_type="loop",
+            loop_count=loop_count,
+        )
+        if context:
+            self.short_memory.add(role="Database", content=context)
+
     def tool_handling(self):
 
         self.tool_struct = BaseTool(
@@ -625,9 +685,7 @@ class Agent:
 
         # Convert all the tools into a list of dictionaries
         self.tools_list_dictionary = (
-            convert_multiple_functions_to_openai_function_schema(
-                self.tools
-            )
+            self.tool_struct.compiled_tools().schemas
         )
 
         self.short_memory.add(
@@ -667,6 +725,9 @@ class Agent:
                 if self.conversation_schema
                 else False
             ),
+            max_memory_messages=self.max_memory_messages,
+            max_memory_bytes=self.max_memory_bytes,
+            spill_dir=self.spill_dir,
         )
 
         return memory
@@ -1038,20 +1099,24 @@ class Agent:
                     self.short_memory.return_history_as_string()
                 )
 
+                # Retrieve this loop's RAG context while the LLM call runs
+                rag_prefetch = None
+                if (
+                    self.long_term_memory is not None
+                    and self.rag_every_loop is True
+                ):
+                    logger.info(
+                        "Querying RAG database for context..."
+                    )
+                    rag_prefetch = self.get_rag_handler().prefetch(
+                        self.rag_handler.loop_query(task, task_prompt)
+                    )
+
                 # Parameters
                 attempt = 0
                 success = False
                 while attempt < self.retry_attempts and not success:
                     try:
-                        if (
-                            self.long_term_memory is not None
-                            and self.rag_every_loop is True
-                        ):
-                            logger.info(
-                                "Querying RAG database for context..."
-                            )
-                            self.memory_query(task_prompt)
-
                         if img is not None:
                             response = self.call_llm(
                                 task=task_prompt,
@@ -1072,6 +1137,12 @@ class Agent:
                         # Parse the response from the agent with the output type
                         response = self.parse_llm_output(response)
 
+                        if rag_prefetch is not None:
+                            self.add_rag_context(
+                                rag_prefetch, task_prompt, loop_count
+                            )
+                            rag_prefetch = None
+
                         self.short_memory.add(
                             role=self.agent_name,
                             content=response,
@@ -1744,6 +1815,14 @@ class Agent:
                     time_enabled=False,
                     user=self.user_name,
                     rules=self.rules,
+                    # State files from older versions lack these
+                    max_memory_messages=getattr(
+                        self, "max_memory_messages", None
+                    ),
+                    max_memory_bytes=getattr(
+                        self, "max_memory_bytes", None
+                    ),
+                    spill_dir=getattr(self, "spill_dir", None),
                 )
 
             # Reinitialize executor if needed
@@ -1957,8 +2036,9 @@ class Agent:
             None
         """
         try:
-            for doc in docs:
-                data = data_to_text(doc)
+            data = format_documents(
+                self.get_doc_ingestor().iter_documents(docs)
+            )
 
             return self.short_memory.add(
                 role=self.user_name, content=data
@@ -2048,20 +2128,28 @@ class Agent:
         for tool in tools:
             self.tools.remove(tool)
 
+    def get_doc_ingestor(self) -> DocumentIngestor:
+        """Return the document ingestor, caching extracted text in the workspace."""
+        if getattr(self, "_doc_ingestor", None) is None:
+            cache_dir = (
+                os.path.join(self.workspace_dir, "doc_cache")
+                if self.workspace_dir
+                else None
+            )
+            self._doc_ingestor = DocumentIngestor(cache_dir=cache_dir)
+        return self._doc_ingestor
+
     def get_docs_from_doc_folders(self):
         """Get the docs from the files"""
         try:
             logger.info("Getting docs from doc folders")
-            # Get the list of files then extract them and add them to the memory
-            files = os.listdir(self.docs_folder)
-
-            # Extract the text from the files
-            # Process each file and combine their contents
-            all_text = ""
-            for file in files:
-                file_path = os.path.join(self.docs_folder, file)
-                text = data_to_text(file_path)
-                all_text += f"\nContent from {file}:\n{text}\n"
+            # Extract the files in parallel (cached by content hash)
+            # and combine their contents
+            all_text = format_documents(
+                self.get_doc_ingestor().extract_folder(
+                    self.docs_folder
+                )
+            )
 
             # Add the combined content to memory
             return self.short_memory.add(
@@ -2470,9 +2558,21 @@ class Agent:
 
         try:
             if img is not None:
-                out = self.llm.run(
-                    task=task, img=img, *args, **kwargs
-                )
+                kwargs["img"] = img
+
+            if self.streams_live():
+                with formatter.stream_panel(
+                    title=f"Agent Name: {self.agent_name}"
+                ) as panel:
+                    panel.write(f"{self.agent_name}: ")
+                    out = self.llm.run(
+                        task=task,
+                        on_chunk=panel.write,
+                        *args,
+                        **kwargs,
+                    )
+                # Already on screen; pretty_print skips it
+                self._streamed_response = out
             else:
                 out = self.llm.run(task=task, *args, **kwargs)
 
@@ -2690,22 +2790,27 @@ class Agent:
         """
         return self.role
 
+    def streams_live(self) -> bool:
+        """Whether LLM output is displayed as it is generated."""
+        return bool(
+            self.streaming_on
+            and self.no_print is False
+            and isinstance(self.llm, LiteLLM)
+            and self.llm.streams_text
+        )
+
     def pretty_print(self, response: str, loop_count: int):
+        streamed = getattr(self, "_streamed_response", None)
+        self._streamed_response = None
+
         if self.no_print is False:
-            if self.streaming_on is True:
-                # self.stream_response(response)
-                formatter.print_panel_token_by_token(
-                    f"{self.agent_name}: {response}",
-                    title=f"Agent Name: {self.agent_name} [Max Loops: {loop_count}]",
-                )
-            elif self.no_print is True:
-                pass
-            else:
-                # logger.info(f"Response: {response}")
-                formatter.print_panel(
-                    f"{self.agent_name}: {response}",
-                    f"Agent Name {self.agent_name} [Max Loops: {loop_count} ]",
-                )
+            if streamed is not None and response == streamed:
+                # Shown live by call_llm while it was generated
+                return
+            formatter.print_panel(
+                f"{self.agent_name}: {response}",
+                f"Agent Name {self.agent_name} [Max Loops: {loop_count} ]",
+            )
 
     def parse_llm_output(self, response: Any):
         """Parse and standardize the output from the LLM.
@@ -1,5 +1,10 @@
+import hashlib
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Literal, Optional
 
 from loguru import logger
 from swarms.utils.litellm_tokenizer import count_tokens
@@ -48,6 +53,27 @@ class RAGConfig(BaseModel):
     relevance_keywords: Optional[List[str]] = Field(
         default=None, description="Keywords to check for relevance"
     )
+    memory_backend: Optional[Literal["local"]] = Field(
+        default=None,
+        description="Built-in memory store to create when no long_term_memory is given ('local' for the in-process NumPy store)",
+    )
+    embedding_model: Optional[str] = Field(
+        default=None,
+        description="sentence-transformers model for the local store; None uses dependency-free hashing embeddings",
+    )
+    memory_index: Literal["flat", "ivf"] = Field(
+        default="flat",
+        description="Search index for the local store: exact 'flat' or clustered 'ivf' for large stores",
+    )
+    memory_persist_path: Optional[str] = Field(
+        default=None,
+        description="Where the local store is loaded from and saved to",
+    )
+    query_cache_size: int = Field(
+        default=128,
+        ge=0,
+        description="Number of memory query results kept in the LRU cache (0 disables caching)",
+    )
 
     @field_validator("relevance_keywords", mode="before")
     def set_default_keywords(cls, v):
@@ -81,10 +107,47 @@ class RAGConfig(BaseModel):
                     "summary",
                     "conclusion",
                 ],
+                "memory_backend": "local",
+                "memory_index": "flat",
             }
         }
 
 
+def query_cache_key(query: str) -> str:
+    """Hash a query after normalizing case and whitespace."""
+    normalized = re.sub(r"\s+", " ", query).strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def create_memory_backend(config: RAGConfig) -> Optional[Any]:
+    """
+    Create the built-in memory store selected by ``config.memory_backend``.
+
+    Args:
+        config (RAGConfig): The RAG configuration.
+
+    Returns:
+        Optional[Any]: The memory store, or None if no backend is selected.
+    """
+    if config.memory_backend is None:
+        return None
+
+    if config.memory_backend == "local":
+        from swarms.structs.local_vector_memory import (
+            LocalVectorMemory,
+        )
+
+        return LocalVectorMemory(
+            embedding_model=config.embedding_model,
+            index_type=config.memory_index,
+            persist_path=config.memory_persist_path,
+        )
+
+    raise ValueError(
+        f"Unknown memory backend: {config.memory_backend}"
+    )
+
+
 class AgentRAGHandler:
     """
     Handles all RAG (Retrieval-Augmented Generation) operations for agents.
@@ -103,13 +166,18 @@ class AgentRAGHandler:
         Initialize the RAG handler.
 
         Args:
-            long_term_memory: The long-term memory store (must implement add() and query() methods)
+            long_term_memory: The long-term memory store (must implement add() and query() methods).
+                If None, the store selected by ``config.memory_backend`` is created.
             config: RAG configuration settings
             agent_name: Name of the agent using this handler
             verbose: Enable verbose logging
         """
-        self.long_term_memory = long_term_memory
         self.config = config or RAGConfig()
+        self.long_term_memory = (
+            long_term_memory
+            if long_term_memory is not None
+            else create_memory_backend(self.config)
+        )
         self.agent_name = agent_name
         self.verbose = verbose
         self.max_context_length = max_context_length
@@ -118,6 +186,14 @@ class AgentRAGHandler:
         self._conversation_history = []
         self._important_memories = []
 
+        self._query_cache: "OrderedDict[str, List[Any]]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_version: Any = None
+        self._injected = set()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+
         # Validate memory interface
         if (
             self.long_term_memory
@@ -168,12 +244,8 @@ class AgentRAGHandler:
                     f"🔍 [{self.agent_name}] Querying RAG for {context_type}: {query[:100]}..."
                 )
 
-            # Query the memory store
-            results = self.long_term_memory.query(
-                query=query,
-                top_k=self.config.max_results,
-                similarity_threshold=self.config.similarity_threshold,
-            )
+            # Query the memory store (memoized per normalized query)
+            results = self.retrieve(query)
 
             if not results:
                 if self.verbose:
@@ -402,6 +474,9 @@ class AgentRAGHandler:
                 content, metadata=default_metadata
             )
 
+            # New memories can change the answer to any cached query
+            self.clear_query_cache()
+
             if success and self.verbose:
                 logger.info(
                     f"✅ Successfully saved {content_type} to long-term memory"
@@ -508,7 +583,9 @@ KEY INSIGHTS:
 
         # 1. Query memory if enabled for this loop
         if self.config.query_every_loop and loop_count > 1:
-            query_context = f"Task: {task}\nCurrent Context: {conversation_context[-500:]}"
+            query_context = self.loop_query(
+                task, conversation_context
+            )
             retrieved_context = self.query_memory(
                 query_context,
                 context_type=f"loop_{loop_count}",
@@ -599,6 +676,155 @@ KEY INSIGHTS:
             logger.error(f"Error searching memories: {e}")
             return []
 
+    def loop_query(
+        self, task: str, conversation_context: str = ""
+    ) -> str:
+        """
+        Build the memory query for a reasoning loop.
+
+        Uses the task plus the tail of the conversation rather than the whole
+        transcript, so consecutive loops produce stable, cacheable queries.
+        """
+        return f"Task: {task}\nCurrent Context: {conversation_context[-500:]}"
+
+    def _memory_version(self) -> Any:
+        """
+        A value that changes whenever long-term memory changes.
+
+        Uses the store's ``version`` counter when it has one (as
+        ``LocalVectorMemory`` does) and its length otherwise. Returns None
+        for stores that expose neither; their cache is then only cleared
+        when this handler saves.
+        """
+        version = getattr(self.long_term_memory, "version", None)
+        if version is not None:
+            return version
+        try:
+            return len(self.long_term_memory)
+        except TypeError:
+            return None
+
+    def retrieve(self, query: str) -> List[Any]:
+        """
+        Search long-term memory through an LRU cache.
+
+        The cache is keyed on a hash of the normalized query. It is cleared
+        whenever this handler saves new content, and whenever the memory
+        store's version (or size) changes, so documents added to the store
+        directly are not hidden behind stale results.
+
+        Args:
+            query: Search query
+
+        Returns:
+            List of memory results
+        """
+        if self.config.query_cache_size == 0:
+            return self.search_memories(query)
+
+        key = query_cache_key(query)
+        version = self._memory_version()
+        with self._cache_lock:
+            if version != self._cache_version:
+                self._query_cache.clear()
+                self._cache_version = version
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                return self._query_cache[key]
+
+        results = self.search_memories(query)
+
+        with self._cache_lock:
+            if version != self._cache_version:
+                # Memory changed during the search; do not cache
+                return results
+            self._query_cache[key] = results
+            self._query_cache.move_to_end(key)
+            while (
+                len(self._query_cache) > self.config.query_cache_size
+            ):
+                self._query_cache.popitem(last=False)
+        return results
+
+    def prefetch(self, query: str) -> Future:
+        """
+        Start retrieving ``query`` in the background.
+
+        Lets the memory lookup overlap with the LLM call; collect the
+        results with ``future.result()``.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Future resolving to the list of memory results
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"rag-{self.agent_name}",
+            )
+        return self._prefetch_executor.submit(self.retrieve, query)
+
+    def build_context(
+        self,
+        results: List[Any],
+        existing_context: str = "",
+        context_type: str = "general",
+        loop_count: Optional[int] = None,
+    ) -> str:
+        """
+        Format results that are not already in the conversation.
+
+        Results whose content was injected earlier in this session or already
+        appears in ``existing_context`` are dropped, and results are added
+        best first until ``config.context_window_tokens`` would be exceeded.
+
+        Args:
+            results: Memory results, best first
+            existing_context: The conversation so far
+            context_type: Type of context being queried (for the header)
+            loop_count: Current loop number (for the header)
+
+        Returns:
+            Formatted context, empty string if nothing new fits
+        """
+        selected = []
+        budget = self.config.context_window_tokens
+        for result in results:
+            content = self._extract_result_fields(result)[0]
+            digest = query_cache_key(content)
+            if digest in self._injected or (
+                content and content in existing_context
+            ):
+                continue
+
+            tokens = count_tokens(content)
+            if tokens > budget:
+                break
+            budget -= tokens
+            selected.append(result)
+            self._injected.add(digest)
+
+        if not selected:
+            return ""
+        return self._format_memory_results(
+            selected, context_type, loop_count
+        )
+
+    def clear_query_cache(self):
+        """Drop all cached query results."""
+        with self._cache_lock:
+            self._query_cache.clear()
+
+    def shutdown(self):
+        """Stop the background prefetch thread, if one was started."""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(
+                wait=False, cancel_futures=True
+            )
+            self._prefetch_executor = None
+
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get statistics about memory usage and operations"""
         return {
@@ -623,6 +849,8 @@ KEY INSIGHTS:
         self._loop_counter = 0
         self._conversation_history.clear()
         self._important_memories.clear()
+        self._injected.clear()
+        self.clear_query_cache()
 
         if self.verbose:
             logger.info(f"[{self.agent_name}] Session data cleared")
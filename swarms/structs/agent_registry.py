@@ -1,8 +1,17 @@
 import json
+import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -38,17 +47,37 @@ class AgentRegistrySchema(BaseModel):
     )
 
 
+_KEYWORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _keywords(text: Optional[str]) -> Set[str]:
+    """Split a description into lowercase alphanumeric keywords."""
+    if not text:
+        return set()
+    return set(_KEYWORD_PATTERN.findall(text.lower()))
+
+
 class AgentRegistry:
     """
     A class for managing a registry of agents.
 
+    Agents are stored in a dictionary keyed by name, with secondary hash indexes
+    by ID, tag and role (and optionally by description keyword) so lookups and
+    filtered queries do not scan every agent.
+
+    Access is lock-striped: reads and writes of a name take only that name's
+    stripe, and each index key has its own stripe, so operations on different
+    agents do not wait for each other. A writer holds its name's stripe while
+    it updates one index stripe at a time, and readers never hold two
+    stripes at once, so stripes cannot deadlock.
+
     Attributes:
         name (str): The name of the registry.
         description (str): A description of the registry.
         return_json (bool): Indicates whether to return data in JSON format.
         auto_save (bool): Indicates whether to automatically save changes to the registry.
         agents (Dict[str, Agent]): A dictionary of agents in the registry, keyed by agent name.
-        lock (Lock): A lock for thread-safe operations on the registry.
+        lock (Lock): A lock guarding the ``agent_registry`` schema.
         agent_registry (AgentRegistrySchema): The schema for the agent registry.
     """
 
@@ -59,6 +88,9 @@ class AgentRegistry:
         agents: Optional[List[Agent]] = None,
         return_json: bool = True,
         auto_save: bool = False,
+        index_descriptions: bool = False,
+        num_lock_stripes: int = 16,
+        record_configs: bool = True,
         *args,
         **kwargs,
     ):
@@ -71,13 +103,27 @@ class AgentRegistry:
             agents (Optional[List[Agent]], optional): A list of agents to initially add to the registry. Defaults to None.
             return_json (bool, optional): Indicates whether to return data in JSON format. Defaults to True.
             auto_save (bool, optional): Indicates whether to automatically save changes to the registry. Defaults to False.
+            index_descriptions (bool, optional): Whether to maintain a keyword index over agent descriptions. Defaults to False.
+            num_lock_stripes (int, optional): Number of locks that names, and separately index keys, are spread across. Defaults to 16.
+            record_configs (bool, optional): Whether to snapshot each agent's config into ``agent_registry`` when it is added. Lookup-only registries turn this off. Defaults to True.
         """
         self.name = name
         self.description = description
         self.return_json = return_json
         self.auto_save = auto_save
+        self.index_descriptions = index_descriptions
+        self.record_configs = record_configs
         self.agents: Dict[str, Agent] = {}
         self.lock = Lock()
+        stripes = max(1, num_lock_stripes)
+        self._name_stripes = [Lock() for _ in range(stripes)]
+        self._index_stripes = [Lock() for _ in range(stripes)]
+
+        # Secondary indexes: key -> agent names
+        self._by_id: Dict[str, str] = {}
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._by_role: Dict[str, Set[str]] = defaultdict(set)
+        self._by_keyword: Dict[str, Set[str]] = defaultdict(set)
 
         # Initialize the agent registry
         self.agent_registry = AgentRegistrySchema(
@@ -90,6 +136,24 @@ class AgentRegistry:
         if agents:
             self.add_many(agents)
 
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled or deep-copied; recreate on restore
+        state = self.__dict__.copy()
+        for attribute in ("lock", "_name_stripes", "_index_stripes"):
+            state.pop(attribute, None)
+        state["_num_lock_stripes"] = len(self._name_stripes)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        stripes = state.pop("_num_lock_stripes")
+        self.__dict__.update(state)
+        self.lock = Lock()
+        self._name_stripes = [Lock() for _ in range(stripes)]
+        self._index_stripes = [Lock() for _ in range(stripes)]
+
     def add(self, agent: Agent) -> None:
         """
         Adds a new agent to the registry.
@@ -103,9 +167,10 @@ class AgentRegistry:
         """
         name = agent.agent_name
 
-        self.agent_to_py_model(agent)
+        if self.record_configs:
+            self.agent_to_py_model(agent)
 
-        with self.lock:
+        with self._name_lock(name):
             if name in self.agents:
                 logger.error(
                     f"Agent with name {name} already exists."
@@ -115,6 +180,7 @@ class AgentRegistry:
                 )
             try:
                 self.agents[name] = agent
+                self._index(name, agent)
                 logger.info(f"Agent {name} added successfully.")
             except ValidationError as e:
                 logger.error(f"Validation error: {e}")
@@ -131,17 +197,12 @@ class AgentRegistry:
             ValueError: If any of the agent_names already exist in the registry.
             ValidationError: If the input data is invalid.
         """
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(self.add, agent): agent
-                for agent in agents
-            }
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error adding agent: {e}")
-                    raise
+        for agent in agents:
+            try:
+                self.add(agent)
+            except Exception as e:
+                logger.error(f"Error adding agent: {e}")
+                raise
 
     def delete(self, agent_name: str) -> None:
         """
@@ -153,9 +214,10 @@ class AgentRegistry:
         Raises:
             KeyError: If the agent_name does not exist in the registry.
         """
-        with self.lock:
+        with self._name_lock(agent_name):
             try:
-                del self.agents[agent_name]
+                agent = self.agents.pop(agent_name)
+                self._unindex(agent_name, agent)
                 logger.info(
                     f"Agent {agent_name} deleted successfully."
                 )
@@ -175,7 +237,7 @@ class AgentRegistry:
             KeyError: If the agent_name does not exist in the registry.
             ValidationError: If the input data is invalid.
         """
-        with self.lock:
+        with self._name_lock(agent_name):
             if agent_name not in self.agents:
                 logger.error(
                     f"Agent with name {agent_name} does not exist."
@@ -184,7 +246,9 @@ class AgentRegistry:
                     f"Agent with name {agent_name} does not exist."
                 )
             try:
+                self._unindex(agent_name, self.agents[agent_name])
                 self.agents[agent_name] = new_agent
+                self._index(agent_name, new_agent)
                 logger.info(
                     f"Agent {agent_name} updated successfully."
                 )
@@ -205,7 +269,7 @@ class AgentRegistry:
         Raises:
             KeyError: If the agent_name does not exist in the registry.
         """
-        with self.lock:
+        with self._name_lock(agent_name):
             try:
                 agent = self.agents[agent_name]
                 logger.info(
@@ -224,10 +288,10 @@ class AgentRegistry:
             List[str]: A list of all agent names.
         """
         try:
-            with self.lock:
-                agent_names = list(self.agents.keys())
-                logger.info("Listing all agents.")
-                return agent_names
+            # list() copies the dict in one step, so no stripe is needed
+            agent_names = list(self.agents.keys())
+            logger.info("Listing all agents.")
+            return agent_names
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
@@ -240,41 +304,57 @@ class AgentRegistry:
             List[Agent]: A list of all agents.
         """
         try:
-            with self.lock:
-                agents = list(self.agents.values())
-                logger.info("Returning all agents.")
-                return agents
+            agents = list(self.agents.values())
+            logger.info("Returning all agents.")
+            return agents
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
 
     def query(
-        self, condition: Optional[Callable[[Agent], bool]] = None
+        self,
+        condition: Optional[Callable[[Agent], bool]] = None,
+        tag: Optional[str] = None,
+        role: Optional[str] = None,
+        keyword: Optional[str] = None,
     ) -> List[Agent]:
         """
-        Queries agents based on a condition.
+        Queries agents based on indexed fields and an optional condition.
+
+        Indexed filters are intersected first, so the condition only runs on
+        the agents that already match them.
 
         Args:
             condition (Optional[Callable[[Agent], bool]]): A function that takes an agent and returns a boolean indicating
                                                            whether the agent meets the condition.
+            tag (Optional[str]): Only return agents with this tag.
+            role (Optional[str]): Only return agents with this role.
+            keyword (Optional[str]): Only return agents whose description contains this word.
+                                     Requires ``index_descriptions=True``.
 
         Returns:
             List[Agent]: A list of agents that meet the condition.
         """
         try:
-            with self.lock:
-                if condition is None:
-                    agents = list(self.agents.values())
-                    logger.info("Querying all agents.")
-                    return agents
-
-                agents = [
+            names = self._indexed_names(tag, role, keyword)
+            if names is None:
+                candidates = list(self.agents.values())
+            else:
+                candidates = [
                     agent
-                    for agent in self.agents.values()
-                    if condition(agent)
+                    for agent in map(self.agents.get, names)
+                    if agent is not None
                 ]
-                logger.info("Querying agents with condition.")
-                return agents
+
+            if condition is None:
+                logger.info("Querying all agents.")
+                return candidates
+
+            agents = [
+                agent for agent in candidates if condition(agent)
+            ]
+            logger.info("Querying agents with condition.")
+            return agents
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
@@ -287,27 +367,164 @@ class AgentRegistry:
             agent_name (str): The name of the agent to find.
 
         Returns:
-            Agent: The agent with the given name.
+            Agent: The agent with the given name, or None if not found.
         """
-        try:
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self.get, agent_name): agent_name
-                    for agent_name in self.agents.keys()
-                }
-                for future in as_completed(futures):
-                    agent = future.result()
-                    if agent.agent_name == agent_name:
-                        return agent
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            raise e
+        return self.agents.get(agent_name)
 
     def find_agent_by_id(self, agent_id: str) -> Optional[Agent]:
         """
         Find an agent by its ID.
+
+        Args:
+            agent_id (str): The ID of the agent to find.
+
+        Returns:
+            Agent: The agent with the given ID, or None if not found.
+        """
+        name = self._by_id.get(agent_id)
+        return self.agents.get(name) if name is not None else None
+
+    def find_agents_by_tag(self, tag: str) -> List[Agent]:
+        """
+        Find all agents carrying a tag.
+
+        Args:
+            tag (str): The tag to look up.
+
+        Returns:
+            List[Agent]: The agents with the given tag.
+        """
+        return self.query(tag=tag)
+
+    def find_agents_by_role(self, role: str) -> List[Agent]:
+        """
+        Find all agents with a role.
+
+        Args:
+            role (str): The role to look up.
+
+        Returns:
+            List[Agent]: The agents with the given role.
         """
-        return self.agents.get(agent_id)
+        return self.query(role=role)
+
+    def search_descriptions(self, text: str) -> List[Agent]:
+        """
+        Find agents whose description contains every word in ``text``.
+
+        Args:
+            text (str): One or more keywords.
+
+        Returns:
+            List[Agent]: The matching agents.
+
+        Raises:
+            ValueError: If the registry was created without ``index_descriptions``.
+        """
+        if not self.index_descriptions:
+            raise ValueError(
+                "Description search requires index_descriptions=True."
+            )
+        names: Optional[Set[str]] = None
+        for word in _keywords(text):
+            matches = self._indexed(self._by_keyword, word)
+            names = matches if names is None else names & matches
+        return [
+            agent
+            for agent in map(self.agents.get, names or ())
+            if agent is not None
+        ]
+
+    def _name_lock(self, agent_name: str) -> Lock:
+        """Return the stripe guarding reads and writes of a name."""
+        return self._name_stripes[
+            hash(agent_name) % len(self._name_stripes)
+        ]
+
+    def _index_lock(self, index: Dict[str, Any], key: Any) -> Lock:
+        """Return the stripe guarding one key of a secondary index."""
+        return self._index_stripes[
+            hash((id(index), key)) % len(self._index_stripes)
+        ]
+
+    def _indexed(
+        self, index: Dict[str, Set[str]], key: Any
+    ) -> Set[str]:
+        """Copy the names filed under ``key`` in ``index``."""
+        with self._index_lock(index, key):
+            return set(index.get(key, ()))
+
+    def _indexed_names(
+        self,
+        tag: Optional[str],
+        role: Optional[str],
+        keyword: Optional[str],
+    ) -> Optional[Set[str]]:
+        """Intersect the secondary indexes; None means no filter was given."""
+        if keyword is not None and not self.index_descriptions:
+            raise ValueError(
+                "Keyword queries require index_descriptions=True."
+            )
+
+        names: Optional[Set[str]] = None
+        for index, key in (
+            (self._by_tag, tag),
+            (self._by_role, role),
+            (self._by_keyword, keyword and keyword.lower()),
+        ):
+            if key is None:
+                continue
+            matches = self._indexed(index, key)
+            names = matches if names is None else names & matches
+        return names
+
+    def _index_entries(self, agent: Agent) -> List[tuple]:
+        """The ``(index, key)`` pairs an agent is filed under."""
+        entries = [
+            (self._by_tag, tag)
+            for tag in getattr(agent, "tags", None) or []
+        ]
+        role = getattr(agent, "role", None)
+        if role is not None:
+            entries.append((self._by_role, role))
+        if self.index_descriptions:
+            entries.extend(
+                (self._by_keyword, word)
+                for word in _keywords(
+                    getattr(agent, "description", None)
+                )
+            )
+        return entries
+
+    def _index(self, name: str, agent: Agent) -> None:
+        """Add an agent to the secondary indexes. Caller holds its name's stripe."""
+        agent_id = getattr(agent, "id", None)
+        if agent_id is not None:
+            with self._index_lock(self._by_id, agent_id):
+                self._by_id[agent_id] = name
+        for index, key in self._index_entries(agent):
+            with self._index_lock(index, key):
+                index[key].add(name)
+
+    def _unindex(self, name: str, agent: Agent) -> None:
+        """Remove an agent from the secondary indexes. Caller holds its name's stripe."""
+        agent_id = getattr(agent, "id", None)
+        with self._index_lock(self._by_id, agent_id):
+            if self._by_id.get(agent_id) == name:
+                del self._by_id[agent_id]
+        for index, key in self._index_entries(agent):
+            with self._index_lock(index, key):
+                self._discard(index, key, name)
+
+    @staticmethod
+    def _discard(
+        index: Dict[str, Set[str]], key: Optional[str], name: str
+    ) -> None:
+        names = index.get(key)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del index[key]
 
     def agents_to_json(self) -> str:
         """
@@ -347,7 +564,68 @@ class AgentRegistry:
             f"Agent {agent_name} converted to Pydantic model."
         )
 
-        self.agent_registry.agents.append(schema)
+        with self.lock:
+            self.agent_registry.agents.append(schema)
+
+
+def index_agents(agents: Optional[Iterable[Any]]) -> AgentRegistry:
+    """
+    Build a lookup-only registry over a swarm's agents.
+
+    Routers and swarms build one once and pass it to :func:`lookup_agent`
+    (or the ``find_agent_by_*`` helpers) so names and IDs resolve in O(1).
+    Agent configs are not snapshotted, entries without an ``agent_name``
+    (plain callables) are skipped, and for duplicate names the first agent
+    wins, as with a list scan.
+
+    Args:
+        agents (Optional[Iterable[Any]]): The swarm's agents.
+
+    Returns:
+        AgentRegistry: A registry indexing ``agents``.
+    """
+    registry = AgentRegistry(record_configs=False)
+    for agent in agents or ():
+        name = getattr(agent, "agent_name", None)
+        if name is not None and name not in registry.agents:
+            registry.add(agent)
+    return registry
+
+
+def lookup_agent(
+    agents: Any, value: str, attribute: str = "name"
+) -> Optional[Any]:
+    """
+    Find the first agent whose ``attribute`` equals ``value``.
+
+    ``agents`` may be an :class:`AgentRegistry`, which answers name and ID
+    lookups from its indexes in O(1), or a list of agents, which is scanned.
+    Lists are not cached: callers that look agents up repeatedly should
+    build a registry once with :func:`index_agents` and pass that instead.
+
+    Args:
+        agents (Any): An AgentRegistry or a list of agents (or callables).
+        value (str): The name or ID to look up.
+        attribute (str): The agent attribute to match, "name" or "id".
+
+    Returns:
+        Optional[Any]: The matching agent, or None if not found.
+    """
+    if isinstance(agents, AgentRegistry):
+        if attribute == "id":
+            return agents.find_agent_by_id(value)
+        agent = agents.find_agent_by_name(value)
+        if agent is None:
+            matches = agents.query(
+                lambda a: getattr(a, attribute, None) == value
+            )
+            agent = matches[0] if matches else None
+        return agent
+
+    for agent in agents or ():
+        if getattr(agent, attribute, None) == value:
+            return agent
+    return None
 
 
 # if __name__ == "__main__":
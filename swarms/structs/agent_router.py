@@ -4,11 +4,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from typing import Union, Callable, Any
 from swarms import Agent
 from swarms.utils.loguru_logger import initialize_logger
-
-# from swarms.utils.lazy_loader import lazy_import_decorator
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
+from swarms.utils.optional_dependencies import require
 
 
 logger = initialize_logger(log_folder="agent_router")
@@ -34,13 +30,7 @@ class AgentRouter:
         *args,
         **kwargs,
     ):
-        try:
-            import chromadb
-        except ImportError:
-            auto_check_and_download_package(
-                "chromadb", package_manager="pip", upgrade=True
-            )
-            import chromadb
+        chromadb = require("chromadb", feature="AgentRouter")
 
         self.collection_name = collection_name
         self.n_agents = n_agents
@@ -18,6 +18,11 @@ from typing import (
 import yaml
 
 from swarms.structs.agent import Agent
+from swarms.structs.agent_registry import (
+    AgentRegistry,
+    index_agents,
+    lookup_agent,
+)
 from swarms.structs.conversation import Conversation
 from swarms.structs.omni_agent_types import AgentType
 from pydantic import BaseModel
@@ -183,6 +188,8 @@ class BaseSwarm(ABC):
         self.agents_dict = {
             agent.agent_name: agent for agent in self.agents
         }
+        # Name and ID indexes, kept in sync by add_agent/remove_agent
+        self.agent_registry = index_agents(self.agents)
 
     def communicate(self):
         """Communicate with the swarm through the orchestrator, protocols, and the universal communication layer"""
@@ -218,10 +225,13 @@ class BaseSwarm(ABC):
     def add_agent(self, agent: AgentType):
         """Add a agent to the swarm"""
         self.agents.append(agent)
+        self._index_agent(agent)
 
     def add_agents(self, agents: List[AgentType]):
         """Add a list of agents to the swarm"""
         self.agents.extend(agents)
+        for agent in agents:
+            self._index_agent(agent)
 
     def add_agent_by_id(self, agent_id: str):
         """Add a agent to the swarm by id"""
@@ -231,12 +241,42 @@ class BaseSwarm(ABC):
     def remove_agent(self, agent: AgentType):
         """Remove a agent from the swarm"""
         self.agents.remove(agent)
+        registry = self._agent_index()
+        name = getattr(agent, "agent_name", None)
+        if registry.agents.get(name) is agent:
+            registry.delete(name)
+            # Another agent may share the name further down the list
+            replacement = lookup_agent(
+                self.agents, name, "agent_name"
+            )
+            if replacement is not None:
+                registry.add(replacement)
+
+    def _agent_index(self) -> AgentRegistry:
+        """The name and ID indexes, built here for subclasses that skip __init__."""
+        registry = self.__dict__.get("agent_registry")
+        if registry is None:
+            registry = self.agent_registry = index_agents(self.agents)
+        return registry
+
+    def _index_agent(self, agent: AgentType):
+        """Add an agent to the name and ID indexes."""
+        registry = self._agent_index()
+        name = getattr(agent, "agent_name", None)
+        if name is not None and name not in registry.agents:
+            registry.add(agent)
+
+    def _lookup_agent(self, value: Any, attribute: str):
+        """Resolve an agent from the indexes, falling back to a scan."""
+        agent = lookup_agent(self._agent_index(), value, attribute)
+        if agent is None:
+            # Agents appended to self.agents directly are not indexed
+            agent = lookup_agent(self.agents, value, attribute)
+        return agent
 
     def get_agent_by_name(self, name: str):
         """Get a agent by name"""
-        for agent in self.agents:
-            if agent.name == name:
-                return agent
+        return self._lookup_agent(name, "name")
 
     def reset_all_agents(self):
         """Resets the state of all agents."""
@@ -264,10 +304,7 @@ class BaseSwarm(ABC):
         Returns:
             Agent: The Agent object if found, None otherwise.
         """
-        for agent in self.agents:
-            if agent.agent_name == name:
-                return agent
-        return None
+        return self._lookup_agent(name, "agent_name")
 
     def self_find_agent_by_id(self, id: uuid.UUID):
         """
@@ -279,10 +316,7 @@ class BaseSwarm(ABC):
         Returns:
             Agent: The Agent object if found, None otherwise.
         """
-        for agent in self.agents:
-            if agent.id == id:
-                return agent
-        return None
+        return self._lookup_agent(id, "id")
 
     def agent_exists(self, name: str):
         """
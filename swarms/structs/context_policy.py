@@ -0,0 +1,314 @@
+"""
+Context-window policies for building agent input from a ``Conversation``.
+
+Multi-agent structures traditionally hand every agent the entire transcript
+(``conversation.get_str()``), so input tokens grow with every turn and layer.
+A ``ContextPolicy`` decides which messages an agent actually sees:
+
+    - ``FullHistory``: the whole transcript (the default behaviour).
+    - ``LastKTurns``: the most recent ``k`` messages.
+    - ``TokenWindow``: the most recent messages that fit a token budget.
+    - ``RoleBudget``: a separate token budget per role.
+    - ``RollingSummary``: a token window plus a cached summary of everything
+      that has scrolled out of it.
+
+Policies read per-message token counts through ``Conversation.count_message_tokens``,
+which caches them, so selecting a window only walks the messages it keeps.
+
+Structures accept either a single policy or a ``{agent_name: policy}``
+mapping; ``resolve_policy`` picks the right one for each agent.
+"""
+
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from swarms.structs.conversation import Conversation
+
+SYSTEM_ROLES = {"system", "System"}
+
+
+def format_messages(messages: List[dict]) -> str:
+    """Render messages the same way ``Conversation.get_str`` does."""
+    return "\n\n".join(
+        f"{message['role']}: {message['content']}"
+        for message in messages
+    )
+
+
+class ContextPolicy:
+    """
+    Base class for context-window policies.
+
+    Subclasses implement ``select`` and return the messages, in
+    conversation order, that an agent should see.
+    """
+
+    def select(
+        self, conversation: "Conversation", messages: List[dict]
+    ) -> List[dict]:
+        raise NotImplementedError
+
+    def render(self, conversation: "Conversation") -> str:
+        """Return the selected messages formatted as a transcript."""
+        messages = conversation.get_messages()
+        return format_messages(self.select(conversation, messages))
+
+
+class FullHistory(ContextPolicy):
+    """Every message in the conversation."""
+
+    def select(self, conversation, messages):
+        return list(messages)
+
+
+def _split_pinned(
+    messages: List[dict], keep_system: bool
+) -> Tuple[List[int], List[int]]:
+    """Split message indices into pinned system messages and the rest."""
+    pinned, rest = [], []
+    for index, message in enumerate(messages):
+        if keep_system and message.get("role") in SYSTEM_ROLES:
+            pinned.append(index)
+        else:
+            rest.append(index)
+    return pinned, rest
+
+
+class LastKTurns(ContextPolicy):
+    """
+    The most recent ``k`` messages.
+
+    Args:
+        k (int): Number of recent messages to keep.
+        keep_system (bool): Always include system messages.
+    """
+
+    def __init__(self, k: int = 10, keep_system: bool = True):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.keep_system = keep_system
+
+    def select(self, conversation, messages):
+        pinned, rest = _split_pinned(messages, self.keep_system)
+        kept = rest[-self.k :] if self.k else []
+        return [messages[i] for i in sorted(pinned + kept)]
+
+
+class TokenWindow(ContextPolicy):
+    """
+    The most recent messages whose token counts fit in ``max_tokens``.
+
+    Pinned system messages are counted against the budget first. The walk
+    stops at the first message that does not fit, so the window is always a
+    contiguous suffix of the conversation.
+
+    Args:
+        max_tokens (int): Token budget for the window.
+        keep_system (bool): Always include system messages.
+    """
+
+    def __init__(
+        self, max_tokens: int = 4000, keep_system: bool = True
+    ):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.keep_system = keep_system
+
+    def window(
+        self, conversation: "Conversation", messages: List[dict]
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """Return (pinned, kept, dropped) message indices."""
+        pinned, rest = _split_pinned(messages, self.keep_system)
+        budget = self.max_tokens - sum(
+            conversation.count_message_tokens(messages[i])
+            for i in pinned
+        )
+
+        start = len(rest)
+        while start > 0:
+            tokens = conversation.count_message_tokens(
+                messages[rest[start - 1]]
+            )
+            if tokens > budget:
+                break
+            budget -= tokens
+            start -= 1
+
+        return pinned, rest[start:], rest[:start]
+
+    def select(self, conversation, messages):
+        pinned, kept, _ = self.window(conversation, messages)
+        return [messages[i] for i in sorted(pinned + kept)]
+
+
+class RoleBudget(ContextPolicy):
+    """
+    Separate token budgets per role.
+
+    Each role keeps its own most recent messages that fit its budget, so a
+    verbose agent cannot crowd the user's instructions out of the window.
+
+    Args:
+        budgets (Dict[str, int]): Token budget per role name.
+        default_budget (Optional[int]): Budget for roles not in ``budgets``;
+            ``None`` keeps every message of those roles, 0 drops them.
+        keep_system (bool): Always include system messages.
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[str, int],
+        default_budget: Optional[int] = None,
+        keep_system: bool = True,
+    ):
+        self.budgets = dict(budgets)
+        self.default_budget = default_budget
+        self.keep_system = keep_system
+
+    def select(self, conversation, messages):
+        pinned, rest = _split_pinned(messages, self.keep_system)
+        remaining = dict(self.budgets)
+        full = set()
+        kept = []
+
+        for index in reversed(rest):
+            role = messages[index].get("role")
+            budget = remaining.get(role, self.default_budget)
+            if budget is None:
+                kept.append(index)
+                continue
+            if role in full:
+                continue
+
+            tokens = conversation.count_message_tokens(
+                messages[index]
+            )
+            if tokens > budget:
+                # Keep each role's window contiguous
+                full.add(role)
+                continue
+            remaining[role] = budget - tokens
+            kept.append(index)
+
+        return [messages[i] for i in sorted(pinned + kept)]
+
+
+class RollingSummary(TokenWindow):
+    """
+    A token window plus a summary of the messages that fell out of it.
+
+    The summary is rolled forward incrementally: when more messages leave the
+    window, only those messages and the previous summary are sent to
+    ``summarizer``. Summaries are cached per conversation, so repeated calls
+    with an unchanged window are free.
+
+    Args:
+        summarizer (Callable[[str], str]): Turns text into a summary, e.g. a
+            small agent's ``run`` method.
+        max_tokens (int): Token budget for the verbatim window.
+        keep_system (bool): Always include system messages.
+        summary_role (str): Role used for the injected summary message.
+    """
+
+    def __init__(
+        self,
+        summarizer: Callable[[str], str],
+        max_tokens: int = 4000,
+        keep_system: bool = True,
+        summary_role: str = "Summary",
+    ):
+        super().__init__(
+            max_tokens=max_tokens, keep_system=keep_system
+        )
+        self.summarizer = summarizer
+        self.summary_role = summary_role
+        # conversation -> (number of messages summarized, summary)
+        self._summaries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def summary_prompt(self, summary: str, new_text: str) -> str:
+        """Build the summarizer input from the old summary and new messages."""
+        if not summary:
+            return (
+                "Summarize the following conversation, keeping decisions, "
+                f"facts and open questions:\n\n{new_text}"
+            )
+        return (
+            "Update this conversation summary with the new messages, "
+            "keeping decisions, facts and open questions.\n\n"
+            f"Summary so far:\n{summary}\n\nNew messages:\n{new_text}"
+        )
+
+    def summarize(
+        self, conversation: "Conversation", dropped: List[dict]
+    ) -> str:
+        """Return the cached summary of ``dropped``, extending it if needed."""
+        with self._lock:
+            done, summary = self._summaries.get(conversation, (0, ""))
+            if len(dropped) < done:
+                # The conversation was cleared or truncated
+                done, summary = 0, ""
+            if len(dropped) > done:
+                summary = self.summarizer(
+                    self.summary_prompt(
+                        summary, format_messages(dropped[done:])
+                    )
+                )
+                self._summaries[conversation] = (
+                    len(dropped),
+                    summary,
+                )
+            return summary
+
+    def select(self, conversation, messages):
+        pinned, kept, dropped = self.window(conversation, messages)
+        selected = [messages[i] for i in sorted(pinned + kept)]
+        if not dropped:
+            return selected
+
+        summary = self.summarize(
+            conversation, [messages[i] for i in dropped]
+        )
+        summary_message = {
+            "role": self.summary_role,
+            "content": summary,
+        }
+        return [messages[i] for i in pinned] + (
+            [summary_message] + [messages[i] for i in kept]
+        )
+
+
+def resolve_policy(
+    context_policy: Union[
+        ContextPolicy, Dict[str, ContextPolicy], None
+    ],
+    agent_name: str,
+) -> Optional[ContextPolicy]:
+    """
+    Pick the policy for ``agent_name``.
+
+    Args:
+        context_policy: A policy shared by every agent, a mapping from agent
+            name to policy (``"*"`` is used as a fallback), or None.
+        agent_name (str): The agent about to run.
+
+    Returns:
+        Optional[ContextPolicy]: The policy, or None for the full history.
+    """
+    if context_policy is None or isinstance(
+        context_policy, ContextPolicy
+    ):
+        return context_policy
+    return context_policy.get(agent_name, context_policy.get("*"))
@@ -1,9 +1,12 @@
 import concurrent.futures
 import datetime
+import hashlib
+import inspect
 import json
 import os
 import threading
 import uuid
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -18,15 +21,27 @@ from typing import (
 import yaml
 
 from swarms.structs.base_structure import BaseStructure
+from swarms.structs.paged_history import PagedHistory
 from swarms.utils.any_to_str import any_to_str
 from swarms.utils.formatter import formatter
 from swarms.utils.litellm_tokenizer import count_tokens
+from swarms.utils.message_index import (
+    MessageIndex,
+    SQLiteMessageIndex,
+    Since,
+    normalize_since,
+    parse_query,
+)
 
 if TYPE_CHECKING:
     from swarms.structs.agent import Agent
+    from swarms.structs.context_policy import ContextPolicy
 
 from loguru import logger
 
+# Token counts cached per conversation for messages without a stored count
+TOKEN_CACHE_SIZE = 1024
+
 
 def generate_conversation_id():
     """Generate a unique conversation ID."""
@@ -178,6 +193,9 @@ class Conversation(BaseStructure):
         save_as_json_bool (bool): Flag to save conversation history as JSON.
         token_count (bool): Flag to enable token counting for messages.
         conversation_history (list): List to store the history of messages.
+            When ``max_memory_messages`` or ``max_memory_bytes`` is set this
+            is a ``PagedHistory`` that keeps only recent messages in memory
+            and spills older ones to a SQLite file in ``spill_dir``.
     """
 
     def __init__(
@@ -216,11 +234,32 @@ class Conversation(BaseStructure):
         auto_persist: bool = True,
         redis_data_dir: Optional[str] = None,
         conversations_dir: Optional[str] = None,
+        # Paged in-memory history
+        max_memory_messages: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        page_size: int = 256,
         *args,
         **kwargs,
     ):
         super().__init__()
 
+        if (
+            max_memory_messages is not None
+            or max_memory_bytes is not None
+        ):
+            self._history = PagedHistory(
+                max_messages=max_memory_messages,
+                max_bytes=max_memory_bytes,
+                directory=spill_dir,
+                page_size=page_size,
+            )
+        else:
+            self._history = []
+        self._index = self._new_index()
+        self._index_stale = False
+        self._index_lock = threading.Lock()
+
         # Support both 'provider' and 'backend' parameters for backwards compatibility
         # 'backend' takes precedence if both are provided
         self.backend = backend or provider
@@ -263,7 +302,8 @@ class Conversation(BaseStructure):
             self.save_filepath = None
 
         self.load_filepath = load_filepath
-        self.conversation_history = []
+        self._token_cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
         self.tokenizer = tokenizer
         self.context_length = context_length
         self.rules = rules
@@ -311,6 +351,27 @@ class Conversation(BaseStructure):
             # For in-memory and mem0 backends, use the original setup
             self.setup()
 
+    @property
+    def conversation_history(self) -> Union[List[dict], PagedHistory]:
+        """The messages, oldest first."""
+        return self._history
+
+    @conversation_history.setter
+    def conversation_history(self, messages: List[dict]) -> None:
+        self._index_stale = True
+        if isinstance(self._history, PagedHistory):
+            if messages is not self._history:
+                messages = list(messages)
+                self._history.clear()
+                self._history.extend(messages)
+        else:
+            self._history = messages
+
+    @property
+    def is_paged(self) -> bool:
+        """Whether older messages are spilled to disk."""
+        return isinstance(self._history, PagedHistory)
+
     def _initialize_backend(self, **kwargs):
         """
         Initialize the persistent storage backend.
@@ -511,6 +572,8 @@ class Conversation(BaseStructure):
         if self.token_count is True:
             self._count_tokens(content, message)
 
+        self._index_appended()
+
         # Autosave after adding message, but only if saving is enabled
         if self.autosave and self.save_enabled and self.save_filepath:
             try:
@@ -630,6 +693,7 @@ class Conversation(BaseStructure):
                 logger.error(f"Backend delete failed: {e}")
                 raise
         self.conversation_history.pop(int(index))
+        self._index_stale = True
 
     def update(self, index: str, role, content):
         """Update a message in the conversation history.
@@ -648,8 +712,12 @@ class Conversation(BaseStructure):
                 logger.error(f"Backend update failed: {e}")
                 raise
         if 0 <= int(index) < len(self.conversation_history):
-            self.conversation_history[int(index)]["role"] = role
-            self.conversation_history[int(index)]["content"] = content
+            # Reassign so spilled messages are rewritten on disk
+            message = dict(self.conversation_history[int(index)])
+            message["role"] = role
+            message["content"] = content
+            self.conversation_history[int(index)] = message
+            self._index_stale = True
         else:
             logger.warning(f"Invalid index: {index}")
 
@@ -672,28 +740,181 @@ class Conversation(BaseStructure):
             return self.conversation_history[int(index)]
         return None
 
-    def search(self, keyword: str):
-        """Search for messages containing a keyword.
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled or deep-copied; recreate on restore
+        state = self.__dict__.copy()
+        state.pop("_index_lock", None)
+        state.pop("_token_cache_lock", None)
+        # The index is rebuilt on the next search
+        state.pop("_index", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._index_lock = threading.Lock()
+        self._token_cache_lock = threading.Lock()
+        self._index = self._new_index()
+        self._index_stale = True
+
+    def _new_index(self) -> Union[MessageIndex, SQLiteMessageIndex]:
+        # Paged histories keep their index on disk next to the pages
+        if self.is_paged:
+            return self._history.open_index()
+        return MessageIndex()
+
+    def _index_appended(self) -> None:
+        # Paged histories index new messages before they can spill, so
+        # searches never read spilled pages back
+        if self.is_paged:
+            with self._index_lock:
+                self._search_index()
+
+    def _search_index(
+        self,
+    ) -> Union[MessageIndex, SQLiteMessageIndex]:
+        # Appends are indexed incrementally; other edits trigger a rebuild
+        history = self.conversation_history
+        if self._index_stale or len(self._index) > len(history):
+            self._index.clear()
+            self._index_stale = False
+        self._index.sync(history)
+        return self._index
+
+    def _backend_search(
+        self,
+        query: str,
+        role: Optional[str],
+        since: Since,
+        limit: Optional[int],
+        ranked: bool,
+    ) -> List[dict]:
+        search = self.backend_instance.search
+        if "ranked" in inspect.signature(search).parameters:
+            return search(
+                query,
+                role=role,
+                since=since,
+                limit=limit,
+                ranked=ranked,
+            )
+        if ranked:
+            raise NotImplementedError(
+                f"Ranked search is not supported by the "
+                f"{self.backend} backend"
+            )
+
+        # Keyword-only backends: apply the filters here
+        results = list(search(query))
+        if role is not None:
+            results = [m for m in results if m.get("role") == role]
+        if since is not None:
+            since = normalize_since(since)
+            results = [
+                m
+                for m in results
+                if m.get("timestamp")
+                and normalize_since(m["timestamp"]) >= since
+            ]
+        return results[:limit]
+
+    def search(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+        ranked: bool = False,
+    ) -> List[dict]:
+        """Search messages by keyword or full text, role and time.
+
+        By default this returns the messages whose content contains
+        ``query`` as a case-sensitive substring, oldest first. With
+        ``ranked=True``, every word in ``query`` must appear in a message
+        (case-insensitive; ``word*`` matches a prefix) and results are
+        ranked by BM25 relevance, or newest first when the query has no
+        words. In memory, both modes use an inverted index that is updated
+        incrementally as messages are added; paged histories keep it in
+        their spill file (FTS5 plus role and time indexes) so searches stay
+        within the memory ceiling.
 
         Args:
-            keyword (str): The keyword to search for.
+            query (str): The keyword, or the words to search for.
+            role (Optional[str]): Only return messages from this role.
+            since (Since): Only return messages timestamped at or after
+                this datetime, ISO-8601 string or Unix time. Requires
+                ``time_enabled``.
+            limit (Optional[int]): Maximum number of messages to return.
+            ranked (bool): Full-text search ranked by relevance instead
+                of substring matching.
 
         Returns:
-            list: A list of messages containing the keyword.
+            list: The matching messages.
+
+        Raises:
+            NotImplementedError: If ``ranked`` is set and the backend
+                only supports keyword search.
         """
         if self.backend_instance:
             try:
-                return self.backend_instance.search(keyword)
+                return self._backend_search(
+                    query, role, since, limit, ranked
+                )
+            except NotImplementedError:
+                raise
             except Exception as e:
                 logger.error(f"Backend search failed: {e}")
                 # Fallback to in-memory search
                 pass
 
-        return [
-            message
-            for message in self.conversation_history
-            if keyword in str(message["content"])
-        ]
+        if ranked and parse_query(query):
+            with self._index_lock:
+                hits = self._search_index().search(
+                    query, role=role, since=since, limit=limit
+                )
+                return [
+                    self.conversation_history[position]
+                    for position, _ in hits
+                ]
+
+        # Substring search; nothing indexable (e.g. punctuation) also
+        # lands here when ranked
+        results = []
+        with self._index_lock:
+            positions = self._search_index().candidates(
+                query, role=role, since=since
+            )
+            for position in positions:
+                message = self.conversation_history[position]
+                if query in str(message["content"]):
+                    results.append(message)
+                    if limit is not None and len(results) >= limit:
+                        break
+        return results
+
+    def get_messages_by_role(self, role: str) -> List[dict]:
+        """Get all messages from a role, oldest first.
+
+        Args:
+            role (str): The role to filter by.
+
+        Returns:
+            list: The role's messages.
+        """
+        if self.backend_instance:
+            try:
+                return self.backend_instance.get_messages_by_role(
+                    role
+                )
+            except Exception as e:
+                logger.error(
+                    f"Backend get_messages_by_role failed: {e}"
+                )
+        with self._index_lock:
+            positions = self._search_index().positions_by_role(role)
+            return [
+                self.conversation_history[position]
+                for position in positions
+            ]
 
     def display_conversation(self, detailed: bool = False):
         """Display the conversation history.
@@ -856,6 +1077,75 @@ class Conversation(BaseStructure):
                 pass
         return self.return_history_as_string()
 
+    def get_messages(self) -> List[dict]:
+        """Get the conversation history as a list of message dictionaries.
+
+        Returns:
+            List[dict]: The messages, oldest first.
+        """
+        if self.backend_instance:
+            try:
+                return self.backend_instance.to_dict()
+            except Exception as e:
+                logger.error(f"Backend to_dict failed: {e}")
+        return self.conversation_history
+
+    def count_message_tokens(self, message: dict) -> int:
+        """Count the tokens in a message, caching the result.
+
+        Uses the count stored by ``token_count`` when available. Otherwise
+        counts are kept in a small LRU keyed by a hash of the content, so
+        the cache never holds message text.
+
+        Args:
+            message (dict): A message from the conversation history.
+
+        Returns:
+            int: The number of tokens in the message content.
+        """
+        if "token_count" in message:
+            return message["token_count"]
+
+        content = message.get("content", "")
+        text = (
+            content
+            if isinstance(content, str)
+            else any_to_str(content)
+        )
+        key = hashlib.blake2b(
+            text.encode("utf-8", "replace"), digest_size=16
+        ).digest()
+        with self._token_cache_lock:
+            tokens = self._token_cache.get(key)
+            if tokens is not None:
+                self._token_cache.move_to_end(key)
+                return tokens
+
+        if self.tokenizer is not None:
+            tokens = int(self.tokenizer.count_tokens(text=text))
+        else:
+            tokens = int(count_tokens(text))
+
+        with self._token_cache_lock:
+            self._token_cache[key] = tokens
+            while len(self._token_cache) > TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return tokens
+
+    def get_context(self, policy: "ContextPolicy" = None) -> str:
+        """Get the conversation history filtered by a context policy.
+
+        Args:
+            policy (ContextPolicy, optional): The policy choosing which
+                messages to include. Defaults to the full history.
+
+        Returns:
+            str: The selected messages formatted like ``get_str``.
+        """
+        if policy is None:
+            return self.get_str()
+        return policy.render(self)
+
     def save_as_json(self, filename: str = None):
         """Save the conversation history as a JSON file.
 
@@ -887,12 +1177,6 @@ class Conversation(BaseStructure):
                     "custom_rules_prompt": self.custom_rules_prompt,
                 }
 
-                # Prepare save data
-                save_data = {
-                    "metadata": metadata,
-                    "history": self.conversation_history,
-                }
-
                 # Create directory if it doesn't exist
                 os.makedirs(
                     os.path.dirname(save_path),
@@ -900,9 +1184,28 @@ class Conversation(BaseStructure):
                     exist_ok=True,
                 )
 
-                # Write directly to file
-                with open(save_path, "w") as f:
-                    json.dump(save_data, f, indent=2)
+                if self.is_paged:
+                    # Stream spilled pages instead of loading them all
+                    with open(save_path, "w") as f:
+                        f.write('{\n  "metadata": ')
+                        f.write(json.dumps(metadata, default=str))
+                        f.write(',\n  "history": [')
+                        for i, message in enumerate(
+                            self.conversation_history
+                        ):
+                            f.write(",\n    " if i else "\n    ")
+                            f.write(json.dumps(message, default=str))
+                        f.write("\n  ]\n}\n")
+                else:
+                    # Prepare save data
+                    save_data = {
+                        "metadata": metadata,
+                        "history": self.conversation_history,
+                    }
+
+                    # Write directly to file
+                    with open(save_path, "w") as f:
+                        json.dump(save_data, f, indent=2)
 
                 # Only log explicit saves, not autosaves
                 if not self.autosave:
@@ -954,11 +1257,7 @@ class Conversation(BaseStructure):
         Returns:
             list: List of messages containing the keyword.
         """
-        return [
-            msg
-            for msg in self.conversation_history
-            if keyword in msg["content"]
-        ]
+        return self.search(keyword)
 
     def truncate_memory_with_tokenizer(self):
         """
@@ -1007,6 +1306,8 @@ class Conversation(BaseStructure):
                 # Fallback to in-memory clear
                 pass
         self.conversation_history = []
+        with self._token_cache_lock:
+            self._token_cache.clear()
 
     def to_json(self):
         """Convert the conversation history to a JSON string.
@@ -1021,7 +1322,7 @@ class Conversation(BaseStructure):
                 logger.error(f"Backend to_json failed: {e}")
                 # Fallback to in-memory implementation
                 pass
-        return json.dumps(self.conversation_history)
+        return json.dumps(self._materialize())
 
     def to_dict(self):
         """Convert the conversation history to a dictionary.
@@ -1036,6 +1337,12 @@ class Conversation(BaseStructure):
                 logger.error(f"Backend to_dict failed: {e}")
                 # Fallback to in-memory implementation
                 pass
+        return self._materialize()
+
+    def _materialize(self) -> List[dict]:
+        # Paged histories are read back from disk into a plain list
+        if self.is_paged:
+            return list(self.conversation_history)
         return self.conversation_history
 
     def to_yaml(self):
@@ -1051,7 +1358,7 @@ class Conversation(BaseStructure):
                 logger.error(f"Backend to_yaml failed: {e}")
                 # Fallback to in-memory implementation
                 pass
-        return yaml.dump(self.conversation_history)
+        return yaml.dump(self._materialize())
 
     def get_visible_messages(self, agent: "Agent", turn: int):
         """
@@ -1266,6 +1573,7 @@ class Conversation(BaseStructure):
                 # Fallback to in-memory implementation
                 pass
         self.conversation_history.extend(messages)
+        self._index_appended()
 
     def clear_memory(self):
         """Clear the memory of the conversation."""
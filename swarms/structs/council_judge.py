@@ -1,8 +1,23 @@
 import multiprocessing
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Dict, Optional, Tuple
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from loguru import logger
 
@@ -115,21 +130,42 @@ def judge_system_prompt() -> str:
     """
 
 
-@lru_cache(maxsize=128)
-def build_judge_prompt(
-    dimension_name: str, user_prompt: str, model_response: str
-) -> str:
+def build_pair_prefix(user_prompt: str, model_response: str) -> str:
     """
-    Builds a prompt for evaluating a specific dimension.
-    Cached to avoid repeated string creation for same inputs.
+    Builds the part of a judge prompt shared by every dimension.
+
+    Judge prompts start with the prompt and response under evaluation so
+    that all dimension calls for one pair share a long common prefix,
+    which providers with prompt caching only process once.
 
     Args:
-        dimension_name (str): Name of the evaluation dimension
         user_prompt (str): The original user prompt
         model_response (str): The model's response to evaluate
 
     Returns:
-        str: The formatted evaluation prompt
+        str: The shared prompt prefix
+    """
+    return f"""
+    --- BEGIN USER PROMPT ---
+    {user_prompt}
+    --- END USER PROMPT ---
+
+    --- BEGIN MODEL RESPONSE ---
+    {model_response}
+    --- END MODEL RESPONSE ---
+    """
+
+
+@lru_cache(maxsize=None)
+def build_dimension_instructions(dimension_name: str) -> str:
+    """
+    Builds the dimension-specific end of a judge prompt.
+
+    Args:
+        dimension_name (str): Name of the evaluation dimension
+
+    Returns:
+        str: The evaluation instructions for the dimension
 
     Raises:
         KeyError: If dimension_name is not in EVAL_DIMENSIONS
@@ -145,7 +181,7 @@ def build_judge_prompt(
 
     {evaluation_focus}
 
-    Your task is to provide a detailed, technical analysis of the model response focusing exclusively on the {dimension_name} dimension.
+    Your task is to provide a detailed, technical analysis of the model response above focusing exclusively on the {dimension_name} dimension.
 
     Guidelines:
     1. Be specific and reference exact parts of the response
@@ -154,19 +190,37 @@ def build_judge_prompt(
     4. Suggest specific improvements where applicable
     5. Maintain a technical, analytical tone
 
-    --- BEGIN USER PROMPT ---
-    {user_prompt}
-    --- END USER PROMPT ---
-
-    --- BEGIN MODEL RESPONSE ---
-    {model_response}
-    --- END MODEL RESPONSE ---
-
     ### Technical Analysis ({dimension_name.upper()} Dimension):
     Provide a comprehensive analysis that would be valuable for model improvement.
     """
 
 
+def build_judge_prompt(
+    dimension_name: str, user_prompt: str, model_response: str
+) -> str:
+    """
+    Builds a prompt for evaluating a specific dimension.
+
+    The pair under evaluation comes first and the dimension instructions
+    last, see ``build_pair_prefix``.
+
+    Args:
+        dimension_name (str): Name of the evaluation dimension
+        user_prompt (str): The original user prompt
+        model_response (str): The model's response to evaluate
+
+    Returns:
+        str: The formatted evaluation prompt
+
+    Raises:
+        KeyError: If dimension_name is not in EVAL_DIMENSIONS
+    """
+    instructions = build_dimension_instructions(dimension_name)
+    return (
+        build_pair_prefix(user_prompt, model_response) + instructions
+    )
+
+
 @lru_cache(maxsize=128)
 def aggregator_system_prompt() -> str:
     """
@@ -223,6 +277,34 @@ def build_aggregation_prompt(rationales: Dict[str, str]) -> str:
     return aggregation_input
 
 
+@dataclass
+class PairEvaluation:
+    """
+    Result of evaluating one (task, response) pair in a batch.
+
+    Attributes:
+        index (int): Position of the pair in the batch
+        task (str): The original user prompt
+        model_response (str): The evaluated response
+        rationales (Dict[str, str]): Judge output per dimension
+        errors (Dict[str, str]): Error per failed dimension, plus
+            "aggregation" if the report failed
+        report (Optional[str]): The aggregated report, if requested
+    """
+
+    index: int
+    task: str
+    model_response: str
+    rationales: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    report: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether every dimension and the report succeeded."""
+        return not self.errors
+
+
 class CouncilAsAJudge:
     """
     A council of AI agents that evaluates model responses across multiple dimensions.
@@ -266,7 +348,7 @@ class CouncilAsAJudge:
             description (str): Description of the council's purpose
             model_name (str): Name of the model to use for evaluations
             output_type (str): Type of output to return
-            cache_size (int): Size of the LRU cache for prompts
+            cache_size (int): Unused; kept for backwards compatibility
         """
         self.id = id
         self.name = name
@@ -310,34 +392,6 @@ class CouncilAsAJudge:
             f"Using {self.max_workers} worker threads out of {total_cores} CPU cores"
         )
 
-        # Configure caching
-        self._configure_caching(self.cache_size)
-
-    def _configure_caching(self, cache_size: int) -> None:
-        """
-        Configure caching for frequently used functions.
-
-        Args:
-            cache_size (int): Size of the LRU cache
-        """
-        # Update cache sizes for cached functions
-        judge_system_prompt.cache_info = (
-            lambda: None
-        )  # Reset cache info
-        build_judge_prompt.cache_info = lambda: None
-        aggregator_system_prompt.cache_info = lambda: None
-
-        # Set new cache sizes
-        judge_system_prompt.__wrapped__.__wrapped__ = lru_cache(
-            maxsize=cache_size
-        )(judge_system_prompt.__wrapped__)
-        build_judge_prompt.__wrapped__.__wrapped__ = lru_cache(
-            maxsize=cache_size
-        )(build_judge_prompt.__wrapped__)
-        aggregator_system_prompt.__wrapped__.__wrapped__ = lru_cache(
-            maxsize=cache_size
-        )(aggregator_system_prompt.__wrapped__)
-
     def _create_judges(self) -> Dict[str, Agent]:
         """
         Create judge agents for each evaluation dimension.
@@ -430,6 +484,131 @@ class CouncilAsAJudge:
                 f"Failed to evaluate dimension {dim}: {str(e)}"
             )
 
+    def evaluate_batch(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_in_flight: int = 24,
+        aggregate: bool = True,
+        dimensions: Optional[Sequence[str]] = None,
+    ) -> Iterator[PairEvaluation]:
+        """
+        Evaluate many (task, response) pairs as one stream of judge calls.
+
+        Every dimension of every pair becomes one job. Jobs are issued pair
+        by pair, so consecutive calls share the judge system prompt and
+        the pair prefix (see ``build_pair_prefix``), and at most
+        ``max_in_flight`` calls run at once. A pair is aggregated as soon
+        as its own dimensions finish, ahead of judge calls for later
+        pairs, and is yielded when done. Judges are called through their
+        LLMs directly, so no agent memory grows across pairs and nothing
+        is added to ``self.conversation``.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): ``(task, model_response)``
+                pairs, consumed lazily
+            max_in_flight (int): Maximum concurrent LLM calls
+            aggregate (bool): Whether to write a report per pair
+            dimensions (Optional[Sequence[str]]): Dimensions to score.
+                Defaults to all judges
+
+        Yields:
+            PairEvaluation: One per pair, in completion order
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        dimensions = list(dimensions or self.judge_agents)
+        for dim in dimensions:
+            if dim not in self.judge_agents:
+                raise KeyError(f"Unknown evaluation dimension: {dim}")
+
+        def jobs() -> Iterator[Tuple[PairEvaluation, str]]:
+            for index, (task, model_response) in enumerate(pairs):
+                evaluation = PairEvaluation(
+                    index, task, model_response
+                )
+                for dim in dimensions:
+                    yield evaluation, dim
+
+        def judge(evaluation: PairEvaluation, dim: str) -> str:
+            prompt = build_judge_prompt(
+                dim, evaluation.task, evaluation.model_response
+            )
+            return self.judge_agents[dim].llm.run(prompt).strip()
+
+        def report(evaluation: PairEvaluation) -> str:
+            return self.aggregator_agent.llm.run(
+                build_aggregation_prompt(evaluation.rationales)
+            )
+
+        pending = jobs()
+        ready: deque = deque()
+        remaining: Dict[int, int] = {}
+        in_flight: Dict[
+            Future, Tuple[PairEvaluation, Optional[str]]
+        ] = {}
+        exhausted = False
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_in_flight,
+            thread_name_prefix="council-judge",
+        )
+        try:
+            while True:
+                while len(in_flight) < max_in_flight:
+                    if ready:
+                        evaluation = ready.popleft()
+                        future = executor.submit(report, evaluation)
+                        in_flight[future] = (evaluation, None)
+                        continue
+                    if exhausted:
+                        break
+                    job = next(pending, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    evaluation, dim = job
+                    remaining.setdefault(
+                        evaluation.index, len(dimensions)
+                    )
+                    future = executor.submit(judge, evaluation, dim)
+                    in_flight[future] = (evaluation, dim)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    evaluation, dim = in_flight.pop(future)
+                    error = future.exception()
+
+                    if dim is None:
+                        if error is None:
+                            evaluation.report = future.result()
+                        else:
+                            evaluation.errors["aggregation"] = str(
+                                error
+                            )
+                        yield evaluation
+                        continue
+
+                    if error is None:
+                        evaluation.rationales[dim] = future.result()
+                    else:
+                        logger.error(
+                            f"Pair {evaluation.index}: dimension {dim} failed: {error}"
+                        )
+                        evaluation.errors[dim] = str(error)
+
+                    remaining[evaluation.index] -= 1
+                    if remaining[evaluation.index] == 0:
+                        del remaining[evaluation.index]
+                        if aggregate and evaluation.rationales:
+                            ready.append(evaluation)
+                        else:
+                            yield evaluation
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def run(
         self, task: str, model_response: Optional[str] = None
     ) -> None:
@@ -1,11 +1,10 @@
 import concurrent.futures
 import json
 import os
-from typing import Any, List
+from typing import Any, List, Optional
 
 from dotenv import load_dotenv
 from rich.console import Console
-import requests
 
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
@@ -13,6 +12,11 @@ from swarms.utils.formatter import formatter
 from swarms.utils.history_output_formatter import (
     history_output_formatter,
 )
+from swarms.utils.search_client import (
+    SearchClient,
+    format_exa_results,
+    get_search_client,
+)
 from swarms.utils.str_to_dict import str_to_dict
 
 console = Console()
@@ -30,95 +34,18 @@ MAX_WORKERS = (
 
 def exa_search(query: str, **kwargs: Any) -> str:
     """Performs web search using Exa.ai API and returns formatted results."""
-    api_url = "https://api.exa.ai/search"
-    api_key = os.getenv("EXA_API_KEY")
-
-    if not api_key:
-        return "### Error\nEXA_API_KEY environment variable not set\n"
-
-    headers = {
-        "x-api-key": api_key,
-        "Content-Type": "application/json",
-    }
-
     safe_kwargs = {
         str(k): v
         for k, v in kwargs.items()
         if k is not None and v is not None and str(k) != "None"
     }
 
-    payload = {
-        "query": query,
-        "useAutoprompt": True,
-        "numResults": safe_kwargs.get("num_results", 10),
-        "contents": {
-            "text": True,
-            "highlights": {"numSentences": 10},
-        },
-    }
-
-    for key, value in safe_kwargs.items():
-        if key not in payload and key not in [
-            "query",
-            "useAutoprompt",
-            "numResults",
-            "contents",
-        ]:
-            payload[key] = value
-
     try:
-        response = requests.post(
-            api_url, json=payload, headers=headers
-        )
-        if response.status_code != 200:
-            return f"### Error\nHTTP {response.status_code}: {response.text}\n"
-        json_data = response.json()
+        json_data = get_search_client().search(query, **safe_kwargs)
     except Exception as e:
         return f"### Error\n{str(e)}\n"
 
-    if "error" in json_data:
-        return f"### Error\n{json_data['error']}\n"
-
-    formatted_text = []
-    search_params = json_data.get("effectiveFilters", {})
-    query = search_params.get("query", "General web search")
-    formatted_text.append(
-        f"### Exa Search Results for: '{query}'\n\n---\n"
-    )
-
-    results = json_data.get("results", [])
-    if not results:
-        formatted_text.append("No results found.\n")
-        return "".join(formatted_text)
-
-    for i, result in enumerate(results, 1):
-        title = result.get("title", "No title")
-        url = result.get("url", result.get("id", "No URL"))
-        published_date = result.get("publishedDate", "")
-        highlights = result.get("highlights", [])
-        highlight_text = (
-            "\n".join(
-                (
-                    h.get("text", str(h))
-                    if isinstance(h, dict)
-                    else str(h)
-                )
-                for h in highlights[:3]
-            )
-            if highlights
-            else "No summary available"
-        )
-
-        formatted_text.extend(
-            [
-                f"{i}. **{title}**\n",
-                f"   - URL: {url}\n",
-                f"   - Published: {published_date.split('T')[0] if published_date else 'Date unknown'}\n",
-                f"   - Key Points:\n      {highlight_text}\n\n",
-            ]
-        )
-
-    return "".join(formatted_text)
+    return format_exa_results(json_data)
 
 
 # Define the research tools schema
@@ -235,6 +162,7 @@ class DeepResearchSwarm:
         token_count: bool = False,
         research_model_name: str = "gpt-4o-mini",
         claude_summarization_model_name: str = "claude-3-5-sonnet-20240620",
+        search_client: Optional[SearchClient] = None,
     ):
         self.name = name
         self.description = description
@@ -247,6 +175,10 @@ class DeepResearchSwarm:
             claude_summarization_model_name
         )
 
+        # Shared across steps and batched_run tasks, so repeated queries
+        # are served from its cache over pooled connections
+        self.search_client = search_client or get_search_client()
+
         self.reliability_check()
         self.conversation = Conversation(token_count=token_count)
 
@@ -365,34 +297,21 @@ class DeepResearchSwarm:
 
             print(queries)
 
-            # Submit all queries for concurrent processing
-            futures = []
-            for q in queries:
-                future = self.executor.submit(exa_search, q)
-                futures.append((q, future))
-
-            # Process results as they complete
-            for q, future in futures:
-                try:
-                    # Get search results only
-                    results = future.result()
-
-                    # Add search results to conversation
-                    self.conversation.add(
-                        role="User",
-                        content=f"Search results for {q}: \n {results}",
-                    )
-
-                except Exception as e:
-                    # Handle any errors in the thread
-                    error_msg = (
-                        f"Error processing query '{q}': {str(e)}"
-                    )
+            # Results are added as each search completes
+            for q, results in self.search_client.search_many(queries):
+                if isinstance(results, Exception):
+                    error_msg = f"Error processing query '{q}': {str(results)}"
                     console.print(f"[bold red]{error_msg}[/bold red]")
                     self.conversation.add(
                         role="System",
                         content=error_msg,
                     )
+                    continue
+
+                self.conversation.add(
+                    role="User",
+                    content=f"Search results for {q}: \n {format_exa_results(results)}",
+                )
 
             # Generate final comprehensive analysis after all searches are complete
             try:
@@ -458,10 +377,10 @@ class DeepResearchSwarm:
         Returns:
             List[str]: A list of formatted conversation histories
         """
-        futures = []
-        for task in tasks:
-            future = self.executor.submit(self.step, task)
-            futures.append((task, future))
+        futures = [
+            self.executor.submit(self.step, task) for task in tasks
+        ]
+        return [future.result() for future in futures]
 
 
 # Example usage
@@ -3,6 +3,7 @@ import random
 from swarms.structs.agent import Agent
 from typing import List
 from swarms.structs.conversation import Conversation
+from swarms.structs.agent_registry import index_agents
 from swarms.structs.ma_blocks import find_agent_by_name
 from swarms.utils.history_output_formatter import (
     history_output_formatter,
@@ -61,6 +62,7 @@ class DynamicConversationalSwarm:
         self.name = name
         self.description = description
         self.agents = agents
+        self.agent_registry = index_agents(agents)
         self.max_loops = max_loops
         self.output_type = output_type
 
@@ -101,7 +103,7 @@ class DynamicConversationalSwarm:
             RuntimeError: If there's an error running the agent
         """
         agent = find_agent_by_name(
-            agents=self.agents, agent_name=agent_name
+            agents=self.agent_registry, agent_name=agent_name
         )
         return agent.run(task)
 
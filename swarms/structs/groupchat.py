@@ -1,10 +1,14 @@
 import concurrent.futures
 import random
-from typing import Callable, List
+from typing import Callable, Dict, List, Union
 
 from loguru import logger
 
 from swarms.structs.agent import Agent
+from swarms.structs.context_policy import (
+    ContextPolicy,
+    resolve_policy,
+)
 from swarms.structs.conversation import Conversation
 from swarms.structs.multi_agent_exec import get_agents_info
 from swarms.utils.history_output_formatter import (
@@ -213,6 +217,9 @@ class GroupChat:
         agents (List[Agent], optional): List of participating agents. Defaults to empty list.
         speaker_fn (SpeakerFunction, optional): Speaker selection function. Defaults to round_robin.
         max_loops (int, optional): Maximum conversation turns. Defaults to 1.
+        context_policy (Union[ContextPolicy, Dict[str, ContextPolicy]], optional): Limits
+            the history each agent receives, for all agents or per agent name. Defaults to
+            None (full history).
 
     Raises:
         ValueError: If invalid initialization parameters are provided
@@ -227,6 +234,9 @@ class GroupChat:
         max_loops: int = 1,
         rules: str = "",
         output_type: str = "string",
+        context_policy: Union[
+            ContextPolicy, Dict[str, ContextPolicy]
+        ] = None,
     ):
         self.name = name
         self.description = description
@@ -235,6 +245,7 @@ class GroupChat:
         self.max_loops = max_loops
         self.output_type = output_type
         self.rules = rules
+        self.context_policy = context_policy
 
         self.conversation = Conversation(
             time_enabled=False, rules=rules
@@ -315,7 +326,12 @@ class GroupChat:
                 try:
                     # Build complete context with conversation history
                     conversation_history = (
-                        self.conversation.return_history_as_string()
+                        self.conversation.get_context(
+                            resolve_policy(
+                                self.context_policy,
+                                current_speaker.agent_name,
+                            )
+                        )
                     )
 
                     # Prepare a prompt that explicitly encourages responding to others
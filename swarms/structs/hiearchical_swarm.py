@@ -5,6 +5,7 @@ from typing import Any, List, Optional, Union, Dict
 from pydantic import BaseModel, Field
 
 from swarms.structs.agent import Agent
+from swarms.structs.agent_registry import index_agents, lookup_agent
 from swarms.structs.base_swarm import BaseSwarm
 from swarms.structs.conversation import Conversation
 from swarms.utils.output_types import OutputType
@@ -293,6 +294,9 @@ class HierarchicalSwarm(BaseSwarm):
         # Handle teams
         self.handle_teams()
 
+        # Resolve agent names in O(1) once every team agent is added
+        self.agent_registry = index_agents(self.agents)
+
         # List all agents
         list_all_agents(self.agents, self.conversation, self.name)
 
@@ -498,19 +502,14 @@ class HierarchicalSwarm(BaseSwarm):
         :raises: ValueError if agent is not found
         """
         try:
-            # Fast path: use list comprehension for quick lookup
-            matching_agents = [
-                agent
-                for agent in self.agents
-                if agent.agent_name == name
-            ]
-
-            if not matching_agents:
+            agent = lookup_agent(self.agent_registry, name)
+
+            if agent is None:
                 error_msg = f"Agent '{name}' not found in the swarm '{self.name}'"
                 logger.error(error_msg)
                 return None
 
-            return matching_agents[0]
+            return agent
 
         except Exception as e:
             logger.error(f"Error finding agent '{name}': {str(e)}")
@@ -1,5 +1,5 @@
 import re
-from typing import Callable, List, Union
+from typing import Callable, List, Optional, Union
 
 from loguru import logger
 
@@ -57,6 +57,9 @@ class InteractiveGroupChat:
         max_loops (int, optional): Maximum conversation turns. Defaults to 1.
         output_type (str, optional): Type of output format. Defaults to "string".
         interactive (bool, optional): Whether to enable interactive terminal mode. Defaults to False.
+        max_memory_messages (int, optional): Messages of chat history kept in memory; older ones spill to disk. Defaults to None (unbounded).
+        max_memory_bytes (int, optional): Serialized bytes of chat history kept in memory. Defaults to None (unbounded).
+        spill_dir (str, optional): Where spilled chat history is written. Defaults to the system temp directory.
 
     Raises:
         ValueError: If invalid initialization parameters are provided
@@ -71,6 +74,9 @@ class InteractiveGroupChat:
         max_loops: int = 1,
         output_type: str = "string",
         interactive: bool = False,
+        max_memory_messages: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ):
         self.id = id
         self.name = name
@@ -81,7 +87,12 @@ class InteractiveGroupChat:
         self.interactive = interactive
 
         # Initialize conversation history
-        self.conversation = Conversation(time_enabled=True)
+        self.conversation = Conversation(
+            time_enabled=True,
+            max_memory_messages=max_memory_messages,
+            max_memory_bytes=max_memory_bytes,
+            spill_dir=spill_dir,
+        )
 
         # Create a mapping of agent names to agents for easy lookup
         self.agent_map = {}
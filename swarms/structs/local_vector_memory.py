@@ -0,0 +1,546 @@
+"""
+In-process vector memory for agents.
+
+``LocalVectorMemory`` implements the ``add``/``query`` interface expected by
+``AgentRAGHandler`` and ``Agent.memory_query`` without a network hop: float32
+embeddings live in one contiguous NumPy matrix (optionally memory-mapped from
+disk), inserts are batched, and queries are a single matrix-vector product
+followed by ``argpartition`` top-k. For larger stores an inverted-file (IVF)
+index restricts each query to the nearest clusters.
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+import zlib
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import numpy as np
+
+from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.optional_dependencies import require
+
+logger = initialize_logger(log_folder="local_vector_memory")
+
+EmbeddingFunction = Callable[[List[str]], np.ndarray]
+MetadataFilter = Union[
+    Dict[str, Any], Callable[[Dict[str, Any]], bool]
+]
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """
+    Dependency-free text embedder based on feature hashing.
+
+    Unigrams and bigrams are hashed (with ``zlib.crc32``, so vectors are
+    stable across processes) into a fixed number of signed buckets, weighted
+    by log term frequency and L2-normalized. It captures lexical overlap only,
+    which is often enough for small per-agent knowledge bases; pass a
+    sentence-transformers model name for semantic similarity.
+
+    Args:
+        dimension (int): Number of hash buckets.
+    """
+
+    def __init__(self, dimension: int = 512):
+        self.dimension = dimension
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros(
+            (len(texts), self.dimension), dtype=np.float32
+        )
+        for row, text in enumerate(texts):
+            tokens = _TOKEN_PATTERN.findall(text.lower())
+            features = tokens + [
+                f"{a} {b}" for a, b in zip(tokens, tokens[1:])
+            ]
+            counts: Dict[int, float] = {}
+            for feature in features:
+                digest = zlib.crc32(feature.encode("utf-8"))
+                bucket = digest % self.dimension
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                counts[bucket] = counts.get(bucket, 0.0) + sign
+            for bucket, count in counts.items():
+                vectors[row, bucket] = np.sign(count) * np.log1p(
+                    abs(count)
+                )
+        return _normalize(vectors)
+
+
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str):
+    sentence_transformers = require(
+        "sentence_transformers", feature="LocalVectorMemory"
+    )
+    return sentence_transformers.SentenceTransformer(model_name)
+
+
+def sentence_transformer_embedder(
+    model_name: str = "all-MiniLM-L6-v2",
+) -> EmbeddingFunction:
+    """Return an embedding function backed by a local sentence-transformers model."""
+
+    def embed(texts: List[str]) -> np.ndarray:
+        model = _load_sentence_transformer(model_name)
+        return model.encode(
+            list(texts),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+    return embed
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+class LocalVectorMemory:
+    """
+    Thread-safe in-process vector store for agent long-term memory.
+
+    Args:
+        embedding_function (Optional[EmbeddingFunction]): Maps a list of
+            texts to an ``(n, dim)`` array. Defaults to ``HashingEmbedder``.
+        embedding_model (Optional[str]): sentence-transformers model to use
+            instead of the hashing embedder. Ignored if
+            ``embedding_function`` is given.
+        index_type (str): ``"flat"`` for exact brute-force search or
+            ``"ivf"`` for an inverted-file index over k-means clusters.
+        ivf_min_size (int): Stores smaller than this are always searched
+            exhaustively, even with ``index_type="ivf"``.
+        n_lists (Optional[int]): Number of IVF clusters. Defaults to
+            ``sqrt(n)``.
+        n_probe (int): Number of IVF clusters searched per query.
+        persist_path (Optional[str]): Where ``save()`` writes by default.
+            An existing store at this path is loaded on construction.
+        mmap (bool): Memory-map embeddings when loading from disk instead
+            of reading them into RAM.
+
+    Examples:
+        >>> memory = LocalVectorMemory()
+        >>> memory.add_many(["Paris is in France", "Rome is in Italy"])
+        >>> memory.query("Where is Paris?", top_k=1)[0]["content"]
+        'Paris is in France'
+    """
+
+    def __init__(
+        self,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        embedding_model: Optional[str] = None,
+        index_type: Literal["flat", "ivf"] = "flat",
+        ivf_min_size: int = 4096,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        persist_path: Optional[str] = None,
+        mmap: bool = False,
+    ):
+        if index_type not in ("flat", "ivf"):
+            raise ValueError(
+                f"Unknown index_type: {index_type}. Use 'flat' or 'ivf'"
+            )
+
+        if embedding_function is None:
+            embedding_function = (
+                sentence_transformer_embedder(embedding_model)
+                if embedding_model
+                else HashingEmbedder()
+            )
+
+        self.embedding_function = embedding_function
+        self.index_type = index_type
+        self.ivf_min_size = ivf_min_size
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.persist_path = persist_path
+
+        self._lock = threading.RLock()
+        # Bumped on every change so callers can invalidate cached queries
+        self.version = 0
+        self._embeddings: Optional[np.ndarray] = None
+        self._size = 0
+        self._ids: List[str] = []
+        self._contents: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+
+        self._centroids: Optional[np.ndarray] = None
+        self._inverted_lists: List[List[int]] = []
+        self._indexed_size = 0
+
+        if persist_path and os.path.exists(
+            self._paths(persist_path)[0]
+        ):
+            self.load(persist_path, mmap=mmap)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        return self._size
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """View of the stored embeddings, one row per entry."""
+        if self._embeddings is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._embeddings[: self._size]
+
+    def _reserve(self, extra: int, dimension: int) -> None:
+        """Grow the embedding matrix geometrically to fit ``extra`` rows."""
+        needed = self._size + extra
+        if self._embeddings is None:
+            self._embeddings = np.empty(
+                (max(needed, 64), dimension), dtype=np.float32
+            )
+            return
+
+        if self._embeddings.shape[1] != dimension:
+            raise ValueError(
+                f"Embedding dimension {dimension} does not match the "
+                f"store's dimension {self._embeddings.shape[1]}"
+            )
+
+        capacity = len(self._embeddings)
+        # Memory-mapped matrices are read-only, so the first insert copies
+        if needed > capacity or not self._embeddings.flags.writeable:
+            grown = np.empty(
+                (max(needed, capacity * 2), dimension),
+                dtype=np.float32,
+            )
+            grown[: self._size] = self._embeddings[: self._size]
+            self._embeddings = grown
+
+    def add(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs,
+    ) -> bool:
+        """
+        Add a single entry.
+
+        Args:
+            content (str): The text to store.
+            metadata (Optional[Dict[str, Any]]): Metadata to store alongside.
+
+        Returns:
+            bool: True once the entry is stored.
+        """
+        self.add_many([content], [metadata or {}])
+        return True
+
+    def add_many(
+        self,
+        contents: Sequence[str],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        ids: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        """
+        Embed and store many entries with a single embedding call.
+
+        Args:
+            contents (Sequence[str]): The texts to store.
+            metadatas (Optional[Sequence[Dict[str, Any]]]): One metadata dict
+                per text.
+            ids (Optional[Sequence[str]]): Explicit ids. Generated if omitted.
+
+        Returns:
+            List[str]: The ids of the stored entries.
+        """
+        contents = [str(content) for content in contents]
+        if not contents:
+            return []
+
+        metadatas = list(metadatas or [{} for _ in contents])
+        ids = list(ids or [str(uuid.uuid4()) for _ in contents])
+        if not len(contents) == len(metadatas) == len(ids):
+            raise ValueError(
+                "contents, metadatas and ids must have the same length"
+            )
+
+        vectors = _normalize(self.embedding_function(contents))
+
+        with self._lock:
+            self._reserve(len(contents), vectors.shape[1])
+            start = self._size
+            self._embeddings[start : start + len(contents)] = vectors
+            self._size += len(contents)
+            self._ids.extend(ids)
+            self._contents.extend(contents)
+            self._metadata.extend(dict(m or {}) for m in metadatas)
+
+            if self._centroids is not None:
+                self._assign(np.arange(start, self._size))
+            self.version += 1
+
+        return ids
+
+    def query(
+        self,
+        query: str,
+        top_k: int = 5,
+        similarity_threshold: float = 0.0,
+        filter: Optional[MetadataFilter] = None,
+        *args,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the entries most similar to ``query``.
+
+        Args:
+            query (str): The query text.
+            top_k (int): Maximum number of results.
+            similarity_threshold (float): Minimum cosine similarity.
+            filter (Optional[MetadataFilter]): Either a dict of metadata
+                values that must all match, or a predicate on metadata.
+
+        Returns:
+            List[Dict[str, Any]]: Results with ``id``, ``content``, ``score``
+            and ``metadata``, best first.
+        """
+        if self._size == 0 or top_k <= 0:
+            return []
+
+        query_vector = _normalize(self.embedding_function([query]))[0]
+
+        with self._lock:
+            candidates = self._candidates(query_vector)
+            if candidates is None:
+                scores = self.embeddings @ query_vector
+                positions = np.flatnonzero(
+                    scores >= similarity_threshold
+                )
+                scores = scores[positions]
+            else:
+                scores = self._embeddings[candidates] @ query_vector
+                keep = scores >= similarity_threshold
+                positions, scores = candidates[keep], scores[keep]
+
+            if filter is not None:
+                matches = np.fromiter(
+                    (
+                        self._matches(self._metadata[p], filter)
+                        for p in positions
+                    ),
+                    dtype=bool,
+                    count=len(positions),
+                )
+                positions, scores = (
+                    positions[matches],
+                    scores[matches],
+                )
+
+            order = _top_k(scores, top_k)
+            return [
+                {
+                    "id": self._ids[positions[i]],
+                    "content": self._contents[positions[i]],
+                    "score": float(scores[i]),
+                    "metadata": self._metadata[positions[i]],
+                }
+                for i in order
+            ]
+
+    @staticmethod
+    def _matches(
+        metadata: Dict[str, Any], filter: MetadataFilter
+    ) -> bool:
+        if callable(filter):
+            return bool(filter(metadata))
+        return all(
+            metadata.get(key) == value
+            for key, value in filter.items()
+        )
+
+    # IVF index
+
+    def _candidates(self, query_vector: np.ndarray):
+        """Positions to score for a query, or None for exhaustive search."""
+        if self.index_type != "ivf" or self._size < self.ivf_min_size:
+            return None
+
+        # Re-cluster whenever the store has doubled since the last build
+        if self._centroids is None or self._size >= 2 * max(
+            self._indexed_size, 1
+        ):
+            self.build_index()
+
+        centroid_scores = self._centroids @ query_vector
+        probes = _top_k(
+            centroid_scores, min(self.n_probe, len(centroid_scores))
+        )
+        lists = [
+            self._inverted_lists[p]
+            for p in probes
+            if self._inverted_lists[p]
+        ]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(
+            [np.asarray(positions) for positions in lists]
+        )
+
+    def build_index(
+        self, iterations: int = 10, seed: int = 0
+    ) -> None:
+        """
+        (Re)build the IVF index with spherical k-means.
+
+        Called automatically by ``query`` for ``index_type="ivf"``; call it
+        explicitly to pay the clustering cost up front.
+
+        Args:
+            iterations (int): Number of k-means iterations.
+            seed (int): Seed for centroid initialization.
+        """
+        with self._lock:
+            if self._size == 0:
+                return
+
+            vectors = self.embeddings
+            n_lists = self.n_lists or max(1, int(np.sqrt(self._size)))
+            n_lists = min(n_lists, self._size)
+
+            rng = np.random.default_rng(seed)
+            centroids = vectors[
+                rng.choice(self._size, n_lists, replace=False)
+            ].copy()
+
+            for _ in range(iterations):
+                assignments = np.argmax(vectors @ centroids.T, axis=1)
+                for cluster in range(n_lists):
+                    members = vectors[assignments == cluster]
+                    if len(members):
+                        centroids[cluster] = members.sum(axis=0)
+                centroids = _normalize(centroids)
+
+            self._centroids = centroids
+            self._inverted_lists = [[] for _ in range(n_lists)]
+            self._indexed_size = self._size
+            self._assign(np.arange(self._size))
+
+            logger.debug(
+                f"Built IVF index with {n_lists} lists over {self._size} vectors"
+            )
+
+    def _assign(self, positions: np.ndarray) -> None:
+        assignments = np.argmax(
+            self._embeddings[positions] @ self._centroids.T, axis=1
+        )
+        for position, cluster in zip(positions, assignments):
+            self._inverted_lists[cluster].append(int(position))
+
+    # Persistence
+
+    @staticmethod
+    def _paths(path: str):
+        root = os.path.splitext(path)[0]
+        return f"{root}.json", f"{root}.npy"
+
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Persist the store as ``<path>.json`` (records) and ``<path>.npy``.
+
+        Args:
+            path (Optional[str]): Destination. Defaults to ``persist_path``.
+
+        Returns:
+            str: The path of the records file.
+        """
+        path = path or self.persist_path
+        if path is None:
+            raise ValueError("No path given and no persist_path set")
+
+        records_path, embeddings_path = self._paths(path)
+        directory = os.path.dirname(records_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            records = {
+                "ids": self._ids,
+                "contents": self._contents,
+                "metadata": self._metadata,
+            }
+            # np.save appends .npy to names that lack it
+            tmp_embeddings = f"{embeddings_path}.tmp.npy"
+            np.save(tmp_embeddings, self.embeddings)
+            tmp_records = f"{records_path}.tmp"
+            with open(tmp_records, "w", encoding="utf-8") as f:
+                json.dump(records, f, default=str)
+
+        os.replace(tmp_embeddings, embeddings_path)
+        os.replace(tmp_records, records_path)
+        return records_path
+
+    def load(self, path: Optional[str] = None, mmap: bool = False):
+        """
+        Replace the store's contents with a store saved by ``save``.
+
+        Args:
+            path (Optional[str]): Source. Defaults to ``persist_path``.
+            mmap (bool): Memory-map the embeddings instead of reading them.
+
+        Returns:
+            LocalVectorMemory: ``self``.
+        """
+        path = path or self.persist_path
+        records_path, embeddings_path = self._paths(path)
+
+        with open(records_path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        embeddings = np.load(
+            embeddings_path, mmap_mode="r" if mmap else None
+        )
+
+        with self._lock:
+            self._embeddings = embeddings if len(embeddings) else None
+            self._size = len(embeddings)
+            self._ids = records["ids"]
+            self._contents = records["contents"]
+            self._metadata = records["metadata"]
+            self._centroids = None
+            self._inverted_lists = []
+            self._indexed_size = 0
+            self.version += 1
+        return self
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._embeddings = None
+            self._size = 0
+            self._ids, self._contents, self._metadata = [], [], []
+            self._centroids = None
+            self._inverted_lists = []
+            self._indexed_size = 0
+            self.version += 1
@@ -1,18 +1,112 @@
 import concurrent.futures
+import hashlib
 import os
-from typing import Union, List
-import PyPDF2
-import markdown
+from typing import Literal, Optional, Union, List
 from pathlib import Path
+from swarms.utils.document_ingestion import (
+    DocumentIngestor,
+    iter_chunks,
+)
 from swarms.utils.litellm_tokenizer import count_tokens
+from swarms.utils.pdf_to_text import iter_pdf_pages
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
+from swarms.structs.map_reduce import tree_map_reduce
 from swarms.utils.history_output_formatter import (
     history_output_formatter,
 )
 from swarms.utils.formatter import formatter
 
 
+CHUNK_AGENT_PROMPT = """
+You are an expert document analysis and summarization agent specialized in processing and understanding complex documents. Your primary responsibilities include:
+
+1. Document Analysis:
+- Thoroughly analyze the provided document chunk
+- Identify key themes, main arguments, and important details
+- Extract critical information and relationships between concepts
+
+2. Summarization Capabilities:
+- Create concise yet comprehensive summaries
+- Generate both high-level overviews and detailed breakdowns
+- Highlight key points, findings, and conclusions
+- Maintain context and relationships between different sections
+
+3. Information Extraction:
+- Identify and extract important facts, figures, and data points
+- Recognize and preserve technical terminology and domain-specific concepts
+- Maintain accuracy in representing the original content
+
+4. Response Format:
+- Provide clear, structured responses
+- Use bullet points for key findings
+- Include relevant quotes or references when necessary
+- Maintain professional and academic tone
+
+5. Context Awareness:
+- Consider the document's purpose and target audience
+- Adapt your analysis based on the document type (academic, technical, general)
+- Preserve the original meaning and intent
+
+Your goal is to help users understand and extract value from this document chunk while maintaining accuracy and completeness in your analysis.
+"""
+
+AGGREGATOR_AGENT_PROMPT = """
+You are an expert document synthesis agent specialized in creating comprehensive reports from multiple document summaries. Your responsibilities include:
+
+1. Synthesis and Integration:
+- Combine multiple document summaries into a coherent narrative
+- Identify and resolve any contradictions or inconsistencies
+- Maintain logical flow and structure in the final report
+- Preserve important details while eliminating redundancy
+
+2. Report Structure:
+- Create a clear, hierarchical structure for the report
+- Include an executive summary at the beginning
+- Organize content into logical sections with clear headings
+- Ensure smooth transitions between different topics
+
+3. Analysis and Insights:
+- Identify overarching themes and patterns across summaries
+- Draw meaningful conclusions from the combined information
+- Highlight key findings and their implications
+- Provide context and connections between different pieces of information
+
+4. Quality Assurance:
+- Ensure factual accuracy and consistency
+- Maintain professional and academic tone
+- Verify that all important information is included
+- Check for clarity and readability
+
+Your goal is to create a comprehensive, well-structured report that effectively synthesizes all the provided document summaries into a single coherent document.
+"""
+
+CHUNK_TASK = """Please analyze and summarize the following document chunk:
+
+{chunk}"""
+
+REDUCE_TASK = """Merge the following partial summaries of one document set into a single summary.
+Keep every distinct finding, figure and conclusion; remove repetition.
+
+{summaries}
+"""
+
+REPORT_TASK = """
+Please create a comprehensive report by synthesizing the following document summaries:
+
+{summaries}
+
+Please structure your response as follows:
+1. Executive Summary
+2. Main Findings and Analysis
+3. Key Themes and Patterns
+4. Detailed Breakdown by Topic
+5. Conclusions and Implications
+
+Ensure the report is well-organized, comprehensive, and maintains a professional tone throughout.
+"""
+
+
 class LongAgent:
     """
     A class to handle and process long-form content from various sources including PDFs,
@@ -27,8 +121,27 @@ class LongAgent:
         output_type: str = "final",
         model_name: str = "gpt-4o-mini",
         aggregator_model_name: str = "gpt-4o-mini",
+        cache_dir: Optional[str] = None,
+        mode: Literal["flat", "map_reduce"] = "flat",
+        max_concurrency: int = 8,
+        fan_in: int = 8,
+        checkpoint_dir: Optional[str] = None,
     ):
-        """Initialize the LongAgent."""
+        """Initialize the LongAgent.
+
+        Args:
+            cache_dir (Optional[str]): Directory for cached extracted text and
+                token counts. Defaults to None (in-memory cache only).
+            mode (str): "flat" sends every chunk summary to one aggregator
+                call; "map_reduce" summarizes chunks in parallel and merges
+                them in a tree, so no call sees more than ``fan_in``
+                summaries.
+            max_concurrency (int): Chunk and merge calls in flight at once
+                in map-reduce mode.
+            fan_in (int): Summaries merged per call in map-reduce mode.
+            checkpoint_dir (Optional[str]): Directory where map-reduce
+                results are checkpointed so an interrupted run resumes.
+        """
         self.name = name
         self.description = description
         self.model_name = model_name
@@ -39,6 +152,13 @@ class LongAgent:
         self.output_type = output_type
         self.agents = []
         self.conversation = Conversation()
+        self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.fan_in = fan_in
+        self.checkpoint_dir = checkpoint_dir
+        self.ingestor = DocumentIngestor(
+            cache_dir=cache_dir, token_counter=count_tokens
+        )
 
     def load_pdf(self, file_path: Union[str, Path]) -> str:
         """
@@ -55,11 +175,7 @@ class LongAgent:
                 f"PDF file not found at {file_path}"
             )
 
-        text = ""
-        with open(file_path, "rb") as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+        text = "".join(iter_pdf_pages(str(file_path)))
 
         self.content = text
         self.metadata["source"] = "pdf"
@@ -84,9 +200,6 @@ class LongAgent:
         with open(file_path, "r", encoding="utf-8") as file:
             content = file.read()
 
-        # Convert markdown to HTML for processing
-        markdown.markdown(content)
-
         self.content = content
         self.metadata["source"] = "markdown"
         self.metadata["file_path"] = str(file_path)
@@ -130,32 +243,21 @@ class LongAgent:
         """
         Count the number of tokens in a document.
 
+        Extracted text and counts are cached by content hash, so the
+        document is not parsed again when it is chunked.
+
         Args:
-            document (str): The document to count tokens for
+            file_path (Union[str, Path]): The document to count tokens for
         """
-        if file_path.endswith(".pdf"):
-            count = count_tokens(self.load_pdf(file_path))
-            formatter.print_panel(
-                f"Token count for {file_path}: {count}",
-                title="Token Count",
-            )
-            print(f"Token count for {file_path}: {count}")
-        elif file_path.endswith(".md"):
-            count = count_tokens(self.load_markdown(file_path))
-            formatter.print_panel(
-                f"Token count for {file_path}: {count}",
-                title="Token Count",
-            )
-            print(f"Token count for {file_path}: {count}")
-        elif file_path.endswith(".txt"):
-            count = count_tokens(self.load_text(file_path))
-            formatter.print_panel(
-                f"Token count for {file_path}: {count}",
-                title="Token Count",
-            )
-            print(f"Token count for {file_path}: {count}")
-        else:
+        file_path = str(file_path)
+        if not file_path.endswith((".pdf", ".md", ".txt")):
             raise ValueError(f"Unsupported file type: {file_path}")
+
+        count = self.ingestor.count_tokens(file_path)
+        formatter.print_panel(
+            f"Token count for {file_path}: {count}",
+            title="Token Count",
+        )
         return count
 
     def count_multiple_documents(
@@ -171,6 +273,20 @@ class LongAgent:
             int: Total token count across all documents
         """
         total_tokens = 0
+
+        # Extract every document across the process pool first; the
+        # per-file counts below then read the cached text
+        try:
+            for _ in self.ingestor.iter_documents(
+                [str(path) for path in file_paths]
+            ):
+                pass
+        except Exception as e:
+            formatter.print_panel(
+                f"Error extracting documents: {str(e)}",
+                title="Error",
+            )
+
         # Calculate max_workers as 20% of CPU count
         max_workers = max(1, int(os.cpu_count() * 0.2))
 
@@ -204,57 +320,22 @@ class LongAgent:
         Returns:
             List[Agent]: List of created agents
         """
-        for file_path in file_paths:
-            # Load the document content
-            if str(file_path).endswith(".pdf"):
-                content = self.load_pdf(file_path)
-            elif str(file_path).endswith(".md"):
-                content = self.load_markdown(file_path)
-            else:
-                content = self.load_text(str(file_path))
-
-            # Split content into chunks based on token count
-            chunks = self._split_into_chunks(content)
+        # Documents are extracted in parallel (or read from the cache
+        # filled while counting tokens) and chunked lazily
+        for file_path, content in self.ingestor.iter_documents(
+            [str(path) for path in file_paths]
+        ):
+            self.content = content
+            self.metadata["file_path"] = file_path
 
             # Create an agent for each chunk
-            for i, chunk in enumerate(chunks):
-                agent = Agent(
-                    agent_name=f"Document Analysis Agent - {Path(file_path).name} - Chunk {i+1}",
-                    system_prompt="""
-                    You are an expert document analysis and summarization agent specialized in processing and understanding complex documents. Your primary responsibilities include:
-
-                    1. Document Analysis:
-                    - Thoroughly analyze the provided document chunk
-                    - Identify key themes, main arguments, and important details
-                    - Extract critical information and relationships between concepts
-
-                    2. Summarization Capabilities:
-                    - Create concise yet comprehensive summaries
-                    - Generate both high-level overviews and detailed breakdowns
-                    - Highlight key points, findings, and conclusions
-                    - Maintain context and relationships between different sections
-
-                    3. Information Extraction:
-                    - Identify and extract important facts, figures, and data points
-                    - Recognize and preserve technical terminology and domain-specific concepts
-                    - Maintain accuracy in representing the original content
-
-                    4. Response Format:
-                    - Provide clear, structured responses
-                    - Use bullet points for key findings
-                    - Include relevant quotes or references when necessary
-                    - Maintain professional and academic tone
-
-                    5. Context Awareness:
-                    - Consider the document's purpose and target audience
-                    - Adapt your analysis based on the document type (academic, technical, general)
-                    - Preserve the original meaning and intent
-
-                    Your goal is to help users understand and extract value from this document chunk while maintaining accuracy and completeness in your analysis.
-                    """,
-                    model_name=self.model_name,
-                    max_loops=1,
-                    max_tokens=self.token_count_per_agent,
+            for i, chunk in enumerate(
+                iter_chunks(
+                    content, self.token_count_per_agent, count_tokens
+                )
+            ):
+                agent = self._create_chunk_agent(
+                    f"Document Analysis Agent - {Path(file_path).name} - Chunk {i+1}"
                 )
 
                 # Run the agent on the chunk
@@ -272,6 +353,97 @@ class LongAgent:
 
         return self.agents
 
+    def _create_chunk_agent(self, agent_name: str) -> Agent:
+        """Create an agent that summarizes one document chunk."""
+        return Agent(
+            agent_name=agent_name,
+            system_prompt=CHUNK_AGENT_PROMPT,
+            model_name=self.model_name,
+            max_loops=1,
+            max_tokens=self.token_count_per_agent,
+        )
+
+    def summarize_chunk(self, chunk: str) -> str:
+        """Summarize one chunk with a fresh chunk agent."""
+        agent = self._create_chunk_agent("Document Analysis Agent")
+        return agent.run(CHUNK_TASK.format(chunk=chunk))
+
+    def merge_summaries(self, summaries: List[str]) -> str:
+        """Merge a group of partial summaries into one."""
+        return self._create_aggregator_agent().run(
+            REDUCE_TASK.format(
+                summaries="\n\n---\n\n".join(summaries)
+            )
+        )
+
+    def write_report(self, summaries: List[str]) -> str:
+        """Write the final report from the last group of summaries."""
+        return self._create_aggregator_agent().run(
+            REPORT_TASK.format(
+                summaries="\n\n---\n\n".join(summaries)
+            )
+        )
+
+    def _checkpoint_namespace(self) -> str:
+        """
+        Checkpoint namespace for the current configuration.
+
+        Combines the model names with a hash of every prompt and of
+        ``token_count_per_agent`` (the agents' ``max_tokens``), so changing
+        any of them starts from fresh checkpoints.
+        """
+        settings = hashlib.sha256()
+        for part in [
+            CHUNK_AGENT_PROMPT,
+            AGGREGATOR_AGENT_PROMPT,
+            CHUNK_TASK,
+            REDUCE_TASK,
+            REPORT_TASK,
+            str(self.token_count_per_agent),
+        ]:
+            settings.update(part.encode("utf-8"))
+            settings.update(b"\0")
+        return (
+            f"{self.model_name}:{self.aggregator_model_name}:"
+            f"{settings.hexdigest()[:16]}"
+        )
+
+    def run_map_reduce(
+        self, file_paths: List[Union[str, Path]]
+    ) -> str:
+        """
+        Summarize documents with a parallel map and a tree of merges.
+
+        Chunks are streamed from the ingestor and summarized concurrently;
+        summaries are then merged ``fan_in`` at a time until one group is
+        left for the final report. Reduce depth grows logarithmically with
+        the number of chunks, and with ``checkpoint_dir`` set a rerun only
+        repeats work that did not finish.
+
+        Args:
+            file_paths (List[Union[str, Path]]): The documents to process
+
+        Returns:
+            str: The final report
+        """
+        chunks = (
+            chunk
+            for _, _, chunk in self.ingestor.iter_chunks(
+                [str(path) for path in file_paths],
+                self.token_count_per_agent,
+            )
+        )
+        return tree_map_reduce(
+            chunks,
+            map_fn=self.summarize_chunk,
+            reduce_fn=self.merge_summaries,
+            final_fn=self.write_report,
+            max_concurrency=self.max_concurrency,
+            fan_in=self.fan_in,
+            checkpoint_dir=self.checkpoint_dir,
+            namespace=self._checkpoint_namespace(),
+        )
+
     def _split_into_chunks(self, content: str) -> List[str]:
         """
         Split content into chunks based on token count.
@@ -282,34 +454,11 @@ class LongAgent:
         Returns:
             List[str]: List of content chunks
         """
-        chunks = []
-        current_chunk = ""
-        current_tokens = 0
-
-        # Split content into sentences (simple approach)
-        sentences = content.split(". ")
-
-        for sentence in sentences:
-            sentence_tokens = count_tokens(sentence)
-
-            if (
-                current_tokens + sentence_tokens
-                > self.token_count_per_agent
-            ):
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = sentence
-                current_tokens = sentence_tokens
-            else:
-                current_chunk += (
-                    ". " + sentence if current_chunk else sentence
-                )
-                current_tokens += sentence_tokens
-
-        if current_chunk:
-            chunks.append(current_chunk)
-
-        return chunks
+        return list(
+            iter_chunks(
+                content, self.token_count_per_agent, count_tokens
+            )
+        )
 
     def count_total_agents(self) -> int:
         """
@@ -328,35 +477,7 @@ class LongAgent:
         """
         return Agent(
             agent_name="Document Aggregator Agent",
-            system_prompt="""
-            You are an expert document synthesis agent specialized in creating comprehensive reports from multiple document summaries. Your responsibilities include:
-
-            1. Synthesis and Integration:
-            - Combine multiple document summaries into a coherent narrative
-            - Identify and resolve any contradictions or inconsistencies
-            - Maintain logical flow and structure in the final report
-            - Preserve important details while eliminating redundancy
-
-            2. Report Structure:
-            - Create a clear, hierarchical structure for the report
-            - Include an executive summary at the beginning
-            - Organize content into logical sections with clear headings
-            - Ensure smooth transitions between different topics
-
-            3. Analysis and Insights:
-            - Identify overarching themes and patterns across summaries
-            - Draw meaningful conclusions from the combined information
-            - Highlight key findings and their implications
-            - Provide context and connections between different pieces of information
-
-            4. Quality Assurance:
-            - Ensure factual accuracy and consistency
-            - Maintain professional and academic tone
-            - Verify that all important information is included
-            - Check for clarity and readability
-
-            Your goal is to create a comprehensive, well-structured report that effectively synthesizes all the provided document summaries into a single coherent document.
-            """,
+            system_prompt=AGGREGATOR_AGENT_PROMPT,
             model_name=self.aggregator_model_name,
             max_loops=1,
             max_tokens=self.token_count_per_agent,
@@ -372,6 +493,15 @@ class LongAgent:
         Returns:
             str: The final comprehensive report
         """
+        if self.mode == "map_reduce":
+            final_report = self.run_map_reduce(file_paths)
+            self.conversation.add(
+                role="Document Aggregator Agent", content=final_report
+            )
+            return history_output_formatter(
+                conversation=self.conversation, type=self.output_type
+            )
+
         # Count total tokens
         total_tokens = self.count_multiple_documents(file_paths)
         formatter.print_panel(
@@ -398,20 +528,7 @@ class LongAgent:
 
         # Generate the final comprehensive report
         final_report = aggregator_agent.run(
-            f"""
-            Please create a comprehensive report by synthesizing the following document summaries:
-
-            {combined_summaries}
-
-            Please structure your response as follows:
-            1. Executive Summary
-            2. Main Findings and Analysis
-            3. Key Themes and Patterns
-            4. Detailed Breakdown by Topic
-            5. Conclusions and Implications
-
-            Ensure the report is well-organized, comprehensive, and maintains a professional tone throughout.
-            """
+            REPORT_TASK.format(summaries=combined_summaries)
         )
 
         # Add the final report to the conversation
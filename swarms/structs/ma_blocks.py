@@ -2,6 +2,10 @@ from typing import Union
 from swarms.structs.agent import Agent
 from typing import List, Callable
 from swarms.structs.conversation import Conversation
+from swarms.structs.agent_registry import (
+    AgentRegistry,
+    lookup_agent,
+)
 from swarms.structs.multi_agent_exec import run_agents_concurrently
 from swarms.utils.history_output_formatter import (
     history_output_formatter,
@@ -125,13 +129,14 @@ def run_agent(
 
 
 def find_agent_by_name(
-    agents: List[Union[Agent, Callable]], agent_name: str
+    agents: Union[List[Union[Agent, Callable]], AgentRegistry],
+    agent_name: str,
 ) -> Agent:
     """
     Find an agent by its name in a list of agents.
 
     Args:
-        agents (List[Union[Agent, Callable]]): List of agents to search through
+        agents (Union[List[Union[Agent, Callable]], AgentRegistry]): Agents to search through. A registry built with ``index_agents`` resolves the name in O(1); a list is scanned
         agent_name (str): Name of the agent to find
 
     Returns:
@@ -151,9 +156,9 @@ def find_agent_by_name(
         raise ValueError("Agent name cannot be empty or whitespace")
 
     try:
-        for agent in agents:
-            if hasattr(agent, "name") and agent.name == agent_name:
-                return agent
+        agent = lookup_agent(agents, agent_name, attribute="name")
+        if agent is not None:
+            return agent
         raise ValueError(f"Agent with name '{agent_name}' not found")
     except Exception as e:
         raise RuntimeError(f"Error finding agent: {str(e)}")
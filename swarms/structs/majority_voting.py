@@ -4,11 +4,16 @@ import os
 import re
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, List, Optional
+from functools import partial
+from typing import Any, Callable, List, Optional, Union
 
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
-from swarms.structs.multi_agent_exec import run_agents_concurrently
+from swarms.structs.quorum_voting import (
+    QuorumResult,
+    normalize_answer,
+    quorum_vote,
+)
 from swarms.utils.output_types import OutputType
 from swarms.utils.formatter import formatter
 from swarms.utils.loguru_logger import initialize_logger
@@ -124,6 +129,11 @@ class MajorityVoting:
             If not provided, the default majority voting function is used.
         autosave (bool, optional): A boolean indicating whether to autosave the conversation to a file.
         verbose (bool, optional): A boolean indicating whether to enable verbose logging.
+        quorum (Union[int, float, None], optional): Votes an answer needs to win without
+            the consensus agent. A float is a fraction of the agents; None means a strict majority.
+        normalizer (Callable, optional): Maps a response to the answer it votes for.
+        max_workers (int, optional): Agents running at once. Defaults to the quorum, so
+            agents beyond it only run while the vote is undecided.
     Examples:
         >>> from swarms.structs.agent import Agent
         >>> from swarms.structs.majority_voting import MajorityVoting
@@ -149,6 +159,9 @@ class MajorityVoting:
         verbose: bool = False,
         max_loops: int = 1,
         output_type: OutputType = "dict",
+        quorum: Union[int, float, None] = None,
+        normalizer: Callable[[Any], str] = normalize_answer,
+        max_workers: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -161,6 +174,10 @@ class MajorityVoting:
         self.verbose = verbose
         self.max_loops = max_loops
         self.output_type = output_type
+        self.quorum = quorum
+        self.normalizer = normalizer
+        self.max_workers = max_workers
+        self.last_vote: Optional[QuorumResult] = None
 
         self.conversation = Conversation(
             time_enabled=False, *args, **kwargs
@@ -183,6 +200,9 @@ class MajorityVoting:
         """
         Runs the majority voting system and returns the majority vote.
 
+        Agents vote until the quorum outcome is decided; the consensus agent
+        is only consulted when no answer reaches the quorum.
+
         Args:
             task (str): The task to be performed by the agents.
             *args: Variable length argument list.
@@ -192,25 +212,59 @@ class MajorityVoting:
             List[Any]: The majority vote.
 
         """
-        results = run_agents_concurrently(
-            self.agents, task, max_workers=os.cpu_count()
+        vote = quorum_vote(
+            [
+                (agent.agent_name, partial(agent.run, task))
+                for agent in self.agents
+            ],
+            quorum=self.quorum,
+            normalizer=self.normalizer,
+            max_workers=self.max_workers,
         )
+        self.last_vote = vote
 
-        # Add responses to conversation and log them
-        for agent, response in zip(self.agents, results):
+        # Responses stay paired with the agent that produced them
+        for agent_name, response in vote.responses:
+            self.conversation.add(agent_name, response)
 
-            response = (
-                response if isinstance(response, list) else [response]
+        if vote.decided:
+            # A clear winner needs no consensus call
+            logger.info(
+                f"Quorum of {vote.quorum} reached after "
+                f"{len(vote.responses)} of {len(self.agents)} agents"
             )
-            self.conversation.add(agent.agent_name, response)
+            self.conversation.add(self.name, vote.winner)
+        else:
+            self.run_consensus(vote)
+
+        # Return the majority vote
+        # return self.conversation.return_history_as_string()
+        if self.output_type == "str":
+            return self.conversation.get_str()
+        elif self.output_type == "dict":
+            return self.conversation.return_messages_as_dictionary()
+        elif self.output_type == "list":
+            return self.conversation.return_messages_as_list()
+        else:
+            return self.conversation.return_history_as_string()
 
+    def run_consensus(self, vote: QuorumResult) -> Any:
+        """
+        Ask the consensus agent to reconcile responses without a clear winner.
+
+        Args:
+            vote (QuorumResult): The undecided vote.
+
+        Returns:
+            Any: The consensus agent's answer.
+        """
         responses = self.conversation.return_history_as_string()
-        # print(responses)
+        voters = [name for name, _ in vote.responses]
 
         prompt = f"""Conduct a detailed majority voting analysis on the following conversation:
         {responses}
 
-        Between the following agents: {[agent.agent_name for agent in self.agents]}
+        Between the following agents: {voters}
 
         Please:
         1. Identify the most common answer/recommendation across all agents
@@ -223,31 +277,14 @@ class MajorityVoting:
         Focus on finding clear patterns while being mindful of important nuances in the responses.
         """
 
-        # If an output parser is provided, parse the responses
-        if self.consensus_agent is not None:
-            majority_vote = self.consensus_agent.run(prompt)
+        # Fall back to the last agent when no consensus agent is set
+        consensus_agent = self.consensus_agent or self.agents[-1]
+        majority_vote = consensus_agent.run(prompt)
 
-            self.conversation.add(
-                self.consensus_agent.agent_name, majority_vote
-            )
-        else:
-            # fetch the last agent
-            majority_vote = self.agents[-1].run(prompt)
-
-            self.conversation.add(
-                self.agents[-1].agent_name, majority_vote
-            )
-
-        # Return the majority vote
-        # return self.conversation.return_history_as_string()
-        if self.output_type == "str":
-            return self.conversation.get_str()
-        elif self.output_type == "dict":
-            return self.conversation.return_messages_as_dictionary()
-        elif self.output_type == "list":
-            return self.conversation.return_messages_as_list()
-        else:
-            return self.conversation.return_history_as_string()
+        self.conversation.add(
+            consensus_agent.agent_name, majority_vote
+        )
+        return majority_vote
 
     def batch_run(
         self, tasks: List[str], *args, **kwargs
@@ -0,0 +1,231 @@
+"""
+Hierarchical map-reduce over text with disk checkpoints.
+
+``tree_map_reduce`` summarizes inputs too large for one model call:
+
+1. **Map** - ``map_fn`` runs on every item in a thread pool, with at most
+   ``max_concurrency`` calls in flight. Items are pulled from the iterable
+   lazily, so chunks can be produced while earlier ones are summarized.
+2. **Reduce** - results are grouped ``fan_in`` at a time and each group is
+   reduced in parallel, level by level, until one result is left. Depth is
+   ``ceil(log_fan_in(n))`` and no reducer ever sees more than ``fan_in``
+   inputs. The root group goes to ``final_fn`` when one is given.
+
+With a ``checkpoint_dir`` every map and reduce result is stored under the
+SHA-256 of its stage and inputs, so a rerun after a failure skips all work
+that already finished, and changed inputs are recomputed.
+
+Example:
+    >>> report = tree_map_reduce(
+    ...     chunks,
+    ...     map_fn=summarize,
+    ...     reduce_fn=lambda parts: combine(parts),
+    ...     fan_in=8,
+    ...     checkpoint_dir="agent_workspace/long_agent",
+    ... )
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+from collections import deque
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+)
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="map_reduce")
+
+
+class CheckpointStore:
+    """
+    Content-addressed store of intermediate results.
+
+    Args:
+        directory (Optional[str]): Where results are written. When None,
+            nothing is persisted.
+        namespace (str): Mixed into every key, e.g. to separate models or
+            prompts sharing one directory.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, namespace: str = ""
+    ):
+        self.directory = directory
+        self.namespace = namespace
+        self.hits = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, stage: str, inputs: List[str]) -> str:
+        """Key for ``inputs`` processed at ``stage``."""
+        digest = hashlib.sha256()
+        for part in [self.namespace, stage, *inputs]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a stored result, or None."""
+        path = self._path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: str) -> None:
+        """Store a result atomically."""
+        path = self._path(key)
+        if not path:
+            return
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"result": result}, f)
+        os.replace(tmp, path)
+
+
+def _checkpointed(
+    store: CheckpointStore,
+    stage: str,
+    inputs: List[str],
+    fn: Callable[[], str],
+) -> str:
+    key = store.key(stage, inputs)
+    result = store.get(key)
+    if result is None:
+        result = str(fn())
+        store.put(key, result)
+    return result
+
+
+def map_stage(
+    items: Iterable[str],
+    map_fn: Callable[[str], str],
+    max_concurrency: int = 8,
+    store: Optional[CheckpointStore] = None,
+) -> List[str]:
+    """
+    Apply ``map_fn`` to every item concurrently, keeping input order.
+
+    Args:
+        items (Iterable[str]): Inputs, consumed lazily.
+        map_fn (Callable[[str], str]): Maps one item.
+        max_concurrency (int): Calls in flight at once.
+        store (Optional[CheckpointStore]): Checkpoints for results.
+
+    Returns:
+        List[str]: One result per item.
+    """
+    store = store or CheckpointStore()
+    results: List[str] = []
+    in_flight: deque = deque()
+    remaining = iter(items)
+
+    def submit(executor) -> bool:
+        item = next(remaining, None)
+        if item is None:
+            return False
+        in_flight.append(
+            executor.submit(
+                _checkpointed,
+                store,
+                "map",
+                [item],
+                lambda: map_fn(item),
+            )
+        )
+        return True
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency
+    ) as executor:
+        while len(in_flight) < max_concurrency and submit(executor):
+            pass
+        while in_flight:
+            results.append(in_flight.popleft().result())
+            submit(executor)
+    return results
+
+
+def tree_map_reduce(
+    items: Iterable[str],
+    map_fn: Callable[[str], str],
+    reduce_fn: Callable[[List[str]], str],
+    final_fn: Optional[Callable[[List[str]], str]] = None,
+    max_concurrency: int = 8,
+    fan_in: int = 8,
+    checkpoint_dir: Optional[str] = None,
+    namespace: str = "",
+) -> str:
+    """
+    Map every item, then reduce the results in a tree.
+
+    Args:
+        items (Iterable[str]): Inputs, e.g. document chunks.
+        map_fn (Callable[[str], str]): Maps one item, e.g. summarizes it.
+        reduce_fn (Callable[[List[str]], str]): Combines up to ``fan_in``
+            results into one.
+        final_fn (Optional[Callable[[List[str]], str]]): Combines the last
+            group into the final output. Defaults to ``reduce_fn``.
+        max_concurrency (int): Map or reduce calls in flight at once.
+        fan_in (int): Maximum inputs per reduce call (at least 2).
+        checkpoint_dir (Optional[str]): Directory for checkpoints.
+        namespace (str): Separates checkpoints of different pipelines.
+
+    Returns:
+        str: The final result ("" when there are no items).
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    store = CheckpointStore(checkpoint_dir, namespace)
+    final_fn = final_fn or reduce_fn
+
+    level = map_stage(items, map_fn, max_concurrency, store)
+    if not level:
+        return ""
+
+    depth = 0
+    while len(level) > fan_in:
+        depth += 1
+        groups = [
+            level[i : i + fan_in]
+            for i in range(0, len(level), fan_in)
+        ]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency
+        ) as executor:
+            level = list(
+                executor.map(
+                    lambda group: _checkpointed(
+                        store,
+                        "reduce",
+                        group,
+                        lambda: reduce_fn(group),
+                    ),
+                    groups,
+                )
+            )
+        logger.info(
+            f"Reduce level {depth}: {len(groups)} groups, "
+            f"{len(level)} results"
+        )
+
+    return _checkpointed(
+        store, "final", level, lambda: final_fn(level)
+    )
@@ -1,5 +1,18 @@
+import concurrent.futures
 import json
-from typing import Any, List
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -24,16 +37,151 @@ class AgentOutput(BaseModel):
     )
 
 
+class AgentCall(NamedTuple):
+    """One deferred ``agent.run(task)`` call."""
+
+    agent: Agent
+    task: str
+
+    @property
+    def key(self) -> Tuple[int, str]:
+        """Identical calls share a key and are run once."""
+        return id(self.agent), self.task
+
+
+def run_calls(
+    calls: Iterable[AgentCall], max_workers: Optional[int] = None
+) -> Dict[Hashable, Any]:
+    """
+    Run each unique call once, concurrently.
+
+    Calls on the same agent run one after another in a single worker, so
+    an agent's memory is never used by two threads at once. A failed call
+    stores its exception as the result instead of raising.
+
+    Args:
+        calls (Iterable[AgentCall]): Calls to run; duplicates are dropped.
+        max_workers (Optional[int]): Agents run at once. Defaults to the
+            CPU count.
+
+    Returns:
+        Dict[Hashable, Any]: Result of every call, by ``AgentCall.key``.
+    """
+    by_agent: Dict[int, Dict[str, AgentCall]] = {}
+    for call in calls:
+        by_agent.setdefault(id(call.agent), {}).setdefault(
+            call.task, call
+        )
+
+    def run_agent(agent_calls: List[AgentCall]) -> Dict:
+        results = {}
+        for call in agent_calls:
+            try:
+                results[call.key] = call.agent.run(call.task)
+            except Exception as e:
+                logger.error(
+                    f"{call.agent.agent_name} failed on {call.task!r}: {e}"
+                )
+                results[call.key] = e
+        return results
+
+    results: Dict[Hashable, Any] = {}
+    if not by_agent:
+        return results
+    workers = min(max_workers or os.cpu_count() or 1, len(by_agent))
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        for agent_results in executor.map(
+            run_agent,
+            [list(tasks.values()) for tasks in by_agent.values()],
+        ):
+            results.update(agent_results)
+    return results
+
+
+class Plan:
+    """
+    A deferred computation over agent calls.
+
+    Building a plan runs nothing. ``evaluate`` collects the calls the plan
+    needs, runs each unique ``(agent, task)`` once with bounded
+    parallelism, then assembles the result from those outputs.
+
+    Args:
+        calls (Callable[[], Iterable[AgentCall]]): Yields the calls needed.
+        assemble (Callable[[Callable[[AgentCall], Any]], Any]): Builds the
+            result given a lookup from call to output.
+    """
+
+    def __init__(
+        self,
+        calls: Callable[[], Iterable[AgentCall]],
+        assemble: Callable[[Callable[[AgentCall], Any]], Any],
+    ):
+        self._calls = calls
+        self._assemble = assemble
+
+    def calls(self) -> Iterable[AgentCall]:
+        """Every call the plan makes, including duplicates."""
+        return self._calls()
+
+    def unique_calls(self) -> List[AgentCall]:
+        """The calls left after deduplication."""
+        return list(
+            {call.key: call for call in self.calls()}.values()
+        )
+
+    def evaluate(self, max_workers: Optional[int] = None) -> Any:
+        """Run the plan's calls and return its result."""
+        return evaluate_plans([self], max_workers)[0]
+
+
+def evaluate_plans(
+    plans: Sequence[Plan], max_workers: Optional[int] = None
+) -> List[Any]:
+    """
+    Evaluate several plans together, sharing calls between them.
+
+    Args:
+        plans (Sequence[Plan]): Plans to evaluate.
+        max_workers (Optional[int]): Agents run at once.
+
+    Returns:
+        List[Any]: One result per plan.
+    """
+    results = run_calls(
+        (call for plan in plans for call in plan.calls()),
+        max_workers,
+    )
+    return [
+        plan._assemble(lambda call: results[call.key])
+        for plan in plans
+    ]
+
+
 class MatrixSwarm:
     """
     A class to manage a matrix of agents and perform matrix operations similar to linear algebra.
+
+    Structural operations (``transpose``, ``add``, ``subtract``,
+    ``scalar_multiply`` and ``view``) return views that share the original
+    agent grid and only remap indices. ``multiply`` and ``determinant``
+    build a ``Plan`` and evaluate it, running each unique agent call once
+    and independent calls concurrently.
     """
 
-    def __init__(self, agents: List[List[Agent]]):
+    def __init__(
+        self,
+        agents: List[List[Agent]],
+        max_workers: Optional[int] = None,
+    ):
         """
         Initializes the MatrixSwarm with a 2D list of agents.
         Args:
             agents (List[List[Agent]]): 2D list of agents representing the matrix.
+            max_workers (Optional[int]): Agents run at once when a plan is
+                evaluated. Defaults to the CPU count.
         """
         if not agents or not all(
             isinstance(row, list) for row in agents
@@ -47,9 +195,89 @@ class MatrixSwarm:
             raise ValueError(
                 "All elements of the matrix must be instances of `Agent`."
             )
-        self.agents = agents
+        self._grid = agents
+        self._rows: Sequence[int] = range(len(agents))
+        self._cols: Sequence[int] = range(len(agents[0]))
+        self._transposed = False
+        self.max_workers = max_workers
         self.outputs = []  # List to store outputs as AgentOutput
 
+    def _derive(
+        self,
+        rows: Sequence[int],
+        cols: Sequence[int],
+        transposed: bool,
+    ) -> "MatrixSwarm":
+        view = MatrixSwarm.__new__(MatrixSwarm)
+        view._grid = self._grid
+        view._rows = rows
+        view._cols = cols
+        view._transposed = transposed
+        view.max_workers = self.max_workers
+        view.outputs = []
+        return view
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """``(rows, columns)`` of the matrix."""
+        if self._transposed:
+            return len(self._cols), len(self._rows)
+        return len(self._rows), len(self._cols)
+
+    def agent_at(self, i: int, j: int) -> Agent:
+        """The agent at row ``i``, column ``j``."""
+        if self._transposed:
+            i, j = j, i
+        return self._grid[self._rows[i]][self._cols[j]]
+
+    @property
+    def agents(self) -> List[List[Agent]]:
+        """The agents as a 2D list, built on access for views."""
+        if (
+            not self._transposed
+            and self._rows == range(len(self._grid))
+            and self._cols == range(len(self._grid[0]))
+        ):
+            return self._grid
+        rows, cols = self.shape
+        return [
+            [self.agent_at(i, j) for j in range(cols)]
+            for i in range(rows)
+        ]
+
+    @agents.setter
+    def agents(self, agents: List[List[Agent]]) -> None:
+        self._grid = agents
+        self._rows = range(len(agents))
+        self._cols = range(len(agents[0]))
+        self._transposed = False
+
+    def view(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        cols: Optional[Sequence[int]] = None,
+    ) -> "MatrixSwarm":
+        """
+        A view of selected rows and columns, without copying agents.
+
+        Args:
+            rows (Optional[Sequence[int]]): Row indices; all when None.
+            cols (Optional[Sequence[int]]): Column indices; all when None.
+
+        Returns:
+            MatrixSwarm: A view sharing this matrix's agents.
+        """
+        n_rows, n_cols = self.shape
+        rows = range(n_rows) if rows is None else rows
+        cols = range(n_cols) if cols is None else cols
+        if self._transposed:
+            rows, cols = cols, rows
+        return self._derive(
+            [self._rows[r] for r in rows],
+            [self._cols[c] for c in cols],
+            self._transposed,
+        )
+
     def validate_dimensions(self, other: "MatrixSwarm") -> None:
         """
         Validates that two matrices have compatible dimensions for operations.
@@ -60,9 +288,7 @@ class MatrixSwarm:
         Raises:
             ValueError: If dimensions are incompatible.
         """
-        if len(self.agents) != len(other.agents) or len(
-            self.agents[0]
-        ) != len(other.agents[0]):
+        if self.shape != other.shape:
             raise ValueError(
                 "Matrix dimensions are incompatible for this operation."
             )
@@ -72,13 +298,11 @@ class MatrixSwarm:
         Transposes the matrix of agents (swap rows and columns).
 
         Returns:
-            MatrixSwarm: A new transposed MatrixSwarm.
+            MatrixSwarm: A transposed view of this MatrixSwarm.
         """
-        transposed_agents = [
-            [self.agents[j][i] for j in range(len(self.agents))]
-            for i in range(len(self.agents[0]))
-        ]
-        return MatrixSwarm(transposed_agents)
+        return self._derive(
+            self._rows, self._cols, not self._transposed
+        )
 
     def add(self, other: "MatrixSwarm") -> "MatrixSwarm":
         """
@@ -88,14 +312,10 @@ class MatrixSwarm:
             other (MatrixSwarm): Another MatrixSwarm to add.
 
         Returns:
-            MatrixSwarm: A new MatrixSwarm resulting from the addition.
+            MatrixSwarm: A view resulting from the addition.
         """
         self.validate_dimensions(other)
-        added_agents = [
-            [self.agents[i][j] for j in range(len(self.agents[i]))]
-            for i in range(len(self.agents))
-        ]
-        return MatrixSwarm(added_agents)
+        return self._derive(self._rows, self._cols, self._transposed)
 
     def scalar_multiply(self, scalar: int) -> "MatrixSwarm":
         """
@@ -105,66 +325,94 @@ class MatrixSwarm:
             scalar (int): The scalar multiplier.
 
         Returns:
-            MatrixSwarm: A new MatrixSwarm where each agent is repeated scalar times along the row.
+            MatrixSwarm: A view where each row is repeated scalar times.
         """
-        scaled_agents = [
-            [agent for _ in range(scalar) for agent in row]
-            for row in self.agents
-        ]
-        return MatrixSwarm(scaled_agents)
+        if self._transposed:
+            return self._derive(
+                list(self._rows) * scalar, self._cols, True
+            )
+        return self._derive(
+            self._rows, list(self._cols) * scalar, False
+        )
 
-    def multiply(
+    def plan_multiply(
         self, other: "MatrixSwarm", inputs: List[str]
-    ) -> List[List[AgentOutput]]:
+    ) -> Plan:
         """
-        Multiplies two matrices (dot product between rows and columns).
+        Build the plan for ``multiply`` without running any agent.
+
+        Cell ``(i, j)`` joins the outputs of row ``i``'s agents on
+        ``inputs[i]``, so every column of a row reuses the same calls.
 
         Args:
             other (MatrixSwarm): Another MatrixSwarm for multiplication.
-            inputs (List[str]): A list of input queries for the agents.
+            inputs (List[str]): One input query per row.
 
         Returns:
-            List[List[AgentOutput]]: A resulting matrix of outputs after multiplication.
+            Plan: Evaluates to a ``List[List[AgentOutput]]``.
         """
-        if len(self.agents[0]) != len(other.agents):
+        n_rows, inner = self.shape
+        other_rows, n_cols = other.shape
+        if inner != other_rows:
             raise ValueError(
                 "Matrix dimensions are incompatible for multiplication."
             )
 
-        results = []
-        for i, row in enumerate(self.agents):
-            row_results = []
-            for col_idx in range(len(other.agents[0])):
-                col = [
-                    other.agents[row_idx][col_idx]
-                    for row_idx in range(len(other.agents))
-                ]
-                query = inputs[
-                    i
-                ]  # Input query for the corresponding row
-                intermediate_result = []
+        def cell_calls(i: int) -> List[AgentCall]:
+            return [
+                AgentCall(self.agent_at(i, k), inputs[i])
+                for k in range(inner)
+            ]
 
-                for agent_r, agent_c in zip(row, col):
-                    try:
-                        result = agent_r.run(query)
-                        intermediate_result.append(result)
-                    except Exception as e:
-                        intermediate_result.append(f"Error: {e}")
+        def calls() -> Iterable[AgentCall]:
+            for i in range(n_rows):
+                for _ in range(n_cols):
+                    yield from cell_calls(i)
 
+        def assemble(
+            lookup: Callable[[AgentCall], Any],
+        ) -> List[List[AgentOutput]]:
+            results = []
+            for i in range(n_rows):
+                intermediate_result = []
+                for call in cell_calls(i):
+                    result = lookup(call)
+                    if isinstance(result, Exception):
+                        result = f"Error: {result}"
+                    intermediate_result.append(result)
                 # Aggregate outputs from dot product
-                combined_result = " ".join(
-                    intermediate_result
-                )  # Example aggregation
-                row_results.append(
-                    AgentOutput(
-                        agent_name=f"DotProduct-{i}-{col_idx}",
-                        input_query=query,
-                        output_result=combined_result,
-                        metadata={"row": i, "col": col_idx},
-                    )
+                combined_result = " ".join(intermediate_result)
+                results.append(
+                    [
+                        AgentOutput(
+                            agent_name=f"DotProduct-{i}-{col_idx}",
+                            input_query=inputs[i],
+                            output_result=combined_result,
+                            metadata={"row": i, "col": col_idx},
+                        )
+                        for col_idx in range(n_cols)
+                    ]
                 )
-            results.append(row_results)
-        return results
+            return results
+
+        return Plan(calls, assemble)
+
+    def multiply(
+        self, other: "MatrixSwarm", inputs: List[str]
+    ) -> List[List[AgentOutput]]:
+        """
+        Multiplies two matrices (dot product between rows and columns).
+
+        Args:
+            other (MatrixSwarm): Another MatrixSwarm for multiplication.
+            inputs (List[str]): A list of input queries for the agents.
+
+        Returns:
+            List[List[AgentOutput]]: A resulting matrix of outputs after multiplication.
+        """
+        return self.plan_multiply(other, inputs).evaluate(
+            self.max_workers
+        )
 
     def subtract(self, other: "MatrixSwarm") -> "MatrixSwarm":
         """
@@ -174,14 +422,10 @@ class MatrixSwarm:
             other (MatrixSwarm): Another MatrixSwarm to subtract.
 
         Returns:
-            MatrixSwarm: A new MatrixSwarm resulting from the subtraction.
+            MatrixSwarm: A view resulting from the subtraction.
         """
         self.validate_dimensions(other)
-        subtracted_agents = [
-            [self.agents[i][j] for j in range(len(self.agents[i]))]
-            for i in range(len(self.agents))
-        ]
-        return MatrixSwarm(subtracted_agents)
+        return self._derive(self._rows, self._cols, self._transposed)
 
     def identity(self, size: int) -> "MatrixSwarm":
         """
@@ -196,7 +440,7 @@ class MatrixSwarm:
         identity_agents = [
             [
                 (
-                    self.agents[i][j]
+                    self.agent_at(i, j)
                     if i == j
                     else Agent(
                         agent_name=f"Zero-Agent-{i}-{j}",
@@ -207,34 +451,68 @@ class MatrixSwarm:
             ]
             for i in range(size)
         ]
-        return MatrixSwarm(identity_agents)
+        return MatrixSwarm(identity_agents, self.max_workers)
 
-    def determinant(self) -> Any:
+    def plan_determinant(self) -> Plan:
         """
-        Computes the determinant of a square MatrixSwarm.
+        Build the plan for ``determinant`` without running any agent.
+
+        Each agent is asked once; the cofactor expansion then reuses its
+        output and memoizes minors, so repeated submatrices cost nothing.
 
         Returns:
-            Any: Determinant of the matrix (as agent outputs).
+            Plan: Evaluates to the determinant.
         """
-        if len(self.agents) != len(self.agents[0]):
+        size, cols = self.shape
+        if size != cols:
             raise ValueError(
                 "Determinant can only be computed for square matrices."
             )
+        task = "Compute determinant"
+
+        def calls() -> Iterable[AgentCall]:
+            for i in range(size):
+                for j in range(size):
+                    yield AgentCall(self.agent_at(i, j), task)
+
+        def assemble(lookup: Callable[[AgentCall], Any]) -> Any:
+            minors: Dict[Tuple[int, ...], Any] = {}
+
+            def value(i: int, j: int) -> Any:
+                result = lookup(AgentCall(self.agent_at(i, j), task))
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            # Minor over rows size - len(columns).. and the given columns
+            def minor(columns: Tuple[int, ...]) -> Any:
+                if columns in minors:
+                    return minors[columns]
+                row = size - len(columns)
+                if len(columns) == 1:
+                    det_result = value(row, columns[0])
+                else:
+                    det_result = 0
+                    for i, column in enumerate(columns):
+                        cofactor = ((-1) ** i) * value(row, column)
+                        det_result += cofactor * minor(
+                            columns[:i] + columns[i + 1 :]
+                        )
+                minors[columns] = det_result
+                return det_result
+
+            return minor(tuple(range(size)))
+
+        return Plan(calls, assemble)
 
-        # Recursive determinant calculation (example using placeholder logic)
-        if len(self.agents) == 1:
-            return self.agents[0][0].run("Compute determinant")
+    def determinant(self) -> Any:
+        """
+        Computes the determinant of a square MatrixSwarm.
 
-        det_result = 0
-        for i in range(len(self.agents)):
-            submatrix = MatrixSwarm(
-                [row[:i] + row[i + 1 :] for row in self.agents[1:]]
-            )
-            cofactor = ((-1) ** i) * self.agents[0][i].run(
-                "Compute determinant"
-            )
-            det_result += cofactor * submatrix.determinant()
-        return det_result
+        Returns:
+            Any: Determinant of the matrix (as agent outputs).
+        """
+        return self.plan_determinant().evaluate(self.max_workers)
 
     def save_to_file(self, path: str) -> None:
         """
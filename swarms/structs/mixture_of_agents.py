@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 
 from swarms.structs.agent import Agent
@@ -12,6 +12,10 @@ from swarms.utils.loguru_logger import initialize_logger
 import concurrent.futures
 from swarms.utils.output_types import OutputType
 from swarms.structs.conversation import Conversation
+from swarms.structs.context_policy import (
+    ContextPolicy,
+    resolve_policy,
+)
 
 
 logger = initialize_logger(log_folder="mixture_of_agents")
@@ -33,6 +37,9 @@ class MixtureOfAgents:
         max_loops: int = 1,
         output_type: OutputType = "final",
         aggregator_model_name: str = "claude-3-5-sonnet-20240620",
+        context_policy: Union[
+            ContextPolicy, Dict[str, ContextPolicy]
+        ] = None,
     ) -> None:
         """
         Initialize the Mixture of Agents class with agents and configuration.
@@ -44,6 +51,7 @@ class MixtureOfAgents:
             aggregator_agent (Agent, optional): The aggregator agent to be used in the mixture. Defaults to None.
             aggregator_system_prompt (str, optional): The system prompt for the aggregator agent. Defaults to "".
             layers (int, optional): The number of layers to process in the mixture. Defaults to 3.
+            context_policy (Union[ContextPolicy, Dict[str, ContextPolicy]], optional): Limits the transcript each agent receives, either for all agents or per agent name. Defaults to None (full history).
         """
         self.name = name
         self.description = description
@@ -54,6 +62,7 @@ class MixtureOfAgents:
         self.max_loops = max_loops
         self.output_type = output_type
         self.aggregator_model_name = aggregator_model_name
+        self.context_policy = context_policy
         self.aggregator_agent = self.aggregator_agent_setup()
 
         self.reliability_check()
@@ -106,6 +115,13 @@ class MixtureOfAgents:
         with open(file_path, "w") as f:
             f.write(self.conversation.get_str())
 
+    def agent_context(self, agent: Agent, task: str) -> str:
+        """Return ``task`` or the agent's policy-limited transcript."""
+        policy = resolve_policy(self.context_policy, agent.agent_name)
+        if policy is None:
+            return task
+        return self.conversation.get_context(policy)
+
     def step(
         self,
         task: str,
@@ -121,7 +137,10 @@ class MixtureOfAgents:
             # Submit all agent tasks and store with their index
             future_to_agent = {
                 executor.submit(
-                    agent.run, task=task, img=img, imgs=imgs
+                    agent.run,
+                    task=self.agent_context(agent, task),
+                    img=img,
+                    imgs=imgs,
                 ): agent
                 for agent in self.agents
             }
@@ -152,7 +171,9 @@ class MixtureOfAgents:
             task = out
 
         out = self.aggregator_agent.run(
-            task=self.conversation.get_str()
+            task=self.agent_context(
+                self.aggregator_agent, self.conversation.get_str()
+            )
         )
 
         self.conversation.add(
@@ -1,9 +1,12 @@
 import asyncio
 import os
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from swarms.structs.routing_cache import RoutingCache
+
 from swarms.utils.function_caller_model import OpenAIFunctionCaller
 from swarms.utils.any_to_str import any_to_str
 from swarms.utils.formatter import formatter
@@ -161,6 +164,28 @@ Provide clear rationale for your model selection based on the specific task requ
 """
 
 
+@lru_cache(maxsize=64)
+def pooled_llm(
+    provider: str,
+    model: str,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+    system_prompt: Optional[str] = None,
+) -> LiteLLM:
+    """
+    Return a shared LiteLLM client for a (provider, model, params) combination.
+
+    ``LiteLLM.run`` keeps no per-call state, so one client per configuration
+    can serve every routed task.
+    """
+    return LiteLLM(
+        model_name=f"{provider}/{model}",
+        max_tokens=max_tokens,
+        temperature=temperature,
+        system_prompt=system_prompt,
+    )
+
+
 class ModelRouter:
     """
     A router class that intelligently selects and executes AI models based on task requirements.
@@ -175,6 +200,7 @@ class ModelRouter:
         max_workers (int): Maximum concurrent workers for batch processing
         model_output (ModelOutput): Pydantic model for structured outputs
         model_caller (OpenAIFunctionCaller): Function calling interface
+        routing_cache (Optional[RoutingCache]): Cache of routing decisions
     """
 
     def __init__(
@@ -185,6 +211,8 @@ class ModelRouter:
         max_workers: int = 10,
         api_key: str = None,
         max_loops: int = 1,
+        routing_cache: Optional[RoutingCache] = None,
+        cache_routing: bool = True,
         *args,
         **kwargs,
     ):
@@ -196,6 +224,10 @@ class ModelRouter:
             max_tokens (int): Maximum output tokens
             temperature (float): Model temperature parameter
             max_workers (int): Max concurrent workers
+            routing_cache (Optional[RoutingCache]): Cache for routing
+                decisions; a default one is created when None
+            cache_routing (bool): Set False to call the router model for
+                every task
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
@@ -206,6 +238,11 @@ class ModelRouter:
             self.max_workers = max_workers
             self.model_output = ModelOutput
             self.max_loops = max_loops
+            if routing_cache is None and cache_routing:
+                routing_cache = RoutingCache()
+            self.routing_cache = (
+                routing_cache if cache_routing else None
+            )
 
             if self.max_workers == "auto":
                 self.max_workers = os.cpu_count()
@@ -221,6 +258,42 @@ class ModelRouter:
                 f"Failed to initialize ModelRouter: {str(e)}"
             )
 
+    def route(self, task: str) -> ModelOutput:
+        """
+        Choose a model for ``task``, answering from the routing cache when
+        possible.
+
+        Exact cache hits reuse the whole decision. Similarity and
+        classifier hits reuse the model settings but run the original
+        task, since the stored rewritten task belongs to another input.
+
+        Args:
+            task (str): The task to route
+
+        Returns:
+            ModelOutput: The routing decision
+        """
+        if self.routing_cache is not None:
+            hit = self.routing_cache.get(task)
+            if hit is not None and hit.decision is not None:
+                if hit.exact:
+                    return hit.decision
+                return hit.decision.model_copy(
+                    update={
+                        "task": task,
+                        "rationale": f"Cached route ({hit.tier}, score {hit.score:.2f})",
+                    }
+                )
+
+        decision = self.model_caller.run(task)
+        if self.routing_cache is not None and decision is not None:
+            self.routing_cache.put(
+                task,
+                f"{decision.provider}/{decision.model}",
+                decision,
+            )
+        return decision
+
     def step(self, task: str):
         """
         Run a single task through the model router.
@@ -234,7 +307,7 @@ class ModelRouter:
         Raises:
             RuntimeError: If model selection or execution fails
         """
-        model_router_output = self.model_caller.run(task)
+        model_router_output = self.route(task)
 
         selected_model = model_router_output.model
         selected_provider = model_router_output.provider
@@ -255,11 +328,12 @@ class ModelRouter:
             title="Model Router Output",
         )
 
-        litellm_wrapper = LiteLLM(
-            model_name=f"{selected_provider}/{selected_model}",
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system_prompt=system_prompt,
+        litellm_wrapper = pooled_llm(
+            selected_provider,
+            selected_model,
+            max_tokens,
+            temperature,
+            system_prompt,
         )
 
         final_output = litellm_wrapper.run(task=routed_task)
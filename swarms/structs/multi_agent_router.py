@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from swarms.utils.function_caller_model import OpenAIFunctionCaller
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
+from swarms.structs.routing_cache import RoutingCache
 from swarms.utils.output_types import OutputType
 from swarms.utils.any_to_str import any_to_str
 from swarms.utils.history_output_formatter import (
@@ -54,6 +55,7 @@ class MultiAgentRouter:
         execute_task (bool): A flag indicating whether the task should be executed by the selected agent.
         boss_system_prompt (str): A system prompt for the boss agent that includes information about all available agents.
         function_caller (OpenAIFunctionCaller): An instance of OpenAIFunctionCaller for calling the boss agent.
+        routing_cache (Optional[RoutingCache]): Cache of the boss agent's routing decisions.
     """
 
     def __init__(
@@ -66,6 +68,8 @@ class MultiAgentRouter:
         shared_memory_system: callable = None,
         output_type: OutputType = "dict",
         if_print: bool = True,
+        routing_cache: Optional[RoutingCache] = None,
+        cache_routing: bool = True,
     ):
         """
         Initializes the MultiAgentRouter with a list of agents and configuration options.
@@ -78,6 +82,8 @@ class MultiAgentRouter:
             temperature (float, optional): The temperature for the boss agent's model. Defaults to 0.1.
             output_type (Literal["json", "string"], optional): The type of output expected from the agents. Defaults to "json".
             execute_task (bool, optional): A flag indicating whether the task should be executed by the selected agent. Defaults to True.
+            routing_cache (RoutingCache, optional): Cache for routing decisions. A default cache is created when None.
+            cache_routing (bool, optional): Set False to ask the boss agent about every task. Defaults to True.
         """
         self.name = name
         self.description = description
@@ -89,6 +95,9 @@ class MultiAgentRouter:
         # Initialize Agents
         self.agents = {agent.name: agent for agent in agents}
         self.conversation = Conversation()
+        if routing_cache is None and cache_routing:
+            routing_cache = RoutingCache()
+        self.routing_cache = routing_cache if cache_routing else None
 
         self.api_key = os.getenv("OPENAI_API_KEY")
 
@@ -144,6 +153,40 @@ class MultiAgentRouter:
         Always select exactly one agent that best matches the task requirements.
         """
 
+    def decide(self, task: str) -> AgentResponse:
+        """
+        Choose an agent for a task, answering from the routing cache when possible.
+
+        Only exact cache hits reuse the boss agent's modified task; similarity and
+        classifier hits reuse the selected agent with the original task.
+
+        Args:
+            task (str): The task to be routed.
+
+        Returns:
+            AgentResponse: The routing decision.
+        """
+        if self.routing_cache is not None:
+            hit = self.routing_cache.get(task)
+            if hit is not None and hit.label in self.agents:
+                if hit.exact and hit.decision is not None:
+                    return hit.decision
+                return AgentResponse(
+                    selected_agent=hit.label,
+                    reasoning=f"Cached route ({hit.tier}, score {hit.score:.2f})",
+                )
+
+        boss_response = self.function_caller.run(task)
+        if (
+            self.routing_cache is not None
+            and boss_response is not None
+            and boss_response.selected_agent in self.agents
+        ):
+            self.routing_cache.put(
+                task, boss_response.selected_agent, boss_response
+            )
+        return boss_response
+
     def route_task(self, task: str) -> dict:
         """
         Routes a task to the appropriate agent and returns their response.
@@ -157,8 +200,8 @@ class MultiAgentRouter:
         try:
             self.conversation.add(role="user", content=task)
 
-            # Get boss decision using function calling
-            boss_response = self.function_caller.run(task)
+            # Get boss decision, from the cache when possible
+            boss_response = self.decide(task)
             boss_response_str = any_to_str(boss_response)
 
             if self.if_print:
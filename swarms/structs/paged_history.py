@@ -0,0 +1,429 @@
+"""
+Bounded-memory message history that spills old messages to disk.
+
+``PagedHistory`` is a drop-in replacement for the plain list behind
+``Conversation.conversation_history``. The most recent messages stay in
+memory as a hot window; once the window exceeds ``max_messages`` or
+``max_bytes`` (serialized size), the oldest messages are moved to a SQLite
+segment file until the window is back under 75% of the ceiling.
+
+Spilled messages keep their positions. Reads, iteration, searches and
+exports load them lazily one page of ``page_size`` messages at a time, and
+a handful of recently read pages are cached. Memory therefore stays flat
+however long a conversation runs.
+
+Messages read back from disk are fresh dicts: mutating one in place does
+not change the history. Assign it back (``history[i] = message``) instead.
+Content that is not JSON serializable is stored as its ``str()``.
+
+Deep copies get their own segment file, copied with SQLite's backup API so
+spilled messages are never loaded. Pickles carry the spilled rows, and
+unpickling writes them to a new segment file.
+
+Example:
+    >>> history = PagedHistory(max_messages=1000)
+    >>> for i in range(100_000):
+    ...     history.append({"role": "user", "content": str(i)})
+    >>> history[0]["content"], len(history)
+    ('0', 100000)
+"""
+
+import copy
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from swarms.utils.message_index import SQLiteMessageIndex
+
+
+def _encode(message: Any) -> str:
+    return json.dumps(message, default=str)
+
+
+def _close(connection: sqlite3.Connection, path: str) -> None:
+    connection.close()
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+
+class PagedHistory(MutableSequence):
+    """
+    A list of messages with a bounded in-memory window.
+
+    Args:
+        max_messages (Optional[int]): Messages kept in memory.
+        max_bytes (Optional[int]): Serialized bytes kept in memory.
+        directory (Optional[str]): Where the segment file for spilled
+            messages is created. Defaults to the system temp directory. The
+            file is removed when the history is closed or garbage collected.
+        page_size (int): Spilled messages loaded per read.
+        cached_pages (int): Spilled pages kept in memory after reading.
+    """
+
+    def __init__(
+        self,
+        max_messages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        directory: Optional[str] = None,
+        page_size: int = 256,
+        cached_pages: int = 4,
+    ):
+        if max_messages is None and max_bytes is None:
+            raise ValueError(
+                "Set max_messages or max_bytes to bound the history"
+            )
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+
+        directory = directory or tempfile.gettempdir()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(
+            directory, f"swarms-history-{uuid.uuid4().hex}.sqlite"
+        )
+
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE messages "
+            "(pos INTEGER PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        self._finalizer = weakref.finalize(
+            self, _close, self._connection, self.path
+        )
+
+        self._lock = threading.RLock()
+        self._hot: List[Any] = []
+        self._hot_sizes: List[int] = []
+        self._hot_bytes = 0
+        self._cold_count = 0
+        self._pages: "OrderedDict[int, List[Any]]" = OrderedDict()
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            "max_messages": self.max_messages,
+            "max_bytes": self.max_bytes,
+            "directory": os.path.dirname(self.path),
+            "page_size": self.page_size,
+            "cached_pages": self.cached_pages,
+        }
+
+    # Copying and pickling
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PagedHistory":
+        with self._lock:
+            clone = type(self)(**self._settings())
+            memo[id(self)] = clone
+            self._connection.backup(clone._connection)
+            clone._cold_count = self._cold_count
+            clone._hot = copy.deepcopy(self._hot, memo)
+            clone._hot_sizes = list(self._hot_sizes)
+            clone._hot_bytes = self._hot_bytes
+        return clone
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The connection cannot be pickled; carry the spilled rows instead
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM messages ORDER BY pos"
+            ).fetchall()
+            return {
+                **self._settings(),
+                "spilled": [row[0] for row in rows],
+                "hot": list(self._hot),
+                "hot_sizes": list(self._hot_sizes),
+            }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        spilled = state.pop("spilled")
+        hot = state.pop("hot")
+        hot_sizes = state.pop("hot_sizes")
+        self.__init__(**state)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO messages (pos, data) VALUES (?, ?)",
+                enumerate(spilled),
+            )
+        self._cold_count = len(spilled)
+        self._hot = hot
+        self._hot_sizes = hot_sizes
+        self._hot_bytes = sum(hot_sizes)
+
+    # Sizes and spilling
+
+    @property
+    def memory_messages(self) -> int:
+        """Messages currently held in memory."""
+        return len(self._hot)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Serialized size of the messages held in memory."""
+        return self._hot_bytes
+
+    @property
+    def spilled_messages(self) -> int:
+        """Messages currently stored on disk."""
+        return self._cold_count
+
+    def _over(self, messages: int, size: int) -> bool:
+        return (
+            self.max_messages is not None
+            and messages > self.max_messages
+        ) or (self.max_bytes is not None and size > self.max_bytes)
+
+    def _spill(self) -> None:
+        if not self._over(len(self._hot), self._hot_bytes):
+            return
+
+        # Spill to a low-water mark so each spill moves a batch
+        target_messages = (
+            int(self.max_messages * 0.75)
+            if self.max_messages is not None
+            else None
+        )
+        target_bytes = (
+            int(self.max_bytes * 0.75)
+            if self.max_bytes is not None
+            else None
+        )
+        count, size = 0, self._hot_bytes
+        while count < len(self._hot) - 1 and (
+            (
+                target_messages is not None
+                and len(self._hot) - count > target_messages
+            )
+            or (target_bytes is not None and size > target_bytes)
+        ):
+            size -= self._hot_sizes[count]
+            count += 1
+        if count == 0:
+            return
+
+        start = self._cold_count
+        rows = [
+            (
+                start + offset,
+                _encode(
+                    dict(message)
+                    if isinstance(message, dict)
+                    else message
+                ),
+            )
+            for offset, message in enumerate(self._hot[:count])
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO messages (pos, data) VALUES (?, ?)", rows
+            )
+        del self._hot[:count]
+        del self._hot_sizes[:count]
+        self._hot_bytes = size
+        self._cold_count += count
+        self._forget_pages(start)
+
+    # Spilled pages
+
+    def _forget_pages(self, from_position: int = 0) -> None:
+        first = from_position // self.page_size
+        for page in [p for p in self._pages if p >= first]:
+            del self._pages[page]
+
+    def _page(self, page: int) -> List[Any]:
+        cached = self._pages.get(page)
+        if cached is not None:
+            self._pages.move_to_end(page)
+            return cached
+        start = page * self.page_size
+        rows = self._connection.execute(
+            "SELECT data FROM messages WHERE pos >= ? AND pos < ? "
+            "ORDER BY pos",
+            (start, start + self.page_size),
+        ).fetchall()
+        messages = [json.loads(row[0]) for row in rows]
+        self._pages[page] = messages
+        while len(self._pages) > self.cached_pages:
+            self._pages.popitem(last=False)
+        return messages
+
+    def _shift(self, after: int, delta: int) -> None:
+        # Two passes keep positions unique while renumbering
+        self._connection.execute(
+            "UPDATE messages SET pos = -(pos + ?) WHERE pos >= ?",
+            (delta, after),
+        )
+        self._connection.execute(
+            "UPDATE messages SET pos = -pos WHERE pos < 0"
+        )
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return self._cold_count + len(self._hot)
+
+    def _index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("history index out of range")
+        return index
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                return [
+                    self[i] for i in range(*index.indices(len(self)))
+                ]
+            index = self._index(index)
+            if index >= self._cold_count:
+                return self._hot[index - self._cold_count]
+            page = self._page(index // self.page_size)
+            return page[index % self.page_size]
+
+    def __setitem__(self, index: int, message: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError(
+                "PagedHistory does not support slice assignment"
+            )
+        with self._lock:
+            index = self._index(index)
+            if index >= self._cold_count:
+                offset = index - self._cold_count
+                size = len(_encode(message))
+                self._hot_bytes += size - self._hot_sizes[offset]
+                self._hot[offset] = message
+                self._hot_sizes[offset] = size
+                self._spill()
+                return
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE messages SET data = ? WHERE pos = ?",
+                    (_encode(message), index),
+                )
+            self._forget_pages(index)
+
+    def __delitem__(self, index: int) -> None:
+        if isinstance(index, slice):
+            for i in sorted(
+                range(*index.indices(len(self))), reverse=True
+            ):
+                del self[i]
+            return
+        with self._lock:
+            index = self._index(index)
+            if index >= self._cold_count:
+                offset = index - self._cold_count
+                self._hot_bytes -= self._hot_sizes.pop(offset)
+                del self._hot[offset]
+                return
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM messages WHERE pos = ?", (index,)
+                )
+                self._shift(index + 1, -1)
+            self._cold_count -= 1
+            self._forget_pages(index)
+
+    def insert(self, index: int, message: Any) -> None:
+        """Insert ``message`` before ``index``."""
+        with self._lock:
+            length = len(self)
+            if index < 0:
+                index = max(0, index + length)
+            index = min(index, length)
+            if index >= self._cold_count:
+                size = len(_encode(message))
+                self._hot.insert(index - self._cold_count, message)
+                self._hot_sizes.insert(index - self._cold_count, size)
+                self._hot_bytes += size
+                self._spill()
+                return
+            with self._connection:
+                self._shift(index, 1)
+                self._connection.execute(
+                    "INSERT INTO messages (pos, data) VALUES (?, ?)",
+                    (index, _encode(message)),
+                )
+            self._cold_count += 1
+            self._forget_pages(index)
+
+    def append(self, message: Any) -> None:
+        """Add ``message`` to the end of the history."""
+        with self._lock:
+            size = len(_encode(message))
+            self._hot.append(message)
+            self._hot_sizes.append(size)
+            self._hot_bytes += size
+            self._spill()
+
+    def extend(self, messages: Iterable[Any]) -> None:
+        """Append every message in ``messages``."""
+        for message in messages:
+            self.append(message)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Walk by position so appends and spills during iteration are safe
+        position = 0
+        while True:
+            with self._lock:
+                if position >= len(self):
+                    return
+                if position < self._cold_count:
+                    page = self._page(position // self.page_size)
+                    chunk = page[position % self.page_size :]
+                    chunk = chunk[: self._cold_count - position]
+                else:
+                    chunk = self._hot[position - self._cold_count :]
+            yield from chunk
+            position += len(chunk)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, PagedHistory)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"PagedHistory({len(self)} messages, "
+            f"{len(self._hot)} in memory)"
+        )
+
+    def clear(self) -> None:
+        """Remove every message, in memory and on disk."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM messages")
+            self._hot.clear()
+            self._hot_sizes.clear()
+            self._hot_bytes = 0
+            self._cold_count = 0
+            self._pages.clear()
+
+    def open_index(self) -> SQLiteMessageIndex:
+        """A search index stored in this history's segment file."""
+        return SQLiteMessageIndex(self._connection, self._lock)
+
+    def close(self) -> None:
+        """Close and remove the segment file."""
+        self._finalizer()
@@ -0,0 +1,259 @@
+"""
+Quorum voting with early termination.
+
+``quorum_vote`` runs voters in a thread pool and tallies answers as they
+finish. Answers are normalized and hashed so trivially different phrasings
+("Paris." / "paris") count as the same vote. Voting stops as soon as the
+outcome is decided:
+
+- some answer has reached the quorum and no other answer can still catch
+  up, or
+- no answer can reach the quorum any more, even if every remaining voter
+  agreed with it.
+
+Voters are started as earlier ones finish, and none are started once the
+vote is settled. By default only ``quorum`` voters run at once, so a
+unanimous vote makes exactly ``quorum`` calls and further calls are only
+made while the vote is still open.
+
+Example:
+    >>> result = quorum_vote(
+    ...     [(agent.agent_name, partial(agent.run, task)) for agent in agents]
+    ... )
+    >>> result.winner if result.decided else result.responses
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="quorum_voting")
+
+_ANSWER_MARKER = re.compile(
+    r"(?:final answer|answer)\s*[:=]\s*", re.I
+)
+
+
+def normalize_answer(response: Any) -> str:
+    """
+    Reduce a response to a canonical form for vote counting.
+
+    Text after the last "answer:" / "final answer:" marker is used when
+    present; the result is lowercased, whitespace is collapsed and
+    surrounding punctuation and quotes are stripped.
+
+    Args:
+        response (Any): An agent response.
+
+    Returns:
+        str: The normalized answer.
+    """
+    text = response if isinstance(response, str) else str(response)
+    markers = list(_ANSWER_MARKER.finditer(text))
+    if markers:
+        text = text[markers[-1].end() :]
+    text = " ".join(text.lower().split())
+    return text.strip(" .,!?;:'\"`*")
+
+
+def answer_key(
+    response: Any, normalizer: Callable = normalize_answer
+) -> str:
+    """Hash of the normalized answer, used as the vote key."""
+    return hashlib.sha256(
+        normalizer(response).encode("utf-8")
+    ).hexdigest()
+
+
+def resolve_quorum(
+    quorum: Union[int, float, None], voters: int
+) -> int:
+    """
+    Turn a quorum setting into a vote count.
+
+    Args:
+        quorum (Union[int, float, None]): Votes needed to win. A float in
+            (0, 1] is a fraction of ``voters``; None means a strict
+            majority.
+        voters (int): Number of voters.
+
+    Returns:
+        int: Votes an answer needs to win.
+    """
+    if quorum is None:
+        return voters // 2 + 1
+    if isinstance(quorum, float) and 0 < quorum <= 1:
+        return max(1, math.ceil(quorum * voters))
+    quorum = int(quorum)
+    if not 1 <= quorum <= voters:
+        raise ValueError(
+            f"quorum must be between 1 and {voters}, got {quorum}"
+        )
+    return quorum
+
+
+@dataclass
+class QuorumResult:
+    """
+    Outcome of a quorum vote.
+
+    Attributes:
+        winner (Optional[Any]): The first response with the winning answer,
+            or None when no answer reached the quorum.
+        decided (bool): Whether an answer reached the quorum.
+        quorum (int): Votes that were needed.
+        responses (List[Tuple[str, Any]]): ``(voter_name, response)`` in
+            completion order. A voter that raised is recorded with its
+            exception as the response and casts no vote.
+        votes (Dict[str, int]): Votes per normalized answer.
+        cancelled (int): Voters that were never started.
+        failed (int): Voters that raised instead of responding.
+    """
+
+    winner: Optional[Any]
+    decided: bool
+    quorum: int
+    responses: List[Tuple[str, Any]] = field(default_factory=list)
+    votes: Dict[str, int] = field(default_factory=dict)
+    cancelled: int = 0
+    failed: int = 0
+
+
+def quorum_vote(
+    voters: Sequence[Tuple[str, Callable[[], Any]]],
+    quorum: Union[int, float, None] = None,
+    normalizer: Callable[[Any], str] = normalize_answer,
+    max_workers: Optional[int] = None,
+) -> QuorumResult:
+    """
+    Run voters until the quorum outcome is decided.
+
+    Args:
+        voters (Sequence[Tuple[str, Callable[[], Any]]]): ``(name, call)``
+            pairs; each call returns that voter's response.
+        quorum (Union[int, float, None]): Votes needed to win; see
+            ``resolve_quorum``.
+        normalizer (Callable[[Any], str]): Maps a response to the answer
+            it votes for.
+        max_workers (Optional[int]): Voters running at once. Defaults to
+            the quorum.
+
+    Returns:
+        QuorumResult: The winner (if any) and every collected response.
+    """
+    if not voters:
+        raise ValueError("quorum_vote needs at least one voter")
+
+    needed = resolve_quorum(quorum, len(voters))
+    tally: Counter = Counter()
+    first_response: Dict[str, Any] = {}
+    labels: Dict[str, str] = {}
+    responses: List[Tuple[str, Any]] = []
+    failed = 0
+    winner_key: Optional[str] = None
+
+    workers = min(len(voters), max_workers or needed)
+    queued = iter(voters)
+    unstarted = len(voters)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures: Dict[Any, str] = {}
+
+    pending = set()
+
+    def submit_next() -> None:
+        nonlocal unstarted
+        name, call = next(queued)
+        future = executor.submit(call)
+        futures[future] = name
+        pending.add(future)
+        unstarted -= 1
+
+    # Voters are submitted as others finish, so nothing beyond the
+    # workers in flight runs once the vote is settled
+    for _ in range(workers):
+        submit_next()
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            pending -= done
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    # A failed voter finishes without voting
+                    logger.error(
+                        f"Voter {futures[future]} failed: {e}"
+                    )
+                    responses.append((futures[future], e))
+                    failed += 1
+                    continue
+                responses.append((futures[future], response))
+                normalized = normalizer(response)
+                key = answer_key(normalized, normalizer=str)
+                tally[key] += 1
+                if key not in first_response:
+                    first_response[key] = response
+                    labels[key] = normalized
+
+            ranked = tally.most_common(2) or [(None, 0)]
+            leader, leader_votes = ranked[0]
+            runner_up = ranked[1][1] if len(ranked) > 1 else 0
+            remaining = len(pending) + unstarted
+
+            if (
+                leader_votes >= needed
+                and leader_votes > runner_up + remaining
+            ):
+                winner_key = leader
+                break
+            if leader_votes + remaining < needed:
+                break
+
+            while unstarted and len(pending) < workers:
+                submit_next()
+    finally:
+        cancelled = unstarted + sum(
+            future.cancel() for future in pending
+        )
+        # Voters already running finish in the background; their
+        # results are discarded
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if cancelled:
+        logger.info(
+            f"Quorum vote settled after {len(responses)} of "
+            f"{len(voters)} voters; cancelled {cancelled}"
+        )
+
+    return QuorumResult(
+        winner=(
+            first_response[winner_key]
+            if winner_key is not None
+            else None
+        ),
+        decided=winner_key is not None,
+        quorum=needed,
+        responses=responses,
+        votes={labels[key]: count for key, count in tally.items()},
+        cancelled=cancelled,
+        failed=failed,
+    )
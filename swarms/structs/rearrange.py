@@ -15,6 +15,10 @@ from swarms.utils.history_output_formatter import (
 from swarms.utils.loguru_logger import initialize_logger
 from swarms.telemetry.main import log_agent_data
 from swarms.structs.conversation import Conversation
+from swarms.structs.context_policy import (
+    ContextPolicy,
+    resolve_policy,
+)
 from swarms.utils.output_types import OutputType
 from swarms.structs.multi_agent_exec import get_agents_info
 
@@ -45,6 +49,8 @@ class AgentRearrange(BaseSwarm):
         swarm_history (dict): History of agent interactions
         input_config (AgentRearrangeInput): Input configuration schema
         output_schema (AgentRearrangeOutput): Output schema
+        context_policy (Union[ContextPolicy, Dict[str, ContextPolicy]]): Limits the
+            transcript each agent receives, for all agents or per agent name
 
     Methods:
         __init__(): Initializes the AgentRearrange object
@@ -90,6 +96,9 @@ class AgentRearrange(BaseSwarm):
         return_entire_history: bool = False,
         rules: str = None,
         team_awareness: bool = False,
+        context_policy: Union[
+            ContextPolicy, Dict[str, ContextPolicy]
+        ] = None,
         *args,
         **kwargs,
     ):
@@ -119,6 +128,7 @@ class AgentRearrange(BaseSwarm):
         self.no_use_clusterops = no_use_clusterops
         self.autosave = autosave
         self.return_entire_history = return_entire_history
+        self.context_policy = context_policy
 
         self.conversation = Conversation(
             time_enabled=False, token_count=False
@@ -132,6 +142,12 @@ class AgentRearrange(BaseSwarm):
 
             self.conversation.add("Your Swarm", agents_info)
 
+    def agent_context(self, agent_name: str) -> str:
+        """Return the transcript ``agent_name`` should see."""
+        return self.conversation.get_context(
+            resolve_policy(self.context_policy, agent_name)
+        )
+
     def set_custom_flow(self, flow: str):
         self.flow = flow
         logger.info(f"Custom flow set: {flow}")
@@ -296,7 +312,7 @@ class AgentRearrange(BaseSwarm):
                         for agent_name in agent_names:
                             agent = self.agents[agent_name]
                             result = agent.run(
-                                task=self.conversation.get_str(),
+                                task=self.agent_context(agent_name),
                                 img=img,
                                 is_last=is_last,
                                 *args,
@@ -325,7 +341,7 @@ class AgentRearrange(BaseSwarm):
                         agent = self.agents[agent_name]
 
                         current_task = agent.run(
-                            task=self.conversation.get_str(),
+                            task=self.agent_context(agent_name),
                             img=img,
                             is_last=is_last,
                             *args,
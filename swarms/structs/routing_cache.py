@@ -0,0 +1,383 @@
+"""
+Cache for LLM routing decisions.
+
+Routers such as ``ModelRouter`` and ``MultiAgentRouter`` spend a full LLM
+call deciding where each task goes. ``RoutingCache`` answers repeat traffic
+locally, in three tiers:
+
+1. **exact** - the normalized task was routed before; the stored decision
+   is reused as-is.
+2. **similar** - a cached task embeds within ``similarity_threshold``
+   (cosine) of the new one; its route is reused but task-specific fields
+   (such as a rewritten task) are not.
+3. **classifier** - an optional ``RoutingClassifier`` trained on logged
+   decisions predicts the route with at least ``min_confidence``.
+
+Entries expire after ``ttl`` seconds and the least recently used entries
+are evicted beyond ``max_entries``. When ``log_path`` is set every decision
+is appended to a JSONL log that ``RoutingClassifier.from_log`` trains on.
+
+Example:
+    >>> cache = RoutingCache(similarity_threshold=0.9, ttl=3600)
+    >>> hit = cache.get(task)
+    >>> if hit is None:
+    ...     decision = boss.run(task)
+    ...     cache.put(task, decision.selected_agent, decision)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from swarms.structs.local_vector_memory import (
+    EmbeddingFunction,
+    HashingEmbedder,
+)
+
+
+def normalize_task(task: str) -> str:
+    """Lowercase and collapse whitespace so trivial edits share a key."""
+    return " ".join(str(task).lower().split())
+
+
+def task_key(task: str) -> str:
+    """SHA-256 of the normalized task."""
+    return hashlib.sha256(
+        normalize_task(task).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass
+class RoutingHit:
+    """
+    A routing decision answered from the cache.
+
+    Attributes:
+        label (str): The route, e.g. an agent name or "provider/model".
+        decision (Any): The stored decision for that route, if any.
+        tier (str): "exact", "similar" or "classifier".
+        score (float): 1.0 for exact hits, otherwise the cosine
+            similarity or classifier confidence.
+    """
+
+    label: str
+    decision: Any
+    tier: Literal["exact", "similar", "classifier"]
+    score: float
+
+    @property
+    def exact(self) -> bool:
+        """Whether task-specific parts of the decision can be reused."""
+        return self.tier == "exact"
+
+
+@dataclass
+class _Entry:
+    label: str
+    decision: Any
+    vector: Optional[np.ndarray]
+    created: float
+
+
+class RoutingClassifier:
+    """
+    Nearest-neighbour classifier over logged routing decisions.
+
+    A prediction is the similarity-weighted vote of the ``k`` most similar
+    logged tasks; its confidence is the winning label's share of that vote.
+
+    Args:
+        embedder (Optional[EmbeddingFunction]): Embeds tasks. Defaults to
+            ``HashingEmbedder``.
+        k (int): Neighbours that vote on a prediction.
+        min_examples (int): Logged decisions needed before predicting.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[EmbeddingFunction] = None,
+        k: int = 5,
+        min_examples: int = 20,
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.k = k
+        self.min_examples = min_examples
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._labels: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def fit(
+        self, tasks: List[str], labels: List[str]
+    ) -> "RoutingClassifier":
+        """Train on ``tasks`` routed to ``labels``."""
+        if len(tasks) != len(labels):
+            raise ValueError(
+                "tasks and labels must be the same length"
+            )
+        self._labels = list(labels)
+        self._vectors = (
+            np.asarray(
+                self.embedder([normalize_task(t) for t in tasks]),
+                dtype=np.float32,
+            )
+            if tasks
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        return self
+
+    @classmethod
+    def from_log(
+        cls, path: str, max_examples: Optional[int] = None, **kwargs
+    ) -> "RoutingClassifier":
+        """
+        Train on a ``RoutingCache`` decision log.
+
+        Args:
+            path (str): The JSONL log.
+            max_examples (Optional[int]): Use only the most recent entries.
+            **kwargs: Passed to the constructor.
+        """
+        tasks, labels = [], []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        tasks.append(record["task"])
+                        labels.append(record["label"])
+        if max_examples:
+            tasks, labels = (
+                tasks[-max_examples:],
+                labels[-max_examples:],
+            )
+        return cls(**kwargs).fit(tasks, labels)
+
+    def predict(self, task: str) -> Optional[Tuple[str, float]]:
+        """
+        Predict the route for ``task``.
+
+        Returns:
+            Optional[Tuple[str, float]]: ``(label, confidence)``, or None
+            when there are too few examples to predict.
+        """
+        if len(self) < max(1, self.min_examples):
+            return None
+        vector = np.asarray(
+            self.embedder([normalize_task(task)]), dtype=np.float32
+        )[0]
+        scores = self._vectors @ vector
+        k = min(self.k, len(scores))
+        nearest = np.argpartition(-scores, k - 1)[:k]
+
+        votes: Counter = Counter()
+        for index in nearest:
+            votes[self._labels[index]] += max(
+                float(scores[index]), 0.0
+            )
+        total = sum(votes.values())
+        if total <= 0:
+            return None
+        label, weight = votes.most_common(1)[0]
+        return label, weight / total
+
+
+class RoutingCache:
+    """
+    Exact-match and similarity cache for routing decisions.
+
+    Args:
+        embedder (Optional[EmbeddingFunction]): Embeds tasks for the
+            similarity tier. Defaults to ``HashingEmbedder``.
+        similarity_threshold (Optional[float]): Minimum cosine similarity
+            for a similarity hit; None disables the tier.
+        ttl (Optional[float]): Seconds an entry stays valid; None keeps
+            entries until evicted.
+        max_entries (int): Entries kept, least recently used evicted first.
+        classifier (Optional[RoutingClassifier]): Fallback predictor.
+        min_confidence (float): Minimum classifier confidence for a hit.
+        log_path (Optional[str]): JSONL file every ``put`` is appended to.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[EmbeddingFunction] = None,
+        similarity_threshold: Optional[float] = 0.92,
+        ttl: Optional[float] = 3600.0,
+        max_entries: int = 1024,
+        classifier: Optional[RoutingClassifier] = None,
+        min_confidence: float = 0.8,
+        log_path: Optional[str] = None,
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+        self.log_path = log_path
+
+        self.stats: Counter = Counter()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_label: Dict[str, Any] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, task: str) -> np.ndarray:
+        return np.asarray(
+            self.embedder([normalize_task(task)]), dtype=np.float32
+        )[0]
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl is not None and now - entry.created > self.ttl
+
+    def _prune(self, now: float) -> None:
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if self._expired(entry, now)
+        ]
+        for key in stale:
+            del self._entries[key]
+        evicted = max(0, len(self._entries) - self.max_entries)
+        for _ in range(evicted):
+            self._entries.popitem(last=False)
+        if stale or evicted:
+            self._matrix = None
+
+    def _similar(
+        self, vector: np.ndarray
+    ) -> Optional[Tuple[_Entry, float]]:
+        if self._matrix is None:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.vector is not None
+            ]
+            self._matrix_keys = keys
+            self._matrix = (
+                np.stack([self._entries[k].vector for k in keys])
+                if keys
+                else None
+            )
+        if self._matrix is None:
+            return None
+        scores = self._matrix @ vector
+        best = int(np.argmax(scores))
+        return self._entries[self._matrix_keys[best]], float(
+            scores[best]
+        )
+
+    def get(self, task: str) -> Optional[RoutingHit]:
+        """
+        Look up a routing decision for ``task``.
+
+        Args:
+            task (str): The task about to be routed.
+
+        Returns:
+            Optional[RoutingHit]: The cached route, or None on a miss.
+        """
+        key = task_key(task)
+        now = time.time()
+
+        with self._lock:
+            self._prune(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["exact"] += 1
+                return RoutingHit(
+                    entry.label, entry.decision, "exact", 1.0
+                )
+
+            if self.similarity_threshold is not None:
+                match = self._similar(self._embed(task))
+                if (
+                    match is not None
+                    and match[1] >= self.similarity_threshold
+                ):
+                    entry, score = match
+                    self.stats["similar"] += 1
+                    return RoutingHit(
+                        entry.label, entry.decision, "similar", score
+                    )
+
+        if self.classifier is not None:
+            prediction = self.classifier.predict(task)
+            if (
+                prediction is not None
+                and prediction[1] >= self.min_confidence
+            ):
+                label, confidence = prediction
+                self.stats["classifier"] += 1
+                return RoutingHit(
+                    label,
+                    self._by_label.get(label),
+                    "classifier",
+                    confidence,
+                )
+
+        self.stats["miss"] += 1
+        return None
+
+    def put(
+        self, task: str, label: str, decision: Any = None
+    ) -> None:
+        """
+        Store the routing decision made for ``task``.
+
+        Args:
+            task (str): The routed task.
+            label (str): The route, e.g. an agent name.
+            decision (Any): The full decision, returned on later hits.
+        """
+        vector = (
+            self._embed(task)
+            if self.similarity_threshold is not None
+            else None
+        )
+        now = time.time()
+        with self._lock:
+            self._entries[task_key(task)] = _Entry(
+                label, decision, vector, now
+            )
+            self._entries.move_to_end(task_key(task))
+            self._by_label[label] = decision
+            self._matrix = None
+            self._prune(now)
+
+            if self.log_path:
+                directory = os.path.dirname(self.log_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(
+                        json.dumps(
+                            {
+                                "task": task,
+                                "label": label,
+                                "time": now,
+                            }
+                        )
+                        + "\n"
+                    )
+
+    def clear(self) -> None:
+        """Drop every cached decision (the log is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_label.clear()
+            self._matrix = None
@@ -1,7 +1,8 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from swarms.structs.agent import Agent
+from swarms.structs.context_policy import ContextPolicy
 from swarms.utils.output_types import OutputType
 from swarms.structs.rearrange import AgentRearrange
 from swarms.utils.loguru_logger import initialize_logger
@@ -20,6 +21,7 @@ class SequentialWorkflow:
         max_loops (int, optional): The maximum number of times to execute the workflow. Defaults to 1.
         output_type (OutputType, optional): The format of the output from the workflow. Defaults to "dict".
         shared_memory_system (callable, optional): A callable for managing shared memory between agents. Defaults to None.
+        context_policy (Union[ContextPolicy, Dict[str, ContextPolicy]], optional): Limits the transcript each agent receives, for all agents or per agent name. Defaults to None (full history).
         *args: Additional positional arguments.
         **kwargs: Additional keyword arguments.
 
@@ -35,6 +37,9 @@ class SequentialWorkflow:
         max_loops: int = 1,
         output_type: OutputType = "dict",
         shared_memory_system: callable = None,
+        context_policy: Union[
+            ContextPolicy, Dict[str, ContextPolicy]
+        ] = None,
         *args,
         **kwargs,
     ):
@@ -44,6 +49,7 @@ class SequentialWorkflow:
         self.max_loops = max_loops
         self.output_type = output_type
         self.shared_memory_system = shared_memory_system
+        self.context_policy = context_policy
 
         self.reliability_check()
         self.flow = self.sequential_flow()
@@ -56,6 +62,7 @@ class SequentialWorkflow:
             max_loops=max_loops,
             output_type=output_type,
             shared_memory_system=shared_memory_system,
+            context_policy=context_policy,
             *args,
             **kwargs,
         )
@@ -3,7 +3,7 @@ import csv
 import datetime
 import os
 import uuid
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import aiofiles
 from pydantic import BaseModel, Field
@@ -13,6 +13,12 @@ from swarms.structs.base_swarm import BaseSwarm
 from swarms.telemetry.main import log_agent_data
 from swarms.utils.file_processing import create_file_in_folder
 from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.result_writer import (
+    OutputFormat,
+    ResultWriter,
+    completed_counts,
+    infer_format,
+)
 
 logger = initialize_logger(log_folder="spreadsheet_swarm")
 
@@ -25,6 +31,16 @@ formatted_time = datetime.datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
 # --------------- NEW CHANGE END ---------------
 
 
+# Output row fields and their CSV column headers
+OUTPUT_FIELDS = {
+    "run_id": "Run ID",
+    "agent_name": "Agent Name",
+    "task": "Task",
+    "result": "Result",
+    "timestamp": "Timestamp",
+}
+
+
 class AgentConfig(BaseModel):
     """Configuration for an agent loaded from CSV"""
 
@@ -73,6 +89,10 @@ class SpreadSheetSwarm(BaseSwarm):
         save_file_path (str, optional): The file path to save the swarm metadata as a CSV file. Defaults to "spreedsheet_swarm.csv".
         max_loops (int, optional): The number of times to repeat the swarm tasks. Defaults to 1.
         workspace_dir (str, optional): The directory path of the workspace. Defaults to the value of the "WORKSPACE_DIR" environment variable.
+        output_format (OutputFormat, optional): "csv", "jsonl" or "parquet". Inferred from save_file_path when None.
+        resume (bool, optional): Skip agent/task pairs that already have a row in save_file_path. Defaults to False.
+        flush_every (int, optional): Number of rows buffered before the background writer flushes. Defaults to 100.
+        max_outputs_in_memory (int, optional): Keep only the most recent N outputs in metadata.outputs; all rows are still written to disk. Defaults to None (keep all).
         *args: Additional positional arguments.
         **kwargs: Additional keyword arguments.
     """
@@ -87,6 +107,10 @@ class SpreadSheetSwarm(BaseSwarm):
         max_loops: int = 1,
         workspace_dir: str = os.getenv("WORKSPACE_DIR"),
         load_path: str = None,
+        output_format: Optional[OutputFormat] = None,
+        resume: bool = False,
+        flush_every: int = 100,
+        max_outputs_in_memory: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -105,13 +129,24 @@ class SpreadSheetSwarm(BaseSwarm):
         self.workspace_dir = workspace_dir
         self.load_path = load_path
         self.agent_configs: Dict[str, AgentConfig] = {}
-
-        # --------------- NEW CHANGE START ---------------
-        # The save_file_path now uses the formatted_time and uuid_hex
+        self.resume = resume
+        self.flush_every = flush_every
+        self.max_outputs_in_memory = max_outputs_in_memory
+        self._writer: Optional[ResultWriter] = None
+        self._run_id: Optional[str] = None
+
+        # A fixed path is needed to resume a run; otherwise each run
+        # gets its own file named after the run id
+        extension = {"jsonl": ".jsonl", "parquet": ".parquet"}.get(
+            output_format, ".csv"
+        )
         self.save_file_path = (
-            f"spreadsheet_swarm_run_id_{uuid_hex}.csv"
+            save_file_path
+            or f"spreadsheet_swarm_run_id_{uuid_hex}{extension}"
+        )
+        self.output_format = output_format or infer_format(
+            self.save_file_path
         )
-        # --------------- NEW CHANGE END ---------------
 
         self.metadata = SwarmRunMetadata(
             run_id=f"spreadsheet_swarm_run_{time}",
@@ -227,23 +262,14 @@ class SpreadSheetSwarm(BaseSwarm):
         logger.info("Running agents from configuration")
         self.metadata.start_time = time
 
-        tasks = []
+        jobs = []
         for agent in self.agents:
             config = self.agent_configs.get(agent.agent_name)
             if config:
                 for _ in range(self.max_loops):
-                    tasks.append(
-                        asyncio.to_thread(
-                            self._run_agent_task, agent, config.task
-                        )
-                    )
-
-        # Run all tasks concurrently
-        results = await asyncio.gather(*tasks)
+                    jobs.append((agent, config.task))
 
-        # Process the results
-        for result in results:
-            self._track_output(*result)
+        await self._run_jobs(jobs)
 
         self.metadata.end_time = time
 
@@ -311,26 +337,77 @@ class SpreadSheetSwarm(BaseSwarm):
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
         """
-        tasks = []
-        for _ in range(self.max_loops):
-            for agent in self.agents:
-                # Use asyncio.to_thread to run the blocking task in a thread pool
-                tasks.append(
-                    asyncio.to_thread(
-                        self._run_agent_task,
-                        agent,
-                        task,
-                        *args,
-                        **kwargs,
-                    )
-                )
+        jobs = [
+            (agent, task)
+            for _ in range(self.max_loops)
+            for agent in self.agents
+        ]
+        await self._run_jobs(jobs, *args, **kwargs)
+
+    def _pending_jobs(
+        self, jobs: List[Tuple[Agent, str]]
+    ) -> List[Tuple[Agent, str]]:
+        """
+        Drop jobs that already have a row in the output when resuming.
+
+        Args:
+            jobs (List[Tuple[Agent, str]]): (agent, task) pairs to run.
+
+        Returns:
+            List[Tuple[Agent, str]]: The jobs that still need to run.
+        """
+        if not self.resume:
+            return jobs
+
+        done = completed_counts(
+            self.save_file_path,
+            ("agent_name", "task"),
+            self.output_format,
+            OUTPUT_FIELDS,
+        )
+        pending = []
+        for agent, task in jobs:
+            key = (agent.agent_name, str(task))
+            if done[key] > 0:
+                done[key] -= 1
+            else:
+                pending.append((agent, task))
+
+        logger.info(
+            f"Resuming run: {len(jobs) - len(pending)} of {len(jobs)} tasks already completed"
+        )
+        return pending
 
-        # Run all tasks concurrently
-        results = await asyncio.gather(*tasks)
+    async def _run_jobs(
+        self, jobs: List[Tuple[Agent, str]], *args, **kwargs
+    ):
+        """
+        Run (agent, task) jobs concurrently, recording each result as soon
+        as its agent finishes.
 
-        # Process the results
-        for result in results:
-            self._track_output(*result)
+        Args:
+            jobs (List[Tuple[Agent, str]]): (agent, task) pairs to run.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+        """
+        jobs = self._pending_jobs(jobs)
+        if self.autosave_on:
+            self._open_writer()
+
+        # Use asyncio.to_thread to run the blocking tasks in a thread pool
+        running = [
+            asyncio.to_thread(
+                self._run_agent_task, agent, task, *args, **kwargs
+            )
+            for agent, task in jobs
+        ]
+        try:
+            for finished in asyncio.as_completed(running):
+                self._track_output(*(await finished))
+        except BaseException:
+            # Keep the rows that finished so the run can be resumed
+            self._close_writer()
+            raise
 
     def _run_agent_task(self, agent, task, *args, **kwargs):
         """
@@ -364,16 +441,48 @@ class SpreadSheetSwarm(BaseSwarm):
             task (str): The task that was completed.
             result (str): The result of the completed task.
         """
+        output = AgentOutput(
+            agent_name=agent_name,
+            task=task,
+            result=result,
+            timestamp=time,
+        )
         self.metadata.tasks_completed += 1
-        self.metadata.outputs.append(
-            AgentOutput(
-                agent_name=agent_name,
-                task=task,
-                result=result,
-                timestamp=time,
+        self.metadata.outputs.append(output)
+
+        if (
+            self.max_outputs_in_memory is not None
+            and len(self.metadata.outputs)
+            > self.max_outputs_in_memory
+        ):
+            del self.metadata.outputs[0]
+
+        if self._writer is not None:
+            self._writer.write(
+                {"run_id": self._run_id, **output.model_dump()}
             )
+
+    def _open_writer(self):
+        """Start the background writer that streams rows to disk."""
+        self._close_writer()
+        self._run_id = str(uuid.uuid4())
+        logger.info(
+            f"Streaming swarm results to: {self.save_file_path}"
+        )
+        self._writer = ResultWriter(
+            self.save_file_path,
+            list(OUTPUT_FIELDS),
+            output_format=self.output_format,
+            headers=OUTPUT_FIELDS,
+            flush_every=self.flush_every,
         )
 
+    def _close_writer(self):
+        """Flush buffered rows and stop the background writer."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
     def export_to_json(self):
         """
         Export the swarm metadata to JSON.
@@ -404,40 +513,22 @@ class SpreadSheetSwarm(BaseSwarm):
 
     async def _save_to_csv(self):
         """
-        Save the swarm metadata to a CSV file.
+        Save the swarm outputs to ``save_file_path``.
+
+        Rows produced during a run are already streamed to disk, so this
+        only flushes the writer. Outputs tracked without a running writer
+        are written in one pass.
         """
+        if self._writer is not None:
+            await asyncio.to_thread(self._close_writer)
+            return
+
         logger.info(
             f"Saving swarm metadata to: {self.save_file_path}"
         )
-        run_id = uuid.uuid4()
-
-        # Check if file exists before opening it
-        file_exists = os.path.exists(self.save_file_path)
-
-        async with aiofiles.open(
-            self.save_file_path, mode="a"
-        ) as file:
-            writer = csv.writer(file)
-
-            # Write header if file doesn't exist
-            if not file_exists:
-                await writer.writerow(
-                    [
-                        "Run ID",
-                        "Agent Name",
-                        "Task",
-                        "Result",
-                        "Timestamp",
-                    ]
-                )
-
-            for output in self.metadata.outputs:
-                await writer.writerow(
-                    [
-                        str(run_id),
-                        output.agent_name,
-                        output.task,
-                        output.result,
-                        output.timestamp,
-                    ]
-                )
+        self._open_writer()
+        for output in self.metadata.outputs:
+            self._writer.write(
+                {"run_id": self._run_id, **output.model_dump()}
+            )
+        await asyncio.to_thread(self._close_writer)
@@ -7,10 +7,8 @@ from pydantic import BaseModel, Field, field_validator
 from pydantic.v1 import validator
 from litellm import embedding
 
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
 from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.optional_dependencies import require
 
 logger = initialize_logger(log_folder="swarm_matcher")
 
@@ -120,23 +118,10 @@ class SwarmMatcher:
 
     def _setup_dependencies(self):
         """Set up required dependencies for the SwarmMatcher."""
-        try:
-            import numpy as np
-            import torch
-        except ImportError:
-            auto_check_and_download_package(
-                "torch", package_manager="pip", upgrade=True
-            )
-            import numpy as np
-            import torch
-
-        try:
-            import transformers
-        except ImportError:
-            auto_check_and_download_package(
-                "transformers", package_manager="pip", upgrade=True
-            )
-            import transformers
+        torch = require("torch", feature="SwarmMatcher local backend")
+        transformers = require(
+            "transformers", feature="SwarmMatcher local backend"
+        )
 
         self.torch = torch
         self.np = np
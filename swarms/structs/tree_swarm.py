@@ -1,14 +1,15 @@
+import threading
 import uuid
-from collections import Counter
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 from swarms.structs.agent import Agent
 from swarms.utils.loguru_logger import initialize_logger
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
+from swarms.utils.optional_dependencies import require
 from swarms.structs.conversation import Conversation
 
 
@@ -45,6 +46,109 @@ class TreeLog(BaseModel):
     result: Any
 
 
+@lru_cache(maxsize=None)
+def load_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
+    """
+    Load a sentence-transformers model once per process.
+
+    The encoder is shared by every TreeAgent using the same model name.
+    """
+    sentence_transformers = require(
+        "sentence_transformers", feature="TreeAgent embeddings"
+    )
+    return sentence_transformers.SentenceTransformer(model_name)
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of L2-normalized text embeddings.
+
+    Embeddings are stored as float32 numpy vectors so similarity reduces to a
+    dot product. Missing texts are encoded in a single batched call.
+
+    Args:
+        model_name (str): The sentence-transformers model to encode with.
+        max_size (int): Maximum number of cached embeddings.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        max_size: int = 4096,
+    ):
+        self.model_name = model_name
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        return load_embedding_model(self.model_name)
+
+    def encode_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Return a (len(texts), dim) matrix of normalized embeddings.
+
+        Args:
+            texts (Sequence[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: Row-aligned normalized embeddings.
+        """
+        texts = [text or "" for text in texts]
+        with self._lock:
+            found = {
+                text: self._cache[text]
+                for text in texts
+                if text in self._cache
+            }
+        missing = [
+            text for text in dict.fromkeys(texts) if text not in found
+        ]
+
+        if missing:
+            vectors = np.asarray(
+                self.model.encode(missing, convert_to_numpy=True),
+                dtype=np.float32,
+            ).reshape(len(missing), -1)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+            found.update(zip(missing, vectors))
+
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                self._cache[text] = found[text]
+                self._cache.move_to_end(text)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return np.stack([found[text] for text in texts])
+
+    def encode(self, text: str) -> np.ndarray:
+        """Return the normalized embedding of a single text."""
+        return self.encode_many([text])[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_embedding_caches: dict = {}
+_embedding_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(
+    model_name: str = "all-MiniLM-L6-v2",
+) -> EmbeddingCache:
+    """Return the process-wide embedding cache for a model."""
+    with _embedding_caches_lock:
+        cache = _embedding_caches.get(model_name)
+        if cache is None:
+            cache = EmbeddingCache(model_name=model_name)
+            _embedding_caches[model_name] = cache
+        return cache
+
+
 def extract_keywords(prompt: str, top_n: int = 5) -> List[str]:
     """
     A simplified keyword extraction function using basic word splitting instead of NLTK tokenization.
@@ -68,6 +172,7 @@ class TreeAgent(Agent):
         system_prompt: str = None,
         model_name: str = "gpt-4o",
         agent_name: Optional[str] = None,
+        embedding_model_name: str = "all-MiniLM-L6-v2",
         *args,
         **kwargs,
     ):
@@ -82,24 +187,12 @@ class TreeAgent(Agent):
             **kwargs,
         )
 
-        try:
-            import sentence_transformers
-        except ImportError:
-            auto_check_and_download_package(
-                "sentence-transformers", package_manager="pip"
-            )
-            import sentence_transformers
-
-        self.sentence_transformers = sentence_transformers
-
-        # Pretrained model for embeddings
-        self.embedding_model = (
-            sentence_transformers.SentenceTransformer(
-                "all-MiniLM-L6-v2"
-            )
+        # Shared, cached encoder: identical prompts are embedded once per process
+        self.embedding_cache = get_embedding_cache(
+            embedding_model_name
         )
-        self.system_prompt_embedding = self.embedding_model.encode(
-            system_prompt, convert_to_tensor=True
+        self.system_prompt_embedding = self.embedding_cache.encode(
+            system_prompt
         )
 
         # Automatically extract keywords from system prompt
@@ -118,10 +211,12 @@ class TreeAgent(Agent):
         Returns:
             float: Distance score between 0 and 1, with 0 being close and 1 being far.
         """
-        similarity = self.sentence_transformers.util.pytorch_cos_sim(
-            self.system_prompt_embedding,
-            other_agent.system_prompt_embedding,
-        ).item()
+        similarity = float(
+            np.dot(
+                self.system_prompt_embedding,
+                other_agent.system_prompt_embedding,
+            )
+        )
         distance = (
             1 - similarity
         )  # Closer agents have a smaller distance
@@ -150,8 +245,21 @@ class TreeAgent(Agent):
 
         return result
 
+    def matches_keywords(self, task: str) -> bool:
+        """
+        Checks whether any of the agent's keywords appear in the task (case-insensitive).
+        """
+        task = task.lower()
+        return any(
+            keyword.lower() in task
+            for keyword in self.relevant_keywords
+        )
+
     def is_relevant_for_task(
-        self, task: str, threshold: float = 0.7
+        self,
+        task: str,
+        threshold: float = 0.7,
+        task_embedding: Optional[np.ndarray] = None,
     ) -> bool:
         """
         Checks if the agent is relevant for the given task using both keyword matching and embedding similarity.
@@ -159,25 +267,19 @@ class TreeAgent(Agent):
         Args:
             task (str): The task to be executed.
             threshold (float): The cosine similarity threshold for embedding-based matching.
+            task_embedding (Optional[np.ndarray]): A precomputed normalized task embedding.
 
         Returns:
             bool: True if the agent is relevant, False otherwise.
         """
-        # Check if any of the relevant keywords are present in the task (case-insensitive)
-        keyword_match = any(
-            keyword.lower() in task.lower()
-            for keyword in self.relevant_keywords
-        )
+        keyword_match = self.matches_keywords(task)
 
         # Perform embedding similarity match if keyword match is not found
         if not keyword_match:
-            task_embedding = self.embedding_model.encode(
-                task, convert_to_tensor=True
-            )
-            similarity = (
-                self.sentence_transformers.util.pytorch_cos_sim(
-                    self.system_prompt_embedding, task_embedding
-                ).item()
+            if task_embedding is None:
+                task_embedding = self.embedding_cache.encode(task)
+            similarity = float(
+                np.dot(self.system_prompt_embedding, task_embedding)
             )
             logger.info(
                 f"Semantic similarity between task and {self.agent_name}: {similarity:.2f}"
@@ -187,6 +289,85 @@ class TreeAgent(Agent):
         return True  # Return True if keyword match is found
 
 
+class AgentEmbeddingIndex:
+    """
+    Stacked matrix of agent system-prompt embeddings for vectorized routing.
+
+    Agents are grouped by embedding model so each group is scored with a single
+    matrix-vector product; the task is embedded once per model. The matrix is
+    rebuilt only when the set of indexed agents changes.
+    """
+
+    def __init__(self):
+        self._key: Tuple = ()
+        self._groups: dict = {}
+
+    def _build(self, agents: Sequence[TreeAgent]) -> None:
+        key = tuple(id(agent) for agent in agents)
+        if key == self._key and self._groups:
+            return
+
+        groups: dict = {}
+        for position, agent in enumerate(agents):
+            cache = agent.embedding_cache
+            group = groups.setdefault(
+                cache.model_name, (cache, [], [])
+            )
+            group[1].append(position)
+            group[2].append(agent.system_prompt_embedding)
+
+        self._groups = {
+            model_name: (cache, positions, np.stack(embeddings))
+            for model_name, (
+                cache,
+                positions,
+                embeddings,
+            ) in groups.items()
+        }
+        self._key = key
+
+    def best_match(
+        self,
+        task: str,
+        agents: Sequence[TreeAgent],
+        task_embeddings: Optional[dict] = None,
+    ) -> Tuple[Optional[int], float]:
+        """
+        Score every agent against the task and return the best one.
+
+        Args:
+            task (str): The task to route.
+            agents (Sequence[TreeAgent]): Agents to score, in index order.
+            task_embeddings (Optional[dict]): Task embeddings keyed by model name, reused across calls.
+
+        Returns:
+            Tuple[Optional[int], float]: Position of the best agent and its similarity.
+        """
+        if not agents:
+            return None, 0.0
+
+        self._build(agents)
+        if task_embeddings is None:
+            task_embeddings = {}
+
+        best_position, best_score = None, float("-inf")
+        for model_name, (
+            cache,
+            positions,
+            matrix,
+        ) in self._groups.items():
+            if model_name not in task_embeddings:
+                task_embeddings[model_name] = cache.encode(task)
+            scores = matrix @ task_embeddings[model_name]
+            top = int(np.argmax(scores))
+            if scores[top] > best_score:
+                best_position, best_score = positions[top], float(
+                    scores[top]
+                )
+
+        return best_position, best_score
+
+
 class Tree:
     def __init__(self, tree_name: str, agents: List[TreeAgent]):
         """
@@ -198,6 +379,7 @@ class Tree:
         """
         self.tree_name = tree_name
         self.agents = agents
+        self.embedding_index = AgentEmbeddingIndex()
         self.calculate_agent_distances()
 
     def calculate_agent_distances(self):
@@ -218,13 +400,21 @@ class Tree:
         # Sort agents by distance after calculation
         self.agents.sort(key=lambda agent: agent.distance)
 
-    def find_relevant_agent(self, task: str) -> Optional[TreeAgent]:
+    def find_relevant_agent(
+        self,
+        task: str,
+        threshold: float = 0.7,
+        task_embeddings: Optional[dict] = None,
+    ) -> Optional[TreeAgent]:
         """
         Finds the most relevant agent in the tree for the given task based on its system prompt.
-        Uses both keyword and semantic similarity matching.
+        Keyword matches win first; otherwise the task is embedded once and scored against
+        all agents with a single vectorized similarity.
 
         Args:
             task (str): The task or query for which we need to find a relevant agent.
+            threshold (float): Minimum cosine similarity for a semantic match.
+            task_embeddings (Optional[dict]): Task embeddings keyed by model name, reused across trees.
 
         Returns:
             Optional[TreeAgent]: The most relevant agent, or None if no match found.
@@ -233,8 +423,18 @@ class Tree:
             f"Searching relevant agent in tree '{self.tree_name}' for task: {task}"
         )
         for agent in self.agents:
-            if agent.is_relevant_for_task(task):
+            if agent.matches_keywords(task):
                 return agent
+
+        position, similarity = self.embedding_index.best_match(
+            task, self.agents, task_embeddings
+        )
+        if position is not None and similarity >= threshold:
+            agent = self.agents[position]
+            logger.info(
+                f"Semantic similarity between task and {agent.agent_name}: {similarity:.2f}"
+            )
+            return agent
         logger.warning(
             f"No relevant agent found in tree '{self.tree_name}' for task: {task}"
         )
@@ -280,6 +480,7 @@ class ForestSwarm:
         self.description = description
         self.trees = trees
         self.shared_memory = shared_memory
+        self.embedding_index = AgentEmbeddingIndex()
         self.save_file_path = f"forest_swarm_{uuid.uuid4().hex}.json"
         self.conversation = Conversation(
             time_enabled=False,
@@ -298,14 +499,51 @@ class ForestSwarm:
         Returns:
             Optional[Tree]: The most relevant tree, or None if no match found.
         """
+        tree, _ = self.route(task)
+        return tree
+
+    def route(
+        self, task: str, threshold: float = 0.7
+    ) -> Tuple[Optional[Tree], Optional[TreeAgent]]:
+        """
+        Selects the tree and agent for a task in one pass over the forest.
+
+        Keyword matches are checked first in tree order. Otherwise the task is
+        embedded once and scored against a stacked matrix of every agent's
+        system-prompt embedding across all trees.
+
+        Args:
+            task (str): The task or query to route.
+            threshold (float): Minimum cosine similarity for a semantic match.
+
+        Returns:
+            Tuple[Optional[Tree], Optional[TreeAgent]]: The selected tree and agent, or (None, None).
+        """
         logger.info(
             f"Searching for the most relevant tree for task: {task}"
         )
-        for tree in self.trees:
-            if tree.find_relevant_agent(task):
-                return tree
+        members = [
+            (tree, agent)
+            for tree in self.trees
+            for agent in tree.agents
+        ]
+
+        for tree, agent in members:
+            if agent.matches_keywords(task):
+                return tree, agent
+
+        position, similarity = self.embedding_index.best_match(
+            task, [agent for _, agent in members]
+        )
+        if position is not None and similarity >= threshold:
+            tree, agent = members[position]
+            logger.info(
+                f"Semantic similarity between task and {agent.agent_name}: {similarity:.2f}"
+            )
+            return tree, agent
+
         logger.warning(f"No relevant tree found for task: {task}")
-        return None
+        return None, None
 
     def run(self, task: str, img: str = None, *args, **kwargs) -> Any:
         """
@@ -321,17 +559,13 @@ class ForestSwarm:
             logger.info(
                 f"Running task across MultiAgentTreeStructure: {task}"
             )
-            relevant_tree = self.find_relevant_tree(task)
-            if relevant_tree:
-                agent = relevant_tree.find_relevant_agent(task)
-                if agent:
-                    result = agent.run_task(
-                        task, img=img, *args, **kwargs
-                    )
-                    relevant_tree.log_tree_execution(
-                        task, agent, result
-                    )
-                    return result
+            relevant_tree, agent = self.route(task)
+            if relevant_tree and agent:
+                result = agent.run_task(
+                    task, img=img, *args, **kwargs
+                )
+                relevant_tree.log_tree_execution(task, agent, result)
+                return result
             else:
                 logger.error(
                     "Task could not be completed: No relevant agent or tree found."
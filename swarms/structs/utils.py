@@ -1,10 +1,14 @@
-from typing import List
+from typing import List, Union
 from swarms.structs.agent import Agent
+from swarms.structs.agent_registry import (
+    AgentRegistry,
+    lookup_agent,
+)
 
 
 def find_agent_by_id(
     agent_id: str = None,
-    agents: List[Agent] = None,
+    agents: Union[List[Agent], AgentRegistry] = None,
     task: str = None,
     *args,
     **kwargs,
@@ -13,21 +17,21 @@ def find_agent_by_id(
 
     Args:
         agent_id (str, optional): _description_. Defaults to None.
-        agents (List[Agent], optional): _description_. Defaults to None.
+        agents (Union[List[Agent], AgentRegistry], optional): The agents, or a registry from ``index_agents`` for O(1) lookups. Defaults to None.
 
     Returns:
         Agent: _description_
     """
     try:
         print(f"Searching for agent with ID: {agent_id}")
-        for agent in agents:
-            if agent.id == agent_id:
-                print(f"Found agent with ID {agent_id}")
-                if task:
-                    print(f"Running task: {task}")
-                    return agent.run(task, *args, **kwargs)
-                else:
-                    return agent
+        agent = lookup_agent(agents, agent_id, attribute="id")
+        if agent is not None:
+            print(f"Found agent with ID {agent_id}")
+            if task:
+                print(f"Running task: {task}")
+                return agent.run(task, *args, **kwargs)
+            else:
+                return agent
         print(f"No agent found with ID {agent_id}")
         return None
     except Exception as e:
@@ -37,7 +41,7 @@ def find_agent_by_id(
 
 def find_agent_by_name(
     agent_name: str = None,
-    agents: List[Agent] = None,
+    agents: Union[List[Agent], AgentRegistry] = None,
     task: str = None,
     *args,
     **kwargs,
@@ -46,21 +50,21 @@ def find_agent_by_name(
 
     Args:
         agent_name (str): _description_
-        agents (List[Agent]): _description_
+        agents (Union[List[Agent], AgentRegistry]): The agents, or a registry from ``index_agents`` for O(1) lookups
 
     Returns:
         Agent: _description_
     """
     try:
         print(f"Searching for agent with name: {agent_name}")
-        for agent in agents:
-            if agent.name == agent_name:
-                print(f"Found agent with name {agent_name}")
-                if task:
-                    print(f"Running task: {task}")
-                    return agent.run(task, *args, **kwargs)
-                else:
-                    return agent
+        agent = lookup_agent(agents, agent_name, attribute="name")
+        if agent is not None:
+            print(f"Found agent with name {agent_name}")
+            if task:
+                print(f"Running task: {task}")
+                return agent.run(task, *args, **kwargs)
+            else:
+                return agent
         print(f"No agent found with name {agent_name}")
         return None
     except Exception as e:
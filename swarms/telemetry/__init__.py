@@ -1,16 +1,21 @@
-from swarms.telemetry.main import (
-    generate_unique_identifier,
-    generate_user_id,
-    get_cpu_info,
-    get_machine_id,
-    get_os_version,
-    get_pip_version,
-    get_python_version,
-    get_ram_info,
-    get_system_info,
-    get_user_device_data,
-    system_info,
-)
+from swarms.utils.lazy_loader import lazy_namespace
+
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "generate_unique_identifier": "swarms.telemetry.main",
+    "generate_user_id": "swarms.telemetry.main",
+    "get_cpu_info": "swarms.telemetry.main",
+    "get_machine_id": "swarms.telemetry.main",
+    "get_os_version": "swarms.telemetry.main",
+    "get_pip_version": "swarms.telemetry.main",
+    "get_python_version": "swarms.telemetry.main",
+    "get_ram_info": "swarms.telemetry.main",
+    "get_system_info": "swarms.telemetry.main",
+    "get_user_device_data": "swarms.telemetry.main",
+    "system_info": "swarms.telemetry.main",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "generate_user_id",
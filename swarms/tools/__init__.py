@@ -1,45 +1,41 @@
-from swarms.tools.tool_utils import (
-    scrape_tool_func_docs,
-    tool_find_by_name,
-)
-from swarms.tools.pydantic_to_json import (
-    _remove_a_key,
-    base_model_to_openai_function,
-    multi_base_model_to_openai_function,
-)
-from swarms.tools.openai_func_calling_schema_pydantic import (
-    OpenAIFunctionCallSchema as OpenAIFunctionCallSchemaBaseModel,
-)
-from swarms.tools.py_func_to_openai_func_str import (
-    get_openai_function_schema_from_func,
-    load_basemodels_if_needed,
-    get_load_param_if_needed_function,
-    get_parameters,
-    get_required_params,
-    Function,
-    ToolFunction,
-)
-from swarms.tools.openai_tool_creator_decorator import tool
-from swarms.tools.base_tool import BaseTool
-from swarms.tools.cohere_func_call_schema import (
-    CohereFuncSchema,
-    ParameterDefinition,
-)
-from swarms.tools.tool_registry import ToolStorage, tool_registry
-from swarms.tools.json_utils import base_model_to_json
-from swarms.tools.mcp_client_call import (
-    execute_tool_call_simple,
-    _execute_tool_call_simple,
-    get_tools_for_multiple_mcp_servers,
-    get_mcp_tools_sync,
-    aget_mcp_tools,
-    execute_multiple_tools_on_multiple_mcp_servers,
-    execute_multiple_tools_on_multiple_mcp_servers_sync,
-    _create_server_tool_mapping,
-    _create_server_tool_mapping_async,
-    _execute_tool_on_server,
-)
+from swarms.utils.lazy_loader import lazy_namespace
 
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "scrape_tool_func_docs": "swarms.tools.tool_utils",
+    "tool_find_by_name": "swarms.tools.tool_utils",
+    "_remove_a_key": "swarms.tools.pydantic_to_json",
+    "base_model_to_openai_function": "swarms.tools.pydantic_to_json",
+    "multi_base_model_to_openai_function": "swarms.tools.pydantic_to_json",
+    "OpenAIFunctionCallSchemaBaseModel": "swarms.tools.openai_func_calling_schema_pydantic:OpenAIFunctionCallSchema",
+    "get_openai_function_schema_from_func": "swarms.tools.py_func_to_openai_func_str",
+    "load_basemodels_if_needed": "swarms.tools.py_func_to_openai_func_str",
+    "get_load_param_if_needed_function": "swarms.tools.py_func_to_openai_func_str",
+    "get_parameters": "swarms.tools.py_func_to_openai_func_str",
+    "get_required_params": "swarms.tools.py_func_to_openai_func_str",
+    "Function": "swarms.tools.py_func_to_openai_func_str",
+    "ToolFunction": "swarms.tools.py_func_to_openai_func_str",
+    "tool": "swarms.tools.openai_tool_creator_decorator",
+    "BaseTool": "swarms.tools.base_tool",
+    "CompiledToolSet": "swarms.tools.compiled_tools",
+    "CohereFuncSchema": "swarms.tools.cohere_func_call_schema",
+    "ParameterDefinition": "swarms.tools.cohere_func_call_schema",
+    "ToolStorage": "swarms.tools.tool_registry",
+    "tool_registry": "swarms.tools.tool_registry",
+    "base_model_to_json": "swarms.tools.json_utils",
+    "execute_tool_call_simple": "swarms.tools.mcp_client_call",
+    "_execute_tool_call_simple": "swarms.tools.mcp_client_call",
+    "get_tools_for_multiple_mcp_servers": "swarms.tools.mcp_client_call",
+    "get_mcp_tools_sync": "swarms.tools.mcp_client_call",
+    "aget_mcp_tools": "swarms.tools.mcp_client_call",
+    "execute_multiple_tools_on_multiple_mcp_servers": "swarms.tools.mcp_client_call",
+    "execute_multiple_tools_on_multiple_mcp_servers_sync": "swarms.tools.mcp_client_call",
+    "_create_server_tool_mapping": "swarms.tools.mcp_client_call",
+    "_create_server_tool_mapping_async": "swarms.tools.mcp_client_call",
+    "_execute_tool_on_server": "swarms.tools.mcp_client_call",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "scrape_tool_func_docs",
@@ -57,6 +53,7 @@ __all__ = [
     "ToolFunction",
     "tool",
     "BaseTool",
+    "CompiledToolSet",
     "CohereFuncSchema",
     "ParameterDefinition",
     "ToolStorage",
@@ -1,9 +1,19 @@
+import asyncio
+import contextlib
+import functools
+import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Any, Callable, Dict, List, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from swarms.tools.compiled_tools import (
+    CompiledToolSet,
+    get_timeout_executor,
+    get_tool_executor,
+)
 from swarms.tools.func_to_str import function_to_str, functions_to_str
 from swarms.tools.function_util import process_tool_docs
 from swarms.tools.py_func_to_openai_func_str import (
@@ -39,6 +49,12 @@ class ToolExecutionError(BaseToolError):
     pass
 
 
+class ToolTimeoutError(ToolExecutionError):
+    """Raised when tool execution exceeds its timeout."""
+
+    pass
+
+
 class ToolNotFoundError(BaseToolError):
     """Raised when a requested tool is not found."""
 
@@ -103,6 +119,46 @@ class BaseTool(BaseModel):
     )
     function_map: Optional[Dict[str, Callable]] = None
     list_of_dicts: Optional[List[Dict[str, Any]]] = None
+    tool_timeouts: Optional[Dict[str, float]] = Field(
+        None,
+        description="Per-tool execution timeouts in seconds, keyed by tool name.",
+    )
+    default_tool_timeout: Optional[float] = Field(
+        None,
+        description="Timeout in seconds for tools without an entry in tool_timeouts.",
+    )
+    tool_concurrency_limits: Optional[Dict[str, int]] = Field(
+        None,
+        description="Maximum concurrent calls per tool name during parallel execution.",
+    )
+    fail_fast: bool = Field(
+        True,
+        description="Cancel sibling calls when a parallel tool call fails.",
+    )
+    return_partial_results: bool = Field(
+        False,
+        description="Return errors in place of failed results instead of raising.",
+    )
+
+    _compiled_tools: Optional[CompiledToolSet] = PrivateAttr(
+        default=None
+    )
+
+    def compiled_tools(self) -> CompiledToolSet:
+        """
+        Return the name-indexed dispatch table for the current tools.
+
+        The table is compiled once and rebuilt only when ``self.tools`` is
+        replaced or modified.
+
+        Returns:
+            CompiledToolSet: The compiled tools.
+        """
+        compiled = self._compiled_tools
+        if compiled is None or not compiled.matches(self.tools):
+            compiled = CompiledToolSet(self.tools)
+            self._compiled_tools = compiled
+        return compiled
 
     def _log_if_verbose(
         self, level: str, message: str, *args, **kwargs
@@ -1254,12 +1310,12 @@ class BaseTool(BaseModel):
             "debug", f"Searching for function: {func_name}"
         )
 
-        for func in self.tools:
-            if func.__name__ == func_name:
-                self._log_if_verbose(
-                    "debug", f"Found function: {func_name}"
-                )
-                return func
+        func = self.compiled_tools().get(func_name)
+        if func is not None:
+            self._log_if_verbose(
+                "debug", f"Found function: {func_name}"
+            )
+            return func
 
         self._log_if_verbose(
             "debug", f"Function {func_name} not found"
@@ -2223,6 +2279,76 @@ class BaseTool(BaseModel):
             >>> tool_calls = [ChatCompletionMessageToolCall(...), ...]
             >>> results = tool.execute_function_calls_from_api_response(tool_calls)
         """
+        function_calls = self._function_calls_from_api_response(
+            api_response
+        )
+
+        if self.function_map is None and self.tools is None:
+            raise ToolValidationError(
+                "Either function_map or tools must be set before executing function calls"
+            )
+
+        try:
+            if not function_calls:
+                self._log_if_verbose(
+                    "warning",
+                    "No function calls found in API response",
+                )
+                return []
+
+            self._log_if_verbose(
+                "info",
+                f"Found {len(function_calls)} function call(s)",
+            )
+
+            # Ensure function_map is available
+            if self.function_map is None and self.tools is not None:
+                self.function_map = {
+                    tool.__name__: tool for tool in self.tools
+                }
+
+            # Execute function calls
+            if sequential:
+                results = self._execute_function_calls_sequential(
+                    function_calls
+                )
+            else:
+                results = self._execute_function_calls_parallel(
+                    function_calls, max_workers
+                )
+
+            # Format results as strings if requested
+            if return_as_string:
+                return self._format_results_as_strings(
+                    results, function_calls
+                )
+            else:
+                return results
+
+        except Exception as e:
+            self._log_if_verbose(
+                "error",
+                f"Failed to execute function calls from API response: {e}",
+            )
+            raise ToolExecutionError(
+                f"Failed to execute function calls from API response: {e}"
+            ) from e
+
+    def _function_calls_from_api_response(
+        self, api_response: Union[Dict[str, Any], str, List[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse an API response into standardized function call dictionaries.
+
+        Args:
+            api_response: The API response containing function calls
+
+        Returns:
+            List[Dict[str, Any]]: The function calls, or an empty list if the response cannot be parsed
+
+        Raises:
+            ToolValidationError: If the API response is None
+        """
         if api_response is None:
             raise ToolValidationError("API response cannot be None")
 
@@ -2276,56 +2402,7 @@ class BaseTool(BaseModel):
                 )
             )
 
-        if self.function_map is None and self.tools is None:
-            raise ToolValidationError(
-                "Either function_map or tools must be set before executing function calls"
-            )
-
-        try:
-            if not function_calls:
-                self._log_if_verbose(
-                    "warning",
-                    "No function calls found in API response",
-                )
-                return []
-
-            self._log_if_verbose(
-                "info",
-                f"Found {len(function_calls)} function call(s)",
-            )
-
-            # Ensure function_map is available
-            if self.function_map is None and self.tools is not None:
-                self.function_map = {
-                    tool.__name__: tool for tool in self.tools
-                }
-
-            # Execute function calls
-            if sequential:
-                results = self._execute_function_calls_sequential(
-                    function_calls
-                )
-            else:
-                results = self._execute_function_calls_parallel(
-                    function_calls, max_workers
-                )
-
-            # Format results as strings if requested
-            if return_as_string:
-                return self._format_results_as_strings(
-                    results, function_calls
-                )
-            else:
-                return results
-
-        except Exception as e:
-            self._log_if_verbose(
-                "error",
-                f"Failed to execute function calls from API response: {e}",
-            )
-            raise ToolExecutionError(
-                f"Failed to execute function calls from API response: {e}"
-            ) from e
+        return function_calls
 
     def _extract_function_calls_from_response(
         self, response: Dict[str, Any]
@@ -2339,6 +2416,13 @@ class BaseTool(BaseModel):
         Returns:
             List[Dict[str, Any]]: List of standardized function call dictionaries
         """
+        # Unambiguous formats only need their own extractor
+        response_format = self.detect_api_response_format(response)
+        if response_format == "anthropic":
+            return self._extract_anthropic_function_calls(response)
+        if response_format == "generic":
+            return self._extract_generic_function_calls(response)
+
         function_calls = []
 
         # Try OpenAI format first
@@ -2664,6 +2748,11 @@ class BaseTool(BaseModel):
                 self._log_if_verbose(
                     "info", f"Successfully executed {call['name']}"
                 )
+            except ToolTimeoutError as e:
+                self._log_if_verbose(
+                    "error", f"Failed to execute {call['name']}: {e}"
+                )
+                raise
             except Exception as e:
                 self._log_if_verbose(
                     "error", f"Failed to execute {call['name']}: {e}"
@@ -2677,52 +2766,179 @@ class BaseTool(BaseModel):
     def _execute_function_calls_parallel(
         self, function_calls: List[Dict[str, Any]], max_workers: int
     ) -> List[Any]:
-        """Execute function calls in parallel using concurrent.futures ThreadPoolExecutor."""
+        """Execute function calls in parallel on an event loop.
+
+        Coroutine tools are awaited directly; synchronous tools run on the
+        shared tool thread pool. See :meth:`aexecute_function_calls`.
+        """
         self._log_if_verbose(
             "info",
             f"Executing {len(function_calls)} function calls in parallel with {max_workers} workers",
         )
+        return self._run_coroutine(
+            self.aexecute_function_calls(function_calls, max_workers)
+        )
 
-        results = [None] * len(
-            function_calls
-        )  # Pre-allocate results list to maintain order
+    async def aexecute_function_calls(
+        self,
+        function_calls: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Execute function calls concurrently on the running event loop.
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all function calls to the executor
-            future_to_index = {}
-            for i, call in enumerate(function_calls):
-                future = executor.submit(
-                    self._execute_single_function_call, call
-                )
-                future_to_index[future] = i
+        ``async def`` tools are awaited on the loop, so many I/O-bound calls
+        can be in flight without extra threads. Synchronous tools run on the
+        shared tool thread pool, or on a separate bounded pool when they have
+        a timeout, so a hung tool cannot starve other calls. Each call is bounded by its timeout from
+        ``tool_timeouts`` (or ``default_tool_timeout``), and by the per-tool
+        caps in ``tool_concurrency_limits``.
 
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                call = function_calls[index]
+        When a call fails and ``fail_fast`` is set, outstanding sibling calls
+        are cancelled. Timeouts never cancel siblings.
 
-                try:
-                    result = future.result()
-                    results[index] = result
+        Args:
+            function_calls (List[Dict[str, Any]]): Standardized function calls
+            max_workers (Optional[int]): Maximum number of calls in flight at once
+
+        Returns:
+            List[Any]: Results in call order. With ``return_partial_results``,
+            failed, timed out and cancelled calls hold a ToolExecutionError
+            instead of raising.
+
+        Raises:
+            ToolExecutionError: If any call fails and partial results are disabled
+        """
+        loop = asyncio.get_running_loop()
+        global_limit = (
+            asyncio.Semaphore(max_workers) if max_workers else None
+        )
+        tool_limits = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in (
+                self.tool_concurrency_limits or {}
+            ).items()
+        }
+
+        async def run_call(call: Dict[str, Any]) -> Any:
+            name, func, arguments = self._resolve_function_call(call)
+            async with contextlib.AsyncExitStack() as stack:
+                for limit in (global_limit, tool_limits.get(name)):
+                    if limit is not None:
+                        await stack.enter_async_context(limit)
+
+                if inspect.iscoroutinefunction(func):
+                    pending_result = self._invoke_function(
+                        name, func, arguments
+                    )
+                else:
+                    executor = (
+                        get_tool_executor()
+                        if self._tool_timeout(name) is None
+                        else get_timeout_executor()
+                    )
+                    pending_result = loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            self._invoke_function,
+                            name,
+                            func,
+                            arguments,
+                        ),
+                    )
+                result = await asyncio.wait_for(
+                    pending_result, self._tool_timeout(name)
+                )
+                if inspect.isawaitable(result):
+                    result = await asyncio.wait_for(
+                        result, self._tool_timeout(name)
+                    )
+                return result
+
+        tasks = {
+            asyncio.ensure_future(run_call(call)): index
+            for index, call in enumerate(function_calls)
+        }
+        results: List[Any] = [None] * len(function_calls)
+        errors: Dict[int, ToolExecutionError] = {}
+        first_error: Optional[ToolExecutionError] = None
+        pending = set(tasks)
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = tasks[task]
+                name = function_calls[index].get("name")
+                if task.cancelled():
+                    errors[index] = ToolExecutionError(
+                        f"Function {name} was cancelled"
+                    )
+                    continue
+                error = task.exception()
+                if error is None:
+                    results[index] = task.result()
                     self._log_if_verbose(
                         "info",
-                        f"Successfully executed {call['name']} (index {index})",
+                        f"Successfully executed {name} (index {index})",
                     )
-                except Exception as e:
-                    self._log_if_verbose(
-                        "error",
-                        f"Failed to execute {call['name']} (index {index}): {e}",
+                    continue
+
+                if isinstance(error, asyncio.TimeoutError):
+                    errors[index] = ToolTimeoutError(
+                        f"Function {name} timed out after {self._tool_timeout(name)}s"
+                    )
+                else:
+                    errors[index] = ToolExecutionError(
+                        f"Failed to execute function {name}: {error}"
                     )
-                    raise ToolExecutionError(
-                        f"Failed to execute function {call['name']}: {e}"
-                    ) from e
+                    errors[index].__cause__ = error
+                    first_error = first_error or errors[index]
+                    if self.fail_fast:
+                        for sibling in pending:
+                            sibling.cancel()
+                self._log_if_verbose(
+                    "error",
+                    f"Failed to execute {name} (index {index}): {errors[index]}",
+                )
 
+        if errors and not self.return_partial_results:
+            raise first_error or errors[min(errors)]
+        for index, error in errors.items():
+            results[index] = error
         return results
 
-    def _execute_single_function_call(
+    def _run_coroutine(self, coroutine: Any) -> Any:
+        """Run a coroutine to completion from synchronous code.
+
+        Uses ``asyncio.run`` when no loop is running in this thread, and a
+        dedicated thread with its own loop otherwise. Borrowing a worker from
+        the shared tool pool here could deadlock once that pool is saturated.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="swarms-tool-loop"
+        ) as loop_thread:
+            return loop_thread.submit(asyncio.run, coroutine).result()
+
+    def _tool_timeout(self, name: str) -> Optional[float]:
+        """Return the timeout in seconds for a tool, or None."""
+        if self.tool_timeouts and name in self.tool_timeouts:
+            return self.tool_timeouts[name]
+        return self.default_tool_timeout
+
+    def _resolve_function_call(
         self, call: Union[Dict[str, Any], BaseModel]
-    ) -> Any:
-        """Execute a single function call."""
+    ) -> tuple:
+        """Look up and validate a function call.
+
+        Returns:
+            tuple: The function name, the callable and its arguments
+        """
         if isinstance(call, BaseModel):
             call = call.model_dump()
 
@@ -2733,10 +2949,11 @@ class BaseTool(BaseModel):
             raise ToolValidationError("Function call missing name")
 
         # Find the function
+        compiled = self.compiled_tools()
         if self.function_map and name in self.function_map:
             func = self.function_map[name]
         elif self.tools:
-            func = self.find_function_name(name)
+            func = compiled.get(name)
             if func is None:
                 raise ToolNotFoundError(
                     f"Function {name} not found in tools"
@@ -2744,18 +2961,64 @@ class BaseTool(BaseModel):
         else:
             raise ToolNotFoundError(f"Function {name} not found")
 
-        # Execute the function
+        if isinstance(arguments, dict) and func is compiled.get(name):
+            error = compiled.validate(name, arguments)
+            if error:
+                raise ToolValidationError(error)
+
+        return name, func, arguments
+
+    def _invoke_function(
+        self, name: str, func: Callable, arguments: Any
+    ) -> Any:
+        """Call a tool with its arguments, wrapping errors."""
         try:
             if isinstance(arguments, dict):
-                result = func(**arguments)
-            else:
-                result = func(arguments)
-            return result
+                return func(**arguments)
+            return func(arguments)
         except Exception as e:
             raise ToolExecutionError(
                 f"Error executing function {name}: {e}"
             ) from e
 
+    def _execute_single_function_call(
+        self, call: Union[Dict[str, Any], BaseModel]
+    ) -> Any:
+        """Execute a single function call.
+
+        Synchronous tools with a timeout run on the timeout pool, as in
+        :meth:`aexecute_function_calls`, so a hung tool cannot block the
+        caller past its limit.
+
+        Raises:
+            ToolTimeoutError: If the tool does not finish within its timeout
+        """
+        name, func, arguments = self._resolve_function_call(call)
+        timeout = self._tool_timeout(name)
+
+        try:
+            if timeout is None or inspect.iscoroutinefunction(func):
+                result = self._invoke_function(name, func, arguments)
+            else:
+                result = (
+                    get_timeout_executor()
+                    .submit(
+                        self._invoke_function, name, func, arguments
+                    )
+                    .result(timeout)
+                )
+
+            # Coroutine tools are driven to completion, honoring their timeout
+            if inspect.isawaitable(result):
+                result = self._run_coroutine(
+                    asyncio.wait_for(result, timeout)
+                )
+        except (FuturesTimeoutError, asyncio.TimeoutError) as e:
+            raise ToolTimeoutError(
+                f"Function {name} timed out after {timeout}s"
+            ) from e
+        return result
+
     def detect_api_response_format(
         self, response: Union[Dict[str, Any], str, BaseModel]
     ) -> str:
@@ -0,0 +1,181 @@
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from swarms.tools.py_func_to_openai_func_str import (
+    convert_multiple_functions_to_openai_function_schema,
+)
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="compiled_tools")
+
+
+class ArgumentValidator:
+    """
+    Pre-built argument checker for a single tool.
+
+    The signature is inspected once when the tool set is compiled, so each
+    call only does set arithmetic on the argument names.
+
+    Args:
+        func (Callable): The tool to validate arguments for.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        self.name = getattr(func, "__name__", repr(func))
+        try:
+            parameters = inspect.signature(func).parameters.values()
+        except (TypeError, ValueError):
+            # Builtins and some C callables have no signature
+            parameters = None
+
+        if parameters is None:
+            self.accepts_any = True
+            self.allowed = frozenset()
+            self.required = frozenset()
+            return
+
+        self.accepts_any = any(
+            p.kind is inspect.Parameter.VAR_KEYWORD
+            for p in parameters
+        )
+        self.allowed = frozenset(
+            p.name
+            for p in parameters
+            if p.kind
+            in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
+            )
+        )
+        self.required = frozenset(
+            p.name
+            for p in parameters
+            if p.name in self.allowed
+            and p.default is inspect.Parameter.empty
+        )
+
+    def validate(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """
+        Check keyword arguments against the tool signature.
+
+        Args:
+            arguments (Dict[str, Any]): The arguments the model supplied.
+
+        Returns:
+            Optional[str]: A description of the problem, or None if valid.
+        """
+        missing = self.required.difference(arguments)
+        if missing:
+            return f"Function {self.name} missing required arguments: {sorted(missing)}"
+        if not self.accepts_any:
+            unexpected = set(arguments).difference(self.allowed)
+            if unexpected:
+                return f"Function {self.name} got unexpected arguments: {sorted(unexpected)}"
+        return None
+
+
+class CompiledToolSet:
+    """
+    A dispatch table compiled once per tool set.
+
+    Maps tool names to callables and pre-built argument validators so a
+    function call resolves in O(1) regardless of how many tools an agent
+    has. OpenAI schemas are built lazily on first access and cached per
+    function.
+
+    Args:
+        tools (List[Callable]): The tools to compile.
+    """
+
+    def __init__(self, tools: Optional[List[Callable[..., Any]]]):
+        self.source = tools
+        self.tools: Tuple[Callable[..., Any], ...] = tuple(
+            tools or ()
+        )
+        self.functions: Dict[str, Callable[..., Any]] = {}
+        self.validators: Dict[str, ArgumentValidator] = {}
+        self._schemas: Optional[List[Dict[str, Any]]] = None
+
+        for func in self.tools:
+            name = getattr(func, "__name__", None)
+            if name is None or name in self.functions:
+                # First tool with a given name wins, matching a linear scan
+                continue
+            self.functions[name] = func
+            self.validators[name] = ArgumentValidator(func)
+
+    @property
+    def schemas(self) -> List[Dict[str, Any]]:
+        """OpenAI function schemas for every tool, in tool order."""
+        if self._schemas is None:
+            self._schemas = (
+                convert_multiple_functions_to_openai_function_schema(
+                    list(self.tools)
+                )
+            )
+        return self._schemas
+
+    def get(self, name: str) -> Optional[Callable[..., Any]]:
+        """Return the tool registered under ``name``, or None."""
+        return self.functions.get(name)
+
+    def validate(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> Optional[str]:
+        """Validate arguments for a tool; see :meth:`ArgumentValidator.validate`."""
+        validator = self.validators.get(name)
+        if validator is None:
+            return None
+        return validator.validate(arguments)
+
+    def matches(
+        self, tools: Optional[List[Callable[..., Any]]]
+    ) -> bool:
+        """Whether this compiled set was built from exactly ``tools``."""
+        if tools is None or len(tools) != len(self.tools):
+            return False
+        return all(a is b for a, b in zip(tools, self.tools))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.functions
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _shared_executor(name: str) -> ThreadPoolExecutor:
+    with _executor_lock:
+        if name not in _executors:
+            _executors[name] = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix=name,
+            )
+        return _executors[name]
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used for parallel tool calls.
+
+    The pool is created on first use and shared by every BaseTool, instead of
+    spinning up a new executor for each batch of calls.
+    """
+    return _shared_executor("swarms-tool")
+
+
+def get_timeout_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool for synchronous tools with a timeout.
+
+    A thread cannot be stopped when its call times out, so a hung tool keeps
+    its worker. Running these calls on their own bounded pool means hung
+    tools can only exhaust this pool, never the one other tool calls use.
+    """
+    return _shared_executor("swarms-tool-timeout")
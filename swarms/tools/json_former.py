@@ -7,17 +7,9 @@ from swarms.tools.logits_processor import (
     OutputNumbersTokens,
     StringStoppingCriteria,
 )
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
+from swarms.utils.optional_dependencies import require
 
-try:
-    import transformers
-except ImportError:
-    auto_check_and_download_package(
-        "transformers", package_manager="pip"
-    )
-    import transformers
+transformers = require("transformers", feature="Jsonformer")
 
 
 GENERATION_MARKER = "|GENERATION|"
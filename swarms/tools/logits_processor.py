@@ -1,23 +1,11 @@
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
-
+from swarms.utils.optional_dependencies import require
 
-try:
-    import torch
-except ImportError:
-    auto_check_and_download_package(
-        "torch", package_manager="pip", upgrade=True
-    )
-    import torch
-
-try:
-    import transformers
-except ImportError:
-    auto_check_and_download_package(
-        "transformers", package_manager="pip", upgrade=True
-    )
-    import transformers
+# The stopping criteria subclass transformers classes, so both are needed
+# as soon as this module is imported
+torch = require("torch", feature="swarms.tools.logits_processor")
+transformers = require(
+    "transformers", feature="swarms.tools.logits_processor"
+)
 
 
 class StringStoppingCriteria(transformers.StoppingCriteria):
@@ -1,8 +1,10 @@
-import os
-import concurrent.futures
+import copy
 import functools
 import inspect
 import json
+import threading
+import weakref
+from collections import OrderedDict
 from logging import getLogger
 from typing import (
     Any,
@@ -483,26 +485,73 @@ def get_openai_function_schema_from_func(
     return model_dump(function)
 
 
+# Weakly keyed so dynamically created tools and closures are not pinned;
+# objects that cannot be weakly referenced go to a small bounded LRU
+_function_schema_cache = weakref.WeakKeyDictionary()
+_strong_schema_cache = OrderedDict()
+_STRONG_SCHEMA_CACHE_SIZE = 256
+_function_schema_cache_lock = threading.Lock()
+
+
+def _cached_schema(
+    function: Callable[..., Any],
+) -> Optional[Dict[str, Any]]:
+    with _function_schema_cache_lock:
+        try:
+            return _function_schema_cache.get(function)
+        except TypeError:
+            schema = _strong_schema_cache.get(function)
+            if schema is not None:
+                _strong_schema_cache.move_to_end(function)
+            return schema
+
+
+def _cache_schema(
+    function: Callable[..., Any], schema: Dict[str, Any]
+) -> None:
+    with _function_schema_cache_lock:
+        try:
+            _function_schema_cache[function] = schema
+        except TypeError:
+            _strong_schema_cache[function] = schema
+            _strong_schema_cache.move_to_end(function)
+            while (
+                len(_strong_schema_cache) > _STRONG_SCHEMA_CACHE_SIZE
+            ):
+                _strong_schema_cache.popitem(last=False)
+
+
+def get_cached_openai_function_schema(
+    function: Callable[..., Any],
+) -> Dict[str, Any]:
+    """Get the OpenAI schema for a function, computing it once per function.
+
+    Schemas are keyed by function identity, so the same tool shared across
+    agents is only introspected once. The cache holds functions weakly, so a
+    tool's entry goes away with the tool. A deep copy is returned so callers
+    can modify the result freely.
+    """
+    try:
+        hash(function)
+    except TypeError:
+        return get_openai_function_schema_from_func(function)
+
+    schema = _cached_schema(function)
+    if schema is None:
+        schema = get_openai_function_schema_from_func(function)
+        _cache_schema(function, schema)
+
+    return copy.deepcopy(schema)
+
+
 def convert_multiple_functions_to_openai_function_schema(
     functions: List[Callable[..., Any]],
 ) -> List[Dict[str, Any]]:
     """Convert a list of functions to a list of OpenAI function schemas"""
-    # return [
-    #     get_openai_function_schema_from_func(function) for function in functions
-    # ]
-    # Use 40% of cpu cores
-    max_workers = int(os.cpu_count() * 0.8)
-
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=max_workers
-    ) as executor:
-        futures = [
-            executor.submit(
-                get_openai_function_schema_from_func, function
-            )
-            for function in functions
-        ]
-        return [future.result() for future in futures]
+    return [
+        get_cached_openai_function_schema(function)
+        for function in functions
+    ]
 
 
 #
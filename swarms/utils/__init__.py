@@ -1,29 +1,27 @@
-from swarms.utils.data_to_text import (
-    csv_to_text,
-    data_to_text,
-    json_to_text,
-    txt_to_text,
-)
-from swarms.utils.file_processing import (
-    load_json,
-    sanitize_file_path,
-    zip_workspace,
-    create_file_in_folder,
-    zip_folders,
-)
-from swarms.utils.parse_code import extract_code_from_markdown
-from swarms.utils.pdf_to_text import pdf_to_text
-from swarms.utils.try_except_wrapper import try_except_wrapper
-from swarms.utils.calculate_func_metrics import profile_func
-from swarms.utils.litellm_tokenizer import count_tokens
-from swarms.utils.output_types import HistoryOutputType
-from swarms.utils.history_output_formatter import (
-    history_output_formatter,
-)
-from swarms.utils.check_all_model_max_tokens import (
-    check_all_model_max_tokens,
-)
+from swarms.utils.lazy_loader import lazy_namespace
 
+# Public name -> module that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "csv_to_text": "swarms.utils.data_to_text",
+    "data_to_text": "swarms.utils.data_to_text",
+    "json_to_text": "swarms.utils.data_to_text",
+    "txt_to_text": "swarms.utils.data_to_text",
+    "load_json": "swarms.utils.file_processing",
+    "sanitize_file_path": "swarms.utils.file_processing",
+    "zip_workspace": "swarms.utils.file_processing",
+    "create_file_in_folder": "swarms.utils.file_processing",
+    "zip_folders": "swarms.utils.file_processing",
+    "extract_code_from_markdown": "swarms.utils.parse_code",
+    "pdf_to_text": "swarms.utils.pdf_to_text",
+    "try_except_wrapper": "swarms.utils.try_except_wrapper",
+    "profile_func": "swarms.utils.calculate_func_metrics",
+    "count_tokens": "swarms.utils.litellm_tokenizer",
+    "HistoryOutputType": "swarms.utils.output_types",
+    "history_output_formatter": "swarms.utils.history_output_formatter",
+    "check_all_model_max_tokens": "swarms.utils.check_all_model_max_tokens",
+}
+
+__getattr__, __dir__ = lazy_namespace(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "csv_to_text",
@@ -1,4 +1,3 @@
-import concurrent.futures
 import logging
 import os
 import warnings
@@ -39,9 +38,8 @@ def disable_logging():
         "packaging",
     ]
 
-    # Use concurrent futures to set the level for each logger concurrently
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        executor.map(set_logger_level, logger_names)
+    for logger_name in logger_names:
+        set_logger_level(logger_name)
 
     # Remove all existing handlers
     logging.getLogger().handlers = []
@@ -53,9 +51,10 @@ def disable_logging():
     if not os.path.exists(workspace_dir):
         os.makedirs(workspace_dir)
 
-    # Create a file handler to log errors to the file
+    # Create a file handler to log errors to the file; the file is only
+    # opened once the first error is logged
     file_handler = logging.FileHandler(
-        os.path.join(workspace_dir, "error.txt")
+        os.path.join(workspace_dir, "error.txt"), delay=True
     )
     file_handler.setLevel(logging.ERROR)
     logging.getLogger().addHandler(file_handler)
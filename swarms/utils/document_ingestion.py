@@ -0,0 +1,351 @@
+"""
+Parallel, cached document ingestion.
+
+``DocumentIngestor`` turns files into text for agents:
+
+- Extraction runs across a process pool (PDF parsing is CPU bound), with a
+  bounded number of files in flight so large folders do not pile up in
+  memory.
+- Extracted text and token counts are cached by the SHA-256 of the file
+  contents, optionally on disk, so re-ingesting a folder or counting tokens
+  before chunking never parses a document twice. Only the most recently
+  used documents' text is kept in memory; the rest is read back from the
+  disk cache on demand.
+- ``iter_documents`` and ``iter_chunks`` are generators, so callers can
+  process documents and token-sized chunks one at a time.
+
+Example:
+    >>> ingestor = DocumentIngestor(cache_dir="agent_workspace/doc_cache")
+    >>> for path, text in ingestor.iter_documents(["a.pdf", "b.md"]):
+    ...     print(path, len(text))
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from swarms.utils.data_to_text import data_to_text
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="document_ingestion")
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _extract(path: str) -> str:
+    """Process-pool worker: extract the text of one file."""
+    return data_to_text(path) or ""
+
+
+def iter_chunks(
+    text: str,
+    max_tokens: int,
+    token_counter: Callable[[str], int],
+) -> Iterator[str]:
+    """
+    Lazily split text into chunks of at most ``max_tokens`` tokens.
+
+    Text is split on sentence boundaries (``". "``); a single sentence
+    longer than the budget becomes its own chunk.
+
+    Args:
+        text (str): The text to split.
+        max_tokens (int): Token budget per chunk.
+        token_counter (Callable[[str], int]): Counts tokens in a string.
+
+    Yields:
+        str: Consecutive chunks of ``text``.
+    """
+    parts: List[str] = []
+    tokens = 0
+
+    for sentence in text.split(". "):
+        sentence_tokens = token_counter(sentence)
+        if parts and tokens + sentence_tokens > max_tokens:
+            chunk = ". ".join(parts)
+            if chunk:
+                yield chunk
+            parts, tokens = [], 0
+        parts.append(sentence)
+        tokens += sentence_tokens
+
+    chunk = ". ".join(parts)
+    if chunk:
+        yield chunk
+
+
+def format_documents(documents: Iterable[Tuple[str, str]]) -> str:
+    """Join ``(path, text)`` pairs into one labelled string."""
+    return "".join(
+        f"\nContent from {os.path.basename(path)}:\n{text}\n"
+        for path, text in documents
+    )
+
+
+class DocumentIngestor:
+    """
+    Extract, cache and chunk documents.
+
+    Args:
+        cache_dir (Optional[str]): Directory for the on-disk cache. When
+            None, results are only cached in memory.
+        max_workers (Optional[int]): Extraction processes. Defaults to
+            the CPU count.
+        use_processes (bool): Extract in a process pool; set False to use
+            threads (e.g. when documents are mostly plain text).
+        token_counter (Optional[Callable[[str], int]]): Token counter used
+            for counts and chunking. Defaults to the litellm tokenizer.
+        memory_cache_size (int): Documents whose text is kept in memory,
+            least recently used first out. 0 keeps none, so text is always
+            read from ``cache_dir`` (or extracted again without one).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        token_counter: Optional[Callable[[str], int]] = None,
+        memory_cache_size: int = 16,
+    ):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self._token_counter = token_counter
+        self.memory_cache_size = memory_cache_size
+
+        self._texts: "OrderedDict[str, str]" = OrderedDict()
+        self._tokens: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # Cache
+
+    def _cache_path(self, digest: str, suffix: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{digest}{suffix}")
+
+    def _remember(self, digest: str, text: str) -> None:
+        with self._lock:
+            self._texts[digest] = text
+            self._texts.move_to_end(digest)
+            while len(self._texts) > self.memory_cache_size:
+                self._texts.popitem(last=False)
+
+    def _cached_text(self, digest: str) -> Optional[str]:
+        with self._lock:
+            if digest in self._texts:
+                self._texts.move_to_end(digest)
+                return self._texts[digest]
+
+        path = self._cache_path(digest, ".txt")
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            self._remember(digest, text)
+            return text
+        return None
+
+    def _store_text(self, digest: str, text: str) -> None:
+        self._remember(digest, text)
+
+        path = self._cache_path(digest, ".txt")
+        if path:
+            # Write then rename so readers never see partial text
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+
+    def clear_memory_cache(self) -> None:
+        """Drop in-memory text; the on-disk cache is kept."""
+        with self._lock:
+            self._texts.clear()
+
+    # Extraction
+
+    def extract(self, path: str) -> str:
+        """
+        Return the text of one file, using the cache when possible.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            str: The extracted text ("" for unsupported binary files).
+        """
+        digest = file_digest(path)
+        text = self._cached_text(digest)
+        if text is None:
+            text = _extract(path)
+            self._store_text(digest, text)
+        return text
+
+    def _executor(self) -> concurrent.futures.Executor:
+        if self.use_processes:
+            try:
+                return concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning(
+                    f"Process pool unavailable ({e}); extracting with threads"
+                )
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+
+    def iter_documents(
+        self, paths: Iterable[str]
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Extract many files in parallel, yielding results in input order.
+
+        Cached files are yielded without touching the pool. At most
+        ``2 * max_workers`` files are in flight at once.
+
+        Args:
+            paths (Iterable[str]): Files to read.
+
+        Yields:
+            Tuple[str, str]: ``(path, text)`` for each file.
+        """
+        paths = list(paths)
+        if len(paths) <= 1:
+            for path in paths:
+                yield path, self.extract(path)
+            return
+
+        window = 2 * self.max_workers
+        in_flight: deque = deque()
+        remaining = iter(paths)
+        executor = None
+
+        def submit_next() -> bool:
+            nonlocal executor
+            path = next(remaining, None)
+            if path is None:
+                return False
+            digest = file_digest(path)
+            result = self._cached_text(digest)
+            if result is None:
+                # The pool is only started once something misses the cache
+                if executor is None:
+                    executor = self._executor()
+                result = executor.submit(_extract, path)
+            in_flight.append((path, digest, result))
+            return True
+
+        try:
+            while len(in_flight) < window and submit_next():
+                pass
+
+            while in_flight:
+                path, digest, result = in_flight.popleft()
+                if isinstance(result, concurrent.futures.Future):
+                    result = result.result()
+                    self._store_text(digest, result)
+                submit_next()
+                yield path, result
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def extract_folder(
+        self, folder: str
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield ``(path, text)`` for every file in ``folder``, sorted by name."""
+        paths = [
+            os.path.join(folder, name)
+            for name in sorted(os.listdir(folder))
+            if os.path.isfile(os.path.join(folder, name))
+        ]
+        return self.iter_documents(paths)
+
+    # Tokens and chunks
+
+    def count_text_tokens(self, text: str) -> int:
+        """Count tokens in a string with the configured counter."""
+        if self._token_counter is None:
+            from swarms.utils.litellm_tokenizer import count_tokens
+
+            self._token_counter = count_tokens
+        return self._token_counter(text)
+
+    def count_tokens(self, path: str) -> int:
+        """
+        Return the token count of a file, cached by content hash.
+
+        Args:
+            path (str): The file to count.
+
+        Returns:
+            int: Number of tokens in the extracted text.
+        """
+        digest = file_digest(path)
+        with self._lock:
+            if digest in self._tokens:
+                return self._tokens[digest]
+
+        # Counts depend on the tokenizer, so they are stored per counter
+        counter = getattr(
+            self._token_counter, "__qualname__", "count_tokens"
+        )
+        meta_path = self._cache_path(digest, ".tokens.json")
+        counts = {}
+        if meta_path and os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                counts = json.load(f)
+
+        count = counts.get(counter)
+        if count is None:
+            count = int(self.count_text_tokens(self.extract(path)))
+            if meta_path:
+                counts[counter] = count
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(counts, f)
+
+        with self._lock:
+            self._tokens[digest] = count
+        return count
+
+    def iter_chunks(
+        self, paths: Iterable[str], max_tokens: int
+    ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Lazily yield token-bounded chunks for many files.
+
+        Args:
+            paths (Iterable[str]): Files to read.
+            max_tokens (int): Token budget per chunk.
+
+        Yields:
+            Tuple[str, int, str]: ``(path, chunk_index, chunk)``.
+        """
+        for path, text in self.iter_documents(paths):
+            for index, chunk in enumerate(
+                iter_chunks(text, max_tokens, self.count_text_tokens)
+            ):
+                yield path, index, chunk
@@ -1,6 +1,20 @@
+import atexit
+import os
+import queue
+import random
+import sys
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from rich.console import Console
 from rich.live import Live
@@ -10,16 +24,206 @@ from rich.table import Table
 from rich.text import Text
 
 
+PANEL_COLORS = [
+    "red",
+    "green",
+    "blue",
+    "yellow",
+    "magenta",
+    "cyan",
+    "white",
+]
+
+
+def panel_output_mode() -> str:
+    """
+    Read ``SWARMS_PANEL_OUTPUT``: "auto" (render only when someone is
+    watching: a terminal, Jupyter/Colab or IDLE), "always" or "never".
+    """
+    mode = os.getenv("SWARMS_PANEL_OUTPUT", "auto").lower()
+    return mode if mode in ("auto", "always", "never") else "auto"
+
+
+class PanelRenderer:
+    """
+    Single background thread that renders queued panels.
+
+    Producers never block: panels go into a bounded queue and are rendered
+    in batches, at most ``max_batches_per_second`` times per second. When
+    the queue is full, new panels are dropped and the next batch ends with
+    a one-line summary of how many were skipped.
+
+    Args:
+        console (Console): The Rich console to render to.
+        max_queue_size (int): Panels buffered before dropping.
+        max_batch_size (int): Panels rendered per console write.
+        max_batches_per_second (float): Upper bound on console writes.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 50,
+        max_batches_per_second: float = 20.0,
+    ):
+        self.console = console
+        self.max_batch_size = max_batch_size
+        self.min_interval = (
+            1.0 / max_batches_per_second
+            if max_batches_per_second
+            else 0.0
+        )
+        self.dropped = 0
+        self.rendered = 0
+
+        self._queue: "queue.Queue[Tuple[str, str, str]]" = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, content: str, title: str, style: str) -> bool:
+        """
+        Queue a panel for rendering without blocking.
+
+        Returns:
+            bool: False if the panel was dropped because the queue is full.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((content, title, style))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued panel has been rendered.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait; None waits forever.
+
+        Returns:
+            bool: True if the queue drained in time.
+        """
+        if self._thread is None:
+            return True
+        deadline = (
+            None if timeout is None else time.monotonic() + timeout
+        )
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="swarms-panel-renderer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            started = time.monotonic()
+            try:
+                self._render(batch)
+            except Exception:
+                # A broken console must never take the renderer down
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            elapsed = time.monotonic() - started
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+
+    def _render(self, batch: List[Tuple[str, str, str]]) -> None:
+        renderables: List[Any] = [
+            Panel(
+                content,
+                title=title,
+                style=f"bold {random.choice(PANEL_COLORS)}",
+            )
+            for content, title, style in batch
+        ]
+
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            renderables.append(
+                Text(
+                    f"... {dropped} panel(s) skipped while the console was busy",
+                    style="dim",
+                )
+            )
+
+        self.console.print(*renderables)
+        self.rendered += len(batch)
+
+
+class StreamingPanel:
+    """
+    Panel whose text grows as chunks are written to it.
+
+    ``write`` only appends to a buffer, so the producer (usually the thread
+    reading the LLM stream) never waits on the console; a ``Live`` display
+    re-renders the panel from its own refresh thread.
+    """
+
+    def __init__(self, title: str = "", style: str = "bold cyan"):
+        self.title = title
+        self.style = style
+        self._chunks: List[str] = []
+        self._lock = threading.Lock()
+
+    def write(self, chunk: str) -> None:
+        """Append a chunk of text."""
+        with self._lock:
+            self._chunks.append(chunk)
+
+    @property
+    def text(self) -> str:
+        """Everything written so far."""
+        with self._lock:
+            return "".join(self._chunks)
+
+    def __rich__(self) -> Panel:
+        return Panel(
+            Text(self.text, style=self.style),
+            title=self.title,
+            border_style=self.style,
+        )
+
+
 class Formatter:
     """
     A class for formatting and printing rich text to the console.
     """
 
-    def __init__(self):
+    def __init__(self, console: Optional[Console] = None):
         """
         Initializes the Formatter with a Rich Console instance.
         """
-        self.console = Console()
+        self.console = console or Console()
+        self.renderer = PanelRenderer(self.console)
 
     def _print_panel(
         self, content: str, title: str = "", style: str = "bold blue"
@@ -32,35 +236,89 @@ class Formatter:
             title (str, optional): The title of the panel. Defaults to "".
             style (str, optional): The style of the panel. Defaults to "bold blue".
         """
-        import random
-
-        colors = [
-            "red",
-            "green",
-            "blue",
-            "yellow",
-            "magenta",
-            "cyan",
-            "white",
-        ]
-        random_color = random.choice(colors)
         panel = Panel(
-            content, title=title, style=f"bold {random_color}"
+            content,
+            title=title,
+            style=f"bold {random.choice(PANEL_COLORS)}",
         )
         self.console.print(panel)
 
+    def panels_enabled(self) -> bool:
+        """Whether ``print_panel`` renders anything at all."""
+        mode = panel_output_mode()
+        if mode == "auto":
+            # Rich reports notebooks and IDLE as non-terminals; only
+            # pipes, files and CI logs are skipped
+            return (
+                self.console.is_terminal
+                or self.console.is_jupyter
+                or getattr(sys.stdin, "__module__", "").startswith(
+                    "idlelib"
+                )
+            )
+        return mode == "always"
+
     def print_panel(
         self,
         content: str,
         title: str = "",
         style: str = "bold blue",
     ) -> None:
-        process_thread = threading.Thread(
-            target=self._print_panel,
-            args=(content, title, style),
-            daemon=True,
-        )
-        process_thread.start()
+        """
+        Queue a panel for the background renderer and return immediately.
+
+        When output is not interactive, i.e. piped, redirected to a file or
+        captured by CI (and ``SWARMS_PANEL_OUTPUT`` is not "always"), the
+        panel is discarded without being built.
+
+        Args:
+            content (str): The content of the panel.
+            title (str, optional): The title of the panel. Defaults to "".
+            style (str, optional): The style of the panel. Defaults to "bold blue".
+        """
+        if not self.panels_enabled():
+            return
+        self.renderer.submit(content, title, style)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued panels to be rendered."""
+        return self.renderer.flush(timeout)
+
+    @contextmanager
+    def stream_panel(
+        self,
+        title: str = "Output",
+        style: str = "bold cyan",
+        refresh_per_second: float = 10,
+    ) -> Iterator[StreamingPanel]:
+        """
+        Display text live as it is produced.
+
+        Example:
+            >>> with formatter.stream_panel("Agent") as panel:
+            ...     llm.run(task, on_chunk=panel.write)
+
+        Args:
+            title (str): Title of the panel.
+            style (str): Style for the text inside the panel.
+            refresh_per_second (float): Redraws per second.
+
+        Yields:
+            StreamingPanel: Write chunks to it with ``panel.write``.
+        """
+        panel = StreamingPanel(title=title, style=style)
+        if not self.panels_enabled():
+            yield panel
+            return
+
+        # Keep queued panels from interleaving with the live display
+        self.flush(timeout=1.0)
+        with Live(
+            panel,
+            console=self.console,
+            refresh_per_second=refresh_per_second,
+        ):
+            yield panel
 
     def print_table(
         self, title: str, data: Dict[str, List[str]]
@@ -147,3 +405,6 @@ class Formatter:
 
 
 formatter = Formatter()
+
+# Render whatever is still queued when the interpreter exits
+atexit.register(formatter.flush, 2.0)
@@ -1,22 +1,12 @@
 import os
-import subprocess
 from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-from loguru import logger
 from pydantic import BaseModel
 
+from swarms.utils.optional_dependencies import optional_import
 
-try:
-    from openai import OpenAI
-except ImportError:
-    logger.error(
-        "OpenAI library not found. Please install the OpenAI library by running 'pip install openai'"
-    )
-    import sys
-
-    subprocess.run([sys.executable, "-m", "pip", "install", "openai"])
-    from openai import OpenAI
+openai = optional_import("openai", feature="OpenAIFunctionCaller")
 
 
 SUPPORTED_MODELS = [
@@ -65,7 +55,7 @@ class OpenAIFunctionCaller:
         self.max_tokens = max_tokens
         self.model_name = model_name
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai.OpenAI(api_key=self.api_key)
 
     def run(self, task: str):
         """
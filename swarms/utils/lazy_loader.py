@@ -0,0 +1,150 @@
+"""
+PEP 562 lazy namespaces for swarms packages.
+
+Package ``__init__`` modules declare which submodule provides each public
+name. The submodule is imported the first time the name is accessed, so
+``import swarms`` does not pull in litellm, networkx, numpy and the rest of
+the dependency tree until something actually needs them.
+
+This module must stay free of third-party imports.
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Tuple
+
+_import_lock = threading.RLock()
+
+
+def _resolve(spec: str) -> Tuple[str, str]:
+    """Split ``"package.module:attribute"`` into its two parts."""
+    module_name, _, attribute = spec.partition(":")
+    return module_name, attribute
+
+
+def lazy_namespace(
+    package_name: str, imports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a lazily populated package.
+
+    Args:
+        package_name (str): The ``__name__`` of the package.
+        imports (Dict[str, str]): Public name -> ``"module"`` or
+            ``"module:attribute"`` (when the public name is an alias).
+
+    Returns:
+        Tuple: The module-level ``__getattr__`` and ``__dir__`` functions.
+
+    Examples:
+        >>> __getattr__, __dir__ = lazy_namespace(
+        ...     __name__, {"Agent": "swarms.structs.agent"}
+        ... )
+    """
+
+    def __getattr__(name: str) -> object:
+        package = importlib.import_module(package_name)
+        spec = imports.get(name)
+
+        if spec is None:
+            # Keep ``package.submodule`` attribute access working
+            try:
+                return importlib.import_module(
+                    f"{package_name}.{name}"
+                )
+            except ModuleNotFoundError as error:
+                if error.name != f"{package_name}.{name}":
+                    raise
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+
+        module_name, attribute = _resolve(spec)
+        with _import_lock:
+            module = importlib.import_module(module_name)
+            value = getattr(module, attribute or name)
+            # Cache on the package so __getattr__ is only hit once per name
+            setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        package = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | set(imports))
+
+    class LazyModule(ModuleType):
+        """
+        Keeps exported names from being shadowed by same-named submodules.
+
+        The import system binds each loaded submodule onto its package, so
+        importing ``swarms.structs.majority_voting`` anywhere would replace
+        the exported ``majority_voting`` function with the module object.
+        Binding the exported attribute instead keeps the package namespace
+        identical to eager ``from module import name`` statements.
+        """
+
+        def __setattr__(self, name: str, value: object) -> None:
+            spec = imports.get(name)
+            if (
+                spec is not None
+                and isinstance(value, ModuleType)
+                and value.__name__ == f"{package_name}.{name}"
+            ):
+                module_name, attribute = _resolve(spec)
+                if module_name == value.__name__:
+                    value = getattr(value, attribute or name, value)
+            super().__setattr__(name, value)
+
+    sys.modules[package_name].__class__ = LazyModule
+
+    return __getattr__, __dir__
+
+
+def lazy_package_namespace(
+    package_name: str, subpackages: Iterable[str]
+) -> Tuple[
+    Callable[[str], object], Callable[[], List[str]], List[str]
+]:
+    """
+    Build a lazy namespace that re-exports the public names of subpackages.
+
+    This is the lazy equivalent of ``from subpackage import *`` for each
+    subpackage in order: when two subpackages export the same name, the one
+    listed later wins. Subpackages must be lazy themselves for this to be
+    cheap, since their ``__all__`` is read at import time.
+
+    Args:
+        package_name (str): The ``__name__`` of the package.
+        subpackages (Iterable[str]): Fully qualified subpackage names.
+
+    Returns:
+        Tuple: ``__getattr__``, ``__dir__`` and ``__all__`` for the package.
+    """
+    subpackages = list(subpackages)
+    owners: Dict[str, str] = {}
+    for subpackage in subpackages:
+        module = importlib.import_module(subpackage)
+        for name in getattr(module, "__all__", ()):
+            owners[name] = subpackage
+
+    def __getattr__(name: str) -> object:
+        subpackage = owners.get(name)
+        if subpackage is None:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(subpackage), name)
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        package: ModuleType = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | set(owners))
+
+    # Like a star import, underscore names resolve but are not re-exported
+    exported = [
+        subpackage.rsplit(".", 1)[-1] for subpackage in subpackages
+    ] + [name for name in owners if not name.startswith("_")]
+
+    return __getattr__, __dir__, exported
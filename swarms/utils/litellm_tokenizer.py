@@ -1,12 +1,18 @@
-from litellm import encode, model_list
 from loguru import logger
-from typing import Optional
+from typing import List, Optional
 from functools import lru_cache
 
 # Use consistent default model
 DEFAULT_MODEL = "gpt-4o-mini"
 
 
+def encode(model: str, text: str) -> List[int]:
+    """Tokenize text with litellm, which is imported on first use."""
+    from litellm import encode as litellm_encode
+
+    return litellm_encode(model=model, text=text)
+
+
 def count_tokens(
     text: str,
     model: str = DEFAULT_MODEL,
@@ -74,6 +80,8 @@ def count_tokens(
 def get_supported_models() -> list:
     """Get list of supported models from litellm."""
     try:
+        from litellm import model_list
+
         return model_list
     except Exception as e:
         logger.warning(f"Could not retrieve model list: {e}")
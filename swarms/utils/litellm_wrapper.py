@@ -1,5 +1,5 @@
 import traceback
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 import base64
 import requests
 from pathlib import Path
@@ -168,6 +168,46 @@ class LiteLLM:
                 out = out.model_dump()
             return out
 
+    @property
+    def streams_text(self) -> bool:
+        """Whether ``run`` streams plain text deltas."""
+        # Tool calls and raw responses need the complete message object
+        return bool(
+            self.stream
+            and self.tools_list_dictionary is None
+            and not self.return_all
+        )
+
+    @staticmethod
+    def collect_stream(
+        chunks: Iterable[Any],
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """
+        Assemble a streamed completion, handing each text delta to
+        ``on_chunk`` as it arrives.
+
+        Args:
+            chunks (Iterable[Any]): The streaming response from litellm.
+            on_chunk (Optional[Callable[[str], None]]): Called with every
+                non-empty text delta.
+
+        Returns:
+            str: The full response text.
+        """
+        parts = []
+        for chunk in chunks:
+            try:
+                delta = chunk.choices[0].delta.content
+            except (AttributeError, IndexError):
+                delta = None
+            if not delta:
+                continue
+            parts.append(delta)
+            if on_chunk is not None:
+                on_chunk(delta)
+        return "".join(parts)
+
     def _prepare_messages(
         self,
         task: str,
@@ -394,7 +434,8 @@ class LiteLLM:
             audio (str, optional): Audio input if any. Defaults to None.
             img (str, optional): Image input if any. Defaults to None.
             *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
+            **kwargs: Additional keyword arguments. ``on_chunk`` receives
+                each text delta as it arrives when streaming.
 
         Returns:
             str: The content of the response from the model.
@@ -402,6 +443,9 @@ class LiteLLM:
         Raises:
             Exception: If there is an error in processing the request.
         """
+        on_chunk = kwargs.pop("on_chunk", None)
+        stream = self.streams_text
+
         try:
             messages = self._prepare_messages(task=task, img=img)
 
@@ -409,7 +453,7 @@ class LiteLLM:
             completion_params = {
                 "model": self.model_name,
                 "messages": messages,
-                "stream": self.stream,
+                "stream": stream,
                 "max_tokens": self.max_tokens,
                 "caching": self.caching,
                 "temperature": self.temperature,
@@ -449,6 +493,9 @@ class LiteLLM:
             # Make the completion call
             response = completion(**completion_params)
 
+            if stream:
+                return self.collect_stream(response, on_chunk)
+
             # Handle tool-based response
             if self.tools_list_dictionary is not None:
                 return self.output_for_tools(response)
@@ -0,0 +1,532 @@
+"""
+Full-text, role and time indexes over conversation messages.
+
+``MessageIndex`` is an incremental inverted index for in-memory
+conversations. Messages are indexed once as they are appended (``sync``
+indexes only the new tail), and searches intersect posting lists instead of
+scanning every message:
+
+- terms are lowercased words; a trailing ``*`` matches a prefix
+  (``deploy*`` finds "deploy", "deployed", "deployment");
+- all terms must match, and hits are ranked with BM25;
+- ``role`` and ``since`` filters use a role index and a sorted timestamp
+  index.
+
+``candidates`` serves plain substring search: it narrows the messages to
+check by role and time, and the caller confirms each candidate against the
+message text.
+
+``SQLiteMessageIndex`` offers the same interface for histories that spill
+to disk. It keeps an FTS5 table plus role and time indexes in the spill
+file, so searching never loads the whole history into memory. The query
+syntax is translated to FTS5 by ``fts5_query``, so database-backed
+conversations rank results the same way.
+
+Example:
+    >>> index = MessageIndex()
+    >>> index.sync(conversation.conversation_history)
+    >>> index.search("deploy* failed", role="assistant", limit=5)
+    [(12, 3.41), (4, 1.87)]
+"""
+
+import bisect
+import datetime
+import json
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+Since = Union[str, float, int, datetime.datetime, None]
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _WORD.findall(str(text).lower())
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """The searchable text of a message's content."""
+    content = message.get("content", "")
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, default=str)
+
+
+def parse_query(query: str) -> List[Tuple[str, bool]]:
+    """
+    Parse a search query into ``(term, is_prefix)`` pairs.
+
+    Args:
+        query (str): Words to match; a trailing ``*`` on a word makes it a
+            prefix match.
+
+    Returns:
+        List[Tuple[str, bool]]: The query terms, in order.
+    """
+    terms = []
+    for part in str(query or "").split():
+        tokens = tokenize(part)
+        if not tokens:
+            continue
+        terms.extend((token, False) for token in tokens[:-1])
+        terms.append((tokens[-1], part.endswith("*")))
+    return terms
+
+
+def fts5_query(query: str) -> Optional[str]:
+    """
+    Translate a search query into an SQLite FTS5 MATCH expression.
+
+    Every term is quoted, so user input can never be parsed as FTS5
+    syntax.
+
+    Returns:
+        Optional[str]: The MATCH expression, or None for an empty query.
+    """
+    terms = parse_query(query)
+    if not terms:
+        return None
+    return " ".join(
+        f'"{term}"' + ("*" if prefix else "")
+        for term, prefix in terms
+    )
+
+
+def normalize_since(since: Since) -> Optional[str]:
+    """
+    Convert ``since`` to an ISO-8601 string comparable with timestamps.
+
+    Args:
+        since: A datetime, an ISO-8601 string or a Unix timestamp.
+    """
+    if since is None:
+        return None
+    if isinstance(since, datetime.datetime):
+        return since.isoformat()
+    if isinstance(since, (int, float)):
+        return datetime.datetime.fromtimestamp(since).isoformat()
+    return str(since)
+
+
+class MessageIndex:
+    """
+    Incremental inverted index over a sequence of messages.
+
+    Messages are identified by their position in the sequence. Appending is
+    incremental; any other change to indexed messages requires a rebuild
+    (``clear`` followed by ``sync``).
+
+    Args:
+        k1 (float): BM25 term-frequency saturation.
+        b (float): BM25 length normalization.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every indexed message."""
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._lengths: List[int] = []
+        self._total_length = 0
+        self._roles: Dict[str, List[int]] = defaultdict(list)
+        self._times: List[Tuple[str, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, message: Dict[str, Any]) -> int:
+        """
+        Index the next message.
+
+        Returns:
+            int: The message's position.
+        """
+        position = len(self._lengths)
+        tokens = tokenize(message_text(message))
+        for term, count in Counter(tokens).items():
+            self._postings[term][position] = count
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+
+        self._roles[str(message.get("role"))].append(position)
+        timestamp = message.get("timestamp")
+        if timestamp:
+            bisect.insort(self._times, (str(timestamp), position))
+        return position
+
+    def sync(self, messages: Sequence[Dict[str, Any]]) -> None:
+        """Index messages appended since the last sync."""
+        for position in range(len(self), len(messages)):
+            self.add(messages[position])
+
+    def positions_by_role(self, role: str) -> List[int]:
+        """Positions of messages from ``role``, oldest first."""
+        return list(self._roles.get(str(role), []))
+
+    def positions_since(self, since: Since) -> Set[int]:
+        """Positions of messages timestamped at or after ``since``."""
+        start = bisect.bisect_left(
+            self._times, (normalize_since(since), -1)
+        )
+        return {position for _, position in self._times[start:]}
+
+    def _filters(
+        self, role: Optional[str], since: Since
+    ) -> List[Set[int]]:
+        filters: List[Set[int]] = []
+        if role is not None:
+            filters.append(set(self._roles.get(str(role), [])))
+        if since is not None:
+            filters.append(self.positions_since(since))
+        return filters
+
+    def candidates(
+        self,
+        text: str,
+        role: Optional[str] = None,
+        since: Since = None,
+    ) -> List[int]:
+        """
+        Positions of messages that may contain ``text`` as a substring.
+
+        The result is a superset narrowed by role and time only: checking
+        a candidate's content is a single substring test, cheaper than
+        matching ``text`` against every term in the vocabulary.
+
+        Args:
+            text (str): The substring to look for.
+            role (Optional[str]): Only messages from this role.
+            since (Since): Only messages timestamped at or after this.
+
+        Returns:
+            List[int]: Candidate positions, oldest first.
+        """
+        filters = self._filters(role, since)
+        if not filters:
+            return list(range(len(self)))
+        return sorted(set.intersection(*filters))
+
+    def _matches(self, term: str, prefix: bool) -> Dict[int, int]:
+        if not prefix:
+            return self._postings.get(term, {})
+        matches: Dict[int, int] = {}
+        for candidate, postings in self._postings.items():
+            if candidate.startswith(term):
+                for position, count in postings.items():
+                    matches[position] = (
+                        matches.get(position, 0) + count
+                    )
+        return matches
+
+    def search(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find messages matching every query term, best first.
+
+        Args:
+            query (str): Words to match; ``word*`` matches a prefix. An
+                empty query matches every message.
+            role (Optional[str]): Only messages from this role.
+            since (Since): Only messages timestamped at or after this.
+            limit (Optional[int]): Maximum number of results.
+
+        Returns:
+            List[Tuple[int, float]]: ``(position, score)`` pairs, highest
+            BM25 score first. Without query terms, newest first with a
+            score of 0.
+        """
+        filters = self._filters(role, since)
+        terms = parse_query(query)
+        if not terms:
+            if filters:
+                candidates = set.intersection(*filters)
+            else:
+                candidates = set(range(len(self)))
+            ranked = [
+                (position, 0.0)
+                for position in sorted(candidates, reverse=True)
+            ]
+            return ranked[:limit] if limit is not None else ranked
+
+        matches = sorted(
+            (self._matches(term, prefix) for term, prefix in terms),
+            key=len,
+        )
+        if not matches[0]:
+            return []
+        candidates = set(matches[0])
+        for postings in matches[1:] + filters:
+            candidates &= set(postings)
+            if not candidates:
+                return []
+
+        total = len(self)
+        average_length = self._total_length / total if total else 0.0
+        scores = {}
+        for position in candidates:
+            length_norm = self.k1 * (
+                1
+                - self.b
+                + self.b
+                * self._lengths[position]
+                / (average_length or 1.0)
+            )
+            score = 0.0
+            for postings in matches:
+                frequency = postings[position]
+                idf = math.log(
+                    1
+                    + (total - len(postings) + 0.5)
+                    / (len(postings) + 0.5)
+                )
+                score += (
+                    idf
+                    * frequency
+                    * (self.k1 + 1)
+                    / (frequency + length_norm)
+                )
+            scores[position] = score
+
+        ranked = sorted(
+            scores.items(), key=lambda item: (-item[1], item[0])
+        )
+        return ranked[:limit] if limit is not None else ranked
+
+
+class SQLiteMessageIndex:
+    """
+    Full-text, role and time index kept in an SQLite database.
+
+    Offers the ``MessageIndex`` interface for message sequences too large
+    to index in memory, such as a ``PagedHistory``, whose segment file it
+    shares. Rows are added by ``sync`` in batches, so only one batch of
+    messages is held in memory at a time. Ranking uses FTS5's BM25; SQLite
+    builds without FTS5 fall back to matching each word as a substring.
+
+    The index is emptied on creation. Like ``MessageIndex``, appends are
+    incremental and any other change requires ``clear`` then ``sync``.
+
+    Args:
+        connection (sqlite3.Connection): Where the index is stored.
+        lock (threading.RLock): Serializes use of ``connection``; pass the
+            lock its owner uses for its own queries.
+        batch_size (int): Messages written per ``sync`` batch.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        lock: Optional[threading.RLock] = None,
+        batch_size: int = 256,
+    ):
+        self._connection = connection
+        self._lock = lock or threading.RLock()
+        self.batch_size = batch_size
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS message_index ("
+                "pos INTEGER PRIMARY KEY, role TEXT, timestamp TEXT, "
+                "content TEXT NOT NULL, opaque INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_message_index_role "
+                "ON message_index (role, pos)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_message_index_time "
+                "ON message_index (timestamp)"
+            )
+            try:
+                self._connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS "
+                    "message_index_fts USING fts5(content, "
+                    "content='message_index', content_rowid='pos')"
+                )
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                self.fts_enabled = False
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every indexed message."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM message_index")
+            if self.fts_enabled:
+                self._connection.execute(
+                    "INSERT INTO message_index_fts (message_index_fts) "
+                    "VALUES ('delete-all')"
+                )
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def sync(self, messages: Sequence[Dict[str, Any]]) -> None:
+        """Index messages appended since the last sync."""
+        with self._lock:
+            total = len(messages)
+            while self._count < total:
+                stop = min(self._count + self.batch_size, total)
+                rows = []
+                for position in range(self._count, stop):
+                    message = messages[position]
+                    timestamp = message.get("timestamp")
+                    rows.append(
+                        (
+                            position,
+                            str(message.get("role")),
+                            str(timestamp) if timestamp else None,
+                            message_text(message),
+                            not isinstance(
+                                message.get("content", ""), str
+                            ),
+                        )
+                    )
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT INTO message_index "
+                        "(pos, role, timestamp, content, opaque) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    if self.fts_enabled:
+                        self._connection.executemany(
+                            "INSERT INTO message_index_fts "
+                            "(rowid, content) VALUES (?, ?)",
+                            [(row[0], row[3]) for row in rows],
+                        )
+                self._count = stop
+
+    def _filters(
+        self, role: Optional[str], since: Since
+    ) -> Tuple[List[str], List[Any]]:
+        conditions, params = ["1"], []
+        if role is not None:
+            conditions.append("m.role = ?")
+            params.append(str(role))
+        if since is not None:
+            conditions.append("m.timestamp >= ?")
+            params.append(normalize_since(since))
+        return conditions, params
+
+    def _positions(self, sql: str, params: List[Any]) -> List[int]:
+        with self._lock:
+            return [
+                row[0]
+                for row in self._connection.execute(sql, params)
+            ]
+
+    def positions_by_role(self, role: str) -> List[int]:
+        """Positions of messages from ``role``, oldest first."""
+        return self._positions(
+            "SELECT pos FROM message_index WHERE role = ? "
+            "ORDER BY pos",
+            [str(role)],
+        )
+
+    def candidates(
+        self,
+        text: str,
+        role: Optional[str] = None,
+        since: Since = None,
+    ) -> List[int]:
+        """
+        Positions of messages that may contain ``text`` as a substring.
+
+        Matches a case-sensitive substring in SQL. Messages whose content
+        is not a string are indexed as JSON, so they are always included
+        and callers must still check each candidate.
+
+        Args:
+            text (str): The substring to look for.
+            role (Optional[str]): Only messages from this role.
+            since (Since): Only messages timestamped at or after this.
+
+        Returns:
+            List[int]: Candidate positions, oldest first.
+        """
+        conditions, params = self._filters(role, since)
+        if text:
+            conditions.append("(instr(m.content, ?) > 0 OR m.opaque)")
+            params.append(text)
+        return self._positions(
+            f"SELECT m.pos FROM message_index m "
+            f"WHERE {' AND '.join(conditions)} ORDER BY m.pos",
+            params,
+        )
+
+    def search(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find messages matching every query term, best first.
+
+        Args:
+            query (str): Words to match; ``word*`` matches a prefix. An
+                empty query matches every message.
+            role (Optional[str]): Only messages from this role.
+            since (Since): Only messages timestamped at or after this.
+            limit (Optional[int]): Maximum number of results.
+
+        Returns:
+            List[Tuple[int, float]]: ``(position, score)`` pairs, highest
+            BM25 score first. Without query terms, or without FTS5, newest
+            first with a score of 0.
+        """
+        conditions, params = self._filters(role, since)
+        match = fts5_query(query)
+        if match and self.fts_enabled:
+            sql = (
+                "SELECT m.pos, -bm25(message_index_fts) AS score "
+                "FROM message_index_fts JOIN message_index m "
+                "ON m.pos = message_index_fts.rowid "
+                f"WHERE message_index_fts MATCH ? AND "
+                f"{' AND '.join(conditions)} "
+                "ORDER BY score DESC, m.pos ASC"
+            )
+            params.insert(0, match)
+        else:
+            for term, _ in parse_query(query):
+                # FTS5 unavailable: match each word as a substring
+                conditions.append("m.content LIKE ?")
+                params.append(f"%{term}%")
+            sql = (
+                "SELECT m.pos, 0.0 FROM message_index m "
+                f"WHERE {' AND '.join(conditions)} "
+                "ORDER BY m.pos DESC"
+            )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [
+                (row[0], row[1])
+                for row in self._connection.execute(sql, params)
+            ]
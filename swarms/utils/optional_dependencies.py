@@ -0,0 +1,234 @@
+"""
+Central registry for optional third-party dependencies.
+
+Modules that need an optional package resolve it through this module
+instead of installing it with pip at import time. Availability is probed
+with ``importlib.util.find_spec`` (cached per process), so checking for a
+package never imports or installs it, and a missing package fails fast with
+an install hint rather than blocking on a network install.
+
+Two entry points cover the call sites in swarms:
+
+- ``require(module)`` imports a module now, raising
+  ``MissingDependencyError`` if it is not installed.
+- ``optional_import(module)`` returns a lazy proxy that imports the module on
+  first attribute access.
+
+Set ``SWARMS_STRICT_DEPENDENCIES=true`` (or pass ``strict=True``) to make
+``optional_import`` raise immediately when the module is missing instead of
+on first use.
+
+This module must stay free of third-party imports.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Dict, List, Optional
+
+# Importable module name -> pip distribution that provides it
+OPTIONAL_DEPENDENCIES: Dict[str, str] = {
+    "chromadb": "chromadb",
+    "duckdb": "duckdb",
+    "openai": "openai",
+    "pulsar": "pulsar-client",
+    "pyarrow": "pyarrow",
+    "pypdf": "pypdf",
+    "redis": "redis",
+    "reportlab": "reportlab",
+    "sentence_transformers": "sentence-transformers",
+    "supabase": "supabase",
+    "torch": "torch",
+    "transformers": "transformers",
+    "vllm": "vllm",
+}
+
+
+class MissingDependencyError(ImportError):
+    """
+    Raised when an optional dependency is required but not installed.
+
+    Subclasses ``ImportError`` so existing ``except ImportError`` handlers
+    keep working.
+
+    Attributes:
+        package (str): The pip distribution that provides the module.
+        feature (Optional[str]): The swarms feature that needed it.
+    """
+
+    def __init__(
+        self, module_name: str, feature: Optional[str] = None
+    ):
+        self.package = install_name(module_name)
+        self.feature = feature
+
+        message = (
+            f"Optional dependency '{module_name}' is not installed"
+        )
+        if feature:
+            message += f" (required by {feature})"
+        message += f". Install it with: pip install {self.package}"
+        super().__init__(message, name=module_name)
+
+
+def install_name(module_name: str) -> str:
+    """Return the pip distribution name for an importable module."""
+    root = module_name.split(".", 1)[0]
+    return OPTIONAL_DEPENDENCIES.get(root, root)
+
+
+def register_optional_dependency(
+    module_name: str, package: str
+) -> None:
+    """
+    Register the pip distribution that provides ``module_name``.
+
+    Args:
+        module_name (str): The importable top-level module name.
+        package (str): The pip distribution to suggest when it is missing.
+    """
+    OPTIONAL_DEPENDENCIES[module_name] = package
+
+
+def strict_mode() -> bool:
+    """Whether missing dependencies should raise as soon as they are declared."""
+    return os.getenv(
+        "SWARMS_STRICT_DEPENDENCIES", "false"
+    ).lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def is_available(module_name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    The result is cached for the lifetime of the process; call
+    ``is_available.cache_clear()`` after installing a package at runtime.
+
+    Args:
+        module_name (str): The module to probe, e.g. ``"redis"``.
+
+    Returns:
+        bool: True if the module is importable.
+    """
+    if sys.modules.get(module_name) is not None:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # Raised when a parent package is missing or has no __spec__
+        return False
+
+
+def missing_dependencies(*module_names: str) -> List[str]:
+    """Return the modules from ``module_names`` that are not installed."""
+    return [name for name in module_names if not is_available(name)]
+
+
+def require(
+    module_name: str, feature: Optional[str] = None
+) -> ModuleType:
+    """
+    Import an optional dependency or fail fast with an install hint.
+
+    Args:
+        module_name (str): The module to import.
+        feature (Optional[str]): The feature that needs it, for the error.
+
+    Returns:
+        ModuleType: The imported module.
+
+    Raises:
+        MissingDependencyError: If the module is not installed.
+    """
+    if not is_available(module_name):
+        raise MissingDependencyError(module_name, feature)
+    return importlib.import_module(module_name)
+
+
+class LazyDependency:
+    """
+    Module proxy that imports an optional dependency on first use.
+
+    Attribute access is forwarded to the real module once it has been
+    imported, so ``pypdf = optional_import("pypdf")`` followed by
+    ``pypdf.PdfReader(...)`` behaves like a regular import that only
+    happens when the function runs.
+
+    Args:
+        module_name (str): The module to resolve.
+        feature (Optional[str]): The feature that needs it, for the error.
+        strict (Optional[bool]): Raise immediately if the module is
+            missing. Defaults to ``SWARMS_STRICT_DEPENDENCIES``.
+    """
+
+    __slots__ = ("_module_name", "_feature", "_module", "_lock")
+
+    def __init__(
+        self,
+        module_name: str,
+        feature: Optional[str] = None,
+        strict: Optional[bool] = None,
+    ):
+        self._module_name = module_name
+        self._feature = feature
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+        if strict is None:
+            strict = strict_mode()
+        if strict and not is_available(module_name):
+            raise MissingDependencyError(module_name, feature)
+
+    @property
+    def available(self) -> bool:
+        """Whether the underlying module is installed."""
+        return is_available(self._module_name)
+
+    def resolve(self) -> ModuleType:
+        """Import the module (once) and return it."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = require(
+                        self._module_name, self._feature
+                    )
+        return self._module
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self.resolve())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "deferred"
+        return f"<LazyDependency {self._module_name!r} ({state})>"
+
+
+def optional_import(
+    module_name: str,
+    feature: Optional[str] = None,
+    strict: Optional[bool] = None,
+) -> LazyDependency:
+    """
+    Declare an optional dependency that is imported on first use.
+
+    Args:
+        module_name (str): The module to resolve lazily.
+        feature (Optional[str]): The feature that needs it, for the error.
+        strict (Optional[bool]): Raise now if the module is missing.
+            Defaults to ``SWARMS_STRICT_DEPENDENCIES``.
+
+    Returns:
+        LazyDependency: A proxy for the module.
+
+    Examples:
+        >>> pypdf = optional_import("pypdf", feature="pdf_to_text")
+        >>> reader = pypdf.PdfReader("paper.pdf")  # imported here
+    """
+    return LazyDependency(module_name, feature=feature, strict=strict)
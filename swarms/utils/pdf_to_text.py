@@ -1,15 +1,25 @@
+from typing import Iterator
+
+from swarms.utils.optional_dependencies import optional_import
 from swarms.utils.try_except_wrapper import try_except_wrapper
 
-try:
-    import pypdf
-except ImportError:
-    import subprocess
-    import sys
+pypdf = optional_import("pypdf", feature="pdf_to_text")
+
+
+def iter_pdf_pages(pdf_path: str) -> Iterator[str]:
+    """
+    Yield the text of each page of a PDF, one page at a time.
+
+    Args:
+        pdf_path (str): The path to the PDF file.
 
-    subprocess.check_call(
-        [sys.executable, "-m", "pip", "install", "pypdf"]
-    )
-    import pypdf
+    Yields:
+        str: The extracted text of a page.
+    """
+    with open(pdf_path, "rb") as file:
+        pdf_reader = pypdf.PdfReader(file)
+        for page in pdf_reader.pages:
+            yield page.extract_text()
 
 
 @try_except_wrapper
@@ -28,16 +38,9 @@ def pdf_to_text(pdf_path: str) -> str:
         Exception: If there is an error in reading the PDF file.
     """
     try:
-        # Open the PDF file
-        with open(pdf_path, "rb") as file:
-            pdf_reader = pypdf.PdfReader(file)
-            text = ""
-
-            # Iterate through each page and extract text
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-
-            return text
+        return "".join(
+            f"{page}\n" for page in iter_pdf_pages(pdf_path)
+        )
     except FileNotFoundError:
         raise FileNotFoundError(
             f"The file at {pdf_path} was not found."
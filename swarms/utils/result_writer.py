@@ -0,0 +1,323 @@
+"""
+Streaming, resumable result sink for long-running swarms.
+
+``ResultWriter`` appends rows to CSV, JSONL or Parquet from a background
+thread. Callers enqueue rows as soon as each result is ready; the writer
+buffers them and flushes every ``flush_every`` rows or ``flush_interval``
+seconds, so memory stays bounded no matter how many rows a run produces
+and nothing is lost if the run is interrupted.
+
+Parquet output is a directory of part files (one per flush), which keeps
+appends cheap and lets a resumed run add new parts next to the old ones.
+
+``completed_counts`` reads an existing output back and counts rows per key
+so a resumed run can skip work that already finished.
+"""
+
+import csv
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.optional_dependencies import require
+
+logger = initialize_logger(log_folder="result_writer")
+
+OutputFormat = Literal["csv", "jsonl", "parquet"]
+
+_STOP = object()
+
+
+def infer_format(path: str) -> str:
+    """Guess the output format from a file extension (defaults to CSV)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".parquet" or (
+        os.path.isdir(path)
+        and glob.glob(os.path.join(path, "*.parquet"))
+    ):
+        return "parquet"
+    return "csv"
+
+
+def row_key(row: Dict[str, Any], key_fields: Sequence[str]) -> Tuple:
+    """Return the key tuple ``completed_counts`` uses for ``row``."""
+    return tuple(str(row.get(k, "")) for k in key_fields)
+
+
+def iter_rows(
+    path: str,
+    output_format: Optional[OutputFormat] = None,
+    headers: Optional[Dict[str, str]] = None,
+):
+    """
+    Yield rows from an existing output one at a time.
+
+    Args:
+        path (str): The CSV/JSONL file or Parquet directory.
+        output_format (Optional[OutputFormat]): Output format, inferred
+            when None.
+        headers (Optional[Dict[str, str]]): CSV header label per field,
+            used to map CSV columns back to field names.
+
+    Yields:
+        Dict[str, Any]: One row keyed by field name.
+    """
+    output_format = output_format or infer_format(path)
+    if not os.path.exists(path):
+        return
+
+    if output_format == "csv":
+        labels = {
+            label: field for field, label in (headers or {}).items()
+        }
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield {
+                    labels.get(key, key): value
+                    for key, value in row.items()
+                }
+    elif output_format == "jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        parquet = require("pyarrow.parquet", feature="Parquet output")
+        for part in sorted(
+            glob.glob(os.path.join(path, "*.parquet"))
+        ):
+            for batch in parquet.ParquetFile(part).iter_batches():
+                yield from batch.to_pylist()
+
+
+def completed_counts(
+    path: str,
+    key_fields: Sequence[str],
+    output_format: Optional[OutputFormat] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Counter:
+    """
+    Count existing rows per key, streaming the output from disk.
+
+    Args:
+        path (str): The CSV/JSONL file or Parquet directory.
+        key_fields (Sequence[str]): Fields identifying a unit of work.
+        output_format (Optional[OutputFormat]): Output format, inferred
+            when None.
+        headers (Optional[Dict[str, str]]): CSV header label per field.
+
+    Returns:
+        Counter: Number of rows already written for each key tuple.
+    """
+    counts: Counter = Counter()
+    for row in iter_rows(path, output_format, headers):
+        counts[row_key(row, key_fields)] += 1
+    return counts
+
+
+class ResultWriter:
+    """
+    Append rows to CSV, JSONL or Parquet from a background thread.
+
+    Args:
+        path (str): Output file (CSV/JSONL) or directory (Parquet).
+        fields (Sequence[str]): Row fields, in column order.
+        output_format (Optional[OutputFormat]): Output format, inferred from
+            ``path`` when None.
+        headers (Optional[Dict[str, str]]): CSV header label per field.
+        flush_every (int): Flush after this many buffered rows.
+        flush_interval (float): Flush at least this often, in seconds.
+        max_pending (Optional[int]): Rows queued before ``write`` blocks,
+            so a slow disk applies backpressure instead of growing memory.
+            Defaults to ``4 * flush_every``.
+
+    Example:
+        >>> with ResultWriter("results.csv", ["task", "result"]) as writer:
+        ...     writer.write({"task": "t1", "result": "done"})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fields: Sequence[str],
+        output_format: Optional[OutputFormat] = None,
+        headers: Optional[Dict[str, str]] = None,
+        flush_every: int = 100,
+        flush_interval: float = 5.0,
+        max_pending: Optional[int] = None,
+    ):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.path = path
+        self.fields = list(fields)
+        self.output_format = output_format or infer_format(path)
+        self.headers = headers or {}
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+
+        if self.output_format == "parquet":
+            self._pyarrow = require(
+                "pyarrow", feature="Parquet output"
+            )
+            self._parquet = require(
+                "pyarrow.parquet", feature="Parquet output"
+            )
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(
+            maxsize=max_pending or 4 * flush_every
+        )
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._worker, name="result-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Enqueue a row; blocks only while ``max_pending`` rows are queued."""
+        if self._closed:
+            raise RuntimeError("ResultWriter is closed")
+        self._raise_error()
+        self._put(row)
+
+    def close(self) -> None:
+        """Flush remaining rows and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def _put(self, item: Any) -> None:
+        # Wait for room, but never on a worker that has already failed
+        while True:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(
+                f"Result writer failed: {self._error}"
+            ) from self._error
+
+    # Background thread
+
+    def _worker(self) -> None:
+        buffer: List[Dict[str, Any]] = []
+        last_flush = time.monotonic()
+
+        while True:
+            timeout = max(
+                0.0,
+                self.flush_interval - (time.monotonic() - last_flush),
+            )
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is _STOP
+            if item is not None and not stop:
+                buffer.append(item)
+
+            due = (
+                len(buffer) >= self.flush_every
+                or time.monotonic() - last_flush
+                >= self.flush_interval
+            )
+            if buffer and (stop or due):
+                try:
+                    self._flush(buffer)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to write results to {self.path}: {e}"
+                    )
+                    self._error = e
+                    return
+                buffer = []
+            if due or stop:
+                last_flush = time.monotonic()
+            if stop:
+                return
+
+    def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        if self.output_format == "csv":
+            self._flush_csv(rows)
+        elif self.output_format == "jsonl":
+            self._flush_jsonl(rows)
+        else:
+            self._flush_parquet(rows)
+        self.rows_written += len(rows)
+
+    def _ensure_parent(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _flush_csv(self, rows: List[Dict[str, Any]]) -> None:
+        self._ensure_parent(self.path)
+        new_file = (
+            not os.path.exists(self.path)
+            or os.path.getsize(self.path) == 0
+        )
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(
+                    [self.headers.get(k, k) for k in self.fields]
+                )
+            writer.writerows(
+                [row.get(k, "") for k in self.fields] for row in rows
+            )
+
+    def _flush_jsonl(self, rows: List[Dict[str, Any]]) -> None:
+        self._ensure_parent(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(
+                    json.dumps({k: row.get(k) for k in self.fields})
+                    + "\n"
+                )
+
+    def _flush_parquet(self, rows: List[Dict[str, Any]]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        table = self._pyarrow.Table.from_pylist(
+            [{k: row.get(k) for k in self.fields} for row in rows]
+        )
+        part = (
+            f"part-{time.time_ns()}-{self.rows_written:09d}.parquet"
+        )
+        self._parquet.write_table(
+            table, os.path.join(self.path, part)
+        )
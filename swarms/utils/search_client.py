@@ -0,0 +1,432 @@
+"""
+Pooled, cached web search.
+
+``SearchClient`` sits between research swarms and a search API:
+
+- The default ``ExaBackend`` reuses one ``requests.Session`` (keep-alive
+  connection pool) and applies a timeout to every request.
+- Results are cached by normalized query and parameters in an in-memory LRU
+  with a TTL, optionally backed by JSON files on disk, so repeated queries
+  across steps and tasks are never fetched twice. Identical queries issued
+  concurrently share one request.
+- ``search_many`` yields results in completion order.
+
+Backends are plain callables ``(query, params, timeout) -> dict``, so tests
+can point ``ExaBackend`` at a local server or replace it entirely.
+
+Example:
+    >>> client = SearchClient(cache_dir="agent_workspace/search_cache")
+    >>> for query, result in client.search_many(["a", "b"]):
+    ...     print(query, format_exa_results(result))
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="search_client")
+
+SearchBackend = Callable[[str, Dict[str, Any], float], Dict[str, Any]]
+
+
+class SearchError(Exception):
+    """Raised when a search request fails."""
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivial variants share a cache entry."""
+    return " ".join(str(query).lower().split())
+
+
+def query_key(
+    query: str, params: Optional[Dict[str, Any]] = None
+) -> str:
+    """Cache key for a query and its search parameters."""
+    payload = json.dumps(
+        [normalize_query(query), params or {}],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExaBackend:
+    """
+    Exa search over a pooled ``requests.Session``.
+
+    Args:
+        api_key (Optional[str]): Exa API key. Defaults to ``EXA_API_KEY``.
+        api_url (str): Search endpoint.
+        pool_size (int): Connections kept alive per host.
+        session (Optional[requests.Session]): Session to use instead of
+            creating one.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.exa.ai/search",
+        pool_size: int = 16,
+        session: Optional[requests.Session] = None,
+    ):
+        self.api_key = api_key
+        self.api_url = api_url
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def build_payload(
+        self, query: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the Exa request body; extra params are passed through."""
+        payload = {
+            "query": query,
+            "useAutoprompt": True,
+            "numResults": params.get("num_results", 10),
+            "contents": {
+                "text": True,
+                "highlights": {"numSentences": 10},
+            },
+        }
+        for key, value in params.items():
+            if key != "num_results" and key not in payload:
+                payload[key] = value
+        return payload
+
+    def __call__(
+        self, query: str, params: Dict[str, Any], timeout: float
+    ) -> Dict[str, Any]:
+        api_key = self.api_key or os.getenv("EXA_API_KEY")
+        if not api_key:
+            raise SearchError(
+                "EXA_API_KEY environment variable not set"
+            )
+        try:
+            response = self.session.post(
+                self.api_url,
+                json=self.build_payload(query, params),
+                headers={
+                    "x-api-key": api_key,
+                    "Content-Type": "application/json",
+                },
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            raise SearchError(str(e)) from e
+
+        if response.status_code != 200:
+            raise SearchError(
+                f"HTTP {response.status_code}: {response.text}"
+            )
+        data = response.json()
+        if "error" in data:
+            raise SearchError(str(data["error"]))
+        return data
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+
+class SearchCache:
+    """
+    LRU cache of search results with a TTL and optional disk persistence.
+
+    Args:
+        max_entries (int): Results kept in memory.
+        ttl (Optional[float]): Seconds a result stays fresh; None never
+            expires.
+        cache_dir (Optional[str]): Directory for JSON copies of results,
+            shared between runs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: Optional[float] = 24 * 3600.0,
+        cache_dir: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _fresh(self, stored: float) -> bool:
+        return self.ttl is None or time.time() - stored <= self.ttl
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached result, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(entry[0]):
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        path = self._path(key)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if self._fresh(record["time"]):
+                self._remember(key, record["time"], record["result"])
+                return record["result"]
+        return None
+
+    def _remember(self, key: str, stored: float, result: Any) -> None:
+        with self._lock:
+            self._entries[key] = (stored, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def put(self, key: str, result: Any) -> None:
+        """Store a result in memory and, when configured, on disk."""
+        now = time.time()
+        self._remember(key, now, result)
+
+        path = self._path(key)
+        if path:
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"time": now, "result": result}, f)
+            os.replace(tmp, path)
+
+    def clear(self) -> None:
+        """Drop in-memory results (files on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SearchClient:
+    """
+    Cached, concurrent search with a pluggable backend.
+
+    Args:
+        backend (Optional[SearchBackend]): Performs one search. Defaults to
+            ``ExaBackend``.
+        cache (Optional[SearchCache]): Result cache. Defaults to an
+            in-memory ``SearchCache``; pass ``cache_dir`` to persist it.
+        cache_dir (Optional[str]): Directory for the default cache.
+        timeout (float): Seconds allowed per query.
+        max_workers (int): Queries fetched at once by ``search_many``.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[SearchBackend] = None,
+        cache: Optional[SearchCache] = None,
+        cache_dir: Optional[str] = None,
+        timeout: float = 30.0,
+        max_workers: int = 8,
+    ):
+        self.backend = backend or ExaBackend()
+        self.cache = (
+            cache
+            if cache is not None
+            else SearchCache(cache_dir=cache_dir)
+        )
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.requests_made = 0
+
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[
+            concurrent.futures.ThreadPoolExecutor
+        ] = None
+
+    def search(self, query: str, **params: Any) -> Dict[str, Any]:
+        """
+        Run one search, answering from the cache when possible.
+
+        Args:
+            query (str): The search query.
+            **params: Backend parameters (e.g. ``num_results``).
+
+        Returns:
+            Dict[str, Any]: The backend's JSON result.
+
+        Raises:
+            SearchError: If the backend fails.
+        """
+        key = query_key(query, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Concurrent callers with the same query share one request
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            self.requests_made += 1
+            result = self.backend(query, params, self.timeout)
+            self.cache.put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = (
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="search",
+                    )
+                )
+            return self._executor
+
+    def search_many(
+        self, queries: Iterable[str], **params: Any
+    ) -> Iterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """
+        Search many queries concurrently, yielding in completion order.
+
+        Duplicate queries are fetched once. Failures are yielded as the
+        exception instead of being raised, so one bad query does not stop
+        the rest.
+
+        Args:
+            queries (Iterable[str]): Queries to run.
+            **params: Backend parameters applied to every query.
+
+        Yields:
+            Tuple[str, Union[Dict[str, Any], Exception]]: ``(query, result)``.
+        """
+        unique: Dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(query_key(query, params), query)
+
+        pool = self._pool()
+        futures = {
+            pool.submit(self.search, query, **params): query
+            for query in unique.values()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            query = futures[future]
+            try:
+                yield query, future.result()
+            except Exception as e:
+                logger.warning(f"Search failed for {query!r}: {e}")
+                yield query, e
+
+    def close(self) -> None:
+        """Stop worker threads and close the backend's connections."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        close = getattr(self.backend, "close", None)
+        if callable(close):
+            close()
+
+
+def format_exa_results(json_data: Dict[str, Any]) -> str:
+    """Render an Exa search response as Markdown."""
+    formatted_text = []
+    search_params = json_data.get("effectiveFilters", {})
+    query = search_params.get("query", "General web search")
+    formatted_text.append(
+        f"### Exa Search Results for: '{query}'\n\n---\n"
+    )
+
+    results = json_data.get("results", [])
+    if not results:
+        formatted_text.append("No results found.\n")
+        return "".join(formatted_text)
+
+    for i, result in enumerate(results, 1):
+        title = result.get("title", "No title")
+        url = result.get("url", result.get("id", "No URL"))
+        published_date = result.get("publishedDate", "")
+        highlights = result.get("highlights", [])
+        highlight_text = (
+            "\n".join(
+                (
+                    h.get("text", str(h))
+                    if isinstance(h, dict)
+                    else str(h)
+                )
+                for h in highlights[:3]
+            )
+            if highlights
+            else "No summary available"
+        )
+
+        formatted_text.extend(
+            [
+                f"{i}. **{title}**\n",
+                f"   - URL: {url}\n",
+                f"   - Published: {published_date.split('T')[0] if published_date else 'Date unknown'}\n",
+                f"   - Key Points:\n      {highlight_text}\n\n",
+            ]
+        )
+
+    return "".join(formatted_text)
+
+
+_default_client: Optional[SearchClient] = None
+_default_lock = threading.Lock()
+
+
+def get_search_client() -> SearchClient:
+    """Return the process-wide default ``SearchClient``."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = SearchClient()
+        return _default_client
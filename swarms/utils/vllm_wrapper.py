@@ -1,20 +1,11 @@
-import os
-import concurrent.futures
-from typing import List, Optional, Dict, Any
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
 from loguru import logger
 
-try:
-    from vllm import LLM, SamplingParams
-except ImportError:
-    import subprocess
-    import sys
+from swarms.utils.optional_dependencies import optional_import
 
-    print("Installing vllm")
-    subprocess.check_call(
-        [sys.executable, "-m", "pip", "install", "-U", "vllm"]
-    )
-    print("vllm installed")
-    from vllm import LLM, SamplingParams
+vllm = optional_import("vllm", feature="VLLMWrapper")
 
 
 class VLLMWrapper:
@@ -34,6 +25,8 @@ class VLLMWrapper:
         tools_list_dictionary: Optional[List[Dict[str, Any]]] = None,
         tool_choice: str = "auto",
         parallel_tool_calls: bool = False,
+        llm: Optional[Any] = None,
+        sampling_params: Optional[Any] = None,
         *args,
         **kwargs,
     ):
@@ -50,6 +43,10 @@ class VLLMWrapper:
             tools_list_dictionary (List[Dict[str, Any]], optional): List of available tools. Defaults to None.
             tool_choice (str): How to choose tools. Defaults to "auto".
             parallel_tool_calls (bool): Whether to allow parallel tool calls. Defaults to False.
+            llm (Any, optional): A pre-built engine exposing ``generate(prompts, sampling_params)``,
+                e.g. a shared ``vllm.LLM``. Defaults to None (one is created from ``model_name``).
+            sampling_params (Any, optional): Sampling parameters passed to ``generate``.
+                Defaults to None (built from ``temperature`` and ``max_tokens``).
         """
         self.model_name = model_name
         self.system_prompt = system_prompt
@@ -62,12 +59,23 @@ class VLLMWrapper:
         self.parallel_tool_calls = parallel_tool_calls
 
         # Initialize vLLM
-        self.llm = LLM(model=model_name, **kwargs)
-        self.sampling_params = SamplingParams(
-            temperature=temperature,
-            max_tokens=max_tokens,
+        self.llm = (
+            llm
+            if llm is not None
+            else vllm.LLM(model=model_name, **kwargs)
+        )
+        self.sampling_params = (
+            sampling_params
+            if sampling_params is not None
+            else vllm.SamplingParams(
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
         )
 
+        # Throughput of the most recent batch, see ``_generate``
+        self.last_batch_stats: Dict[str, float] = {}
+
     def _prepare_prompt(self, task: str) -> str:
         """
         Prepare the prompt for the given task.
@@ -95,17 +103,56 @@ class VLLMWrapper:
             str: The model's response.
         """
         try:
-            prompt = self._prepare_prompt(task)
-
-            outputs = self.llm.generate(prompt, self.sampling_params)
-            response = outputs[0].outputs[0].text.strip()
-
-            return response
+            return self._generate([task])[0]
 
         except Exception as error:
             logger.error(f"Error in VLLMWrapper: {error}")
             raise error
 
+    def _generate(self, tasks: List[str]) -> List[str]:
+        """
+        Generate responses for a list of tasks with one engine call.
+
+        vLLM schedules every prompt in the list together (continuous
+        batching), so a single ``generate`` call over many prompts is far
+        faster than one call per prompt. Outputs are returned in input order.
+
+        Args:
+            tasks (List[str]): The tasks to run.
+
+        Returns:
+            List[str]: One response per task, in order.
+        """
+        prompts = [self._prepare_prompt(task) for task in tasks]
+
+        start = time.perf_counter()
+        outputs = self.llm.generate(prompts, self.sampling_params)
+        elapsed = time.perf_counter() - start
+
+        if len(outputs) != len(prompts):
+            raise RuntimeError(
+                f"Engine returned {len(outputs)} outputs for {len(prompts)} prompts"
+            )
+
+        responses = []
+        generated_tokens = 0
+        for output in outputs:
+            completion = output.outputs[0]
+            responses.append(completion.text.strip())
+            generated_tokens += len(
+                getattr(completion, "token_ids", None) or ()
+            )
+
+        self.last_batch_stats = {
+            "prompts": len(prompts),
+            "generated_tokens": generated_tokens,
+            "elapsed_seconds": elapsed,
+            "tokens_per_second": (
+                generated_tokens / elapsed if elapsed > 0 else 0.0
+            ),
+        }
+        return responses
+
     def __call__(self, task: str, *args, **kwargs) -> str:
         """
         Call the model for the given task.
@@ -120,28 +167,58 @@ class VLLMWrapper:
         """
         return self.run(task, *args, **kwargs)
 
+    def stream_batched_run(
+        self, tasks: List[str], batch_size: Optional[int] = 10
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Run tasks in batches, yielding each batch's responses as it completes.
+
+        Each batch is a single ``generate`` call over ``batch_size`` prompts.
+        Throughput for every batch is logged and stored in
+        ``last_batch_stats``.
+
+        Args:
+            tasks (List[str]): List of tasks to run.
+            batch_size (Optional[int]): Prompts per engine call. ``None`` sends
+                all tasks in one call. Defaults to 10.
+
+        Yields:
+            Tuple[int, List[str]]: The index of the batch's first task and the
+            batch's responses, in input order.
+        """
+        tasks = list(tasks)
+        if not batch_size or batch_size <= 0:
+            batch_size = max(len(tasks), 1)
+
+        for start in range(0, len(tasks), batch_size):
+            responses = self._generate(
+                tasks[start : start + batch_size]
+            )
+            stats = self.last_batch_stats
+            logger.info(
+                f"VLLMWrapper batch {start // batch_size + 1}: "
+                f"{stats['prompts']} prompts, "
+                f"{stats['generated_tokens']} tokens in "
+                f"{stats['elapsed_seconds']:.2f}s "
+                f"({stats['tokens_per_second']:.1f} tokens/sec)"
+            )
+            yield start, responses
+
     def batched_run(
-        self, tasks: List[str], batch_size: int = 10
+        self, tasks: List[str], batch_size: Optional[int] = 10
     ) -> List[str]:
         """
         Run the model for multiple tasks in batches.
 
         Args:
             tasks (List[str]): List of tasks to run.
-            batch_size (int): Size of each batch. Defaults to 10.
+            batch_size (Optional[int]): Prompts per engine call. ``None`` sends
+                all tasks in one call. Defaults to 10.
 
         Returns:
-            List[str]: List of model responses.
+            List[str]: List of model responses, in the same order as ``tasks``.
         """
-        # Calculate the worker count based on 95% of available CPU cores
-        num_workers = max(1, int((os.cpu_count() or 1) * 0.95))
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=num_workers
-        ) as executor:
-            futures = [
-                executor.submit(self.run, task) for task in tasks
-            ]
-            return [
-                future.result()
-                for future in concurrent.futures.as_completed(futures)
-            ]
+        responses: List[str] = []
+        for _, batch in self.stream_batched_run(tasks, batch_size):
+            responses.extend(batch)
+        return responses
@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from swarms.agents.i_agent import IterativeReflectiveExpansion
+
+
+class FakeAgent:
+    """Answers IRE prompts deterministically and records concurrency."""
+
+    agent_name = "fake-reasoner"
+
+    def __init__(self, scores, delay=0.05, slow=()):
+        self.scores = scores
+        self.delay = delay
+        self.slow = slow
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def run(self, prompt):
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            slow = any(marker in prompt for marker in self.slow)
+            time.sleep(self.delay * (4 if slow else 1))
+            if prompt.startswith("Given the following problem"):
+                return "\n".join(self.scores)
+            if prompt.startswith("Simulate"):
+                path = prompt.split("Reasoning Path: ")[-1]
+                return f"Outcome: done\nScore: {self.scores[path]}\nErrors: none"
+            if prompt.startswith("Analyze"):
+                return "feedback"
+            if prompt.startswith("Given the reasoning path"):
+                return "revised path"
+            if prompt.startswith("Evaluate"):
+                return prompt.split(":\n", 1)[1]
+            return "final solution"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def make_engine(agent, **kwargs):
+    engine = IterativeReflectiveExpansion(
+        max_iterations=1, output_type="list", **kwargs
+    )
+    engine.agent = agent
+    engine._create_worker_agent = lambda: agent
+    return engine
+
+
+def test_paths_are_simulated_concurrently():
+    agent = FakeAgent({"a": "0.9", "b": "0.8", "c": "0.95"})
+    engine = make_engine(agent)
+
+    paths, winner = engine.explore_paths(
+        ["a", "b", "c"], executor=_executor()
+    )
+
+    assert winner is None
+    assert paths == ["c", "a", "b"]
+    assert agent.peak == 3
+
+
+def test_low_scores_are_reflected_and_revised():
+    agent = FakeAgent({"a": "0.2", "b": "0.9"})
+    engine = make_engine(agent)
+
+    paths, _ = engine.explore_paths(["a", "b"], executor=_executor())
+
+    assert paths == ["b", "revised path"]
+    assert any(p.startswith("Analyze") for p in agent.prompts)
+
+
+def test_branching_factor_is_capped_by_score():
+    agent = FakeAgent(
+        {"a": "0.71", "b": "0.99", "c": "0.8", "d": "0.75"}
+    )
+    engine = make_engine(agent, max_paths=2)
+
+    paths, _ = engine.explore_paths(
+        ["a", "b", "c", "d"], executor=_executor()
+    )
+
+    assert paths == ["b", "c"]
+
+
+def test_early_stop_skips_remaining_iterations():
+    agent = FakeAgent({"a": "0.95", "b": "0.1"})
+    engine = make_engine(agent, early_stop_score=0.9)
+    engine.max_iterations = 3
+
+    engine.run("problem")
+
+    assert not any(p.startswith("Evaluate") for p in agent.prompts)
+    assert agent.prompts[-1].startswith("Based on the following")
+
+
+def test_exploration_uses_worker_agents():
+    agent = FakeAgent({"a": "0.2", "b": "0.9"})
+    engine = make_engine(agent)
+    engine.agent = FakeAgent({})
+    workers = []
+
+    def create_worker():
+        workers.append(agent)
+        return agent
+
+    engine._create_worker_agent = create_worker
+    engine.explore_paths(["a", "b"], executor=_executor())
+
+    # Two simulations plus one reflect-and-revise for the low score
+    assert len(workers) == 3
+    assert engine.agent.prompts == []
+
+
+def test_early_stop_waits_for_running_calls():
+    agent = FakeAgent(
+        {"a": "0.95", "b": "0.1"},
+        slow=("Reasoning Path: a", "Analyze", "Given the reasoning"),
+    )
+    engine = make_engine(agent, early_stop_score=0.9)
+
+    paths, winner = engine.explore_paths(
+        ["a", "b"], executor=_executor()
+    )
+
+    assert winner == "a" and paths == ["a"]
+    # The reflection on "b" was running at the early stop and finished
+    assert agent.active == 0
+    assert any(p.startswith("Analyze") for p in agent.prompts)
@@ -0,0 +1,206 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from swarms.agents import openai_assistant
+from swarms.agents.openai_assistant import (
+    OpenAIAssistant,
+    poll_delays,
+)
+
+
+def make_run(status, tool_calls=None):
+    run = SimpleNamespace(id="run", thread_id="thread", status=status)
+    if tool_calls:
+        run.required_action = SimpleNamespace(
+            submit_tool_outputs=SimpleNamespace(tool_calls=tool_calls)
+        )
+    return run
+
+
+def tool_call(call_id, name, **arguments):
+    return SimpleNamespace(
+        id=call_id,
+        type="function",
+        function=SimpleNamespace(
+            name=name, arguments=json.dumps(arguments)
+        ),
+    )
+
+
+class Runs:
+    """Returns the queued statuses from ``retrieve`` one at a time."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.submitted = []
+        self.cancelled = False
+
+    def retrieve(self, thread_id, run_id):
+        return self.statuses.pop(0)
+
+    def submit_tool_outputs(self, thread_id, run_id, tool_outputs):
+        self.submitted.append(tool_outputs)
+        return make_run("in_progress")
+
+    def cancel(self, thread_id, run_id):
+        self.cancelled = True
+
+
+class AsyncRuns(Runs):
+    async def retrieve(self, thread_id, run_id):
+        return super().retrieve(thread_id, run_id)
+
+    async def submit_tool_outputs(
+        self, thread_id, run_id, tool_outputs
+    ):
+        return super().submit_tool_outputs(
+            thread_id, run_id, tool_outputs
+        )
+
+    async def cancel(self, thread_id, run_id):
+        super().cancel(thread_id, run_id)
+
+
+def make_client(runs):
+    assistants = SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(id="asst")
+    )
+    beta = SimpleNamespace(
+        assistants=assistants,
+        threads=SimpleNamespace(runs=runs),
+    )
+    return SimpleNamespace(beta=beta)
+
+
+def make_assistant(runs, async_runs=None, **kwargs):
+    return OpenAIAssistant(
+        name="tester",
+        client=make_client(runs),
+        async_client=make_client(async_runs or AsyncRuns([])),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(openai_assistant.time, "sleep", delays.append)
+    return delays
+
+
+def test_poll_delays_back_off_to_maximum():
+    delays = poll_delays(0.1, 1.0, 2.0)
+    assert [next(delays) for _ in range(6)] == [
+        0.1,
+        0.2,
+        0.4,
+        0.8,
+        1.0,
+        1.0,
+    ]
+
+
+def test_wait_for_run_polls_adaptively(sleeps):
+    runs = Runs([make_run("queued")] * 3 + [make_run("completed")])
+    assistant = make_assistant(runs, poll_interval=0.05)
+
+    run = assistant._wait_for_run(make_run("queued"))
+
+    assert run.status == "completed"
+    assert sleeps == pytest.approx([0.05, 0.075, 0.1125])
+
+
+def test_wait_for_run_raises_on_failure(sleeps):
+    assistant = make_assistant(Runs([make_run("cancelled")]))
+
+    with pytest.raises(Exception, match="cancelled"):
+        assistant._wait_for_run(make_run("queued"))
+
+
+def test_wait_for_run_cancels_after_timeout(sleeps):
+    runs = Runs([make_run("in_progress")] * 10)
+    assistant = make_assistant(runs, run_timeout=0)
+
+    with pytest.raises(TimeoutError):
+        assistant._wait_for_run(make_run("queued"))
+    assert runs.cancelled
+
+
+def test_tool_calls_are_executed_and_submitted(sleeps):
+    calls = [
+        tool_call("a", "add", x=1, y=2),
+        tool_call("b", "add", x=3, y=4),
+    ]
+    runs = Runs(
+        [make_run("requires_action", calls), make_run("completed")]
+    )
+    assistant = make_assistant(runs)
+    assistant.available_functions["add"] = lambda x, y: x + y
+
+    assistant._wait_for_run(make_run("queued"))
+
+    assert runs.submitted == [
+        [
+            {"tool_call_id": "a", "output": "3"},
+            {"tool_call_id": "b", "output": "7"},
+        ]
+    ]
+
+
+def test_run_timeout_spans_tool_call_rounds(sleeps, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        openai_assistant.time, "monotonic", lambda: now[0]
+    )
+    calls = [tool_call("a", "tick")]
+    runs = Runs(
+        [make_run("requires_action", calls), make_run("in_progress")]
+        * 4
+    )
+    assistant = make_assistant(runs, run_timeout=2.5)
+
+    def tick():
+        # Each tool round takes one second
+        now[0] += 1
+        return "ok"
+
+    assistant.available_functions["tick"] = tick
+
+    with pytest.raises(TimeoutError):
+        assistant._wait_for_run(make_run("queued"))
+    assert runs.cancelled
+    assert len(runs.submitted) == 3
+
+
+def test_async_runs_share_one_event_loop():
+    calls = [
+        tool_call("a", "slow", value=1),
+        tool_call("b", "slow", value=2),
+    ]
+    async_runs = AsyncRuns(
+        [make_run("requires_action", calls), make_run("completed")]
+    )
+    assistant = make_assistant(Runs([]), async_runs, poll_interval=0)
+    running = []
+
+    async def slow(value):
+        running.append(value)
+        await asyncio.sleep(0)
+        # Both calls have started before either finishes
+        assert len(running) == 2
+        return value * 10
+
+    assistant.available_functions["slow"] = slow
+
+    run = asyncio.run(assistant._await_run(make_run("queued")))
+
+    assert run.status == "completed"
+    assert async_runs.submitted == [
+        [
+            {"tool_call_id": "a", "output": "10"},
+            {"tool_call_id": "b", "output": "20"},
+        ]
+    ]
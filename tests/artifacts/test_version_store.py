@@ -0,0 +1,150 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from swarms.artifacts.main_artifact import Artifact
+from swarms.artifacts.version_store import (
+    FileVersion,
+    VersionStore,
+    apply_delta,
+    compute_delta,
+)
+
+
+def make_document(lines=200):
+    return "".join(f"line {i}\n" for i in range(lines))
+
+
+def make_artifact():
+    return Artifact(
+        file_path="doc.txt",
+        file_type=".txt",
+        contents="",
+        edit_count=0,
+    )
+
+
+def edit_history(count=25):
+    text = make_document()
+    history = [text]
+    for i in range(count):
+        text = text.replace(f"line {i * 3}\n", f"edited {i}\n")
+        history.append(text)
+    return history
+
+
+def test_delta_round_trip():
+    old = "a\nb\nc\n"
+    new = "a\nB\nc\nd"
+    assert apply_delta(old, compute_delta(old, new)) == new
+
+
+def test_store_snapshots_periodically_and_diffs_between():
+    store = VersionStore(snapshot_interval=5)
+    for number, content in enumerate(edit_history(), start=1):
+        store.append(
+            FileVersion(version_number=number, content=content)
+        )
+
+    records = store.to_records()
+    snapshots = [i for i, r in enumerate(records) if "full" in r]
+    assert snapshots == [0, 5, 10, 15, 20, 25]
+    assert all("ops" in r for r in records if "full" not in r)
+
+
+def test_versions_materialize_correctly():
+    history = edit_history()
+    store = VersionStore(snapshot_interval=4, cache_size=2)
+    for number, content in enumerate(history, start=1):
+        store.append(
+            FileVersion(version_number=number, content=content)
+        )
+
+    assert len(store) == len(history)
+    assert [v.content for v in store] == history
+    assert store[-1].content == history[-1]
+    assert [v.version_number for v in store[2:5]] == [3, 4, 5]
+    assert store.get(7).content == history[6]
+    assert store.get(999) is None
+
+
+def test_artifact_history_is_compact_and_round_trips(tmp_path):
+    artifact = make_artifact()
+    history = edit_history()
+    artifact.create(history[0])
+    for content in history[1:]:
+        artifact.edit(content)
+
+    path = tmp_path / "artifact.json"
+    artifact.export_to_json(str(path))
+    exported = path.read_text()
+    assert len(exported) < sum(len(c) for c in history) / 2
+
+    restored = Artifact.import_from_json(str(path))
+    assert restored.versions == artifact.versions
+    assert restored.get_version(10).content == history[9]
+    assert restored.contents == history[-1]
+
+
+def test_legacy_version_lists_are_accepted():
+    artifact = Artifact(
+        file_path="doc.txt",
+        file_type=".txt",
+        contents="v2",
+        edit_count=1,
+        versions=[
+            {"version_number": 1, "content": "v1", "timestamp": "t1"},
+            FileVersion(
+                version_number=2, content="v2", timestamp="t2"
+            ),
+        ],
+    )
+
+    assert isinstance(artifact.versions, VersionStore)
+    assert artifact.get_version(1).content == "v1"
+    assert artifact.get_version(2).timestamp == "t2"
+
+
+def test_version_log_streams_appends(tmp_path):
+    log = tmp_path / "versions.jsonl"
+    artifact = make_artifact()
+    artifact.create(make_document())
+    artifact.log_versions(str(log))
+
+    artifact.edit(make_document() + "tail\n")
+    artifact.edit(make_document() + "tail\nmore\n")
+
+    lines = log.read_text().splitlines()
+    assert len(lines) == 3
+    assert "ops" in json.loads(lines[-1])
+
+    target = tmp_path / "notes.md"
+    restored = Artifact.load_versions(str(log), str(target))
+    assert restored.contents == make_document() + "tail\nmore\n"
+    assert len(restored.versions) == 3
+    assert restored.edit_count == 2
+    assert restored.file_path == str(target)
+    assert restored.file_type == ".md"
+
+    with pytest.raises(ValueError):
+        Artifact.load_versions(str(log), str(log))
+
+
+def test_artifact_copies_and_pickles():
+    artifact = make_artifact()
+    artifact.create(make_document())
+    artifact.edit(make_document() + "tail\n")
+
+    for copied in (
+        artifact.model_copy(deep=True),
+        copy.deepcopy(artifact),
+        pickle.loads(pickle.dumps(artifact)),
+    ):
+        copied.edit("changed\n")
+        assert len(copied.versions) == 3
+        assert copied.get_version(2).content == (
+            make_document() + "tail\n"
+        )
+    assert len(artifact.versions) == 2
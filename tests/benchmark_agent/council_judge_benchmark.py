@@ -0,0 +1,114 @@
+"""
+Throughput of CouncilAsAJudge batch evaluation, in pairs per minute.
+
+Compares evaluating pairs one at a time (every dimension in parallel,
+then the report, then the next pair) with ``evaluate_batch``, which
+streams all judge calls through one bounded pool. By default the judges'
+LLMs are replaced by a stub with fixed latency so the benchmark runs
+offline; pass ``--live`` to call the configured models.
+
+    python tests/benchmark_agent/council_judge_benchmark.py --pairs 20
+"""
+
+import argparse
+import random
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from swarms.structs.council_judge import CouncilAsAJudge
+
+
+class SimulatedLLM:
+    """LLM stub whose calls take ``latency`` seconds (with jitter)."""
+
+    def __init__(self, latency: float, jitter: float = 0.3):
+        self.latency = latency
+        self.jitter = jitter
+
+    def run(self, task: str, *args, **kwargs) -> str:
+        time.sleep(
+            self.latency
+            * random.uniform(1 - self.jitter, 1 + self.jitter)
+        )
+        return "simulated evaluation"
+
+
+def make_pairs(count: int):
+    return [
+        (
+            f"Explain concept number {i} in one paragraph.",
+            f"Concept {i} is explained here in some detail. " * 20,
+        )
+        for i in range(count)
+    ]
+
+
+def pairs_per_minute(pairs: int, seconds: float) -> float:
+    return pairs * 60.0 / seconds if seconds else float("inf")
+
+
+def benchmark(
+    pairs: int, latency: float, max_in_flight: int, live: bool
+):
+    council = CouncilAsAJudge(random_model_name=False)
+    if not live:
+        for agent in council.judge_agents.values():
+            agent.llm = SimulatedLLM(latency)
+        council.aggregator_agent.llm = SimulatedLLM(latency)
+
+    batch = make_pairs(pairs)
+
+    start = time.perf_counter()
+    for pair in batch:
+        list(
+            council.evaluate_batch(
+                [pair], max_in_flight=len(council.judge_agents)
+            )
+        )
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = list(
+        council.evaluate_batch(batch, max_in_flight=max_in_flight)
+    )
+    batched = time.perf_counter() - start
+    failed = sum(not result.ok for result in results)
+
+    table = Table(title=f"CouncilAsAJudge throughput ({pairs} pairs)")
+    table.add_column("Mode")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Pairs / minute", justify="right")
+    table.add_row(
+        "one pair at a time",
+        f"{sequential:.2f}",
+        f"{pairs_per_minute(pairs, sequential):.1f}",
+    )
+    table.add_row(
+        f"evaluate_batch (max_in_flight={max_in_flight})",
+        f"{batched:.2f}",
+        f"{pairs_per_minute(pairs, batched):.1f}",
+    )
+    Console().print(table)
+    if failed:
+        Console().print(f"[red]{failed} pair(s) had failures[/red]")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.5,
+        help="Seconds per simulated LLM call",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=24)
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Call the real models instead of the stub",
+    )
+    args = parser.parse_args()
+    benchmark(args.pairs, args.latency, args.max_in_flight, args.live)
@@ -0,0 +1,92 @@
+"""
+Import-time benchmark for the swarms package.
+
+Runs ``python -X importtime`` in a fresh interpreter and checks that
+``import swarms`` stays lazy: heavy dependencies must not be imported and
+the total import time must stay within a budget.
+
+Run directly for a report of the slowest modules:
+
+    python tests/benchmark_agent/test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Generous default so slow CI machines do not flake; tighten locally
+IMPORT_BUDGET_MS = float(os.getenv("SWARMS_IMPORT_BUDGET_MS", "1500"))
+
+HEAVY_MODULES = ["litellm", "networkx", "numpy", "torch", "mcp"]
+
+
+def measure_import(
+    statement: str = "import swarms",
+) -> Dict[str, int]:
+    """
+    Import in a fresh interpreter and return cumulative microseconds per module.
+
+    Args:
+        statement (str): The import statement to time.
+
+    Returns:
+        Dict[str, int]: Module name -> cumulative import time in microseconds.
+    """
+    env = dict(os.environ, LITELLM_LOCAL_MODEL_COST_MAP="True")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    timings: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if (
+            not line.startswith("import time:")
+            or "cumulative" in line
+        ):
+            continue
+        _, cumulative, module = line.split("|")
+        timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def slowest_modules(
+    timings: Dict[str, int], top_n: int = 15
+) -> List[Tuple[str, int]]:
+    """Return the ``top_n`` modules with the largest cumulative import time."""
+    return sorted(timings.items(), key=lambda item: -item[1])[:top_n]
+
+
+def test_import_swarms_is_lazy():
+    timings = measure_import("import swarms")
+
+    loaded_heavy = [
+        module for module in HEAVY_MODULES if module in timings
+    ]
+    assert not loaded_heavy, f"Eagerly imported: {loaded_heavy}"
+
+
+def test_import_swarms_within_budget():
+    timings = measure_import("import swarms")
+    total_ms = timings["swarms"] / 1000
+
+    assert (
+        total_ms < IMPORT_BUDGET_MS
+    ), f"import swarms took {total_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms): {slowest_modules(timings, 5)}"
+
+
+if __name__ == "__main__":
+    for statement in [
+        "import swarms",
+        "from swarms import Conversation",
+        "from swarms import Agent",
+    ]:
+        timings = measure_import(statement)
+        total = max(timings.values()) / 1000
+        print(f"\n{statement}: {total:.0f}ms")
+        for module, cumulative in slowest_modules(timings):
+            print(f"  {cumulative / 1000:8.1f}ms  {module}")
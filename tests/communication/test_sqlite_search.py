@@ -0,0 +1,103 @@
+import sqlite3
+
+from swarms.communication.sqlite_wrap import SQLiteConversation
+
+
+def make_conversation(tmp_path, **kwargs):
+    return SQLiteConversation(
+        db_path=str(tmp_path / "search.db"),
+        enable_logging=False,
+        **kwargs,
+    )
+
+
+def test_fts_search_ranks_and_filters(tmp_path):
+    conversation = make_conversation(tmp_path)
+    assert conversation.fts_enabled
+
+    conversation.add("user", "Hello world")
+    conversation.add("assistant", "Hello there")
+    conversation.add("user", "Goodbye world, world, world")
+    conversation.add("assistant", {"text": "world tour"})
+
+    results = conversation.search_messages("world", ranked=True)
+    assert len(results) == 3
+    assert results[0]["content"] == "Goodbye world, world, world"
+    assert results[0]["score"] >= results[-1]["score"]
+
+    assert [
+        r["content"]
+        for r in conversation.search(
+            "world", role="user", ranked=True
+        )
+    ] == ["Goodbye world, world, world", "Hello world"]
+    assert (
+        len(conversation.search("world", limit=1, ranked=True)) == 1
+    )
+    assert len(conversation.search("hel*", ranked=True)) == 2
+    assert (
+        conversation.search("world", since="2999-01-01", ranked=True)
+        == []
+    )
+    assert conversation.search('world" OR "x', ranked=True) == []
+
+
+def test_substring_search_is_the_default(tmp_path):
+    conversation = make_conversation(tmp_path)
+    conversation.add("user", "keyword one")
+    conversation.add("assistant", "another keyword")
+    conversation.add("user", "nothing here")
+
+    results = conversation.search("key")
+    assert [r["content"] for r in results] == [
+        "keyword one",
+        "another keyword",
+    ]
+    assert "score" not in results[0]
+    assert conversation.search("ey", role="assistant") == [results[1]]
+    assert conversation.search("key", ranked=True) == []
+
+
+def test_fts_stays_in_sync(tmp_path):
+    conversation = make_conversation(tmp_path)
+    first = conversation.add("user", "alpha beta")
+    second = conversation.add("user", "gamma")
+
+    conversation.update(first, "user", "delta")
+    assert conversation.search("alpha", ranked=True) == []
+    assert conversation.search("delta", ranked=True)[0]["id"] == first
+
+    conversation.delete(second)
+    assert conversation.search("gamma", ranked=True) == []
+
+
+def test_fts_indexes_existing_rows(tmp_path):
+    db_path = str(tmp_path / "search.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            role TEXT NOT NULL,
+            content TEXT NOT NULL,
+            timestamp TEXT,
+            message_type TEXT,
+            metadata TEXT,
+            token_count INTEGER,
+            conversation_id TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO conversations (role, content, conversation_id) "
+        "VALUES ('user', 'legacy message', 'old')"
+    )
+    conn.commit()
+    conn.close()
+
+    conversation = make_conversation(tmp_path)
+    conversation.current_conversation_id = "old"
+    assert conversation.search("legacy", ranked=True)[0][
+        "content"
+    ] == ("legacy message")
@@ -0,0 +1,132 @@
+import threading
+
+from swarms.structs import agent_rag_handler
+from swarms.structs.agent_rag_handler import (
+    AgentRAGHandler,
+    RAGConfig,
+    query_cache_key,
+)
+from swarms.structs.local_vector_memory import LocalVectorMemory
+
+
+class CountingMemory:
+    """Memory stub that records how often it is queried."""
+
+    def __init__(self, results=None):
+        self.results = results or []
+        self.queries = []
+        self.added = []
+
+    def add(self, content, metadata=None):
+        self.added.append(content)
+        return True
+
+    def query(self, query, top_k=5, similarity_threshold=0.7):
+        self.queries.append(query)
+        return self.results[:top_k]
+
+
+def make_handler(memory, **config):
+    config.setdefault("min_content_length", 1)
+    return AgentRAGHandler(
+        long_term_memory=memory, config=RAGConfig(**config)
+    )
+
+
+def test_query_cache_key_normalizes_case_and_whitespace():
+    assert query_cache_key("What is  RAG?\n") == query_cache_key(
+        "what is rag?"
+    )
+    assert query_cache_key("a") != query_cache_key("b")
+
+
+def test_retrieve_is_memoized_until_memory_changes():
+    memory = CountingMemory([{"content": "fact"}])
+    handler = make_handler(memory)
+
+    handler.retrieve("Some Query")
+    handler.retrieve("some   query")
+    assert len(memory.queries) == 1
+
+    handler.save_to_memory("a brand new fact")
+    handler.retrieve("some query")
+    assert len(memory.queries) == 2
+
+
+def test_retrieve_sees_documents_added_to_memory_directly():
+    memory = LocalVectorMemory()
+    memory.add("Paris is the capital of France")
+    handler = make_handler(memory, similarity_threshold=0.0)
+
+    assert len(handler.retrieve("capital of Italy")) == 1
+
+    memory.add("Rome is the capital of Italy")
+    results = handler.retrieve("capital of Italy")
+    assert len(results) == 2
+    assert results[0]["content"] == "Rome is the capital of Italy"
+
+
+def test_retrieve_cache_is_bounded():
+    memory = CountingMemory()
+    handler = make_handler(memory, query_cache_size=2)
+
+    for query in ["a", "b", "c", "a"]:
+        handler.retrieve(query)
+
+    # "a" was evicted by "c" and had to be fetched again
+    assert memory.queries == ["a", "b", "c", "a"]
+
+
+def test_prefetch_runs_in_background():
+    memory = CountingMemory([{"content": "fact"}])
+    handler = make_handler(memory)
+    caller = threading.current_thread().name
+
+    seen = []
+    original = memory.query
+
+    def query(*args, **kwargs):
+        seen.append(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    memory.query = query
+    future = handler.prefetch("q")
+
+    assert future.result(timeout=5) == [{"content": "fact"}]
+    assert seen and seen[0] != caller
+    handler.shutdown()
+
+
+def test_build_context_dedupes_and_respects_token_budget(
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        agent_rag_handler,
+        "count_tokens",
+        lambda text: len(text.split()),
+    )
+    results = [
+        {"content": "already in the conversation"},
+        {"content": "fresh fact one"},
+        {"content": "fresh fact two " * 200},
+    ]
+    handler = make_handler(
+        CountingMemory(results), context_window_tokens=50
+    )
+
+    context = handler.build_context(
+        results,
+        existing_context="user: already in the conversation",
+    )
+    assert "fresh fact one" in context
+    assert "already in the conversation" not in context
+    assert "fresh fact two" not in context
+
+    # Injected results are not repeated in later loops
+    assert (
+        handler.build_context(
+            results,
+            existing_context="user: already in the conversation",
+        )
+        == ""
+    )
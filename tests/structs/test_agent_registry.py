@@ -0,0 +1,227 @@
+import copy
+import gc
+import threading
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from swarms.structs.agent_registry import (
+    AgentRegistry,
+    index_agents,
+    lookup_agent,
+)
+from swarms.structs.base_swarm import BaseSwarm
+from swarms.structs.ma_blocks import find_agent_by_name
+from swarms.structs.utils import find_agent_by_id
+
+
+class StubAgent:
+    """Minimal stand-in exposing the attributes the registry indexes."""
+
+    def __init__(
+        self, name, role="worker", tags=None, description=None
+    ):
+        self.agent_name = name
+        self.name = name
+        self.id = uuid.uuid4().hex
+        self.role = role
+        self.tags = tags
+        self.description = description
+
+    def to_dict(self):
+        return {"agent_name": self.agent_name}
+
+
+def make_registry(**kwargs):
+    agents = [
+        StubAgent(
+            "researcher",
+            tags=["search", "web"],
+            description="Finds papers on the web",
+        ),
+        StubAgent(
+            "writer",
+            role="editor",
+            tags=["text"],
+            description="Writes clear reports",
+        ),
+        StubAgent(
+            "reviewer",
+            role="editor",
+            tags=["text", "web"],
+            description="Reviews web reports",
+        ),
+    ]
+    return AgentRegistry(agents=agents, **kwargs), agents
+
+
+def test_find_by_name_and_id():
+    registry, agents = make_registry()
+
+    assert registry.find_agent_by_name("writer") is agents[1]
+    assert registry.find_agent_by_id(agents[2].id) is agents[2]
+    assert registry.find_agent_by_name("missing") is None
+
+
+def test_indexed_queries():
+    registry, agents = make_registry()
+
+    assert set(registry.find_agents_by_tag("web")) == {
+        agents[0],
+        agents[2],
+    }
+    assert registry.query(role="editor", tag="web") == [agents[2]]
+    assert registry.query(
+        role="editor", condition=lambda a: a.name == "writer"
+    ) == [agents[1]]
+
+
+def test_indexes_follow_updates_and_deletes():
+    registry, agents = make_registry()
+    replacement = StubAgent("writer", role="author")
+
+    registry.update_agent("writer", replacement)
+    registry.delete("reviewer")
+
+    assert registry.find_agents_by_role("editor") == []
+    assert registry.find_agents_by_role("author") == [replacement]
+    assert registry.find_agent_by_id(agents[2].id) is None
+    assert registry.find_agents_by_tag("web") == [agents[0]]
+
+
+def test_description_keyword_index():
+    registry, agents = make_registry(index_descriptions=True)
+
+    assert set(registry.search_descriptions("reports")) == {
+        agents[1],
+        agents[2],
+    }
+    assert registry.search_descriptions("web reports") == [agents[2]]
+
+    with pytest.raises(ValueError):
+        make_registry()[0].search_descriptions("web")
+
+
+def test_duplicate_name_rejected():
+    registry, _ = make_registry()
+
+    with pytest.raises(ValueError):
+        registry.add(StubAgent("writer"))
+
+
+def test_list_lookup_tracks_in_place_edits():
+    agents = [StubAgent(f"agent-{i}") for i in range(50)]
+
+    assert lookup_agent(agents, "agent-42") is agents[42]
+
+    agents[42] = StubAgent("renamed")
+    assert lookup_agent(agents, "agent-42") is None
+    assert lookup_agent(agents, "renamed") is agents[42]
+
+
+def test_list_lookup_keeps_no_references():
+    agents = [StubAgent(f"agent-{i}") for i in range(5)]
+    assert lookup_agent(agents, "agent-3") is agents[3]
+    assert lookup_agent(agents, "missing") is None
+
+    ref = weakref.ref(agents[3])
+    del agents
+    gc.collect()
+    assert ref() is None
+
+
+def test_helpers_route_through_index():
+    registry, agents = make_registry()
+
+    assert find_agent_by_name(agents, "reviewer") is agents[2]
+    assert find_agent_by_name(registry, "reviewer") is agents[2]
+    assert find_agent_by_id(agents[0].id, agents) is agents[0]
+
+    with pytest.raises(RuntimeError):
+        find_agent_by_name(agents, "missing")
+
+
+def test_other_names_do_not_wait_on_a_held_stripe():
+    registry = AgentRegistry(num_lock_stripes=8)
+    other = next(
+        f"agent-{i}"
+        for i in range(100)
+        if registry._name_lock(f"agent-{i}")
+        is not registry._name_lock("busy")
+    )
+
+    with registry._name_lock("busy"):
+        worker = threading.Thread(
+            target=registry.add, args=(StubAgent(other),)
+        )
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+    assert registry.find_agent_by_name(other).name == other
+
+
+def test_concurrent_writes_keep_indexes_consistent():
+    registry = AgentRegistry(num_lock_stripes=4)
+    agents = [
+        StubAgent(f"agent-{i}", tags=["shared", f"t{i % 3}"])
+        for i in range(200)
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(registry.add, agents))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(
+            pool.map(
+                registry.delete,
+                [agent.name for agent in agents[::2]],
+            )
+        )
+
+    assert len(registry) == 100
+    assert set(registry.find_agents_by_tag("shared")) == set(
+        agents[1::2]
+    )
+    assert registry.find_agent_by_id(agents[0].id) is None
+    assert registry.find_agent_by_id(agents[1].id) is agents[1]
+
+
+def test_registry_can_be_deep_copied():
+    registry, agents = make_registry()
+
+    clone = copy.deepcopy(registry)
+    clone.add(StubAgent("extra", tags=["web"]))
+
+    assert clone.find_agent_by_name("writer").name == "writer"
+    assert len(clone.find_agents_by_tag("web")) == 3
+    assert registry.find_agent_by_name("extra") is None
+
+
+def test_index_agents_matches_list_semantics():
+    first, second = StubAgent("dup"), StubAgent("dup")
+
+    def plain_tool(task):
+        return task
+
+    registry = index_agents([first, plain_tool, second])
+
+    assert lookup_agent(registry, "dup") is first
+    assert len(registry) == 1
+    assert registry.agent_registry.agents == []
+
+
+def test_swarm_resolves_names_through_its_registry():
+    agents = [StubAgent(f"agent-{i}") for i in range(3)]
+    swarm = BaseSwarm(agents=agents)
+    late = StubAgent("late")
+
+    swarm.add_agent(late)
+    assert swarm.agent_registry.find_agent_by_name("late") is late
+    assert swarm.get_agent_by_name("late") is late
+    assert swarm.self_find_agent_by_id(agents[1].id) is agents[1]
+
+    swarm.remove_agent(late)
+    assert swarm.get_agent_by_name("late") is None
+    assert swarm.agent_exists("agent-0")
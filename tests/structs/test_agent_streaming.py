@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+from swarms.structs.agent import Agent
+from swarms.utils import litellm_wrapper
+from swarms.utils.formatter import formatter
+
+
+def fake_stream(*parts):
+    def completion(**kwargs):
+        assert kwargs["stream"] is True
+        return iter(
+            SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        delta=SimpleNamespace(content=part)
+                    )
+                ]
+            )
+            for part in parts
+        )
+
+    return completion
+
+
+def test_collect_stream_forwards_chunks():
+    seen = []
+    text = litellm_wrapper.LiteLLM.collect_stream(
+        fake_stream("a", None, "b")(stream=True), seen.append
+    )
+
+    assert text == "ab"
+    assert seen == ["a", "b"]
+
+
+def test_streaming_agent_shows_chunks_live(monkeypatch):
+    monkeypatch.setattr(
+        litellm_wrapper,
+        "completion",
+        fake_stream("The ", "answer"),
+    )
+    written, printed = [], []
+
+    class Recorder:
+        def write(self, chunk):
+            written.append(chunk)
+
+    class StreamPanel:
+        def __enter__(self):
+            return Recorder()
+
+        def __exit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(
+        formatter, "stream_panel", lambda **kwargs: StreamPanel()
+    )
+    monkeypatch.setattr(
+        formatter,
+        "print_panel",
+        lambda *args, **kwargs: printed.append(args),
+    )
+
+    agent = Agent(
+        agent_name="streamer",
+        model_name="gpt-4o-mini",
+        max_loops=1,
+        streaming_on=True,
+    )
+    agent.run("question")
+
+    assert written[1:] == ["The ", "answer"]
+    assert "The answer" in agent.short_memory.get_str()
+    # The streamed response is not printed a second time
+    assert not any("The answer" in str(args) for args in printed)
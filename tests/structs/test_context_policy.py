@@ -0,0 +1,165 @@
+import pytest
+
+from swarms.structs import conversation as conversation_module
+from swarms.structs.context_policy import (
+    FullHistory,
+    LastKTurns,
+    RoleBudget,
+    RollingSummary,
+    TokenWindow,
+    resolve_policy,
+)
+from swarms.structs.conversation import Conversation
+
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    calls = []
+
+    def count(text):
+        calls.append(text)
+        return len(text.split())
+
+    monkeypatch.setattr(conversation_module, "count_tokens", count)
+    return calls
+
+
+def make_conversation(turns=6):
+    conversation = Conversation(token_count=False)
+    conversation.add("System", "be brief")
+    for i in range(turns):
+        role = "User" if i % 2 == 0 else "Agent"
+        conversation.add(role, f"message {i} " + "word " * 3)
+    return conversation
+
+
+def contents(conversation, policy):
+    return [
+        m["content"].split()[1]
+        for m in policy.select(
+            conversation, conversation.get_messages()
+        )
+        if m["role"] not in ("System", "Summary")
+    ]
+
+
+def test_full_history_matches_get_str():
+    conversation = make_conversation()
+    assert conversation.get_context() == conversation.get_str()
+    assert (
+        conversation.get_context(FullHistory())
+        == conversation.get_str()
+    )
+
+
+def test_last_k_turns_keeps_system_prompt():
+    conversation = make_conversation()
+    context = conversation.get_context(LastKTurns(k=2))
+
+    assert context.startswith("System: be brief")
+    assert contents(conversation, LastKTurns(k=2)) == ["4", "5"]
+
+
+def test_token_window_uses_cached_counts(word_tokens):
+    conversation = make_conversation()
+    # System is 2 tokens, every other message is 5
+    policy = TokenWindow(max_tokens=13)
+
+    assert contents(conversation, policy) == ["4", "5"]
+    counted = len(word_tokens)
+    contents(conversation, policy)
+    assert len(word_tokens) == counted
+
+
+def test_token_cache_is_bounded_and_holds_no_text(
+    monkeypatch, word_tokens
+):
+    monkeypatch.setattr(conversation_module, "TOKEN_CACHE_SIZE", 4)
+    conversation = Conversation(token_count=False)
+    for i in range(10):
+        conversation.add("User", f"message {i}")
+    for message in conversation.get_messages():
+        conversation.count_message_tokens(message)
+
+    cache = conversation._token_cache
+    assert len(cache) == 4
+    assert all(isinstance(key, bytes) for key in cache)
+
+    counted = len(word_tokens)
+    conversation.count_message_tokens({"content": "message 9"})
+    assert len(word_tokens) == counted
+    conversation.count_message_tokens({"content": "message 0"})
+    assert len(word_tokens) == counted + 1
+
+
+def test_role_budget_limits_each_role_separately():
+    conversation = make_conversation()
+    conversation.add("Agent", "very long " * 50)
+    policy = RoleBudget({"Agent": 10, "User": 5})
+
+    kept = contents(conversation, policy)
+    # The long reply exhausts Agent's budget; User keeps its latest turn
+    assert kept == ["4"]
+
+
+def test_rolling_summary_is_incremental():
+    prompts = []
+
+    def summarizer(text):
+        prompts.append(text)
+        return f"summary {len(prompts)}"
+
+    conversation = make_conversation()
+    policy = RollingSummary(summarizer, max_tokens=13)
+
+    context = conversation.get_context(policy)
+    assert "Summary: summary 1" in context
+    assert "message 0" in prompts[0] and "message 3" in prompts[0]
+
+    # Unchanged window: the cached summary is reused
+    conversation.get_context(policy)
+    assert len(prompts) == 1
+
+    conversation.add("User", "message 6 word word word")
+    conversation.get_context(policy)
+    assert len(prompts) == 2
+    assert "summary 1" in prompts[1]
+    assert "message 4" in prompts[1] and "message 3" not in prompts[1]
+
+
+def test_resolve_policy_per_agent():
+    shared = LastKTurns(k=1)
+    custom = TokenWindow(max_tokens=10)
+    mapping = {"writer": custom, "*": shared}
+
+    assert resolve_policy(None, "writer") is None
+    assert resolve_policy(shared, "writer") is shared
+    assert resolve_policy(mapping, "writer") is custom
+    assert resolve_policy(mapping, "critic") is shared
+    assert resolve_policy({"writer": custom}, "critic") is None
+
+
+def test_agent_rearrange_applies_policy_per_agent():
+    from swarms.structs.rearrange import AgentRearrange
+
+    class RecordingAgent:
+        def __init__(self, agent_name):
+            self.agent_name = agent_name
+            self.tasks = []
+
+        def run(self, task, *args, **kwargs):
+            self.tasks.append(task)
+            return f"{self.agent_name} done"
+
+    first, second = RecordingAgent("first"), RecordingAgent("second")
+    swarm = AgentRearrange(
+        agents=[first, second],
+        flow="first -> second",
+        context_policy={"second": LastKTurns(k=1)},
+    )
+
+    swarm.run("the task")
+
+    assert "the task" in first.tasks[0]
+    assert second.tasks[0].startswith("first:")
+    assert "the task" not in second.tasks[0]
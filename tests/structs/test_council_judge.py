@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from swarms.structs.council_judge import (
+    EVAL_DIMENSIONS,
+    CouncilAsAJudge,
+    build_judge_prompt,
+    build_pair_prefix,
+)
+
+
+class FakeLLM:
+    """Stands in for a judge's LiteLLM; records concurrency."""
+
+    def __init__(self, name, tracker, delay=0.01, fail=None):
+        self.name = name
+        self.tracker = tracker
+        self.delay = delay
+        self.fail = fail
+
+    def run(self, task, *args, **kwargs):
+        with self.tracker["lock"]:
+            self.tracker["active"] += 1
+            self.tracker["peak"] = max(
+                self.tracker["peak"], self.tracker["active"]
+            )
+            self.tracker["calls"].append((self.name, task))
+        try:
+            time.sleep(self.delay)
+            if self.fail and self.fail in task:
+                raise RuntimeError("judge failed")
+            return f"{self.name} verdict"
+        finally:
+            with self.tracker["lock"]:
+                self.tracker["active"] -= 1
+
+
+@pytest.fixture(scope="module")
+def council():
+    return CouncilAsAJudge(random_model_name=False)
+
+
+def install_fakes(council, fail=None):
+    tracker = {
+        "lock": threading.Lock(),
+        "active": 0,
+        "peak": 0,
+        "calls": [],
+    }
+    for dim, agent in council.judge_agents.items():
+        agent.llm = FakeLLM(dim, tracker, fail=fail)
+    council.aggregator_agent.llm = FakeLLM("report", tracker)
+    return tracker
+
+
+def test_judge_prompt_shares_pair_prefix():
+    prefix = build_pair_prefix("What is 2 + 2?", "4")
+    prompts = [
+        build_judge_prompt(dim, "What is 2 + 2?", "4")
+        for dim in EVAL_DIMENSIONS
+    ]
+    assert all(prompt.startswith(prefix) for prompt in prompts)
+    assert len(set(prompts)) == len(EVAL_DIMENSIONS)
+    with pytest.raises(KeyError):
+        build_judge_prompt("style", "q", "a")
+
+
+def test_evaluate_batch_scores_every_pair(council):
+    tracker = install_fakes(council)
+    pairs = [(f"task {i}", f"response {i}") for i in range(5)]
+
+    results = list(council.evaluate_batch(pairs, max_in_flight=4))
+
+    assert sorted(r.index for r in results) == list(range(5))
+    for result in results:
+        assert result.ok
+        assert set(result.rationales) == set(EVAL_DIMENSIONS)
+        assert result.report == "report verdict"
+    assert tracker["peak"] <= 4
+    assert len(tracker["calls"]) == 5 * (len(EVAL_DIMENSIONS) + 1)
+
+    # Dimension calls are issued pair by pair
+    judged = [
+        task for name, task in tracker["calls"] if name != "report"
+    ]
+    first_pair = judged[: len(EVAL_DIMENSIONS)]
+    assert all("task 0" in task for task in first_pair)
+
+
+def test_evaluate_batch_aggregates_pairs_early(council):
+    tracker = install_fakes(council)
+    pairs = [(f"task {i}", f"response {i}") for i in range(6)]
+
+    stream = council.evaluate_batch(
+        pairs, max_in_flight=len(EVAL_DIMENSIONS)
+    )
+    first = next(stream)
+    judged_before_first = [
+        name for name, _ in tracker["calls"] if name != "report"
+    ]
+    assert first.index == 0
+    assert len(judged_before_first) < 6 * len(EVAL_DIMENSIONS)
+    assert len(list(stream)) == 5
+
+
+def test_evaluate_batch_records_failures(council):
+    install_fakes(council, fail="task 1")
+    results = {
+        r.index: r
+        for r in council.evaluate_batch(
+            [("task 0", "a"), ("task 1", "b")],
+            aggregate=False,
+            dimensions=["accuracy", "coherence"],
+        )
+    }
+    assert results[0].ok and results[0].report is None
+    assert set(results[1].errors) == {"accuracy", "coherence"}
+    assert results[1].rationales == {}
+
+    with pytest.raises(KeyError):
+        list(
+            council.evaluate_batch([("t", "r")], dimensions=["style"])
+        )
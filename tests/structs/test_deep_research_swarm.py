@@ -0,0 +1,38 @@
+from swarms.structs.deep_research_swarm import DeepResearchSwarm
+from swarms.utils.search_client import SearchClient
+
+
+class StubAgent:
+    agent_name = "Summarization-Agent"
+
+    def __init__(self, output):
+        self.output = output
+        self.tasks = []
+
+    def run(self, task):
+        self.tasks.append(task)
+        return self.output
+
+
+def test_step_searches_each_query_once_across_tasks(monkeypatch):
+    calls = []
+
+    def backend(query, params, timeout):
+        calls.append(query)
+        return {"results": [{"title": f"About {query}"}]}
+
+    swarm = DeepResearchSwarm(
+        output_type="list",
+        claude_summarization_model_name="gpt-4o-mini",
+        search_client=SearchClient(backend=backend),
+    )
+    swarm.summarization_agent = StubAgent("report")
+    monkeypatch.setattr(
+        swarm, "get_queries", lambda query: ["tariffs", "Tariffs "]
+    )
+
+    swarm.batched_run(["first task", "second task"])
+
+    assert calls == ["tariffs"]
+    assert "About tariffs" in swarm.conversation.get_str()
+    assert len(swarm.summarization_agent.tasks) == 2
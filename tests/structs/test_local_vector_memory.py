@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from swarms.structs.agent_rag_handler import (
+    AgentRAGHandler,
+    RAGConfig,
+)
+from swarms.structs.local_vector_memory import (
+    HashingEmbedder,
+    LocalVectorMemory,
+)
+
+FACTS = [
+    "Paris is the capital of France",
+    "Rome is the capital of Italy",
+    "The mitochondria is the powerhouse of the cell",
+    "Photosynthesis converts sunlight into chemical energy",
+]
+
+
+def test_hashing_embedder_is_normalized_and_stable():
+    embedder = HashingEmbedder(dimension=64)
+    first = embedder(["hello world", ""])
+    second = embedder(["hello world"])
+
+    assert first.shape == (2, 64)
+    assert first.dtype == np.float32
+    assert np.isclose(np.linalg.norm(first[0]), 1.0)
+    assert np.allclose(first[0], second[0])
+    assert not first[1].any()
+
+
+def test_query_returns_best_match_first():
+    memory = LocalVectorMemory()
+    memory.add_many(
+        FACTS, [{"topic": "geo"}] * 2 + [{"topic": "bio"}] * 2
+    )
+
+    results = memory.query("What is the capital of France?", top_k=2)
+
+    assert len(memory) == 4
+    assert [r["content"] for r in results][0] == FACTS[0]
+    assert results[0]["score"] >= results[1]["score"]
+    assert set(results[0]) == {"id", "content", "score", "metadata"}
+
+
+def test_query_threshold_and_metadata_filter():
+    memory = LocalVectorMemory()
+    memory.add_many(
+        FACTS, [{"topic": "geo"}] * 2 + [{"topic": "bio"}] * 2
+    )
+
+    bio = memory.query("capital", top_k=4, filter={"topic": "bio"})
+    assert all(r["metadata"]["topic"] == "bio" for r in bio)
+
+    predicate = memory.query(
+        "capital",
+        top_k=4,
+        filter=lambda metadata: metadata["topic"] == "geo",
+    )
+    assert {r["content"] for r in predicate} <= set(FACTS[:2])
+
+    assert memory.query("capital", similarity_threshold=1.01) == []
+
+
+def test_add_grows_matrix_in_place():
+    memory = LocalVectorMemory()
+    for i in range(100):
+        assert memory.add(f"entry number {i}", {"i": i})
+
+    assert len(memory) == 100
+    assert memory.embeddings.shape == (100, 512)
+    assert memory.embeddings.flags.c_contiguous
+
+
+def test_version_changes_on_every_write():
+    memory = LocalVectorMemory()
+    versions = [memory.version]
+    memory.add("one")
+    versions.append(memory.version)
+    memory.add_many(["two", "three"])
+    versions.append(memory.version)
+    memory.clear()
+    versions.append(memory.version)
+    assert len(set(versions)) == 4
+
+
+def test_dimension_mismatch_raises():
+    memory = LocalVectorMemory(
+        embedding_function=lambda texts: np.ones((len(texts), 4))
+    )
+    memory.add("a")
+    memory.embedding_function = lambda texts: np.ones((len(texts), 8))
+
+    with pytest.raises(ValueError):
+        memory.add("b")
+
+
+def test_ivf_index_matches_exact_search():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(400, 16)).astype(np.float32)
+    lookup = {str(i): vectors[i] for i in range(len(vectors))}
+
+    def embed(texts):
+        return np.stack([lookup[text] for text in texts])
+
+    flat = LocalVectorMemory(embedding_function=embed)
+    ivf = LocalVectorMemory(
+        embedding_function=embed,
+        index_type="ivf",
+        ivf_min_size=100,
+        n_lists=8,
+        n_probe=8,
+    )
+    texts = list(lookup)
+    flat.add_many(texts)
+    ivf.add_many(texts)
+
+    # Probing every list is exhaustive, so results must agree exactly
+    assert [r["content"] for r in ivf.query("7", top_k=5)] == [
+        r["content"] for r in flat.query("7", top_k=5)
+    ]
+    assert ivf.query("7", top_k=1)[0]["content"] == "7"
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "agent_memory.json")
+    memory = LocalVectorMemory(persist_path=path)
+    memory.add_many(FACTS, [{"n": i} for i in range(len(FACTS))])
+    memory.save()
+
+    restored = LocalVectorMemory(persist_path=path, mmap=True)
+    assert len(restored) == len(FACTS)
+    assert restored.query("powerhouse of the cell", top_k=1)[0][
+        "metadata"
+    ] == {"n": 2}
+
+    # Memory-mapped stores copy on the first insert
+    restored.add("Berlin is the capital of Germany")
+    assert len(restored) == len(FACTS) + 1
+
+
+def test_rag_config_selects_local_backend():
+    handler = AgentRAGHandler(
+        config=RAGConfig(
+            memory_backend="local",
+            similarity_threshold=0.1,
+            min_content_length=5,
+        )
+    )
+
+    assert isinstance(handler.long_term_memory, LocalVectorMemory)
+    assert handler.save_to_memory(FACTS[0])
+    assert FACTS[0] in handler.query_memory("capital of France")
@@ -0,0 +1,169 @@
+import threading
+
+import pytest
+
+from swarms.structs.map_reduce import (
+    CheckpointStore,
+    map_stage,
+    tree_map_reduce,
+)
+
+
+def join_reduce(calls):
+    def reduce_fn(parts):
+        calls.append(len(parts))
+        return "(" + ",".join(parts) + ")"
+
+    return reduce_fn
+
+
+def test_map_stage_keeps_order_and_bounds_concurrency():
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def map_fn(item):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        with lock:
+            active["now"] -= 1
+        return item.upper()
+
+    items = [f"c{i}" for i in range(20)]
+    assert map_stage(iter(items), map_fn, max_concurrency=3) == [
+        item.upper() for item in items
+    ]
+    assert active["peak"] <= 3
+
+
+def test_tree_reduce_respects_fan_in():
+    calls = []
+    result = tree_map_reduce(
+        [str(i) for i in range(20)],
+        map_fn=lambda item: item,
+        reduce_fn=join_reduce(calls),
+        fan_in=4,
+    )
+    # 20 -> 5 -> 2 -> final
+    assert calls == [4] * 5 + [4, 1] + [2]
+    assert max(calls) <= 4
+    assert result.replace("(", "").replace(")", "").split(",") == [
+        str(i) for i in range(20)
+    ]
+
+
+def test_tree_reduce_small_inputs():
+    assert tree_map_reduce([], str.upper, "".join) == ""
+    assert (
+        tree_map_reduce(
+            ["a", "b"],
+            map_fn=str.upper,
+            reduce_fn=lambda parts: "reduce",
+            final_fn=lambda parts: "+".join(parts),
+        )
+        == "A+B"
+    )
+    with pytest.raises(ValueError):
+        tree_map_reduce(["a"], str.upper, "".join, fan_in=1)
+
+
+def test_checkpoints_resume_after_failure(tmp_path):
+    mapped = []
+
+    def map_fn(item):
+        mapped.append(item)
+        return item.upper()
+
+    def failing_final(parts):
+        raise RuntimeError("aggregator unavailable")
+
+    items = [f"chunk {i}" for i in range(6)]
+    with pytest.raises(RuntimeError):
+        tree_map_reduce(
+            items,
+            map_fn,
+            "".join,
+            final_fn=failing_final,
+            fan_in=2,
+            checkpoint_dir=str(tmp_path),
+        )
+    assert len(mapped) == 6
+
+    mapped.clear()
+    result = tree_map_reduce(
+        items,
+        map_fn,
+        "".join,
+        fan_in=2,
+        checkpoint_dir=str(tmp_path),
+    )
+    assert mapped == []
+    assert result == "".join(item.upper() for item in items)
+
+
+def test_checkpoint_keys_depend_on_namespace_and_inputs(tmp_path):
+    store = CheckpointStore(str(tmp_path), namespace="a")
+    other = CheckpointStore(str(tmp_path), namespace="b")
+    key = store.key("map", ["x"])
+    assert key != other.key("map", ["x"])
+    assert key != store.key("map", ["y"])
+
+    store.put(key, "X")
+    assert store.get(key) == "X"
+    assert other.get(other.key("map", ["x"])) is None
+
+
+def test_long_agent_map_reduce_mode(tmp_path, monkeypatch):
+    from swarms.structs.long_agent import LongAgent
+
+    document = tmp_path / "doc.txt"
+    document.write_text(
+        ". ".join(
+            f"Sentence number {i} of the report" for i in range(200)
+        )
+    )
+
+    agent = LongAgent(
+        token_count_per_agent=50,
+        mode="map_reduce",
+        fan_in=3,
+        output_type="final",
+    )
+    merges = []
+    monkeypatch.setattr(
+        agent, "summarize_chunk", lambda chunk: "summary"
+    )
+    monkeypatch.setattr(
+        agent,
+        "merge_summaries",
+        lambda parts: merges.append(len(parts)) or "merged",
+    )
+    monkeypatch.setattr(
+        agent,
+        "write_report",
+        lambda parts: f"report of {len(parts)}",
+    )
+
+    result = agent.run([str(document)])
+    assert merges and max(merges) <= 3
+    assert "report of" in str(result)
+
+
+def test_long_agent_checkpoints_depend_on_prompts_and_params(
+    monkeypatch,
+):
+    from swarms.structs import long_agent
+    from swarms.structs.long_agent import LongAgent
+
+    agent = LongAgent(token_count_per_agent=50, mode="map_reduce")
+    namespace = agent._checkpoint_namespace()
+    assert namespace == agent._checkpoint_namespace()
+
+    agent.token_count_per_agent = 100
+    assert agent._checkpoint_namespace() != namespace
+    agent.token_count_per_agent = 50
+
+    monkeypatch.setattr(
+        long_agent, "REDUCE_TASK", "Merge these:\n{summaries}"
+    )
+    assert agent._checkpoint_namespace() != namespace
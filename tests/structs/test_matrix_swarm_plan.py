@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from swarms import Agent
+from swarms.structs.matrix_swarm import (
+    AgentOutput,
+    MatrixSwarm,
+    evaluate_plans,
+)
+
+
+def create_matrix(rows, cols, calls=None, fail=()):
+    """Matrix of agents whose run() is recorded instead of calling a model."""
+    calls = calls if calls is not None else []
+    lock = threading.Lock()
+
+    def make(i, j):
+        agent = Agent(
+            agent_name=f"Agent-{i}-{j}",
+            model_name="gpt-4o-mini",
+            max_loops=1,
+        )
+
+        def run(task, *args, **kwargs):
+            with lock:
+                calls.append((agent.agent_name, task))
+            if agent.agent_name in fail:
+                raise RuntimeError("boom")
+            return f"{agent.agent_name}:{task}"
+
+        agent.run = run
+        return agent
+
+    return MatrixSwarm(
+        [[make(i, j) for j in range(cols)] for i in range(rows)]
+    )
+
+
+def test_views_share_agents():
+    matrix = create_matrix(2, 3)
+    transposed = matrix.transpose()
+    assert transposed.shape == (3, 2)
+    assert transposed._grid is matrix._grid
+    assert transposed.agent_at(2, 1) is matrix.agent_at(1, 2)
+    assert transposed.transpose().agents is matrix.agents
+
+    scaled = transposed.scalar_multiply(2)
+    assert scaled.shape == (3, 4)
+    assert [a.agent_name for a in scaled.agents[0]] == [
+        "Agent-0-0",
+        "Agent-1-0",
+        "Agent-0-0",
+        "Agent-1-0",
+    ]
+
+    sub = transposed.view(rows=[0, 2], cols=[1])
+    assert sub.shape == (2, 1)
+    assert sub.agent_at(1, 0) is matrix.agent_at(1, 2)
+    assert matrix.add(matrix).shape == (2, 3)
+    with pytest.raises(ValueError):
+        matrix.add(transposed)
+
+
+def test_multiply_dedupes_calls():
+    calls = []
+    left = create_matrix(3, 3, calls)
+    plan = left.plan_multiply(left.transpose(), ["a", "b", "c"])
+    assert calls == []
+    assert len(list(plan.calls())) == 27
+    assert len(plan.unique_calls()) == 9
+
+    result = plan.evaluate(max_workers=4)
+    assert len(calls) == 9
+    assert len(result) == 3 and len(result[0]) == 3
+    assert isinstance(result[1][2], AgentOutput)
+    assert result[1][2].output_result == (
+        "Agent-1-0:b Agent-1-1:b Agent-1-2:b"
+    )
+    assert result[1][2].metadata == {"row": 1, "col": 2}
+
+
+def test_multiply_reports_errors_per_cell():
+    matrix = create_matrix(2, 2, fail={"Agent-0-1"})
+    result = matrix.multiply(matrix, ["x", "y"])
+    assert result[0][0].output_result == "Agent-0-0:x Error: boom"
+    assert result[1][0].output_result == "Agent-1-0:y Agent-1-1:y"
+    with pytest.raises(ValueError):
+        matrix.multiply(create_matrix(3, 1), ["x", "y"])
+
+
+def test_determinant_calls_each_agent_once():
+    calls = []
+    matrix = create_matrix(3, 3, calls)
+    values = {
+        f"Agent-{i}-{j}": v
+        for (i, j), v in zip(
+            [(i, j) for i in range(3) for j in range(3)],
+            [2, 0, 1, 1, 3, 2, 1, 1, 2],
+        )
+    }
+    for row in matrix.agents:
+        for agent in row:
+            agent.run = (
+                lambda task, name=agent.agent_name: calls.append(name)
+                or values[name]
+            )
+
+    assert matrix.determinant() == 6
+    assert sorted(calls) == sorted(values)
+    with pytest.raises(ValueError):
+        create_matrix(2, 3).determinant()
+
+
+def test_evaluate_plans_shares_calls():
+    calls = []
+    matrix = create_matrix(2, 2, calls)
+    first, second = evaluate_plans(
+        [
+            matrix.plan_multiply(matrix, ["q", "q"]),
+            matrix.transpose().plan_multiply(matrix, ["q", "q"]),
+        ]
+    )
+    assert len(calls) == 4
+    assert first[0][0].output_result == "Agent-0-0:q Agent-0-1:q"
+    assert second[0][0].output_result == "Agent-0-0:q Agent-1-0:q"
@@ -0,0 +1,210 @@
+import copy
+import json
+import os
+import pickle
+import random
+
+import pytest
+
+from swarms.structs.conversation import Conversation
+from swarms.structs.paged_history import PagedHistory
+from swarms.utils.message_index import SQLiteMessageIndex
+
+
+def message(i):
+    return {"role": "user", "content": f"message {i}"}
+
+
+def test_paged_history_matches_list(tmp_path):
+    rng = random.Random(0)
+    history = PagedHistory(
+        max_messages=8, directory=str(tmp_path), page_size=3
+    )
+    reference = []
+
+    for step in range(500):
+        op = rng.random()
+        if op < 0.55 or not reference:
+            history.append(message(step))
+            reference.append(message(step))
+        elif op < 0.65:
+            i = rng.randrange(len(reference))
+            del history[i]
+            del reference[i]
+        elif op < 0.75:
+            i = rng.randint(0, len(reference))
+            history.insert(i, message(step))
+            reference.insert(i, message(step))
+        elif op < 0.85:
+            i = rng.randrange(len(reference))
+            history[i] = message(-step)
+            reference[i] = message(-step)
+        else:
+            i = rng.randrange(-len(reference), len(reference))
+            assert history[i] == reference[i]
+        assert len(history) == len(reference)
+        assert history.memory_messages <= 8
+
+    assert list(history) == reference
+    assert history[2:20:3] == reference[2:20:3]
+    assert history.spilled_messages > 0
+
+
+def test_byte_ceiling_and_cleanup(tmp_path):
+    history = PagedHistory(max_bytes=2000, directory=str(tmp_path))
+    for i in range(200):
+        history.append({"role": "user", "content": "x" * 100})
+    assert history.memory_bytes <= 2000
+    assert len(history) == 200
+
+    path = history.path
+    assert os.path.exists(path)
+    history.close()
+    assert not os.path.exists(path)
+
+    with pytest.raises(ValueError):
+        PagedHistory()
+
+
+def test_paged_conversation(tmp_path):
+    conversation = Conversation(
+        max_memory_messages=10,
+        spill_dir=str(tmp_path / "spill"),
+        page_size=4,
+        token_count=False,
+        conversations_dir=str(tmp_path),
+    )
+    assert conversation.is_paged
+    for i in range(100):
+        conversation.add(
+            "user" if i % 2 else "assistant", f"turn {i}"
+        )
+
+    history = conversation.conversation_history
+    assert len(history) == 100
+    assert history.memory_messages <= 10
+    assert conversation.search("turn 3")[0]["content"] == "turn 3"
+    assert conversation.get_final_message_content() == "turn 99"
+    assert (
+        json.loads(conversation.to_json())[0]["content"] == "turn 0"
+    )
+
+    conversation.update(1, "system", "edited")
+    assert conversation.query(1) == {
+        "role": "system",
+        "content": "edited",
+    }
+    conversation.delete(0)
+    assert conversation.query(0)["content"] == "edited"
+
+    conversation.save_enabled = True
+    path = str(tmp_path / "saved.json")
+    conversation.save_as_json(path)
+    with open(path) as f:
+        saved = json.load(f)
+    assert saved["history"] == conversation.to_dict()
+    assert len(saved["history"]) == 99
+
+    conversation.clear()
+    assert len(conversation.conversation_history) == 0
+    assert conversation.is_paged
+
+
+def test_paged_history_copies_and_pickles(tmp_path):
+    history = PagedHistory(
+        max_messages=5, directory=str(tmp_path), page_size=2
+    )
+    for i in range(30):
+        history.append(message(i))
+
+    clone = copy.deepcopy(history)
+    restored = pickle.loads(pickle.dumps(history))
+
+    for other in (clone, restored):
+        assert other.path != history.path
+        assert list(other) == list(history)
+        assert other.memory_messages <= 5
+        assert other.spilled_messages == history.spilled_messages
+
+    clone[0] = message(-1)
+    clone.append(message(30))
+    assert history[0] == message(0)
+    assert len(history) == 30
+
+
+def test_paged_conversation_deep_copies(tmp_path):
+    conversation = Conversation(
+        max_memory_messages=10,
+        spill_dir=str(tmp_path),
+        token_count=False,
+    )
+    for i in range(50):
+        conversation.add("user", f"turn {i}")
+
+    clone = copy.deepcopy(conversation)
+    restored = pickle.loads(pickle.dumps(conversation))
+    clone.add("user", "only in the clone")
+
+    assert clone.is_paged and restored.is_paged
+    assert len(conversation.conversation_history) == 50
+    assert len(clone.conversation_history) == 51
+    assert restored.search("turn 7")[0]["content"] == "turn 7"
+
+
+def test_agent_and_group_chat_pass_paging_options(tmp_path):
+    from swarms.structs.agent import Agent
+    from swarms.structs.interactive_groupchat import (
+        InteractiveGroupChat,
+    )
+
+    agent = Agent(
+        agent_name="pager",
+        model_name="gpt-4o-mini",
+        max_loops=1,
+        max_memory_messages=20,
+        spill_dir=str(tmp_path),
+    )
+    assert agent.short_memory.is_paged
+
+    chat = InteractiveGroupChat(
+        agents=[agent], max_memory_bytes=4096, spill_dir=str(tmp_path)
+    )
+    assert chat.conversation.is_paged
+
+
+def test_paged_search_stays_within_the_ceiling(tmp_path, monkeypatch):
+    conversation = Conversation(
+        max_memory_messages=100,
+        spill_dir=str(tmp_path),
+        page_size=10,
+        token_count=False,
+    )
+    for i in range(300):
+        conversation.add(
+            "assistant" if i % 3 else "user", f"turn {i} of 300"
+        )
+
+    history = conversation.conversation_history
+    loads = []
+    original_page = history._page
+    monkeypatch.setattr(
+        history,
+        "_page",
+        lambda page: loads.append(page) or original_page(page),
+    )
+
+    assert isinstance(conversation._index, SQLiteMessageIndex)
+    # Only matching messages are read back; here they are all in memory
+    assert conversation.search("turn 299 ")[0]["role"] == "assistant"
+    assert conversation.search("turn 29 ", role="user") == []
+    assert loads == []
+
+    assert [
+        m["content"] for m in conversation.search("turn 42 ")
+    ] == ["turn 42 of 300"]
+    hits = conversation.search("turn 7*", ranked=True, limit=3)
+    assert len(hits) == 3
+    assert len(conversation.get_messages_by_role("user")) == 100
+    assert history.memory_messages <= 100
+    assert len(history._pages) <= history.cached_pages
+    assert len(conversation._index) == 300
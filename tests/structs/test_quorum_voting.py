@@ -0,0 +1,137 @@
+import threading
+import time
+
+import pytest
+
+from swarms.structs.majority_voting import MajorityVoting
+from swarms.structs.quorum_voting import (
+    normalize_answer,
+    quorum_vote,
+    resolve_quorum,
+)
+
+
+class VotingAgent:
+    """Agent stub that answers after an optional delay."""
+
+    def __init__(self, agent_name, answer, delay=0.0):
+        self.agent_name = agent_name
+        self.answer = answer
+        self.delay = delay
+        self.calls = []
+
+    def run(self, task, *args, **kwargs):
+        self.calls.append(task)
+        time.sleep(self.delay)
+        return self.answer
+
+
+def test_normalize_answer():
+    assert normalize_answer("  Paris. ") == "paris"
+    assert normalize_answer("Reasoning...\nFinal Answer: PARIS") == (
+        "paris"
+    )
+
+
+def test_resolve_quorum():
+    assert resolve_quorum(None, 5) == 3
+    assert resolve_quorum(0.8, 5) == 4
+    assert resolve_quorum(2, 5) == 2
+    with pytest.raises(ValueError):
+        resolve_quorum(6, 5)
+
+
+def test_unanimous_vote_stops_at_quorum():
+    started = []
+    lock = threading.Lock()
+
+    def voter(i):
+        def call():
+            with lock:
+                started.append(i)
+            return "Paris"
+
+        return (f"v{i}", call)
+
+    result = quorum_vote([voter(i) for i in range(5)])
+
+    assert result.decided and result.winner == "Paris"
+    assert result.quorum == 3
+    assert len(result.responses) == len(started) == 3
+    assert result.cancelled == 2
+
+
+def test_vote_stops_when_quorum_is_unreachable():
+    answers = ["a", "b", "c", "d", "e"]
+    result = quorum_vote(
+        [(a, lambda a=a: a) for a in answers],
+        quorum=3,
+        max_workers=1,
+    )
+
+    assert not result.decided and result.winner is None
+    # After four distinct answers no answer can reach three votes
+    assert len(result.responses) == 4
+    assert result.cancelled == 1
+
+
+def test_failed_voters_are_recorded_without_voting():
+    def fail():
+        raise RuntimeError("model unavailable")
+
+    voters = [("broken", fail)] + [
+        (f"v{i}", lambda: "Paris") for i in range(3)
+    ]
+    result = quorum_vote(voters, quorum=3, max_workers=1)
+
+    assert result.decided and result.winner == "Paris"
+    assert result.failed == 1
+    assert result.votes == {"paris": 3}
+    name, error = result.responses[0]
+    assert name == "broken" and isinstance(error, RuntimeError)
+
+    # Failures count as finished, so an unreachable quorum ends the vote
+    result = quorum_vote(
+        [("a", fail), ("b", fail), ("c", lambda: "x")], quorum=2
+    )
+    assert not result.decided and result.failed >= 1
+
+
+def test_majority_voting_pairs_responses_with_agents():
+    agents = [
+        VotingAgent("slow", "Lyon", delay=0.2),
+        VotingAgent("fast1", "Paris"),
+        VotingAgent("fast2", "paris."),
+    ]
+    consensus = VotingAgent("judge", "unused")
+    mv = MajorityVoting(
+        agents=agents,
+        consensus_agent=consensus,
+        max_workers=3,
+        output_type="list",
+    )
+
+    mv.run("Capital of France?")
+    messages = {
+        m["role"]: m["content"]
+        for m in mv.conversation.conversation_history
+    }
+
+    assert messages["fast1"] == "Paris"
+    assert messages["fast2"] == "paris."
+    assert normalize_answer(messages["MajorityVoting"]) == "paris"
+    assert consensus.calls == []
+
+
+def test_majority_voting_falls_back_to_consensus_agent():
+    agents = [VotingAgent(name, name) for name in ("a", "b", "c")]
+    consensus = VotingAgent("judge", "b wins")
+    mv = MajorityVoting(agents=agents, consensus_agent=consensus)
+
+    mv.run("Pick one")
+
+    assert len(consensus.calls) == 1
+    assert not mv.last_vote.decided
+    assert mv.conversation.conversation_history[-1]["content"] == (
+        "b wins"
+    )
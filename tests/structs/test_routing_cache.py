@@ -0,0 +1,175 @@
+import json
+
+from swarms.structs import model_router
+from swarms.structs.model_router import ModelOutput, ModelRouter
+from swarms.structs.routing_cache import (
+    RoutingCache,
+    RoutingClassifier,
+)
+
+
+class CountingCaller:
+    """Stands in for the routing LLM and counts its calls."""
+
+    def __init__(self, decision):
+        self.decision = decision
+        self.calls = []
+
+    def run(self, task):
+        self.calls.append(task)
+        return self.decision
+
+
+def test_exact_hits_ignore_case_and_whitespace():
+    cache = RoutingCache()
+    cache.put("Summarize the report", "writer", {"id": 1})
+
+    hit = cache.get("  summarize   THE report ")
+
+    assert hit.exact and hit.label == "writer"
+    assert hit.decision == {"id": 1}
+
+
+def test_similarity_tier_respects_threshold():
+    cache = RoutingCache(similarity_threshold=0.7)
+    cache.put(
+        "write a python function that sorts a list of numbers",
+        "coder",
+    )
+
+    hit = cache.get(
+        "write a python function that sorts a list of strings"
+    )
+    assert hit.tier == "similar" and hit.label == "coder"
+    assert 0.7 <= hit.score < 1.0
+
+    assert cache.get("plan a holiday in portugal") is None
+    assert cache.stats["miss"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "swarms.structs.routing_cache.time.time", lambda: clock[0]
+    )
+    cache = RoutingCache(ttl=10)
+    cache.put("task", "agent")
+
+    clock[0] += 5
+    assert cache.get("task") is not None
+    clock[0] += 10
+    assert cache.get("task") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = RoutingCache(max_entries=2, similarity_threshold=None)
+    cache.put("one", "a")
+    cache.put("two", "b")
+    cache.get("one")
+    cache.put("three", "c")
+
+    assert cache.get("two") is None
+    assert cache.get("one").label == "a"
+
+
+def test_classifier_trained_from_log(tmp_path):
+    log = str(tmp_path / "routes.jsonl")
+    cache = RoutingCache(log_path=log, similarity_threshold=None)
+    for i in range(5):
+        cache.put(f"write python code for parser {i}", "coder")
+        cache.put(f"draft a blog post about travel {i}", "writer")
+
+    with open(log) as f:
+        assert json.loads(f.readline())["label"] == "coder"
+
+    classifier = RoutingClassifier.from_log(log, min_examples=5, k=3)
+    fresh = RoutingCache(
+        classifier=classifier,
+        min_confidence=0.6,
+        similarity_threshold=None,
+    )
+    hit = fresh.get("write python code for tokenizer")
+
+    assert hit.tier == "classifier" and hit.label == "coder"
+
+
+def test_model_router_reuses_decisions_and_clients(monkeypatch):
+    created, ran = [], []
+
+    class FakeLLM:
+        def __init__(self, **kwargs):
+            created.append(kwargs["model_name"])
+
+        def run(self, task):
+            ran.append(task)
+            return f"done: {task}"
+
+    monkeypatch.setattr(model_router, "LiteLLM", FakeLLM)
+    model_router.pooled_llm.cache_clear()
+
+    router = ModelRouter(
+        api_key="test-key",
+        routing_cache=RoutingCache(similarity_threshold=0.5),
+    )
+    router.model_caller = CountingCaller(
+        ModelOutput(
+            rationale="simple",
+            model="gpt-4o",
+            provider="openai",
+            task="rewritten task",
+            max_tokens=100,
+            temperature=0.1,
+            system_prompt="be brief",
+        )
+    )
+
+    router.step("translate hello into french please")
+    router.step("translate hello into french please")
+    router.step("translate goodbye into french please")
+
+    assert len(router.model_caller.calls) == 1
+    assert created == ["openai/gpt-4o"]
+    # Similar tasks reuse the model but not the rewritten task
+    assert ran == [
+        "rewritten task",
+        "rewritten task",
+        "translate goodbye into french please",
+    ]
+    model_router.pooled_llm.cache_clear()
+
+
+def test_multi_agent_router_skips_boss_on_cache_hit(monkeypatch):
+    from swarms.structs.multi_agent_router import (
+        AgentResponse,
+        MultiAgentRouter,
+    )
+
+    class Worker:
+        def __init__(self, name):
+            self.name = name
+            self.description = name
+            self.tasks = []
+
+        def run(self, task):
+            self.tasks.append(task)
+            return "ok"
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    coder, writer = Worker("coder"), Worker("writer")
+    router = MultiAgentRouter(
+        agents=[coder, writer], if_print=False, output_type="list"
+    )
+    router.function_caller = CountingCaller(
+        AgentResponse(
+            selected_agent="coder",
+            reasoning="code task",
+            modified_task="write code",
+        )
+    )
+
+    router.run("Write a sorting function")
+    router.run("write a sorting   function")
+
+    assert len(router.function_caller.calls) == 1
+    assert coder.tasks == ["write code", "write code"]
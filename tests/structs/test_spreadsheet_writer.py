@@ -0,0 +1,78 @@
+import csv
+
+from swarms.structs.spreadsheet_swarm import SpreadSheetSwarm
+
+
+class EchoAgent:
+    """Agent stub that records the tasks it runs."""
+
+    def __init__(self, agent_name):
+        self.agent_name = agent_name
+        self.name = agent_name
+        self.tasks = []
+
+    def run(self, task, *args, **kwargs):
+        self.tasks.append(task)
+        return f"{self.agent_name}: {task}"
+
+
+def make_swarm(path, agents, **kwargs):
+    return SpreadSheetSwarm(
+        agents=agents,
+        save_file_path=str(path),
+        workspace_dir=str(path.parent),
+        **kwargs,
+    )
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_rows_stream_to_csv_with_legacy_headers(tmp_path):
+    path = tmp_path / "results.csv"
+    agents = [EchoAgent("a"), EchoAgent("b")]
+
+    make_swarm(path, agents, max_loops=2).run("do it")
+
+    rows = read_rows(path)
+    assert len(rows) == 4
+    assert set(rows[0]) == {
+        "Run ID",
+        "Agent Name",
+        "Task",
+        "Result",
+        "Timestamp",
+    }
+    assert len({row["Run ID"] for row in rows}) == 1
+
+
+def test_resume_skips_completed_rows(tmp_path):
+    path = tmp_path / "results.csv"
+    first = [EchoAgent("a"), EchoAgent("b")]
+    make_swarm(path, first[:1]).run("do it")
+
+    second = [EchoAgent("a"), EchoAgent("b")]
+    swarm = make_swarm(path, second, resume=True)
+    swarm.run("do it")
+
+    assert second[0].tasks == []
+    assert second[1].tasks == ["do it"]
+    assert sorted(r["Agent Name"] for r in read_rows(path)) == [
+        "a",
+        "b",
+    ]
+
+
+def test_outputs_in_memory_are_bounded(tmp_path):
+    path = tmp_path / "results.jsonl"
+    agents = [EchoAgent(f"agent{i}") for i in range(5)]
+    swarm = make_swarm(path, agents, max_outputs_in_memory=2)
+
+    swarm.run("do it")
+
+    assert swarm.output_format == "jsonl"
+    assert swarm.metadata.tasks_completed == 5
+    assert len(swarm.metadata.outputs) == 2
+    assert len(path.read_text().splitlines()) == 5
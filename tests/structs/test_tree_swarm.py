@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from swarms.structs import tree_swarm
+from swarms.structs.tree_swarm import (
+    EmbeddingCache,
+    ForestSwarm,
+    Tree,
+    TreeAgent,
+)
+
+
+class FakeEncoder:
+    """Deterministic bag-of-words encoder that counts calls."""
+
+    vocabulary = ["stock", "tax", "retirement", "ira", "market"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.calls += 1
+        single = isinstance(texts, str)
+        texts = [texts] if single else texts
+        vectors = np.array(
+            [
+                [
+                    float(text.lower().count(word))
+                    for word in self.vocabulary
+                ]
+                + [0.01]
+                for text in texts
+            ],
+            dtype=np.float32,
+        )
+        return vectors[0] if single else vectors
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    fake = FakeEncoder()
+    monkeypatch.setattr(
+        tree_swarm, "load_embedding_model", lambda name: fake
+    )
+    monkeypatch.setattr(tree_swarm, "_embedding_caches", {})
+    return fake
+
+
+def make_agent(name, prompt):
+    agent = TreeAgent(
+        agent_name=name,
+        system_prompt=prompt,
+        model_name="gpt-4o-mini",
+        max_loops=1,
+    )
+    # Disable keyword matching so routing goes through embeddings
+    agent.relevant_keywords = []
+    return agent
+
+
+def test_embedding_cache_reuses_vectors(encoder):
+    cache = EmbeddingCache(model_name="fake")
+    first = cache.encode_many(["stock market", "tax"])
+    second = cache.encode_many(["tax", "stock market"])
+
+    assert encoder.calls == 1
+    assert np.allclose(first[0], second[1])
+    assert np.isclose(np.linalg.norm(first[0]), 1.0)
+
+
+def test_embedding_cache_evicts_least_recent(encoder):
+    cache = EmbeddingCache(model_name="fake", max_size=2)
+    cache.encode_many(["stock", "tax"])
+    cache.encode("stock")
+    cache.encode("ira")
+
+    assert "tax" not in cache._cache
+    assert "stock" in cache._cache
+
+
+def test_forest_routes_with_single_task_encode(encoder):
+    tree1 = Tree(
+        "Stocks",
+        [
+            make_agent("Stock Agent", "stock market stock"),
+            make_agent("Retirement Agent", "retirement ira"),
+        ],
+    )
+    tree2 = Tree("Taxes", [make_agent("Tax Agent", "tax tax")])
+    forest = ForestSwarm(trees=[tree1, tree2])
+
+    calls_before = encoder.calls
+    tree, agent = forest.route("how do I file my tax return")
+
+    assert tree is tree2
+    assert agent.agent_name == "Tax Agent"
+    assert encoder.calls == calls_before + 1
+
+    # Repeated tasks are served from the cache
+    forest.route("how do I file my tax return")
+    assert encoder.calls == calls_before + 1
+
+
+def test_tree_returns_none_below_threshold(encoder):
+    tree = Tree("Stocks", [make_agent("Stock Agent", "stock")])
+
+    assert tree.find_relevant_agent("tax", threshold=0.9) is None
+    assert (
+        tree.find_relevant_agent("stock picks").agent_name
+        == "Stock Agent"
+    )
@@ -1,8 +1,21 @@
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
+import gc
 import json
+import threading
+import time
+import weakref
 
-from swarms.tools.base_tool import BaseTool
+from swarms.tools.base_tool import (
+    BaseTool,
+    ToolExecutionError,
+    ToolTimeoutError,
+    ToolValidationError,
+)
+from swarms.tools.py_func_to_openai_func_str import (
+    convert_multiple_functions_to_openai_function_schema,
+)
 
 
 class TestModel(BaseModel):
@@ -99,6 +112,304 @@ def test_convert_funcs_into_tools():
     print("convert_funcs_into_tools test passed")
 
 
+def multiply_function(x: int, y: int = 2) -> int:
+    """Test function for multiplication."""
+    return x * y
+
+
+def test_compiled_tools_dispatch():
+    print("Testing compiled tool dispatch")
+    tool = BaseTool(tools=[sample_function, multiply_function])
+
+    compiled = tool.compiled_tools()
+    assert tool.compiled_tools() is compiled
+    assert tool.find_function_name("multiply_function") is (
+        multiply_function
+    )
+    assert tool.find_function_name("missing") is None
+
+    tool.tools = [sample_function]
+    assert tool.compiled_tools() is not compiled
+    assert tool.find_function_name("multiply_function") is None
+    print("compiled tool dispatch test passed")
+
+
+def test_compiled_tools_validate_arguments():
+    print("Testing compiled tool argument validation")
+    tool = BaseTool(tools=[multiply_function])
+
+    assert (
+        tool._execute_single_function_call(
+            {"name": "multiply_function", "arguments": {"x": 3}}
+        )
+        == 6
+    )
+
+    try:
+        tool._execute_single_function_call(
+            {"name": "multiply_function", "arguments": {"z": 3}}
+        )
+        assert False, "Expected ToolValidationError"
+    except ToolValidationError as e:
+        assert "x" in str(e)
+    print("compiled tool argument validation test passed")
+
+
+def test_parallel_function_calls_keep_order():
+    print("Testing parallel function calls")
+    tool = BaseTool(tools=[sample_function, multiply_function])
+    response = {
+        "function_calls": [
+            {"name": "sample_function", "arguments": {"x": i, "y": 1}}
+            for i in range(10)
+        ]
+        + [{"name": "multiply_function", "arguments": {"x": 5}}]
+    }
+
+    results = tool.execute_function_calls_from_api_response(
+        response, max_workers=3, return_as_string=False
+    )
+
+    assert results == [i + 1 for i in range(10)] + [10]
+    print("parallel function calls test passed")
+
+
+def test_function_schemas_are_cached():
+    print("Testing function schema cache")
+    first = convert_multiple_functions_to_openai_function_schema(
+        [sample_function]
+    )
+    first[0]["function"]["name"] = "mutated"
+    second = convert_multiple_functions_to_openai_function_schema(
+        [sample_function]
+    )
+
+    assert second[0]["function"]["name"] == "sample_function"
+    print("function schema cache test passed")
+
+
+def test_function_schema_cache_does_not_pin_tools():
+    print("Testing function schema cache references")
+
+    def make_tool():
+        def dynamic_tool(x: int) -> int:
+            """Dynamically created tool."""
+            return x
+
+        return dynamic_tool
+
+    tool = make_tool()
+    convert_multiple_functions_to_openai_function_schema([tool])
+    ref = weakref.ref(tool)
+    del tool
+    gc.collect()
+    assert ref() is None
+
+    class SlotTool:
+        """Callable that cannot be weakly referenced."""
+
+        __slots__ = ()
+        __name__ = "slot_tool"
+
+        def __call__(self, x: int) -> int:
+            return x
+
+    # Falls back to the bounded cache
+    schema = convert_multiple_functions_to_openai_function_schema(
+        [SlotTool()]
+    )
+    assert schema[0]["function"]["name"] == "slot_tool"
+    print("function schema cache reference test passed")
+
+
+async def async_echo(value: str, delay: float = 0.05) -> str:
+    """Async test tool that sleeps before echoing."""
+    await asyncio.sleep(delay)
+    return value
+
+
+def failing_function(x: int) -> int:
+    """Test function that always fails."""
+    raise ValueError("boom")
+
+
+def test_async_tools_run_concurrently():
+    print("Testing async tool execution")
+    tool = BaseTool(tools=[async_echo])
+    calls = [
+        {"name": "async_echo", "arguments": {"value": str(i)}}
+        for i in range(20)
+    ]
+
+    start = time.perf_counter()
+    results = tool.execute_function_calls_from_api_response(
+        {"function_calls": calls},
+        max_workers=20,
+        return_as_string=False,
+    )
+
+    assert results == [str(i) for i in range(20)]
+    assert time.perf_counter() - start < 0.5
+    assert tool._execute_single_function_call(calls[3]) == "3"
+    print("async tool execution test passed")
+
+
+def test_tool_timeout_returns_partial_results():
+    print("Testing tool timeouts")
+    tool = BaseTool(
+        tools=[async_echo, sample_function],
+        tool_timeouts={"async_echo": 0.05},
+        return_partial_results=True,
+    )
+
+    results = asyncio.run(
+        tool.aexecute_function_calls(
+            [
+                {
+                    "name": "async_echo",
+                    "arguments": {"value": "slow", "delay": 5},
+                },
+                {
+                    "name": "sample_function",
+                    "arguments": {"x": 1, "y": 2},
+                },
+            ]
+        )
+    )
+
+    assert isinstance(results[0], ToolTimeoutError)
+    assert results[1] == 3
+    print("tool timeout test passed")
+
+
+def test_fatal_error_cancels_siblings():
+    print("Testing fail-fast cancellation")
+    tool = BaseTool(tools=[async_echo, failing_function])
+    calls = [
+        {
+            "name": "async_echo",
+            "arguments": {"value": "a", "delay": 5},
+        },
+        {"name": "failing_function", "arguments": {"x": 1}},
+    ]
+
+    start = time.perf_counter()
+    try:
+        tool._execute_function_calls_parallel(calls, max_workers=4)
+        assert False, "Expected ToolExecutionError"
+    except ToolExecutionError as e:
+        assert "boom" in str(e)
+    assert time.perf_counter() - start < 1
+    print("fail-fast cancellation test passed")
+
+
+def test_tool_concurrency_limit():
+    print("Testing per-tool concurrency limits")
+    active = {"now": 0, "peak": 0}
+
+    async def limited(value: int) -> int:
+        """Tracks how many calls run at once."""
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return value
+
+    tool = BaseTool(
+        tools=[limited], tool_concurrency_limits={"limited": 2}
+    )
+    results = asyncio.run(
+        tool.aexecute_function_calls(
+            [
+                {"name": "limited", "arguments": {"value": i}}
+                for i in range(10)
+            ]
+        )
+    )
+
+    assert results == list(range(10))
+    assert active["peak"] == 2
+    print("per-tool concurrency limit test passed")
+
+
+def test_timed_out_sync_tools_do_not_starve_the_shared_pool():
+    print("Testing timed out sync tools")
+    release = threading.Event()
+    threads = {}
+
+    def hang(value: int) -> int:
+        """Blocks until released."""
+        threads["hang"] = threading.current_thread().name
+        release.wait(5)
+        return value
+
+    def quick(value: int) -> int:
+        """Returns immediately."""
+        threads["quick"] = threading.current_thread().name
+        return value
+
+    tool = BaseTool(
+        tools=[hang, quick],
+        tool_timeouts={"hang": 0.05},
+        return_partial_results=True,
+    )
+    try:
+        results = asyncio.run(
+            tool.aexecute_function_calls(
+                [
+                    {"name": "hang", "arguments": {"value": 1}},
+                    {"name": "quick", "arguments": {"value": 2}},
+                ]
+            )
+        )
+    finally:
+        release.set()
+
+    assert isinstance(results[0], ToolTimeoutError)
+    assert results[1] == 2
+    assert threads["hang"].startswith("swarms-tool-timeout")
+    assert not threads["quick"].startswith("swarms-tool-timeout")
+    print("timed out sync tool test passed")
+
+
+def test_sequential_sync_tool_times_out():
+    print("Testing sequential sync tool timeouts")
+    release = threading.Event()
+
+    def hang(value: int) -> int:
+        """Blocks until released."""
+        release.wait(5)
+        return value
+
+    tool = BaseTool(tools=[hang], tool_timeouts={"hang": 0.05})
+    start = time.perf_counter()
+    try:
+        tool._execute_function_calls_sequential(
+            [{"name": "hang", "arguments": {"value": 1}}]
+        )
+        assert False, "Expected ToolTimeoutError"
+    except ToolTimeoutError as e:
+        assert "timed out" in str(e)
+    finally:
+        release.set()
+    assert time.perf_counter() - start < 1
+    print("sequential sync tool timeout test passed")
+
+
+def test_nested_loop_runs_on_a_dedicated_thread():
+    print("Testing nested event loops")
+    tool = BaseTool(tools=[async_echo])
+
+    async def caller():
+        # A sync tool path reached from inside a running loop
+        return tool._execute_single_function_call(
+            {"name": "async_echo", "arguments": {"value": "x"}}
+        )
+
+    assert asyncio.run(caller()) == "x"
+    print("nested event loop test passed")
+
+
 def run_all_tests():
     print("Starting all tests")
 
@@ -109,6 +420,18 @@ def run_all_tests():
         test_execute_tool_by_name,
         test_check_str_for_functions_valid,
         test_convert_funcs_into_tools,
+        test_compiled_tools_dispatch,
+        test_compiled_tools_validate_arguments,
+        test_parallel_function_calls_keep_order,
+        test_function_schemas_are_cached,
+        test_function_schema_cache_does_not_pin_tools,
+        test_async_tools_run_concurrently,
+        test_tool_timeout_returns_partial_results,
+        test_fatal_error_cancels_siblings,
+        test_tool_concurrency_limit,
+        test_timed_out_sync_tools_do_not_starve_the_shared_pool,
+        test_sequential_sync_tool_times_out,
+        test_nested_loop_runs_on_a_dedicated_thread,
     ]
 
     for test in tests:
@@ -0,0 +1,144 @@
+from swarms.utils import document_ingestion
+from swarms.utils.document_ingestion import (
+    DocumentIngestor,
+    format_documents,
+    iter_chunks,
+)
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def write_docs(folder, count=4):
+    paths = []
+    for i in range(count):
+        path = folder / f"doc{i}.txt"
+        path.write_text(f"Document {i}. " + "Sentence here. " * 5)
+        paths.append(str(path))
+    return paths
+
+
+def test_iter_chunks_respects_budget_and_keeps_text():
+    text = ". ".join(f"sentence number {i}" for i in range(20))
+    chunks = list(iter_chunks(text, 10, word_count))
+
+    assert len(chunks) > 1
+    assert all(word_count(chunk) <= 10 for chunk in chunks)
+    assert ". ".join(chunks) == text
+
+
+def test_iter_chunks_is_lazy():
+    counted = []
+
+    def counter(text):
+        counted.append(text)
+        return 5
+
+    chunks = iter_chunks("a. b. c. d", 5, counter)
+    assert next(chunks) == "a"
+    assert len(counted) == 2
+
+
+def test_documents_yield_in_input_order(tmp_path):
+    paths = write_docs(tmp_path, 6)
+    ingestor = DocumentIngestor(max_workers=2, use_processes=False)
+
+    results = list(ingestor.iter_documents(paths))
+
+    assert [path for path, _ in results] == paths
+    assert results[3][1].startswith("Document 3.")
+
+
+def test_process_pool_extraction(tmp_path):
+    paths = write_docs(tmp_path, 3)
+    ingestor = DocumentIngestor(max_workers=2)
+
+    texts = [text for _, text in ingestor.iter_documents(paths)]
+
+    assert [t.split(".")[0] for t in texts] == [
+        "Document 0",
+        "Document 1",
+        "Document 2",
+    ]
+
+
+def test_disk_cache_skips_extraction(tmp_path, monkeypatch):
+    paths = write_docs(tmp_path, 3)
+    cache = str(tmp_path / "cache")
+    DocumentIngestor(cache_dir=cache, use_processes=False).extract(
+        paths[0]
+    )
+
+    calls = []
+    original = document_ingestion._extract
+
+    def tracking(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(document_ingestion, "_extract", tracking)
+    fresh = DocumentIngestor(cache_dir=cache, use_processes=False)
+    list(fresh.iter_documents(paths))
+
+    assert calls == paths[1:]
+
+
+def test_memory_cache_is_bounded_and_reads_back_from_disk(
+    tmp_path, monkeypatch
+):
+    paths = write_docs(tmp_path, 5)
+    ingestor = DocumentIngestor(
+        cache_dir=str(tmp_path / "cache"),
+        use_processes=False,
+        memory_cache_size=2,
+    )
+    texts = dict(ingestor.iter_documents(paths))
+    assert len(ingestor._texts) == 2
+
+    calls = []
+    monkeypatch.setattr(
+        document_ingestion,
+        "_extract",
+        lambda path: calls.append(path),
+    )
+    assert [ingestor.extract(path) for path in paths] == [
+        texts[path] for path in paths
+    ]
+    assert calls == []
+    assert len(ingestor._texts) == 2
+
+    uncached = DocumentIngestor(
+        cache_dir=str(tmp_path / "cache"), memory_cache_size=0
+    )
+    assert uncached.extract(paths[0]) == texts[paths[0]]
+    assert len(uncached._texts) == 0
+
+
+def test_token_counts_are_cached_per_counter(tmp_path):
+    (path,) = write_docs(tmp_path, 1)
+    cache = str(tmp_path / "cache")
+    counts = []
+
+    def counter(text):
+        counts.append(text)
+        return word_count(text)
+
+    first = DocumentIngestor(cache_dir=cache, token_counter=counter)
+    assert first.count_tokens(path) == 12
+
+    second = DocumentIngestor(cache_dir=cache, token_counter=counter)
+    assert second.count_tokens(path) == 12
+    assert len(counts) == 1
+
+
+def test_extract_folder_and_format(tmp_path):
+    write_docs(tmp_path, 2)
+    (tmp_path / "nested").mkdir()
+    ingestor = DocumentIngestor(use_processes=False)
+
+    text = format_documents(ingestor.extract_folder(str(tmp_path)))
+
+    assert text.startswith("\nContent from doc0.txt:\nDocument 0.")
+    assert "Content from doc1.txt" in text
+    assert "nested" not in text
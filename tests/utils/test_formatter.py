@@ -0,0 +1,116 @@
+import io
+import threading
+
+from rich.console import Console
+
+from swarms.utils.formatter import Formatter, PanelRenderer
+
+
+def make_console(terminal=True):
+    return Console(
+        file=io.StringIO(), force_terminal=terminal, width=80
+    )
+
+
+def test_panels_render_on_one_thread(monkeypatch):
+    monkeypatch.delenv("SWARMS_PANEL_OUTPUT", raising=False)
+    formatter = Formatter(console=make_console())
+    threads = []
+    render = formatter.renderer._render
+
+    def tracking(batch):
+        threads.append(threading.current_thread().name)
+        render(batch)
+
+    monkeypatch.setattr(formatter.renderer, "_render", tracking)
+    before = threading.active_count()
+
+    for i in range(20):
+        formatter.print_panel(f"content {i}", title=f"panel {i}")
+    assert formatter.flush(timeout=5)
+
+    output = formatter.console.file.getvalue()
+    assert "content 0" in output and "content 19" in output
+    assert set(threads) == {"swarms-panel-renderer"}
+    assert threading.active_count() <= before + 1
+    assert formatter.renderer.rendered == 20
+
+
+def test_full_queue_drops_and_reports(monkeypatch):
+    console = make_console()
+    renderer = PanelRenderer(console, max_queue_size=2)
+    gate = threading.Event()
+    render = renderer._render
+
+    def blocked(batch):
+        gate.wait()
+        render(batch)
+
+    monkeypatch.setattr(renderer, "_render", blocked)
+
+    results = [renderer.submit(str(i), "", "") for i in range(10)]
+    gate.set()
+    renderer.submit("last", "", "")
+    assert renderer.flush(timeout=5)
+
+    assert results.count(False) >= 7
+    assert "skipped while the console was busy" in (
+        console.file.getvalue()
+    )
+
+
+def test_non_terminal_output_is_skipped(monkeypatch):
+    monkeypatch.delenv("SWARMS_PANEL_OUTPUT", raising=False)
+    formatter = Formatter(console=make_console(terminal=False))
+
+    formatter.print_panel("hidden")
+
+    assert formatter.renderer._thread is None
+    assert formatter.console.file.getvalue() == ""
+
+
+def test_jupyter_output_is_rendered(monkeypatch):
+    monkeypatch.delenv("SWARMS_PANEL_OUTPUT", raising=False)
+    console = make_console(terminal=False)
+    console.is_jupyter = True
+    formatter = Formatter(console=console)
+
+    assert not console.is_terminal
+    assert formatter.panels_enabled()
+
+
+def test_env_forces_panel_output(monkeypatch):
+    monkeypatch.setenv("SWARMS_PANEL_OUTPUT", "always")
+    formatter = Formatter(console=make_console(terminal=False))
+
+    formatter.print_panel("shown")
+    assert formatter.flush(timeout=5)
+    assert "shown" in formatter.console.file.getvalue()
+
+    monkeypatch.setenv("SWARMS_PANEL_OUTPUT", "never")
+    terminal = Formatter(console=make_console())
+    terminal.print_panel("hidden")
+    assert terminal.renderer._thread is None
+
+
+def test_stream_panel_renders_written_chunks(monkeypatch):
+    monkeypatch.delenv("SWARMS_PANEL_OUTPUT", raising=False)
+    formatter = Formatter(console=make_console())
+
+    with formatter.stream_panel(title="Live") as panel:
+        for chunk in ["Hello", ", ", "world"]:
+            panel.write(chunk)
+
+    assert panel.text == "Hello, world"
+    assert "Hello, world" in formatter.console.file.getvalue()
+
+
+def test_stream_panel_without_terminal_only_collects(monkeypatch):
+    monkeypatch.delenv("SWARMS_PANEL_OUTPUT", raising=False)
+    formatter = Formatter(console=make_console(terminal=False))
+
+    with formatter.stream_panel() as panel:
+        panel.write("quiet")
+
+    assert panel.text == "quiet"
+    assert formatter.console.file.getvalue() == ""
@@ -0,0 +1,225 @@
+import copy
+import datetime
+import pickle
+import sqlite3
+
+import pytest
+
+from swarms.structs.conversation import Conversation
+from swarms.utils.message_index import (
+    MessageIndex,
+    SQLiteMessageIndex,
+    fts5_query,
+    parse_query,
+)
+
+INDEXES = {
+    "memory": MessageIndex,
+    "sqlite": lambda: SQLiteMessageIndex(sqlite3.connect(":memory:")),
+}
+
+
+@pytest.fixture(params=sorted(INDEXES))
+def make_index(request):
+    return INDEXES[request.param]
+
+
+@pytest.fixture(params=["list", "paged"])
+def make_conversation(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "paged":
+            kwargs.update(
+                max_memory_messages=2,
+                spill_dir=str(tmp_path / "spill"),
+                page_size=1,
+            )
+        return Conversation(token_count=False, **kwargs)
+
+    return make
+
+
+def messages():
+    return [
+        {
+            "role": "user",
+            "content": "The deploy failed on staging",
+            "timestamp": "2024-01-01T10:00:00",
+        },
+        {
+            "role": "assistant",
+            "content": "Deployment logs show a failed migration",
+            "timestamp": "2024-01-02T10:00:00",
+        },
+        {
+            "role": "assistant",
+            "content": "failed failed failed: the deploy failed again",
+            "timestamp": "2024-01-03T10:00:00",
+        },
+        {"role": "user", "content": {"tool": "deploy", "ok": True}},
+    ]
+
+
+def test_parse_and_fts5_query():
+    assert parse_query("Deploy* failed, now") == [
+        ("deploy", True),
+        ("failed", False),
+        ("now", False),
+    ]
+    assert fts5_query('x" OR y*') == '"x" "or" "y"*'
+    assert fts5_query("  !! ") is None
+
+
+def test_search_ranks_and_filters(make_index):
+    index = make_index()
+    index.sync(messages())
+
+    hits = index.search("deploy failed")
+    assert [position for position, _ in hits] == [2, 0]
+    assert hits[0][1] > hits[1][1]
+
+    assert {p for p, _ in index.search("deploy*")} == {0, 1, 2, 3}
+    assert [p for p, _ in index.search("failed", role="user")] == [0]
+    assert [
+        p
+        for p, _ in index.search(
+            "failed", since=datetime.datetime(2024, 1, 2)
+        )
+    ] == [2, 1]
+    assert index.search("missing") == []
+    assert [p for p, _ in index.search("", role="user")] == [3, 0]
+    assert len(index.search("failed", limit=1)) == 1
+
+
+def test_sync_is_incremental(make_index):
+    index = make_index()
+    history = messages()[:2]
+    index.sync(history)
+    assert len(index) == 2
+    history.append(messages()[2])
+    index.sync(history)
+    assert len(index) == 3
+    assert index.positions_by_role("assistant") == [1, 2]
+
+
+def test_conversation_search(make_conversation, tmp_path):
+    conversation = make_conversation(
+        time_enabled=True,
+        conversations_dir=str(tmp_path),
+    )
+    conversation.add("user", "Where is the weather report?")
+    conversation.add("assistant", "The weather is sunny")
+    conversation.add("assistant", "Report: weather report attached")
+
+    results = conversation.search("weather report", ranked=True)
+    assert results[0]["content"] == "Report: weather report attached"
+    assert len(results) == 2
+    assert conversation.search("weather", role="user", ranked=True)[
+        0
+    ]["role"] == ("user")
+    assert (
+        conversation.search("weather report", limit=1, ranked=True)
+        == results[:1]
+    )
+    assert (
+        conversation.search("sunny", since="2999-01-01", ranked=True)
+        == []
+    )
+    assert conversation.search("?", ranked=True) == [
+        conversation.conversation_history[0]
+    ]
+    assert [
+        m["content"]
+        for m in conversation.get_messages_by_role("assistant")
+    ] == ["The weather is sunny", "Report: weather report attached"]
+
+    # Edits rebuild the index
+    conversation.delete(0)
+    conversation.update(0, "assistant", "Rain expected")
+    assert conversation.search("sunny", ranked=True) == []
+    assert (
+        conversation.search("rain", ranked=True)[0]["content"]
+        == "Rain expected"
+    )
+    conversation.clear()
+    assert conversation.search("weather", ranked=True) == []
+
+
+def test_conversation_copies_and_pickles(make_conversation):
+    conversation = make_conversation()
+    conversation.add("user", "weather report")
+    conversation.search("weather")
+
+    for restored in (
+        copy.deepcopy(conversation),
+        pickle.loads(pickle.dumps(conversation)),
+    ):
+        restored.add("assistant", "weather update")
+        assert len(restored.search("weather")) == 2
+    assert len(conversation.search("weather")) == 1
+
+
+def test_conversation_substring_search(make_conversation):
+    conversation = make_conversation()
+    conversation.add("user", "Find the keyword here")
+    conversation.add("assistant", "no match")
+    conversation.add("assistant", {"text": "keyword in a dict"})
+    conversation.add("user", "KEYWORD shouting")
+
+    assert [m["content"] for m in conversation.search("key")] == [
+        "Find the keyword here",
+        {"text": "keyword in a dict"},
+    ]
+    assert conversation.search_keyword_in_conversation("match") == [
+        conversation.conversation_history[1]
+    ]
+    assert conversation.search("d the k") == [
+        conversation.conversation_history[0]
+    ]
+    assert conversation.search("key", role="user", limit=5) == [
+        conversation.conversation_history[0]
+    ]
+    assert len(conversation.search("")) == 4
+
+
+class KeywordBackend:
+    """A backend whose search only takes a keyword."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def search(self, keyword):
+        return [m for m in self.messages if keyword in m["content"]]
+
+
+def test_keyword_only_backend_search_is_filtered():
+    conversation = Conversation(token_count=False)
+    conversation.backend = "redis"
+    conversation.backend_instance = KeywordBackend(
+        [
+            {
+                "role": "user",
+                "content": "report one",
+                "timestamp": "2024-01-01T10:00:00",
+            },
+            {
+                "role": "assistant",
+                "content": "report two",
+                "timestamp": "2024-02-01T10:00:00",
+            },
+        ]
+    )
+
+    assert len(conversation.search("report")) == 2
+    assert [
+        m["content"]
+        for m in conversation.search("report", role="assistant")
+    ] == ["report two"]
+    assert [
+        m["content"]
+        for m in conversation.search(
+            "report", since=datetime.datetime(2024, 1, 15)
+        )
+    ] == ["report two"]
+    assert len(conversation.search("report", limit=1)) == 1
+    with pytest.raises(NotImplementedError):
+        conversation.search("report", ranked=True)
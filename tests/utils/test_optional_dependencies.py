@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from swarms.utils import optional_dependencies
+from swarms.utils.optional_dependencies import (
+    LazyDependency,
+    MissingDependencyError,
+    install_name,
+    is_available,
+    missing_dependencies,
+    optional_import,
+    register_optional_dependency,
+    require,
+)
+
+MISSING = "swarms_definitely_missing_module"
+
+
+def test_is_available_probes_without_importing():
+    assert is_available("json")
+    assert not is_available(MISSING)
+    assert not is_available(f"{MISSING}.submodule")
+
+
+def test_missing_dependencies():
+    assert missing_dependencies("json", MISSING) == [MISSING]
+
+
+def test_install_name_uses_registry():
+    assert install_name("pulsar") == "pulsar-client"
+    assert install_name("sentence_transformers.models") == (
+        "sentence-transformers"
+    )
+    assert install_name("unregistered") == "unregistered"
+
+
+def test_require_raises_with_install_hint():
+    register_optional_dependency(MISSING, "missing-dist")
+    try:
+        with pytest.raises(MissingDependencyError) as excinfo:
+            require(MISSING, feature="a test")
+    finally:
+        optional_dependencies.OPTIONAL_DEPENDENCIES.pop(MISSING)
+
+    error = excinfo.value
+    assert isinstance(error, ImportError)
+    assert error.package == "missing-dist"
+    assert "required by a test" in str(error)
+    assert "pip install missing-dist" in str(error)
+
+
+def test_optional_import_is_deferred_until_first_use():
+    proxy = optional_import("json")
+    assert isinstance(proxy, LazyDependency)
+    assert "deferred" in repr(proxy)
+
+    assert proxy.dumps({"a": 1}) == json.dumps({"a": 1})
+    assert proxy.resolve() is json
+    assert "loaded" in repr(proxy)
+
+
+def test_optional_import_missing_fails_on_use():
+    proxy = optional_import(MISSING, strict=False)
+    assert not proxy.available
+
+    with pytest.raises(MissingDependencyError):
+        proxy.anything
+
+
+def test_strict_mode_raises_at_declaration(monkeypatch):
+    monkeypatch.setenv("SWARMS_STRICT_DEPENDENCIES", "true")
+
+    with pytest.raises(MissingDependencyError):
+        optional_import(MISSING)
+
+    # Installed modules are still deferred in strict mode
+    assert isinstance(optional_import("json"), LazyDependency)
@@ -0,0 +1,145 @@
+import csv
+import json
+import threading
+import time
+
+import pytest
+
+from swarms.utils.optional_dependencies import (
+    MissingDependencyError,
+    is_available,
+)
+from swarms.utils.result_writer import (
+    ResultWriter,
+    completed_counts,
+    infer_format,
+)
+
+FIELDS = ["agent_name", "task", "result"]
+HEADERS = {
+    "agent_name": "Agent Name",
+    "task": "Task",
+    "result": "Result",
+}
+
+
+def rows(count):
+    return [
+        {
+            "agent_name": f"agent{i % 2}",
+            "task": f"t{i}",
+            "result": str(i),
+        }
+        for i in range(count)
+    ]
+
+
+def test_infer_format():
+    assert infer_format("out.csv") == "csv"
+    assert infer_format("out.jsonl") == "jsonl"
+    assert infer_format("out.parquet") == "parquet"
+    assert infer_format("out") == "csv"
+
+
+def test_csv_rows_are_flushed_in_batches(tmp_path):
+    path = tmp_path / "results.csv"
+    writer = ResultWriter(
+        str(path), FIELDS, headers=HEADERS, flush_every=2
+    )
+    for row in rows(5):
+        writer.write(row)
+    writer.close()
+
+    with open(path, newline="") as f:
+        written = list(csv.DictReader(f))
+    assert [r["Task"] for r in written] == [f"t{i}" for i in range(5)]
+    assert writer.rows_written == 5
+
+    with pytest.raises(RuntimeError):
+        writer.write(rows(1)[0])
+
+
+def test_appending_keeps_a_single_header(tmp_path):
+    path = str(tmp_path / "results.csv")
+    for batch in (rows(2), rows(3)):
+        with ResultWriter(path, FIELDS, headers=HEADERS) as writer:
+            for row in batch:
+                writer.write(row)
+
+    with open(path, newline="") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "Agent Name,Task,Result"
+    assert len(lines) == 6
+
+
+def test_interval_flush_without_close(tmp_path):
+    path = tmp_path / "results.jsonl"
+    writer = ResultWriter(
+        str(path), FIELDS, flush_every=1000, flush_interval=0.05
+    )
+    writer.write(rows(1)[0])
+
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert path.exists()
+    writer.close()
+
+    assert (
+        json.loads(path.read_text().splitlines()[0])["task"] == "t0"
+    )
+
+
+def test_slow_disk_applies_backpressure(tmp_path, monkeypatch):
+    path = tmp_path / "results.jsonl"
+    writer = ResultWriter(
+        str(path), FIELDS, flush_every=1, max_pending=2
+    )
+    gate = threading.Event()
+    flush = writer._flush
+
+    def slow_flush(batch):
+        gate.wait(5)
+        flush(batch)
+
+    monkeypatch.setattr(writer, "_flush", slow_flush)
+    producer = threading.Thread(
+        target=lambda: [writer.write(row) for row in rows(10)]
+    )
+    producer.start()
+    time.sleep(0.3)
+
+    # One row is being flushed, two are queued; the producer waits
+    assert producer.is_alive()
+    assert writer._queue.qsize() <= 2
+
+    gate.set()
+    producer.join(5)
+    writer.close()
+    assert len(path.read_text().splitlines()) == 10
+
+
+@pytest.mark.parametrize("name", ["results.csv", "results.jsonl"])
+def test_completed_counts_reads_back_output(tmp_path, name):
+    path = str(tmp_path / name)
+    with ResultWriter(path, FIELDS, headers=HEADERS) as writer:
+        for row in rows(3) + rows(1):
+            writer.write(row)
+
+    counts = completed_counts(
+        path, ("agent_name", "task"), headers=HEADERS
+    )
+    assert counts[("agent0", "t0")] == 2
+    assert counts[("agent1", "t1")] == 1
+    assert (
+        completed_counts(str(tmp_path / "missing.csv"), ["task"])
+        == {}
+    )
+
+
+@pytest.mark.skipif(
+    is_available("pyarrow"), reason="pyarrow is installed"
+)
+def test_parquet_requires_pyarrow(tmp_path):
+    with pytest.raises(MissingDependencyError):
+        ResultWriter(str(tmp_path / "results.parquet"), FIELDS)
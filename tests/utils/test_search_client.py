@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from swarms.utils.search_client import (
+    ExaBackend,
+    SearchCache,
+    SearchClient,
+    SearchError,
+    format_exa_results,
+)
+
+
+@pytest.fixture
+def exa_server():
+    """Local stand-in for the Exa search endpoint."""
+    seen = {"requests": [], "connections": set()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(
+                self.rfile.read(int(self.headers["Content-Length"]))
+            )
+            seen["requests"].append(body)
+            seen["connections"].add(self.client_address)
+            if body["query"] == "broken":
+                status, payload = 500, {"error": "boom"}
+            else:
+                status, payload = 200, {
+                    "results": [
+                        {"title": body["query"], "url": "http://x"}
+                    ]
+                }
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, daemon=True
+    )
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/search"
+    yield url, seen
+    server.shutdown()
+
+
+def test_backend_reuses_connections_and_caches(exa_server):
+    url, seen = exa_server
+    client = SearchClient(
+        backend=ExaBackend(api_key="key", api_url=url), max_workers=1
+    )
+
+    first = client.search("Quantum computing")
+    again = client.search("  quantum   COMPUTING ")
+    client.search("fusion power", num_results=3)
+
+    assert first is again
+    assert client.requests_made == 2
+    assert len(seen["requests"]) == 2
+    assert seen["requests"][1]["numResults"] == 3
+    # Sequential requests share one keep-alive connection
+    assert len(seen["connections"]) == 1
+    assert (
+        "quantum computing".lower()
+        in format_exa_results(first).lower()
+    )
+    client.close()
+
+
+def test_http_errors_raise_and_are_not_cached(exa_server):
+    url, seen = exa_server
+    client = SearchClient(
+        backend=ExaBackend(api_key="k", api_url=url)
+    )
+
+    for _ in range(2):
+        with pytest.raises(SearchError):
+            client.search("broken")
+    assert len(seen["requests"]) == 2
+
+
+def test_search_many_yields_in_completion_order():
+    delays = {"slow": 0.3, "fast": 0.0}
+    calls = []
+
+    def backend(query, params, timeout):
+        calls.append(query)
+        time.sleep(delays[query])
+        return {"query": query}
+
+    client = SearchClient(backend=backend, max_workers=2)
+    results = list(client.search_many(["slow", "fast", "Fast "]))
+
+    assert [query for query, _ in results] == ["fast", "slow"]
+    assert sorted(calls) == ["fast", "slow"]
+
+
+def test_search_many_reports_failures_inline():
+    def backend(query, params, timeout):
+        if query == "bad":
+            raise SearchError("nope")
+        return {"query": query}
+
+    client = SearchClient(backend=backend)
+    results = dict(client.search_many(["bad", "good"]))
+
+    assert isinstance(results["bad"], SearchError)
+    assert results["good"] == {"query": "good"}
+
+
+def test_concurrent_identical_queries_share_a_request():
+    gate = threading.Event()
+    calls = []
+
+    def backend(query, params, timeout):
+        calls.append(query)
+        gate.wait(5)
+        return {"query": query}
+
+    client = SearchClient(backend=backend)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.search("same"))
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["same"]
+    assert len(results) == 3
+
+
+def test_disk_cache_and_ttl(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "swarms.utils.search_client.time.time", lambda: clock[0]
+    )
+    calls = []
+
+    def backend(query, params, timeout):
+        calls.append(query)
+        return {"query": query}
+
+    cache_dir = str(tmp_path / "cache")
+    SearchClient(
+        backend=backend,
+        cache=SearchCache(ttl=60, cache_dir=cache_dir),
+    ).search("topic")
+
+    fresh = SearchClient(
+        backend=backend,
+        cache=SearchCache(ttl=60, cache_dir=cache_dir),
+    )
+    fresh.search("topic")
+    assert calls == ["topic"]
+
+    clock[0] += 120
+    fresh.search("topic")
+    assert calls == ["topic", "topic"]
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+
+from swarms.utils.vllm_wrapper import VLLMWrapper
+
+
+class StubEngine:
+    """Mimics ``vllm.LLM.generate`` and records each call's prompts."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, prompts, sampling_params):
+        self.calls.append(list(prompts))
+        return [
+            SimpleNamespace(
+                outputs=[
+                    SimpleNamespace(
+                        text=f" {prompt.splitlines()[0]} ",
+                        token_ids=[0, 1, 2],
+                    )
+                ]
+            )
+            for prompt in prompts
+        ]
+
+
+def make_wrapper(engine):
+    return VLLMWrapper(llm=engine, sampling_params=object())
+
+
+def test_run_uses_engine():
+    engine = StubEngine()
+    wrapper = make_wrapper(engine)
+
+    assert wrapper.run("hi") == "User: hi"
+    assert engine.calls == [["User: hi\nAssistant:"]]
+
+
+def test_batched_run_chunks_prompts_and_keeps_order():
+    engine = StubEngine()
+    wrapper = make_wrapper(engine)
+    tasks = [f"task {i}" for i in range(7)]
+
+    results = wrapper.batched_run(tasks, batch_size=3)
+
+    assert results == [f"User: task {i}" for i in range(7)]
+    assert [len(call) for call in engine.calls] == [3, 3, 1]
+
+
+def test_batched_run_without_batch_size_uses_one_call():
+    engine = StubEngine()
+    wrapper = make_wrapper(engine)
+
+    wrapper.batched_run(["a", "b", "c"], batch_size=None)
+
+    assert len(engine.calls) == 1
+
+
+def test_stream_batched_run_yields_batches_with_stats():
+    engine = StubEngine()
+    wrapper = make_wrapper(engine)
+
+    batches = list(
+        wrapper.stream_batched_run(["a", "b", "c", "d", "e"], 2)
+    )
+
+    assert [start for start, _ in batches] == [0, 2, 4]
+    assert batches[-1][1] == ["User: e"]
+    assert wrapper.last_batch_stats["prompts"] == 1
+    assert wrapper.last_batch_stats["generated_tokens"] == 3
+    assert wrapper.last_batch_stats["tokens_per_second"] >= 0
+
+
+def test_mismatched_engine_output_raises():
+    engine = StubEngine()
+    engine.generate = lambda prompts, params: []
+    wrapper = make_wrapper(engine)
+
+    with pytest.raises(RuntimeError):
+        wrapper.batched_run(["a"])